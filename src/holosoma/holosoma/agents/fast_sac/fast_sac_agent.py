@@ -13,15 +13,17 @@ from loguru import logger
 from holosoma.agents.base_algo.base_algo import BaseAlgo
 from holosoma.agents.fast_sac.fast_sac import Actor, CNNActor, CNNCritic, Critic
 from holosoma.agents.fast_sac.fast_sac_utils import (
+    CompactReplayBuffer,
     EmpiricalNormalization,
     SimpleReplayBuffer,
     save_params,
 )
+from holosoma.agents.fast_sac.tiered_buffer import TieredReplayBuffer
 from holosoma.agents.modules.augmentation_utils import SymmetryUtils
 from holosoma.agents.modules.logging_utils import LoggingHelper
 from holosoma.config_types.algo import FastSACConfig
 from holosoma.envs.base_task.base_task import BaseTask
-from holosoma.utils.average_meters import TensorAverageMeterDict
+from holosoma.utils.average_meters import StreamingMeanDict
 from holosoma.utils.inference_helpers import (
     attach_onnx_metadata,
     export_motion_and_policy_as_onnx,
@@ -176,7 +178,7 @@ class FastSACAgent(BaseAlgo):
             num_gpus=self.gpu_world_size,
         )
 
-        self.training_metrics = TensorAverageMeterDict()
+        self.training_metrics = StreamingMeanDict(device=self.device)
 
     def setup(self) -> None:
         logger.info("Setting up FastSAC")
@@ -333,16 +335,47 @@ class FastSACAgent(BaseAlgo):
 
         logger.info(f"actor_obs_dim: {actor_obs_dim}, critic_obs_dim: {critic_obs_dim}")
 
-        self.rb = SimpleReplayBuffer(
-            n_env=env.num_envs,
-            buffer_size=args.buffer_size,
-            n_obs=actor_obs_dim,
-            n_act=n_act,
-            n_critic_obs=critic_obs_dim,
-            n_steps=args.num_steps,
-            gamma=args.gamma,
-            device=device,
-        )
+        if args.replay_host_buffer_size > 0:
+            if args.compact_replay_buffer:
+                raise ValueError("compact_replay_buffer cannot be combined with replay_host_buffer_size")
+            self.rb: SimpleReplayBuffer = TieredReplayBuffer(
+                n_env=env.num_envs,
+                buffer_size=args.buffer_size,
+                n_obs=actor_obs_dim,
+                n_act=n_act,
+                n_critic_obs=critic_obs_dim,
+                n_steps=args.num_steps,
+                gamma=args.gamma,
+                device=device,
+                host_buffer_size=args.replay_host_buffer_size,
+                host_storage=args.replay_host_storage,
+                memmap_dir=self.log_dir,
+            )
+        elif args.compact_replay_buffer:
+            replay_obs_dtypes = {"fp32": torch.float32, "bf16": torch.bfloat16, "fp16": torch.float16}
+            self.rb = CompactReplayBuffer(
+                n_env=env.num_envs,
+                buffer_size=args.buffer_size,
+                n_obs=actor_obs_dim,
+                n_act=n_act,
+                n_critic_obs=critic_obs_dim,
+                n_steps=args.num_steps,
+                gamma=args.gamma,
+                device=device,
+                obs_dtype=replay_obs_dtypes[args.replay_obs_dtype],
+                boundary_capacity=args.replay_boundary_capacity,
+            )
+        else:
+            self.rb = SimpleReplayBuffer(
+                n_env=env.num_envs,
+                buffer_size=args.buffer_size,
+                n_obs=actor_obs_dim,
+                n_act=n_act,
+                n_critic_obs=critic_obs_dim,
+                n_steps=args.num_steps,
+                gamma=args.gamma,
+                device=device,
+            )
 
         if args.use_symmetry:
             # using env._env is not really ideal..
@@ -773,18 +806,14 @@ class FastSACAgent(BaseAlgo):
                 if self.global_step % args.logging_interval == 0:
                     with torch.no_grad():
                         # Use accumulated training metrics for smoother logging (reduces noise)
-                        accumulated_metrics = self.training_metrics.mean_and_clear()
-
-                        # Convert tensor values to float for logging
-                        loss_dict = {}
-                        for key, value in accumulated_metrics.items():
-                            if isinstance(value, torch.Tensor):
-                                loss_dict[key] = value.item()
-                            else:
-                                loss_dict[key] = float(value)
+                        loss_dict = self.training_metrics.mean_and_clear()
 
                         # Add current env rewards (not part of training loop accumulation)
                         loss_dict["env_rewards"] = rewards.mean().item()
+                        if isinstance(rb, CompactReplayBuffer):
+                            loss_dict["replay_lost_boundaries"] = rb.lost_boundaries.item()
+                        elif isinstance(rb, TieredReplayBuffer):
+                            loss_dict.update({f"replay_{key}": value for key, value in rb.stats().items()})
 
                     # Use logging helper
                     self.logging_helper.post_epoch_logging(it=self.global_step, loss_dict=loss_dict, extra_log_dicts={})
@@ -13,6 +13,8 @@ from holosoma.config_types.algo import FastSACConfig
 
 
 class SimpleReplayBuffer(nn.Module):
+    flag_dtype = torch.long
+
     def __init__(
         self,
         n_env: int,
@@ -39,42 +41,60 @@ class SimpleReplayBuffer(nn.Module):
         self.n_steps = n_steps
         self.device = device
 
-        self.observations = torch.zeros((n_env, buffer_size, n_obs), device=device, dtype=torch.float)
         self.actions = torch.zeros((n_env, buffer_size, n_act), device=device, dtype=torch.float)
         self.rewards = torch.zeros((n_env, buffer_size), device=device, dtype=torch.float)
-        self.dones = torch.zeros((n_env, buffer_size), device=device, dtype=torch.long)
-        self.truncations = torch.zeros((n_env, buffer_size), device=device, dtype=torch.long)
-        self.next_observations = torch.zeros((n_env, buffer_size, n_obs), device=device, dtype=torch.float)
+        self.dones = torch.zeros((n_env, buffer_size), device=device, dtype=self.flag_dtype)
+        self.truncations = torch.zeros((n_env, buffer_size), device=device, dtype=self.flag_dtype)
+        self._init_observation_storage()
+        self.ptr = 0
+
+    def _init_observation_storage(self):
+        self.observations = torch.zeros((self.n_env, self.buffer_size, self.n_obs), device=self.device)
+        self.next_observations = torch.zeros((self.n_env, self.buffer_size, self.n_obs), device=self.device)
         # Store full critic observations
-        self.critic_observations = torch.zeros((n_env, buffer_size, n_critic_obs), device=device, dtype=torch.float)
+        self.critic_observations = torch.zeros((self.n_env, self.buffer_size, self.n_critic_obs), device=self.device)
         self.next_critic_observations = torch.zeros(
-            (n_env, buffer_size, n_critic_obs), device=device, dtype=torch.float
+            (self.n_env, self.buffer_size, self.n_critic_obs), device=self.device
         )
-        self.ptr = 0
+
+    def _store_observations(self, ptr: int, tensor_dict: TensorDict):
+        self.observations[:, ptr] = tensor_dict["observations"]
+        self.next_observations[:, ptr] = tensor_dict["next"]["observations"]
+        # Store full critic observations
+        self.critic_observations[:, ptr] = tensor_dict["critic_observations"]
+        self.next_critic_observations[:, ptr] = tensor_dict["next"]["critic_observations"]
+
+    def _gather_observations(self, indices: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Gather observations and critic observations at ``indices`` of shape ``[n_env, batch_size]``."""
+        observations = torch.gather(self.observations, 1, indices.unsqueeze(-1).expand(-1, -1, self.n_obs))
+        critic_observations = torch.gather(
+            self.critic_observations, 1, indices.unsqueeze(-1).expand(-1, -1, self.n_critic_obs)
+        )
+        return observations, critic_observations
+
+    def _gather_next_observations(self, indices: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Gather next observations and next critic observations at ``indices`` of shape ``[n_env, batch_size]``."""
+        next_observations = torch.gather(self.next_observations, 1, indices.unsqueeze(-1).expand(-1, -1, self.n_obs))
+        next_critic_observations = torch.gather(
+            self.next_critic_observations, 1, indices.unsqueeze(-1).expand(-1, -1, self.n_critic_obs)
+        )
+        return next_observations, next_critic_observations
 
     def extend(
         self,
         tensor_dict: TensorDict,
     ):
-        observations = tensor_dict["observations"]
         actions = tensor_dict["actions"]
         rewards = tensor_dict["next"]["rewards"]
         dones = tensor_dict["next"]["dones"]
         truncations = tensor_dict["next"]["truncations"]
-        next_observations = tensor_dict["next"]["observations"]
 
         ptr = self.ptr % self.buffer_size
-        self.observations[:, ptr] = observations
+        self._store_observations(ptr, tensor_dict)
         self.actions[:, ptr] = actions
         self.rewards[:, ptr] = rewards
         self.dones[:, ptr] = dones
         self.truncations[:, ptr] = truncations
-        self.next_observations[:, ptr] = next_observations
-        critic_observations = tensor_dict["critic_observations"]
-        next_critic_observations = tensor_dict["next"]["critic_observations"]
-        # Store full critic observations
-        self.critic_observations[:, ptr] = critic_observations
-        self.next_critic_observations[:, ptr] = next_critic_observations
         self.ptr += 1
 
     @torch.no_grad()
@@ -88,26 +108,20 @@ class SimpleReplayBuffer(nn.Module):
                 (self.n_env, batch_size),
                 device=self.device,
             )
-            obs_indices = indices.unsqueeze(-1).expand(-1, -1, self.n_obs)
             act_indices = indices.unsqueeze(-1).expand(-1, -1, self.n_act)
-            observations = torch.gather(self.observations, 1, obs_indices).reshape(self.n_env * batch_size, self.n_obs)
-            next_observations = torch.gather(self.next_observations, 1, obs_indices).reshape(
-                self.n_env * batch_size, self.n_obs
-            )
+            observations, critic_observations = self._gather_observations(indices)
+            next_observations, next_critic_observations = self._gather_next_observations(indices)
+            observations = observations.reshape(self.n_env * batch_size, self.n_obs)
+            next_observations = next_observations.reshape(self.n_env * batch_size, self.n_obs)
             actions = torch.gather(self.actions, 1, act_indices).reshape(self.n_env * batch_size, self.n_act)
 
             rewards = torch.gather(self.rewards, 1, indices).reshape(self.n_env * batch_size)
-            dones = torch.gather(self.dones, 1, indices).reshape(self.n_env * batch_size)
-            truncations = torch.gather(self.truncations, 1, indices).reshape(self.n_env * batch_size)
+            dones = torch.gather(self.dones, 1, indices).long().reshape(self.n_env * batch_size)
+            truncations = torch.gather(self.truncations, 1, indices).long().reshape(self.n_env * batch_size)
             effective_n_steps = torch.ones_like(dones)
             # Gather full critic observations
-            critic_obs_indices = indices.unsqueeze(-1).expand(-1, -1, self.n_critic_obs)
-            critic_observations = torch.gather(self.critic_observations, 1, critic_obs_indices).reshape(
-                self.n_env * batch_size, self.n_critic_obs
-            )
-            next_critic_observations = torch.gather(self.next_critic_observations, 1, critic_obs_indices).reshape(
-                self.n_env * batch_size, self.n_critic_obs
-            )
+            critic_observations = critic_observations.reshape(self.n_env * batch_size, self.n_critic_obs)
+            next_critic_observations = next_critic_observations.reshape(self.n_env * batch_size, self.n_critic_obs)
         else:
             # Sample base indices
             if self.ptr >= self.buffer_size:
@@ -131,17 +145,14 @@ class SimpleReplayBuffer(nn.Module):
                     (self.n_env, batch_size),
                     device=self.device,
                 )
-            obs_indices = indices.unsqueeze(-1).expand(-1, -1, self.n_obs)
             act_indices = indices.unsqueeze(-1).expand(-1, -1, self.n_act)
 
             # Get base transitions
-            observations = torch.gather(self.observations, 1, obs_indices).reshape(self.n_env * batch_size, self.n_obs)
+            observations, critic_observations = self._gather_observations(indices)
+            observations = observations.reshape(self.n_env * batch_size, self.n_obs)
             actions = torch.gather(self.actions, 1, act_indices).reshape(self.n_env * batch_size, self.n_act)
             # Gather full critic observations
-            critic_obs_indices = indices.unsqueeze(-1).expand(-1, -1, self.n_critic_obs)
-            critic_observations = torch.gather(self.critic_observations, 1, critic_obs_indices).reshape(
-                self.n_env * batch_size, self.n_critic_obs
-            )
+            critic_observations = critic_observations.reshape(self.n_env * batch_size, self.n_critic_obs)
 
             # Create sequential indices for each sample
             # This creates a [n_env, batch_size, n_step] tensor of indices
@@ -151,12 +162,12 @@ class SimpleReplayBuffer(nn.Module):
             # Gather all rewards and terminal flags
             # Using advanced indexing - result shapes: [n_env, batch_size, n_step]
             all_rewards = torch.gather(self.rewards.unsqueeze(-1).expand(-1, -1, self.n_steps), 1, all_indices)
-            all_dones = torch.gather(self.dones.unsqueeze(-1).expand(-1, -1, self.n_steps), 1, all_indices)
+            all_dones = torch.gather(self.dones.unsqueeze(-1).expand(-1, -1, self.n_steps), 1, all_indices).long()
             all_truncations = torch.gather(
                 self.truncations.unsqueeze(-1).expand(-1, -1, self.n_steps),
                 1,
                 all_indices,
-            )
+            ).long()
 
             # Create masks for rewards *after* first done
             # This creates a cumulative product that zeroes out rewards after the first done
@@ -197,17 +208,12 @@ class SimpleReplayBuffer(nn.Module):
             )  # [n_env, batch_size]
 
             # Gather final values
-            final_next_observations = self.next_observations.gather(
-                1, final_next_obs_indices.unsqueeze(-1).expand(-1, -1, self.n_obs)
+            final_next_observations, final_next_critic_observations = self._gather_next_observations(
+                final_next_obs_indices
             )
-            final_dones = self.dones.gather(1, final_next_obs_indices)
-            final_truncations = self.truncations.gather(1, final_next_obs_indices)
+            final_dones = self.dones.gather(1, final_next_obs_indices).long()
+            final_truncations = self.truncations.gather(1, final_next_obs_indices).long()
 
-            # Gather final next critic observations directly
-            final_next_critic_observations = self.next_critic_observations.gather(
-                1,
-                final_next_obs_indices.unsqueeze(-1).expand(-1, -1, self.n_critic_obs),
-            )
             next_critic_observations = final_next_critic_observations.reshape(
                 self.n_env * batch_size, self.n_critic_obs
             )
@@ -242,6 +248,131 @@ class SimpleReplayBuffer(nn.Module):
         return out
 
 
+class CompactReplayBuffer(SimpleReplayBuffer):
+    flag_dtype = torch.bool
+
+    def __init__(
+        self,
+        n_env: int,
+        buffer_size: int,
+        n_obs: int,
+        n_act: int,
+        n_critic_obs: int,
+        n_steps: int = 1,
+        gamma: float = 0.99,
+        device=None,
+        obs_dtype: torch.dtype = torch.float,
+        boundary_capacity: int = 64,
+    ):
+        """
+        A replay buffer with the same ``sample()`` contract as :class:`SimpleReplayBuffer` that stores every
+        observation stream once.
+
+        The next observation of a transition is the observation of the following transition, except at
+        episode boundaries where the environment stored a different one (e.g. the final observation of a
+        timed-out episode). Boundaries are detected on ``extend`` by comparing the previous next observation
+        with the new observation, and only those next observations are kept, in a per-env ring of
+        ``boundary_capacity`` entries. Done and truncation flags are stored as bool, and observations may be
+        stored in a lower precision ``obs_dtype`` (returned as float32).
+
+        If more than ``boundary_capacity`` boundaries happen within ``buffer_size`` steps of one env, the
+        oldest ones are dropped and their transitions fall back to the following observation. Such drops are
+        counted in ``lost_boundaries``.
+        """
+        self.obs_dtype = obs_dtype
+        self.boundary_capacity = boundary_capacity
+        super().__init__(n_env, buffer_size, n_obs, n_act, n_critic_obs, n_steps=n_steps, gamma=gamma, device=device)
+
+    def _init_observation_storage(self):
+        n_env, device = self.n_env, self.device
+        self.observations = torch.zeros((n_env, self.buffer_size, self.n_obs), device=device, dtype=self.obs_dtype)
+        self.critic_observations = torch.zeros(
+            (n_env, self.buffer_size, self.n_critic_obs), device=device, dtype=self.obs_dtype
+        )
+        # Next observations of the latest transition, which has no following transition yet
+        self.pending_next_observations = torch.zeros((n_env, self.n_obs), device=device)
+        self.pending_next_critic_observations = torch.zeros((n_env, self.n_critic_obs), device=device)
+        # Next observations at episode boundaries
+        self.boundary_observations = torch.zeros(
+            (n_env, self.boundary_capacity, self.n_obs), device=device, dtype=self.obs_dtype
+        )
+        self.boundary_critic_observations = torch.zeros(
+            (n_env, self.boundary_capacity, self.n_critic_obs), device=device, dtype=self.obs_dtype
+        )
+        # Boundary entry holding the next observations of each transition, or -1 for the following observation
+        self.boundary_index = torch.full((n_env, self.buffer_size), -1, device=device, dtype=torch.long)
+        # Transition that owns each boundary entry, and the next boundary entry to write per env
+        self.boundary_owner = torch.full((n_env, self.boundary_capacity), -1, device=device, dtype=torch.long)
+        self.boundary_ptr = torch.zeros(n_env, device=device, dtype=torch.long)
+        self.lost_boundaries = torch.zeros((), device=device, dtype=torch.long)
+        self.env_ids = torch.arange(n_env, device=device)
+
+    def _store_observations(self, ptr: int, tensor_dict: TensorDict):
+        observations = tensor_dict["observations"]
+        critic_observations = tensor_dict["critic_observations"]
+        if self.ptr > 0:
+            self._store_boundaries((ptr - 1) % self.buffer_size, observations, critic_observations)
+
+        self.observations[:, ptr] = observations
+        self.critic_observations[:, ptr] = critic_observations
+        self.boundary_index[:, ptr] = -1
+        self.pending_next_observations.copy_(tensor_dict["next"]["observations"])
+        self.pending_next_critic_observations.copy_(tensor_dict["next"]["critic_observations"])
+
+    def _store_boundaries(self, prev_ptr: int, observations: torch.Tensor, critic_observations: torch.Tensor):
+        # Envs whose previous next observation is not the current observation
+        is_boundary = (self.pending_next_observations != observations).any(dim=-1) | (
+            self.pending_next_critic_observations != critic_observations
+        ).any(dim=-1)
+
+        env_ids = self.env_ids
+        entry = self.boundary_ptr
+        owner = self.boundary_owner[env_ids, entry]
+        owner_index = self.boundary_index[env_ids, owner.clamp(min=0)]
+        is_lost = is_boundary & (owner >= 0) & (owner_index == entry)
+        self.lost_boundaries += is_lost.sum()
+        self.boundary_index[env_ids, owner.clamp(min=0)] = torch.where(is_lost, -1, owner_index)
+
+        mask = is_boundary.unsqueeze(-1)
+        self.boundary_observations[env_ids, entry] = torch.where(
+            mask, self.pending_next_observations.to(self.obs_dtype), self.boundary_observations[env_ids, entry]
+        )
+        self.boundary_critic_observations[env_ids, entry] = torch.where(
+            mask,
+            self.pending_next_critic_observations.to(self.obs_dtype),
+            self.boundary_critic_observations[env_ids, entry],
+        )
+        self.boundary_owner[env_ids, entry] = torch.where(is_boundary, prev_ptr, owner)
+        self.boundary_index[:, prev_ptr] = torch.where(is_boundary, entry, -1)
+        self.boundary_ptr.copy_((entry + is_boundary.long()) % self.boundary_capacity)
+
+    def _gather_observations(self, indices: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        observations, critic_observations = super()._gather_observations(indices)
+        return observations.float(), critic_observations.float()
+
+    def _gather_next_observations(self, indices: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        next_observations, next_critic_observations = self._gather_observations((indices + 1) % self.buffer_size)
+
+        is_latest = (indices == (self.ptr - 1) % self.buffer_size).unsqueeze(-1)
+        next_observations = torch.where(is_latest, self.pending_next_observations.unsqueeze(1), next_observations)
+        next_critic_observations = torch.where(
+            is_latest, self.pending_next_critic_observations.unsqueeze(1), next_critic_observations
+        )
+
+        boundary_index = self.boundary_index.gather(1, indices)
+        is_boundary = (boundary_index >= 0).unsqueeze(-1)
+        boundary_index = boundary_index.clamp(min=0).unsqueeze(-1)
+        boundary_observations = torch.gather(
+            self.boundary_observations, 1, boundary_index.expand(-1, -1, self.n_obs)
+        ).float()
+        boundary_critic_observations = torch.gather(
+            self.boundary_critic_observations, 1, boundary_index.expand(-1, -1, self.n_critic_obs)
+        ).float()
+        next_observations = torch.where(is_boundary, boundary_observations, next_observations)
+        next_critic_observations = torch.where(is_boundary, boundary_critic_observations, next_critic_observations)
+        return next_observations, next_critic_observations
+
+
 class EmpiricalNormalization(nn.Module):
     """Normalize mean and variance of values based on empirical values."""
 
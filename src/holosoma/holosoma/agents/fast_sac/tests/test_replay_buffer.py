@@ -0,0 +1,97 @@
+"""Tests for the compact FastSAC replay buffer."""
+
+import pytest
+import torch
+from tensordict import TensorDict
+
+from holosoma.agents.fast_sac.fast_sac_utils import CompactReplayBuffer, SimpleReplayBuffer
+
+N_ENV = 4
+N_OBS = 3
+N_CRITIC_OBS = 5
+N_ACT = 2
+
+
+def _transitions(num_steps, seed=0):
+    """Transitions following the FastSAC rollout: next obs is the final obs of timed-out envs."""
+    generator = torch.Generator().manual_seed(seed)
+    obs = torch.randn(N_ENV, N_OBS, generator=generator)
+    critic_obs = torch.randn(N_ENV, N_CRITIC_OBS, generator=generator)
+    transitions = []
+    for _ in range(num_steps):
+        next_obs = torch.randn(N_ENV, N_OBS, generator=generator)
+        next_critic_obs = torch.randn(N_ENV, N_CRITIC_OBS, generator=generator)
+        dones = torch.rand(N_ENV, generator=generator) < 0.2
+        truncations = dones & (torch.rand(N_ENV, generator=generator) < 0.5)
+        final_obs = torch.randn(N_ENV, N_OBS, generator=generator)
+        final_critic_obs = torch.randn(N_ENV, N_CRITIC_OBS, generator=generator)
+        transition = TensorDict(
+            {
+                "observations": obs,
+                "actions": torch.randn(N_ENV, N_ACT, generator=generator),
+                "next": {
+                    "observations": torch.where(truncations[:, None], final_obs, next_obs),
+                    "rewards": torch.randn(N_ENV, generator=generator),
+                    "truncations": truncations.long(),
+                    "dones": dones.long(),
+                },
+            },
+            batch_size=(N_ENV,),
+        )
+        transition["critic_observations"] = critic_obs
+        transition["next"]["critic_observations"] = torch.where(truncations[:, None], final_critic_obs, next_critic_obs)
+        transitions.append(transition)
+        obs, critic_obs = next_obs, next_critic_obs
+    return transitions
+
+
+def _make_buffers(n_steps, **compact_kwargs):
+    kwargs = {"n_env": N_ENV, "buffer_size": 8, "n_obs": N_OBS, "n_act": N_ACT, "n_critic_obs": N_CRITIC_OBS}
+    simple = SimpleReplayBuffer(**kwargs, n_steps=n_steps, device="cpu")
+    compact = CompactReplayBuffer(**kwargs, n_steps=n_steps, device="cpu", **compact_kwargs)
+    return simple, compact
+
+
+@pytest.mark.parametrize("n_steps", [1, 3])
+@pytest.mark.parametrize("num_transitions", [5, 21])
+def test_compact_buffer_matches_simple_buffer(n_steps, num_transitions):
+    simple, compact = _make_buffers(n_steps)
+    for transition in _transitions(num_transitions):
+        simple.extend(transition)
+        compact.extend(transition)
+
+    torch.manual_seed(0)
+    expected = simple.sample(16)
+    torch.manual_seed(0)
+    actual = compact.sample(16)
+
+    assert set(actual.keys(include_nested=True)) == set(expected.keys(include_nested=True))
+    for key in expected.keys(include_nested=True, leaves_only=True):
+        assert actual[key].dtype == expected[key].dtype, key
+        torch.testing.assert_close(actual[key], expected[key], rtol=0, atol=0, msg=str(key))
+    assert compact.lost_boundaries.item() == 0
+
+
+def test_compact_buffer_bf16_observations():
+    simple, compact = _make_buffers(1, obs_dtype=torch.bfloat16)
+    for transition in _transitions(12):
+        simple.extend(transition)
+        compact.extend(transition)
+
+    torch.manual_seed(0)
+    expected = simple.sample(16)
+    torch.manual_seed(0)
+    actual = compact.sample(16)
+    for key in ("observations", "critic_observations", ("next", "observations"), ("next", "critic_observations")):
+        assert actual[key].dtype == torch.float32
+        torch.testing.assert_close(actual[key], expected[key], rtol=1e-2, atol=1e-2)
+
+
+def test_compact_buffer_counts_lost_boundaries():
+    _, compact = _make_buffers(1, boundary_capacity=1)
+    transitions = _transitions(8, seed=1)
+    for transition in transitions:
+        compact.extend(transition)
+    num_boundaries = sum(int(t["next"]["truncations"].sum()) for t in transitions[:-1])
+    # All but the most recent boundary of each env are dropped
+    assert 0 < compact.lost_boundaries.item() <= num_boundaries - 1
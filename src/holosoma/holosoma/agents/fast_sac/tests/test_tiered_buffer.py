@@ -0,0 +1,88 @@
+"""Tests for the tiered (device + host) FastSAC replay buffer."""
+
+import pytest
+import torch
+from tensordict import TensorDict
+
+from holosoma.agents.fast_sac.tiered_buffer import TieredReplayBuffer
+
+N_ENV = 3
+N_OBS = 2
+N_CRITIC_OBS = 4
+N_ACT = 2
+
+
+def _transition(step: int) -> TensorDict:
+    # Every field encodes (env, step) so sampled rows can be checked for consistency
+    ids = torch.arange(N_ENV, dtype=torch.float) * 1000 + step
+    transition = TensorDict(
+        {
+            "observations": ids[:, None].expand(N_ENV, N_OBS).clone(),
+            "actions": -ids[:, None].expand(N_ENV, N_ACT).clone(),
+            "next": {
+                "observations": ids[:, None].expand(N_ENV, N_OBS) + 0.5,
+                "rewards": ids * 2,
+                "truncations": torch.full((N_ENV,), step % 2),
+                "dones": torch.full((N_ENV,), step % 3 == 0).long(),
+            },
+        },
+        batch_size=(N_ENV,),
+    )
+    transition["critic_observations"] = ids[:, None].expand(N_ENV, N_CRITIC_OBS) + 0.25
+    transition["next"]["critic_observations"] = ids[:, None].expand(N_ENV, N_CRITIC_OBS) + 0.75
+    return transition
+
+
+@pytest.mark.parametrize("host_storage", ["pinned", "memmap"])
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_tiered_buffer_samples_both_tiers(tmp_path, host_storage, prefetch):
+    rb = TieredReplayBuffer(
+        N_ENV,
+        buffer_size=4,
+        n_obs=N_OBS,
+        n_act=N_ACT,
+        n_critic_obs=N_CRITIC_OBS,
+        device="cpu",
+        host_buffer_size=12,
+        host_storage=host_storage,
+        memmap_dir=str(tmp_path),
+        prefetch=prefetch,
+    )
+    # The memmap file is unnamed, nothing is left behind for a rerun to reuse
+    assert list(tmp_path.iterdir()) == []
+    num_steps = 20
+    for step in range(num_steps):
+        rb.extend(_transition(step))
+    assert rb.num_spilled == num_steps - 4
+
+    batch_size = 64
+    for _ in range(3):
+        data = rb.sample(batch_size)
+        assert data.batch_size == torch.Size([N_ENV * batch_size])
+        ids = data["observations"][:, 0]
+        env = (ids // 1000).long()
+        step = (ids % 1000).long()
+        # Per-env layout, and only the 16 most recent steps are stored
+        assert torch.equal(env, torch.arange(N_ENV).repeat_interleave(batch_size))
+        assert step.min() >= num_steps - 16
+        torch.testing.assert_close(data["actions"][:, 0], -ids)
+        torch.testing.assert_close(data["critic_observations"][:, 0], ids + 0.25)
+        torch.testing.assert_close(data["next"]["observations"][:, 0], ids + 0.5)
+        torch.testing.assert_close(data["next"]["critic_observations"][:, 0], ids + 0.75)
+        torch.testing.assert_close(data["next"]["rewards"], ids * 2)
+        assert data["next"]["dones"].dtype == torch.long
+        torch.testing.assert_close(data["next"]["truncations"], step % 2)
+        torch.testing.assert_close(data["next"]["dones"], (step % 3 == 0).long())
+        torch.testing.assert_close(data["next"]["effective_n_steps"], torch.ones_like(step))
+        # 12 of the 16 stored steps are on the host
+        assert (step < num_steps - 4).sum() == N_ENV * 48
+
+    stats = rb.stats()
+    assert stats["device_hit_ratio"] == pytest.approx(0.25)
+    assert stats["prefetch_hit_ratio"] == (pytest.approx(2 / 3) if prefetch else 0.0)
+    assert stats["spilled_steps"] == num_steps - 4
+
+
+def test_tiered_buffer_rejects_n_step():
+    with pytest.raises(ValueError, match="n_steps"):
+        TieredReplayBuffer(1, 4, 1, 1, 1, n_steps=3, device="cpu", host_buffer_size=4)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import torch
+from tensordict import TensorDict
+
+from holosoma.agents.fast_sac.fast_sac_utils import SimpleReplayBuffer
+
+
+class TieredReplayBuffer(SimpleReplayBuffer):
+    def __init__(
+        self,
+        n_env: int,
+        buffer_size: int,
+        n_obs: int,
+        n_act: int,
+        n_critic_obs: int,
+        n_steps: int = 1,
+        gamma: float = 0.99,
+        device=None,
+        host_buffer_size: int = 0,
+        host_storage: str = "pinned",
+        memmap_dir: str | None = None,
+        prefetch: bool = True,
+    ):
+        """
+        A replay buffer that keeps the latest ``buffer_size`` steps per env on device and spills older ones to
+        a host tier of ``host_buffer_size`` steps, either pinned host memory (``host_storage="pinned"``) or a
+        ``numpy.memmap`` of an unnamed temporary file in ``memmap_dir`` (``host_storage="memmap"``, None uses the
+        system temporary directory). The file has no directory entry, so it is never reused and its disk space
+        is freed when the buffer is garbage collected or the process exits.
+
+        ``sample()`` keeps the :class:`SimpleReplayBuffer` contract and draws from both tiers in proportion to
+        the number of stored steps. The host part of the next batch is gathered and copied to the device by a
+        background thread while the current update runs, so it is drawn from the host tier as it was when the
+        previous batch was returned. ``stats()`` reports tier hit ratios and the time spent waiting on host
+        batches. Only 1-step returns are supported.
+        """
+        if n_steps != 1:
+            raise ValueError("TieredReplayBuffer only supports n_steps == 1")
+        if host_buffer_size <= 0:
+            raise ValueError("host_buffer_size must be positive")
+        super().__init__(n_env, buffer_size, n_obs, n_act, n_critic_obs, n_steps=n_steps, gamma=gamma, device=device)
+
+        self.host_buffer_size = host_buffer_size
+        self._use_cuda = device is not None and torch.device(device).type == "cuda"
+        # Host record layout: obs, critic obs, next obs, next critic obs, actions, reward, done, truncation
+        self._fields = {
+            "observations": n_obs,
+            "critic_observations": n_critic_obs,
+            "next_observations": n_obs,
+            "next_critic_observations": n_critic_obs,
+            "actions": n_act,
+            "rewards": 1,
+            "dones": 1,
+            "truncations": 1,
+        }
+        self.record_dim = sum(self._fields.values())
+        shape = (host_buffer_size, n_env, self.record_dim)
+        if host_storage == "pinned":
+            self.host_records = torch.zeros(shape, pin_memory=self._use_cuda)
+        elif host_storage == "memmap":
+            # The mapping stays valid after the file is closed
+            with tempfile.TemporaryFile(prefix="replay_host", suffix=".bin", dir=memmap_dir) as memmap_file:
+                records = np.memmap(memmap_file, dtype=np.float32, mode="w+", shape=shape)
+            self.host_records = torch.from_numpy(records)
+        else:
+            raise ValueError(f"Unknown host storage: {host_storage}")
+        self._host_flat = self.host_records.view(-1, self.record_dim)
+        self._env_ids = torch.arange(n_env)
+        # Host indices are drawn on the prefetch thread, so they use their own generator
+        self._host_generator = torch.Generator().manual_seed(torch.initial_seed())
+        self.num_spilled = 0
+
+        self._lock = threading.Lock()
+        self._spill_event = torch.cuda.Event() if self._use_cuda else None
+        self._copy_stream = torch.cuda.Stream(device=device) if self._use_cuda else None
+        self._staging: torch.Tensor | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replay-prefetch") if prefetch else None
+        self._prefetched: tuple[int, Future] | None = None
+
+        self.device_samples = 0
+        self.host_samples = 0
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+        self.stall_time = 0.0
+
+    def extend(self, tensor_dict: TensorDict):
+        if self.ptr >= self.buffer_size:
+            self._spill(self.ptr % self.buffer_size)
+        super().extend(tensor_dict)
+
+    def _spill(self, slot: int):
+        """Move the oldest device step (about to be overwritten) to the host tier."""
+        record = torch.cat(
+            [
+                self.observations[:, slot],
+                self.critic_observations[:, slot],
+                self.next_observations[:, slot],
+                self.next_critic_observations[:, slot],
+                self.actions[:, slot],
+                self.rewards[:, slot, None],
+                self.dones[:, slot, None].float(),
+                self.truncations[:, slot, None].float(),
+            ],
+            dim=-1,
+        )
+        with self._lock:
+            self.host_records[self.num_spilled % self.host_buffer_size].copy_(record, non_blocking=self._use_cuda)
+            if self._spill_event is not None:
+                self._spill_event.record()
+            self.num_spilled += 1
+
+    def _gather_host(self, host_batch: int, host_valid: int) -> torch.Tensor:
+        """Gather ``host_batch`` random host records per env and copy them to the device."""
+        rows = torch.randint(0, host_valid, (self.n_env, host_batch), generator=self._host_generator)
+        flat_indices = (rows * self.n_env + self._env_ids.unsqueeze(-1)).view(-1)
+        num_records = self.n_env * host_batch
+        if self._staging is None or self._staging.shape[0] != num_records:
+            self._staging = torch.empty((num_records, self.record_dim), pin_memory=self._use_cuda)
+        with self._lock:
+            if self._spill_event is not None:
+                # Spilled records are copied asynchronously from the device
+                self._spill_event.synchronize()
+            torch.index_select(self._host_flat, 0, flat_indices, out=self._staging)
+
+        if self._copy_stream is None:
+            return self._staging.clone()
+        with torch.cuda.stream(self._copy_stream):
+            records = self._staging.to(self.device, non_blocking=True)
+        self._copy_stream.synchronize()
+        return records
+
+    def _host_records(self, host_batch: int, host_valid: int) -> torch.Tensor:
+        start = time.perf_counter()
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched is not None and prefetched[0] == host_batch:
+            records = prefetched[1].result()
+            self.prefetch_hits += 1
+            if self._use_cuda:
+                records.record_stream(torch.cuda.current_stream(self.device))
+        else:
+            if prefetched is not None:
+                prefetched[1].result()
+            records = self._gather_host(host_batch, host_valid)
+            self.prefetch_misses += 1
+        self.stall_time += time.perf_counter() - start
+        return records
+
+    def _split_batch(self, batch_size: int) -> tuple[int, int]:
+        """Number of samples per env drawn from the host tier, and the number of valid host steps."""
+        device_valid = min(self.ptr, self.buffer_size)
+        host_valid = min(self.num_spilled, self.host_buffer_size)
+        return round(batch_size * host_valid / (device_valid + host_valid)), host_valid
+
+    @torch.no_grad()
+    def sample(self, batch_size: int):
+        host_batch, host_valid = self._split_batch(batch_size)
+        device_batch = batch_size - host_batch
+        device_data = super().sample(device_batch)
+        self.device_samples += self.n_env * device_batch
+        if host_batch == 0:
+            return device_data
+
+        records = self._host_records(host_batch, host_valid).view(self.n_env, host_batch, self.record_dim)
+        host_data = dict(zip(self._fields, records.split(list(self._fields.values()), dim=-1)))
+        self.host_samples += self.n_env * host_batch
+
+        if self._executor is not None:
+            # Gather the host part of the next batch while this one is used
+            next_host_batch, next_host_valid = self._split_batch(batch_size)
+            future = self._executor.submit(self._gather_host, next_host_batch, next_host_valid)
+            self._prefetched = (next_host_batch, future)
+
+        def merge(device_value: torch.Tensor, host_value: torch.Tensor) -> torch.Tensor:
+            # Keep the per-env [n_env, batch_size] layout of SimpleReplayBuffer.sample
+            device_value = device_value.view(self.n_env, device_batch, *host_value.shape[2:])
+            return torch.cat([device_value, host_value.to(device_value.dtype)], dim=1).flatten(0, 1)
+
+        out = TensorDict(
+            {
+                "observations": merge(device_data["observations"], host_data["observations"]),
+                "actions": merge(device_data["actions"], host_data["actions"]),
+                "next": {
+                    "rewards": merge(device_data["next"]["rewards"], host_data["rewards"].squeeze(-1)),
+                    "dones": merge(device_data["next"]["dones"], host_data["dones"].squeeze(-1)),
+                    "truncations": merge(device_data["next"]["truncations"], host_data["truncations"].squeeze(-1)),
+                    "observations": merge(device_data["next"]["observations"], host_data["next_observations"]),
+                    "effective_n_steps": merge(
+                        device_data["next"]["effective_n_steps"], torch.ones_like(host_data["dones"].squeeze(-1))
+                    ),
+                },
+            },
+            batch_size=self.n_env * batch_size,
+        )
+        out["critic_observations"] = merge(device_data["critic_observations"], host_data["critic_observations"])
+        out["next"]["critic_observations"] = merge(
+            device_data["next"]["critic_observations"], host_data["next_critic_observations"]
+        )
+        return out
+
+    def stats(self) -> dict[str, float]:
+        """Sampling statistics since construction.
+
+        Returns:
+            ``device_hit_ratio`` (fraction of samples served from the device tier), ``prefetch_hit_ratio``
+            (fraction of host batches that were prefetched), ``prefetch_stall_ms`` (mean time ``sample`` waited
+            for a host batch) and ``spilled_steps`` (steps moved to the host tier).
+        """
+        num_samples = max(self.device_samples + self.host_samples, 1)
+        num_host_batches = self.prefetch_hits + self.prefetch_misses
+        return {
+            "device_hit_ratio": self.device_samples / num_samples,
+            "prefetch_hit_ratio": self.prefetch_hits / max(num_host_batches, 1),
+            "prefetch_stall_ms": 1000.0 * self.stall_time / max(num_host_batches, 1),
+            "spilled_steps": float(self.num_spilled),
+        }
@@ -1,39 +1,65 @@
 from __future__ import annotations
 
+import math
+
 import torch
 from torch import Tensor
 
 
+def _column_view(packed: Tensor, columns: slice, shape: tuple[int, ...]) -> Tensor:
+    """View the given columns of a packed buffer with per-element ``shape``."""
+    return packed[..., columns].view(*packed.shape[:-1], *shape)
+
+
 class RolloutStorage:
     """Simple buffer for storing rollout data during training.
 
     This is a lightweight storage for PPO rollout data. It stores transitions in tensors
     and provides methods for adding data and generating mini-batches.
+
+    In packed mode, all keys with the same storage dtype share one ``[num_transitions_per_env,
+    num_envs, total_width]`` buffer and each key is a column view of it. Mini-batches are then
+    produced by one gather per dtype group and epoch instead of one gather per key and mini-batch.
     """
 
-    def __init__(self, num_envs: int, num_transitions_per_env: int, device: str = "cpu"):
+    def __init__(self, num_envs: int, num_transitions_per_env: int, device: str = "cpu", packed: bool = False):
         """Initialize the rollout storage.
 
         Args:
             num_envs: Number of parallel environments
             num_transitions_per_env: Number of transitions to store per environment
             device: Device to store tensors on
+            packed: Whether to pack keys of the same storage dtype into a single buffer
         """
         self.device = device
         self.num_transitions_per_env = num_transitions_per_env
         self.num_envs = num_envs
+        self.packed = packed
         self.step = 0
 
         # Dictionary to store all data buffers
         self._buffers: dict[str, Tensor] = {}
-
-    def register(self, key: str, shape: tuple[int, ...] | list[int] = (), dtype: torch.dtype = torch.float):
+        # Data type returned in mini-batches, which may differ from the storage dtype
+        self._dtypes: dict[str, torch.dtype] = {}
+        # Packed mode: one buffer per storage dtype, and the column slice of every key in it
+        self._packed_buffers: dict[torch.dtype, Tensor] = {}
+        self._columns: dict[str, slice] = {}
+
+    def register(
+        self,
+        key: str,
+        shape: tuple[int, ...] | list[int] = (),
+        dtype: torch.dtype = torch.float,
+        storage_dtype: torch.dtype | None = None,
+    ):
         """Register a new data key to store in the buffer.
 
         Args:
             key: Name of the data field (e.g., "obs", "actions", "rewards")
             shape: Shape of each data element (excluding batch dimensions)
             dtype: Data type of the tensor
+            storage_dtype: Data type held in memory (e.g. ``torch.bfloat16`` to halve the bandwidth of
+                large observations). Mini-batches are cast back to ``dtype``. Defaults to ``dtype``.
         """
         if key in self._buffers:
             raise ValueError(f"Key '{key}' already registered")
@@ -41,10 +67,36 @@ class RolloutStorage:
         if not isinstance(shape, (list, tuple)):
             raise ValueError("shape must be a list or tuple")
 
+        storage_dtype = dtype if storage_dtype is None else storage_dtype
+        self._dtypes[key] = dtype
+        if self.packed:
+            self._register_packed(key, tuple(shape), storage_dtype)
+            return
+
         # Create buffer with shape: [num_transitions_per_env, num_envs, *shape]
-        buffer = torch.zeros((self.num_transitions_per_env, self.num_envs, *shape), dtype=dtype, device=self.device)
+        buffer = torch.zeros(
+            (self.num_transitions_per_env, self.num_envs, *shape), dtype=storage_dtype, device=self.device
+        )
         self._buffers[key] = buffer
 
+    def _register_packed(self, key: str, shape: tuple[int, ...], storage_dtype: torch.dtype):
+        width = math.prod(shape)
+        old = self._packed_buffers.get(storage_dtype)
+        offset = 0 if old is None else old.shape[-1]
+        packed = torch.zeros(
+            (self.num_transitions_per_env, self.num_envs, offset + width), dtype=storage_dtype, device=self.device
+        )
+        if old is not None:
+            packed[..., :offset] = old
+        self._packed_buffers[storage_dtype] = packed
+        self._columns[key] = slice(offset, offset + width)
+        self._buffers[key] = _column_view(packed, self._columns[key], shape)
+
+        # Registration reallocated the group buffer: rebuild the views of its other keys
+        for other, buf in self._buffers.items():
+            if other != key and buf.dtype == storage_dtype:
+                self._buffers[other] = _column_view(packed, self._columns[other], buf.shape[2:])
+
     def add(self, **data: Tensor):
         """Add a transition to the buffer.
 
@@ -114,6 +166,10 @@ class RolloutStorage:
         Yields:
             Dictionary mapping buffer keys to mini-batch tensors
         """
+        if self.packed:
+            yield from self._packed_mini_batch_generator(num_mini_batches, num_epochs)
+            return
+
         batch_size = self.num_envs * self.num_transitions_per_env
         mini_batch_size = batch_size // num_mini_batches
 
@@ -130,5 +186,35 @@ class RolloutStorage:
                 batch_indices = indices[start:end]
 
                 # Extract mini-batch for each buffer
-                mini_batch = {key: flattened[key][batch_indices] for key in self._buffers}
+                mini_batch = {key: flattened[key][batch_indices].to(self._dtypes[key]) for key in self._buffers}
+                yield mini_batch
+
+    def _packed_mini_batch_generator(self, num_mini_batches: int, num_epochs: int):
+        """Packed-mode mini-batches: one shuffle per dtype group and epoch, then contiguous row slices.
+
+        Unlike the unpacked generator, a new permutation is drawn for every epoch. The yielded tensors are
+        views into the shuffled buffer, so they are only valid until the next epoch starts.
+        """
+        batch_size = self.num_envs * self.num_transitions_per_env
+        mini_batch_size = batch_size // num_mini_batches
+        num_samples = num_mini_batches * mini_batch_size
+
+        flattened = {dtype: buf.flatten(0, 1) for dtype, buf in self._packed_buffers.items()}
+        shuffled = {
+            dtype: torch.empty((num_samples, buf.shape[-1]), dtype=dtype, device=self.device)
+            for dtype, buf in flattened.items()
+        }
+
+        for _ in range(num_epochs):
+            indices = torch.randperm(batch_size, requires_grad=False, device=self.device)[:num_samples]
+            for dtype, buf in flattened.items():
+                torch.index_select(buf, 0, indices, out=shuffled[dtype])
+
+            for i in range(num_mini_batches):
+                rows = slice(i * mini_batch_size, (i + 1) * mini_batch_size)
+                mini_batch = {}
+                for key, buf in self._buffers.items():
+                    # Views into the shuffled buffer; only keys stored in a narrower dtype are copied
+                    view = _column_view(shuffled[buf.dtype][rows], self._columns[key], buf.shape[2:])
+                    mini_batch[key] = view.to(self._dtypes[key])
                 yield mini_batch
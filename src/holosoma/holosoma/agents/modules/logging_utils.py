@@ -16,7 +16,7 @@ from rich.live import Live
 from rich.panel import Panel
 from torch.utils.tensorboard import SummaryWriter
 
-from holosoma.utils.average_meters import TensorAverageMeterDict
+from holosoma.utils.average_meters import StreamingMeanDict
 
 console = Console()
 
@@ -95,13 +95,13 @@ class LoggingHelper:
         self.num_gpus: int = num_gpus
 
         # Book keeping
-        self.ep_infos: list[dict[str, Any]] = []
-        self.raw_ep_infos: list[dict[str, Any]] = []
         self.rewbuffer: deque[float] = deque(maxlen=100)
         self.lenbuffer: deque[float] = deque(maxlen=100)
         self.cur_reward_sum: torch.Tensor = torch.zeros(num_envs, dtype=torch.float, device=self.device)
         self.cur_episode_length: torch.Tensor = torch.zeros(num_envs, dtype=torch.float, device=self.device)
-        self.episode_env_tensors: TensorAverageMeterDict = TensorAverageMeterDict()
+        # Running means of the episode, raw episode and env metrics, keyed by their logging section
+        # ("Episode/", "RawEpisode/", "Env/"), so that an epoch is read back with a single host sync.
+        self.episode_stats: StreamingMeanDict = StreamingMeanDict(device=self.device)
 
     @contextmanager
     def record_collection_time(self) -> Generator[None, None, None]:
@@ -131,10 +131,11 @@ class LoggingHelper:
         """
         if not self.is_main_process:
             return
-        self.ep_infos.append(infos["episode"])
+        # Episode statistics only hold the envs reset at this step (empty tensors if none was), so they need no mask
+        self.episode_stats.add({f"Episode/{k}": v for k, v in infos["episode"].items()})
         # Also process raw episode data if it exists
         if "raw_episode" in infos:
-            self.raw_ep_infos.append(infos["raw_episode"])
+            self.episode_stats.add({f"RawEpisode/{k}": v for k, v in infos["raw_episode"].items()})
         self.cur_reward_sum += rewards
         self.cur_episode_length += 1
 
@@ -146,7 +147,7 @@ class LoggingHelper:
             self.cur_episode_length[new_ids] = 0
 
         # Update episode environment tensors
-        self.episode_env_tensors.add(infos["to_log"])
+        self.episode_stats.add({f"Env/{k}": v for k, v in infos["to_log"].items()})
 
     def post_epoch_logging(
         self,
@@ -183,10 +184,10 @@ class LoggingHelper:
         iteration_time = self.collection_time + self.learn_time
 
         # Log episode info
-        ep_string, ep_scalars_to_log = self._log_episode_info()
+        episode_means, episode_counts = self.episode_stats.mean_and_clear(return_counts=True)
+        ep_string, ep_scalars_to_log = self._log_episode_info(episode_means, episode_counts)
 
-        env_log_dict = self.episode_env_tensors.mean_and_clear()
-        env_log_dict = {f"Env/{k}": v for k, v in env_log_dict.items()}
+        env_log_dict = {k: v for k, v in episode_means.items() if k.startswith("Env/")}
 
         fps = int(
             self.num_steps_per_env * self.num_envs * self.num_gpus / (self.collection_time + self.learn_time + 1e-8)
@@ -219,19 +220,22 @@ class LoggingHelper:
         with Live(Panel(log_string, title=self.title), refresh_per_second=4, console=console):
             pass
 
-        # Clear episode infos after logging
-        self.ep_infos.clear()
-        self.raw_ep_infos.clear()
         self.learn_time = 0.0
         self.collection_time = 0.0
 
-    def _log_episode_info(self) -> tuple[str, dict[str, float]]:
+    def _log_episode_info(
+        self, episode_means: dict[str, float], episode_counts: dict[str, int]
+    ) -> tuple[str, dict[str, float]]:
         """Log episode information and return formatted string.
 
+        Episode statistics without any finished episode in the epoch are skipped.
+
         Parameters
         ----------
-        it : int
-            Current iteration number
+        episode_means : dict[str, float]
+            Means of the episode statistics accumulated over the epoch, keyed by logging section.
+        episode_counts : dict[str, int]
+            Number of accumulated values of each key of ``episode_means``.
 
         Returns
         -------
@@ -243,37 +247,12 @@ class LoggingHelper:
         ep_string = ""
         scalars_to_log: dict[str, float] = {}
 
-        # Process regular episode info
-        if self.ep_infos:
-            for key in self.ep_infos[0]:
-                infotensor = torch.tensor([], device=self.device)
-                for ep_info in self.ep_infos:
-                    if not isinstance(ep_info[key], torch.Tensor):
-                        ep_info[key] = torch.Tensor([ep_info[key]])
-                    if len(ep_info[key].shape) == 0:
-                        ep_info[key] = ep_info[key].unsqueeze(0)
-                    infotensor = torch.cat((infotensor, ep_info[key].to(self.device)))
-                if len(infotensor) == 0:
-                    continue
-                value = torch.mean(infotensor).item()
-                scalars_to_log[f"Episode/{key}"] = value
-                ep_string += f"""{f"Mean episode {key}:":>35} {value:.4f}\n"""
-
-        # Process raw episode info if it exists
-        if self.raw_ep_infos:
-            for key in self.raw_ep_infos[0]:
-                infotensor = torch.tensor([], device=self.device)
-                for ep_info in self.raw_ep_infos:
-                    if not isinstance(ep_info[key], torch.Tensor):
-                        ep_info[key] = torch.Tensor([ep_info[key]])
-                    if len(ep_info[key].shape) == 0:
-                        ep_info[key] = ep_info[key].unsqueeze(0)
-                    infotensor = torch.cat((infotensor, ep_info[key].to(self.device)))
-                if len(infotensor) == 0:
+        for section, label in (("Episode/", "Mean episode"), ("RawEpisode/", "Mean raw episode")):
+            for log_key, value in episode_means.items():
+                if not log_key.startswith(section) or episode_counts[log_key] == 0:
                     continue
-                value = torch.mean(infotensor).item()
-                scalars_to_log[f"RawEpisode/{key}"] = value
-                ep_string += f"""{f"Mean raw episode {key}:":>35} {value:.4f}\n"""
+                scalars_to_log[log_key] = value
+                ep_string += f"""{f"{label} {log_key[len(section) :]}:":>35} {value:.4f}\n"""
 
         return ep_string, scalars_to_log
 
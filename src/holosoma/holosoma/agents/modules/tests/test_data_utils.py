@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+import torch
+
+from holosoma.agents.modules.data_utils import RolloutStorage
+
+NUM_ENVS = 6
+NUM_STEPS = 4
+
+
+def _make_storage(packed: bool, obs_storage_dtype: torch.dtype | None = None) -> RolloutStorage:
+    storage = RolloutStorage(NUM_ENVS, NUM_STEPS, packed=packed)
+    storage.register("actor_obs", shape=(5,), storage_dtype=obs_storage_dtype)
+    storage.register("dones", shape=(1,), dtype=torch.bool)
+    storage.register("actions", shape=(3,))
+    storage.register("values", shape=(1,))
+    return storage
+
+
+def _fill(storage: RolloutStorage) -> None:
+    generator = torch.Generator().manual_seed(0)
+    for step in range(NUM_STEPS):
+        storage.add(
+            actor_obs=torch.randn(NUM_ENVS, 5, generator=generator),
+            dones=torch.rand(NUM_ENVS, 1, generator=generator) < 0.5,
+            actions=torch.randn(NUM_ENVS, 3, generator=generator),
+            values=torch.full((NUM_ENVS, 1), float(step)),
+        )
+    storage["values"] = storage["values"] * 2.0
+
+
+def test_packed_storage_matches_unpacked():
+    packed = _make_storage(packed=True)
+    unpacked = _make_storage(packed=False)
+    _fill(packed)
+    _fill(unpacked)
+
+    for key in ("actor_obs", "dones", "actions", "values"):
+        assert packed[key].shape == unpacked[key].shape
+        assert packed[key].dtype == unpacked[key].dtype
+        torch.testing.assert_close(packed[key], unpacked[key], rtol=0, atol=0)
+
+
+@pytest.mark.parametrize("obs_storage_dtype", [None, torch.bfloat16])
+def test_packed_mini_batches_cover_each_sample_once_per_epoch(obs_storage_dtype):
+    storage = _make_storage(packed=True, obs_storage_dtype=obs_storage_dtype)
+    _fill(storage)
+    num_mini_batches = 3
+
+    stored_obs = storage["actor_obs"].float().flatten(0, 1)
+    stored_values = storage["values"].flatten(0, 1)
+    epoch_actions: list[list[torch.Tensor]] = [[], []]
+    for i, mb in enumerate(storage.mini_batch_generator(num_mini_batches, num_epochs=2)):
+        assert mb["actor_obs"].dtype == torch.float32
+        assert mb["dones"].dtype == torch.bool
+        # Mini-batches are views into a buffer reshuffled every epoch, so check them as they come
+        epoch_actions[i // num_mini_batches].append(mb["actions"].clone())
+        # Rows stay aligned across dtype groups
+        matches = (mb["actor_obs"][:, None, :] == stored_obs[None, :, :]).all(-1).int().argmax(-1)
+        torch.testing.assert_close(mb["values"], stored_values[matches])
+
+    for mini_batch_actions in epoch_actions:
+        actions = torch.cat(mini_batch_actions)
+        assert actions.shape == (NUM_ENVS * NUM_STEPS, 3)
+        # Every transition appears exactly once: compare the sorted first action column
+        torch.testing.assert_close(actions[:, 0].sort().values, storage["actions"][..., 0].flatten().sort().values)
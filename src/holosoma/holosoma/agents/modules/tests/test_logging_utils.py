@@ -50,7 +50,7 @@ def prefixed_logging_helper(mock_writer):
 def test_prefix_in_logging(prefixed_logging_helper, mock_writer, mock_wandb):
     """Test that the prefix is properly added to all logged metrics."""
     # Add episode info
-    prefixed_logging_helper.ep_infos = [{"test_metric": torch.tensor([1.0], device=prefixed_logging_helper.device)}]
+    prefixed_logging_helper.episode_stats.add({"Episode/test_metric": torch.tensor([1.0])})
 
     # Call post_epoch_logging with some test data
     prefixed_logging_helper.post_epoch_logging(
@@ -79,7 +79,7 @@ def test_prefix_in_logging(prefixed_logging_helper, mock_writer, mock_wandb):
 def test_no_prefix_logging(logging_helper, mock_writer, mock_wandb):
     """Test that logging works correctly without a prefix."""
     # Add episode info
-    logging_helper.ep_infos = [{"test_metric": torch.tensor([1.0], device=logging_helper.device)}]
+    logging_helper.episode_stats.add({"Episode/test_metric": torch.tensor([1.0])})
 
     # Call post_epoch_logging with some test data
     logging_helper.post_epoch_logging(
@@ -133,22 +133,56 @@ def test_episode_stats_update(logging_helper):
     assert len(logging_helper.lenbuffer) == 1
     assert logging_helper.lenbuffer[0] == 1.0  # First environment's length
 
-    # Verify episode info was stored
-    assert len(logging_helper.ep_infos) == 1
-    assert logging_helper.ep_infos[0]["test_metric"].item() == 1.0
+    # Verify episode, raw episode and env info were accumulated
+    assert logging_helper.episode_stats.mean() == {
+        "Episode/test_metric": 1.0,
+        "RawEpisode/raw_test_metric": 2.0,
+        "Env/env_metric": 2.0,
+    }
+
+
+def test_episode_stats_streaming_mean(logging_helper, mock_writer, mock_wandb):
+    """Test that episode statistics are averaged over all episodes of the epoch with constant memory."""
+    rewards = torch.zeros(2, device=logging_helper.device)
+    dones = torch.zeros(2, device=logging_helper.device)
+    episodes = [torch.tensor([1.0, 2.0]), torch.tensor([]), torch.tensor([6.0])]
+    for episode in episodes:
+        infos = {"episode": {"test_metric": episode}, "to_log": {"env_metric": episode.sum()}}
+        logging_helper.update_episode_stats(rewards, dones, infos)
+    assert logging_helper.episode_stats.sums.numel() == 2
+
+    logging_helper.post_epoch_logging(it=0, loss_dict={}, extra_log_dicts={})
+
+    logged = {call[0][0]: call[0][1] for call in mock_writer.add_scalar.call_args_list}
+    assert logged["Episode/test_metric"] == pytest.approx(3.0)
+    assert logged["Env/env_metric"] == pytest.approx(3.0)
+    assert logging_helper.episode_stats.mean() == {}
 
-    # Verify raw episode info was stored
-    assert len(logging_helper.raw_ep_infos) == 1
-    assert logging_helper.raw_ep_infos[0]["raw_test_metric"].item() == 2.0
+
+def test_episode_stats_without_finished_episodes(logging_helper, mock_writer, mock_wandb):
+    """Test that an epoch without finished episodes logs no episode statistics, env metrics are still logged."""
+    rewards = torch.zeros(2, device=logging_helper.device)
+    dones = torch.zeros(2, device=logging_helper.device)
+    for _ in range(3):
+        infos = {
+            "episode": {"rew_test": torch.tensor([])},
+            "raw_episode": {"raw_rew_test": torch.tensor([])},
+            "to_log": {"env_metric": torch.tensor([])},
+        }
+        logging_helper.update_episode_stats(rewards, dones, infos)
+
+    logging_helper.post_epoch_logging(it=0, loss_dict={}, extra_log_dicts={})
+
+    logged = {call[0][0]: call[0][1] for call in mock_writer.add_scalar.call_args_list}
+    assert not [key for key in logged if key.startswith(("Episode/", "RawEpisode/"))]
+    assert logged["Env/env_metric"] == 0.0
 
 
 def test_wandb_logging(prefixed_logging_helper, mock_wandb):
     """Test that metrics are properly logged to wandb when available."""
     # Add some episode info to avoid empty list error
-    prefixed_logging_helper.ep_infos = [{"test_metric": torch.tensor([1.0], device=prefixed_logging_helper.device)}]
-    prefixed_logging_helper.raw_ep_infos = [
-        {"raw_test_metric": torch.tensor([2.0], device=prefixed_logging_helper.device)}
-    ]
+    prefixed_logging_helper.episode_stats.add({"Episode/test_metric": torch.tensor([1.0])})
+    prefixed_logging_helper.episode_stats.add({"RawEpisode/raw_test_metric": torch.tensor([2.0])})
 
     # Call post_epoch_logging with some test data
     prefixed_logging_helper.post_epoch_logging(
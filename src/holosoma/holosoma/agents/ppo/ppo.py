@@ -21,6 +21,8 @@ from holosoma.agents.modules.module_utils import (
     setup_ppo_actor_module,
     setup_ppo_critic_module,
 )
+from holosoma.agents.ppo.gae import GAE_FUNCTIONS
+from holosoma.agents.ppo.rollout import GraphedRolloutStep
 from holosoma.config_types.algo import PPOConfig
 from holosoma.envs.base_task.base_task import BaseTask
 from holosoma.utils.helpers import instantiate
@@ -222,14 +224,20 @@ class PPO(BaseAlgo):
         return torch.zeros(1, actor_obs_dim, device=self.device)
 
     def _setup_storage(self):
-        self.storage = RolloutStorage(self.env.num_envs, self.config.num_steps_per_env, device=self.device)
+        self.storage = RolloutStorage(
+            self.env.num_envs,
+            self.config.num_steps_per_env,
+            device=self.device,
+            packed=self.config.packed_minibatches,
+        )
+        obs_storage_dtype = getattr(torch, self.config.obs_storage_dtype)
         actor_obs_dim = self._get_obs_dim(self.actor_obs_keys)
         print(f"Registering key: actor_obs with shape: {actor_obs_dim}")
-        self.storage.register("actor_obs", shape=(actor_obs_dim,), dtype=torch.float)
+        self.storage.register("actor_obs", shape=(actor_obs_dim,), dtype=torch.float, storage_dtype=obs_storage_dtype)
 
         critic_obs_dim = self._get_obs_dim(self.critic_obs_keys)
         print(f"Registering key: critic_obs with shape: {critic_obs_dim}")
-        self.storage.register("critic_obs", shape=(critic_obs_dim,), dtype=torch.float)
+        self.storage.register("critic_obs", shape=(critic_obs_dim,), dtype=torch.float, storage_dtype=obs_storage_dtype)
 
         # Register others based on Minibatch structure
         minibatch_keys = [
@@ -246,6 +254,18 @@ class PPO(BaseAlgo):
         for key, shape, dtype in minibatch_keys:
             self.storage.register(key, shape=shape, dtype=dtype)
 
+        self.graphed_rollout_step: GraphedRolloutStep | None = None
+        if self.config.graphed_rollout:
+            self.graphed_rollout_step = GraphedRolloutStep(
+                self.actor,
+                self.critic,
+                self.storage,
+                actor_obs_dim=actor_obs_dim,
+                critic_obs_dim=critic_obs_dim,
+                gamma=self.config.gamma,
+                device=self.device,
+            )
+
     def _eval_mode(self):
         self.actor.eval()
         self.critic.eval()
@@ -296,6 +316,9 @@ class PPO(BaseAlgo):
             self.export(onnx_file_path=os.path.join(self.log_dir, f"model_{self.current_learning_iteration:05d}.onnx"))
 
     def _rollout_step(self, obs_dict):
+        if self.graphed_rollout_step is not None:
+            return self._graphed_rollout_step(obs_dict, self.graphed_rollout_step)
+
         with torch.inference_mode():
             for _ in range(self.config.num_steps_per_env):
                 # Environment step
@@ -341,34 +364,64 @@ class PPO(BaseAlgo):
                     # Update episode stats using logging helper
                     self.logging_helper.update_episode_stats(rewards, dones, infos)
 
-            # Return / Advantage computation
-            last_critic_obs = torch.cat([obs_dict[k] for k in self.critic_obs_keys], dim=1)
-            last_values = self.critic.evaluate({"critic_obs": last_critic_obs}).detach().to(self.device)
-            returns, advantages = self._compute_returns_and_advantages(
-                last_values,
-                self.storage["values"].to(self.device),
-                self.storage["dones"].to(self.device),
-                self.storage["rewards"].to(self.device),
-            )
+            self._finish_rollout(obs_dict)
+
+        return obs_dict
 
-            self.storage["returns"] = returns
-            self.storage["advantages"] = advantages
+    def _graphed_rollout_step(self, obs_dict, rollout_step: GraphedRolloutStep):
+        """Rollout without host syncs; see :class:`GraphedRolloutStep`."""
+        with torch.inference_mode():
+            rollout_step.begin()
+            for _ in range(self.config.num_steps_per_env):
+                actions = rollout_step.act(
+                    [obs_dict[k] for k in self.actor_obs_keys], [obs_dict[k] for k in self.critic_obs_keys]
+                )
+
+                obs_dict, rewards, dones, infos = self.env.step({"actions": actions})
+
+                for obs_key in obs_dict:
+                    obs_dict[obs_key] = obs_dict[obs_key].to(self.device)
+                rewards, dones = rewards.to(self.device), dones.to(self.device)
+
+                final_observations = infos.get("final_observations")
+                rollout_step.record(
+                    rewards,
+                    dones,
+                    infos["time_outs"].to(self.device),
+                    [final_observations[k] for k in self.critic_obs_keys] if final_observations else None,
+                )
+
+                # Reset actor and critic for completed envs
+                self.actor.reset(dones)
+                self.critic.reset(dones)
+
+                if self.log_dir is not None:
+                    # Update episode stats using logging helper
+                    self.logging_helper.update_episode_stats(rewards, dones, infos)
+
+            self._finish_rollout(obs_dict)
 
         return obs_dict
 
+    def _finish_rollout(self, obs_dict):
+        # Return / Advantage computation
+        last_critic_obs = torch.cat([obs_dict[k] for k in self.critic_obs_keys], dim=1)
+        last_values = self.critic.evaluate({"critic_obs": last_critic_obs}).detach().to(self.device)
+        returns, advantages = self._compute_returns_and_advantages(
+            last_values,
+            self.storage["values"].to(self.device),
+            self.storage["dones"].to(self.device),
+            self.storage["rewards"].to(self.device),
+        )
+
+        self.storage["returns"] = returns
+        self.storage["advantages"] = advantages
+
     def _compute_returns_and_advantages(self, last_values, values, dones, rewards):
-        advantage = 0
-        returns = torch.zeros_like(values)
-        num_steps = returns.shape[0]
-        for step in reversed(range(num_steps)):
-            if step == num_steps - 1:
-                next_values = last_values
-            else:
-                next_values = values[step + 1]
-            next_is_not_terminal = 1.0 - dones[step].float()
-            delta = rewards[step] + next_is_not_terminal * self.config.gamma * next_values - values[step]
-            advantage = delta + next_is_not_terminal * self.config.gamma * self.config.lam * advantage
-            returns[step] = advantage + values[step]
+        compute_gae = GAE_FUNCTIONS[self.config.gae_mode]
+        advantages = compute_gae(last_values, values, dones, rewards, self.config.gamma, self.config.lam)
+        returns = advantages + values
+        # Recover advantages from returns as before, so the loop mode reproduces the original rounding
         advantages = returns - values
 
         if self.is_multi_gpu:
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import torch
+from loguru import logger
+
+from holosoma.agents.modules.data_utils import RolloutStorage
+from holosoma.agents.modules.ppo_modules import PPOActor, PPOCritic
+
+
+class GraphedRolloutStep:
+    """Host-sync-free PPO rollout step, optionally captured in CUDA graphs.
+
+    The per-step policy work is split around ``env.step`` into two phases that only
+    read and write static buffers:
+
+    * :meth:`act` runs the actor and critic on the static observations and writes
+      observations, actions, values and action statistics into the rollout storage.
+    * :meth:`record` evaluates the critic on the final observations of every env,
+      adds the discounted bootstrap value to timed-out envs through a mask (instead of
+      a Python-level ``time_outs.any()`` check) and writes rewards and dones.
+
+    The storage row is selected by a step counter that lives on the device, so the
+    same captured graphs can be replayed for every step of the rollout. On CPU, or
+    when ``use_cuda_graph`` is ``False``, both phases run eagerly with the same
+    structure.
+
+    Args:
+        actor: PPO actor module.
+        critic: PPO critic module.
+        storage: Rollout storage with the keys registered by ``PPO._setup_storage``.
+        actor_obs_dim: Dimension of the concatenated actor observations.
+        critic_obs_dim: Dimension of the concatenated critic observations.
+        gamma: Discount factor used for the timeout bootstrap.
+        device: Device of the rollout buffers.
+        use_cuda_graph: Whether to capture both phases in CUDA graphs (CUDA devices only).
+    """
+
+    def __init__(
+        self,
+        actor: PPOActor,
+        critic: PPOCritic,
+        storage: RolloutStorage,
+        actor_obs_dim: int,
+        critic_obs_dim: int,
+        gamma: float,
+        device: str,
+        use_cuda_graph: bool = True,
+    ):
+        self.actor = actor
+        self.critic = critic
+        self.storage = storage
+        self.gamma = gamma
+        self.device = device
+        num_envs = storage.num_envs
+
+        # Static inputs
+        self.actor_obs = torch.zeros(num_envs, actor_obs_dim, device=device)
+        self.critic_obs = torch.zeros(num_envs, critic_obs_dim, device=device)
+        self.final_critic_obs = torch.zeros(num_envs, critic_obs_dim, device=device)
+        self.rewards = torch.zeros(num_envs, device=device)
+        self.dones = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self.time_outs = torch.zeros(num_envs, dtype=torch.bool, device=device)
+
+        # Static outputs
+        self.actions = torch.zeros(num_envs, storage["actions"].shape[-1], device=device)
+
+        # Storage row written by the current step, kept on device so graphs can be replayed
+        self._step_index = torch.zeros(1, dtype=torch.long, device=device)
+
+        self.use_cuda_graph = use_cuda_graph and torch.device(device).type == "cuda"
+        if self.use_cuda_graph and actor.min_mean_noise_std:
+            # ``min_mean_noise_std`` branches on a tensor value, which cannot be captured
+            logger.warning("CUDA graph rollout does not support min_mean_noise_std, running eagerly")
+            self.use_cuda_graph = False
+        self._act_graph: torch.cuda.CUDAGraph | None = None
+        self._record_graph: torch.cuda.CUDAGraph | None = None
+
+    def _write(self, key: str, value: torch.Tensor) -> None:
+        buffer = self.storage[key]
+        buffer.index_copy_(0, self._step_index, value.unsqueeze(0).to(buffer.dtype))
+
+    def _act(self) -> None:
+        actions = self.actor.act({"actor_obs": self.actor_obs})
+        values = self.critic.evaluate({"critic_obs": self.critic_obs})
+        self.actions.copy_(actions)
+
+        self._write("actor_obs", self.actor_obs)
+        self._write("critic_obs", self.critic_obs)
+        self._write("actions", actions)
+        self._write("values", values)
+        self._write("actions_log_prob", self.actor.get_actions_log_prob(actions).unsqueeze(1))
+        self._write("action_mean", self.actor.action_mean)
+        self._write("action_sigma", self.actor.action_std)
+
+    def _record(self) -> None:
+        # Bootstrap value for timeouts, masked instead of branching on ``time_outs.any()``
+        final_values = self.critic.evaluate({"critic_obs": self.final_critic_obs}).squeeze(1)
+        final_rewards = torch.where(self.time_outs, self.gamma * final_values, torch.zeros_like(final_values))
+
+        self._write("rewards", (self.rewards + final_rewards).view(-1, 1))
+        self._write("dones", self.dones.view(-1, 1))
+        self._step_index += 1
+
+    def _capture(self) -> None:
+        logger.info("Capturing PPO rollout step in CUDA graphs")
+        side_stream = torch.cuda.Stream(device=self.device)
+        side_stream.wait_stream(torch.cuda.current_stream(self.device))
+        with torch.cuda.stream(side_stream):
+            # Warm up allocations and lazy initialization outside of capture
+            for _ in range(3):
+                self._step_index.zero_()
+                self._act()
+                self._record()
+        torch.cuda.current_stream(self.device).wait_stream(side_stream)
+
+        self._act_graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self._act_graph):
+            self._act()
+        self._record_graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self._record_graph, pool=self._act_graph.pool()):
+            self._record()
+
+    def begin(self) -> None:
+        """Start a new rollout at the first storage row."""
+        if self.use_cuda_graph and self._act_graph is None:
+            self._capture()
+        self._step_index.zero_()
+
+    def act(self, actor_obs: list[torch.Tensor], critic_obs: list[torch.Tensor]) -> torch.Tensor:
+        """Run the policy and critic for the current observations.
+
+        Args:
+            actor_obs: Actor observation tensors, concatenated along the last dimension.
+            critic_obs: Critic observation tensors, concatenated along the last dimension.
+
+        Returns:
+            Sampled actions. This is a static buffer that is overwritten by the next call.
+        """
+        torch.cat(actor_obs, dim=1, out=self.actor_obs)
+        torch.cat(critic_obs, dim=1, out=self.critic_obs)
+        if self._act_graph is not None:
+            self._act_graph.replay()
+        else:
+            self._act()
+        return self.actions
+
+    def record(
+        self,
+        rewards: torch.Tensor,
+        dones: torch.Tensor,
+        time_outs: torch.Tensor,
+        final_critic_obs: list[torch.Tensor] | None,
+    ) -> None:
+        """Store the outcome of ``env.step`` and advance to the next storage row.
+
+        Args:
+            rewards: Rewards of shape ``[num_envs]``.
+            dones: Done flags of shape ``[num_envs]``.
+            time_outs: Timeout flags of shape ``[num_envs]``.
+            final_critic_obs: Critic observation tensors of the final state of reset envs, or
+                ``None`` if no env has been reset yet (timeouts are then all ``False``).
+        """
+        self.rewards.copy_(rewards)
+        self.dones.copy_(dones)
+        self.time_outs.copy_(time_outs)
+        if final_critic_obs is not None:
+            torch.cat(final_critic_obs, dim=1, out=self.final_critic_obs)
+        if self._record_graph is not None:
+            self._record_graph.replay()
+        else:
+            self._record()
+        self.storage.step += 1
@@ -0,0 +1,76 @@
+"""Equivalence tests for the GAE implementations."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from holosoma.agents.ppo.gae import GAE_FUNCTIONS, compute_gae_loop
+from holosoma.agents.ppo.ppo import PPO
+
+GAMMA = 0.99
+LAM = 0.95
+
+
+def _rollout(num_steps, num_envs, dtype=torch.float32, seed=0):
+    generator = torch.Generator().manual_seed(seed)
+    values = torch.randn(num_steps, num_envs, 1, generator=generator, dtype=dtype)
+    rewards = torch.randn(num_steps, num_envs, 1, generator=generator, dtype=dtype)
+    dones = torch.rand(num_steps, num_envs, 1, generator=generator) < 0.1
+    last_values = torch.randn(num_envs, 1, generator=generator, dtype=dtype)
+    return last_values, values, dones, rewards
+
+
+@pytest.mark.parametrize("mode", ["jit", "scan"])
+@pytest.mark.parametrize("num_steps", [1, 5, 24, 33])
+def test_gae_matches_loop(mode, num_steps):
+    args = _rollout(num_steps, 64, dtype=torch.float64)
+    expected = compute_gae_loop(*args, GAMMA, LAM)
+    actual = GAE_FUNCTIONS[mode](*args, GAMMA, LAM)
+    torch.testing.assert_close(actual, expected, rtol=1e-12, atol=1e-12)
+
+    args = _rollout(num_steps, 64, dtype=torch.float32)
+    expected = compute_gae_loop(*args, GAMMA, LAM)
+    actual = GAE_FUNCTIONS[mode](*args, GAMMA, LAM)
+    torch.testing.assert_close(actual, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_gae_done_cuts_bootstrap():
+    last_values, values, dones, rewards = _rollout(4, 2)
+    dones.zero_()
+    dones[1] = True
+    advantages = GAE_FUNCTIONS["scan"](last_values, values, dones, rewards, GAMMA, LAM)
+    # A done at step 1 means steps 0-1 are independent of anything after step 1
+    values[2:] += 100.0
+    rewards[2:] -= 100.0
+    last_values += 100.0
+    changed = GAE_FUNCTIONS["scan"](last_values, values, dones, rewards, GAMMA, LAM)
+    torch.testing.assert_close(changed[:2], advantages[:2])
+
+
+@pytest.mark.parametrize("is_multi_gpu", [False, True])
+def test_ppo_gae_modes_with_normalization(is_multi_gpu):
+    if is_multi_gpu:
+        # Single-process group to exercise the all-reduce normalization path on CPU
+        os.environ.setdefault("MASTER_ADDR", "127.0.0.1")
+        os.environ.setdefault("MASTER_PORT", "29517")
+        torch.distributed.init_process_group(backend="gloo", rank=0, world_size=1)
+    try:
+        args = _rollout(24, 128)
+        results = {}
+        for mode in GAE_FUNCTIONS:
+            ppo = PPO.__new__(PPO)
+            ppo.config = SimpleNamespace(gae_mode=mode, gamma=GAMMA, lam=LAM)
+            ppo.is_multi_gpu = is_multi_gpu
+            ppo.gpu_world_size = 1
+            results[mode] = ppo._compute_returns_and_advantages(*args)
+    finally:
+        if is_multi_gpu:
+            torch.distributed.destroy_process_group()
+
+    returns, advantages = results["loop"]
+    assert advantages.mean().abs() < 1e-5
+    for mode in ("jit", "scan"):
+        torch.testing.assert_close(results[mode][0], returns, rtol=1e-5, atol=1e-5)
+        torch.testing.assert_close(results[mode][1], advantages, rtol=1e-4, atol=1e-4)
@@ -0,0 +1,120 @@
+"""Tests for the host-sync-free PPO rollout step."""
+
+import pytest
+import torch
+
+from holosoma.agents.modules.data_utils import RolloutStorage
+from holosoma.agents.modules.module_utils import setup_ppo_actor_module, setup_ppo_critic_module
+from holosoma.agents.ppo.rollout import GraphedRolloutStep
+from holosoma.config_types.algo import LayerConfig, ModuleConfig
+
+NUM_ENVS = 16
+NUM_STEPS = 6
+NUM_ACT = 3
+OBS_DIMS = {"actor_obs": 5, "critic_obs": 7}
+GAMMA = 0.99
+
+
+def _make_storage(packed=False):
+    storage = RolloutStorage(NUM_ENVS, NUM_STEPS, packed=packed)
+    storage.register("actor_obs", shape=(OBS_DIMS["actor_obs"],))
+    storage.register("critic_obs", shape=(OBS_DIMS["critic_obs"],))
+    for key, shape, dtype in [
+        ("actions", (NUM_ACT,), torch.float),
+        ("rewards", (1,), torch.float),
+        ("dones", (1,), torch.bool),
+        ("values", (1,), torch.float),
+        ("actions_log_prob", (1,), torch.float),
+        ("action_mean", (NUM_ACT,), torch.float),
+        ("action_sigma", (NUM_ACT,), torch.float),
+    ]:
+        storage.register(key, shape=shape, dtype=dtype)
+    return storage
+
+
+def _make_modules():
+    torch.manual_seed(0)
+    layer_config = LayerConfig(hidden_dims=[32, 32])
+    actor = setup_ppo_actor_module(
+        obs_dim_dict=OBS_DIMS,
+        module_config=ModuleConfig(
+            type="MLP", input_dim=["actor_obs"], output_dim=["robot_action_dim"], layer_config=layer_config
+        ),
+        num_actions=NUM_ACT,
+        init_noise_std=0.8,
+        device="cpu",
+        history_length={"actor_obs": 1, "critic_obs": 1},
+    )
+    critic = setup_ppo_critic_module(
+        obs_dim_dict=OBS_DIMS,
+        module_config=ModuleConfig(type="MLP", input_dim=["critic_obs"], output_dim=[1], layer_config=layer_config),
+        device="cpu",
+        history_length={"actor_obs": 1, "critic_obs": 1},
+    )
+    return actor, critic
+
+
+def _env_steps():
+    generator = torch.Generator().manual_seed(1)
+    steps = []
+    for step in range(NUM_STEPS):
+        obs = {key: torch.randn(NUM_ENVS, dim, generator=generator) for key, dim in OBS_DIMS.items()}
+        dones = torch.rand(NUM_ENVS, generator=generator) < 0.3
+        time_outs = dones & (torch.rand(NUM_ENVS, generator=generator) < 0.5)
+        final = {key: torch.randn(NUM_ENVS, dim, generator=generator) for key, dim in OBS_DIMS.items()}
+        rewards = torch.randn(NUM_ENVS, generator=generator)
+        if step == 0:
+            # No env has been reset yet, so there are no final observations
+            time_outs.zero_()
+            final = None
+        steps.append((obs, rewards, dones.long(), time_outs, final))
+    return steps
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_graphed_rollout_matches_reference_loop(packed):
+    actor, critic = _make_modules()
+    steps = _env_steps()
+    initial_obs = {key: torch.ones(NUM_ENVS, dim) for key, dim in OBS_DIMS.items()}
+
+    # Reference: the per-step loop of PPO._rollout_step
+    reference = _make_storage()
+    torch.manual_seed(2)
+    with torch.inference_mode():
+        obs = initial_obs
+        for next_obs, rewards, dones, time_outs, final in steps:
+            actions = actor.act({"actor_obs": obs["actor_obs"]})
+            values = critic.evaluate({"critic_obs": obs["critic_obs"]})
+            final_rewards = torch.zeros_like(rewards)
+            if time_outs.any():
+                final_values = critic.evaluate({"critic_obs": final["critic_obs"]})
+                final_rewards += GAMMA * torch.squeeze(final_values * time_outs.unsqueeze(1), 1)
+            reference.add(
+                actor_obs=obs["actor_obs"],
+                critic_obs=obs["critic_obs"],
+                actions=actions,
+                values=values,
+                actions_log_prob=actor.get_actions_log_prob(actions).unsqueeze(1),
+                action_mean=actor.action_mean,
+                action_sigma=actor.action_std,
+                rewards=(rewards + final_rewards).view(-1, 1),
+                dones=dones.view(-1, 1),
+            )
+            obs = next_obs
+
+    storage = _make_storage(packed)
+    rollout_step = GraphedRolloutStep(
+        actor, critic, storage, OBS_DIMS["actor_obs"], OBS_DIMS["critic_obs"], GAMMA, "cpu"
+    )
+    torch.manual_seed(2)
+    with torch.inference_mode():
+        rollout_step.begin()
+        obs = initial_obs
+        for next_obs, rewards, dones, time_outs, final in steps:
+            rollout_step.act([obs["actor_obs"]], [obs["critic_obs"]])
+            rollout_step.record(rewards, dones, time_outs, [final["critic_obs"]] if final else None)
+            obs = next_obs
+
+    assert storage.step == reference.step == NUM_STEPS
+    for key in ["actor_obs", "critic_obs", "actions", "values", "actions_log_prob", "rewards", "dones"]:
+        torch.testing.assert_close(storage[key], reference[key], rtol=0, atol=0)
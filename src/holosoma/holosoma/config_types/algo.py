@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import field
-from typing import Any, List, Union
+from typing import Any, List, Literal, Union
 
 from pydantic.dataclasses import dataclass
 
@@ -126,6 +126,10 @@ class PPOConfig:
     lam: float = 0.95
     """GAE lambda parameter."""
 
+    gae_mode: Literal["loop", "jit", "scan"] = "loop"
+    """GAE implementation: ``loop`` (Python loop over steps), ``jit`` (TorchScript loop) or ``scan``
+    (log-depth parallel scan)."""
+
     value_loss_coef: float = 1.0
     """Value loss coefficient."""
 
@@ -180,6 +184,18 @@ class PPOConfig:
     init_at_random_ep_len: bool = True
     """Whether to initialize at random episode length."""
 
+    graphed_rollout: bool = False
+    """Whether to collect rollouts without host syncs, capturing the policy/critic forward and storage writes of
+    each step in CUDA graphs (runs the same sync-free step eagerly on CPU)."""
+
+    packed_minibatches: bool = False
+    """Whether to pack rollout storage into one buffer per dtype, shuffle it once per epoch and yield
+    minibatches as contiguous row slices (draws a new permutation every epoch)."""
+
+    obs_storage_dtype: Literal["float32", "float16", "bfloat16"] = "float32"
+    """Dtype used to store actor/critic observations in the rollout storage. Minibatches are cast back to
+    float32; lower precision reduces memory bandwidth at large env counts."""
+
     eval_callbacks: Any = None
     """Evaluation callbacks configuration."""
 
@@ -206,6 +222,24 @@ class FastSACConfig:
     buffer_size: int = 1024
     """the replay memory buffer size per environment"""
 
+    compact_replay_buffer: bool = False
+    """whether to store each observation stream once in the replay buffer (next observations are only kept at
+    episode boundaries) with bool done/truncation flags"""
+
+    replay_obs_dtype: Literal["fp32", "bf16", "fp16"] = "fp32"
+    """the dtype of the observations stored in the compact replay buffer ("fp32", "bf16" or "fp16")"""
+
+    replay_boundary_capacity: int = 64
+    """the number of episode-boundary next observations kept per environment by the compact replay buffer"""
+
+    replay_host_buffer_size: int = 0
+    """the number of older transitions per environment spilled from the device replay buffer to host memory
+    (0 keeps the whole buffer on device; only supported with num_steps == 1)"""
+
+    replay_host_storage: str = "pinned"
+    """where spilled transitions are kept: "pinned" host memory or a "memmap" temporary file in the log directory,
+    deleted when training ends"""
+
     num_steps: int = 1
     """the number of steps to use for the multi-step return"""
 
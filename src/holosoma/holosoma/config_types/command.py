@@ -88,7 +88,9 @@ class MotionConfig:
     """
 
     motion_file: str
-    """Motion file (.npz) that contains motion_clips to track. """
+    """Motion file (.npz, or .hsmotion from ``python -m holosoma.convert_motions``) that contains motion_clips to
+    track, or a directory whose motion files (sorted by name) are all loaded into one motion library; every env then
+    tracks its own clip."""
 
     body_name_ref: list[str]
     """Body name of the reference frame (in general, torso_link). """
@@ -99,6 +101,16 @@ class MotionConfig:
     use_adaptive_timesteps_sampler: bool = False
     """During training, whether to prioritize training on motion segments where the robot fails often."""
 
+    motion_clip_weights: list[float] | None = None
+    """Relative sampling weight of every clip of the motion library, in motion file order.
+    If None, clips are sampled proportionally to their length (uniformly over all frames)."""
+
+    motion_storage_device: str | None = None
+    """Device holding the motion library frames. If None, the simulation device is used;
+    "cpu" keeps large datasets in host memory and copies the current frames to the device every step.
+    A .hsmotion file converted for the robot and loaded without default-pose transitions is then used directly
+    from the memory-mapped file."""
+
     start_at_timestep_zero_prob: float = 0.2
     """Probability of starting at timestep zero."""
 
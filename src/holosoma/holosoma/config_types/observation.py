@@ -54,3 +54,10 @@ class ObservationManagerCfg:
 
     clip_observations: float = 100.0
     """Global observation clipping threshold (applied to all observations)."""
+
+    fused: bool = False
+    """If ``True``, write terms into preallocated group buffers and apply noise, scale and clipping
+    (including ``clip_observations``) as one fused op per group."""
+
+    compile: bool = False
+    """Whether to wrap the fused group op with ``torch.compile`` (only used when ``fused`` is ``True``)."""
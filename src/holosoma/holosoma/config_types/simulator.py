@@ -23,6 +23,9 @@ class MujocoBackend(str, Enum):
     WARP = "warp"
     """GPU-accelerated multi-environment backend."""
 
+    THREADED = "threaded"
+    """CPU-based multi-environment backend stepping environments on a thread pool."""
+
 
 @dataclass(frozen=True)
 class MujocoWarpConfig:
@@ -58,6 +61,18 @@ class MujocoWarpConfig:
     """
 
 
+@dataclass(frozen=True)
+class MujocoThreadedConfig:
+    """Configuration for the MuJoCo threaded CPU backend."""
+
+    num_threads: int | None = None
+    """Number of worker threads stepping environments (default: all CPU cores).
+
+    Capped at the number of environments. Environments are split into one
+    contiguous chunk per thread.
+    """
+
+
 @dataclass(frozen=True)
 class ResetManagerConfig:
     """Configuration for the reset event manager."""
@@ -518,6 +533,7 @@ class SimulatorInitConfig:
     Determines which MuJoCo backend to use for physics simulation:
     - 'classic': CPU-based single environment (backward compatible, default)
     - 'warp': GPU-accelerated multi-environment with mujoco_warp
+    - 'threaded': CPU multi-environment, one MjData per environment stepped on a thread pool
 
     This setting only applies when using the MuJoCo simulator (name='mujoco').
     For other simulators (isaacgym, isaacsim), this field is ignored.
@@ -525,6 +541,7 @@ class SimulatorInitConfig:
     Command line usage:
         --simulator.config.mujoco-backend=warp
         --simulator.config.mujoco-backend=classic
+        --simulator.config.mujoco-backend=threaded
 
     Or use the syntactic sugar configs:
         simulator:mujoco   (uses classic backend)
@@ -543,6 +560,15 @@ class SimulatorInitConfig:
         --simulator.config.mujoco-warp.njmax-per-env=1024
     """
 
+    mujoco_threaded: MujocoThreadedConfig = field(default_factory=MujocoThreadedConfig)
+    """MuJoCo threaded CPU backend configuration.
+
+    Only used when mujoco_backend='threaded'.
+
+    Command line usage:
+        --simulator.config.mujoco-threaded.num-threads=16
+    """
+
     bridge: BridgeConfig = field(default_factory=BridgeConfig)
     """Robot SDK bridge configuration."""
 
@@ -121,6 +121,13 @@ class VideoConfig:
     record_env_id: int = 0
     """Which environment to record (for multi-environment simulations)."""
 
+    record_env_ids: list[int] = field(default_factory=list)
+    """Additional environments recorded together with ``record_env_id`` (MuJoCo only). All of them are rendered at
+    every captured step, over the recorded episodes of ``record_env_id``."""
+
+    tile_recorded_envs: bool = False
+    """Whether to tile the frames of all recorded environments into one video instead of one video per environment."""
+
     camera: CameraConfig = field(default_factory=CartesianCameraConfig)
     """Camera configuration with automatic type discrimination based on 'type' field.
 
@@ -136,7 +143,11 @@ class VideoConfig:
     """Target FPS for threaded recording."""
 
     recording_queue_size: int = 100
-    """Maximum size of the recording queue for threaded mode."""
+    """Maximum number of captured frames waiting to be encoded. Frames are encoded while recording, so this bounds
+    the memory used by video recording independently of the episode length."""
+
+    drop_frames_when_queue_full: bool = False
+    """Whether to drop frames when the encoder falls behind and the queue is full, instead of blocking capture."""
 
     vertical_fov: float = 45.0
     """Camera vertical field of view in degrees. Used for approximate consistency across simulators."""
@@ -0,0 +1,125 @@
+"""Convert ``.npz`` motion clips into a native ``.hsmotion`` motion dataset.
+
+The output stores every clip uncompressed in the packed layout used for training, with quaternions already in xyzw.
+With ``--robot`` the bodies and joints are stored in that robot's order, so training memory-maps the file without
+any copy or reordering (see :mod:`holosoma.utils.motion_format`).
+
+Example:
+    python -m holosoma.convert_motions --inputs data/lafan/ --output data/lafan.hsmotion --robot g1_29dof
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import tyro
+from loguru import logger
+
+from holosoma.utils.file_cache import cached_open
+from holosoma.utils.motion_format import (
+    FAKE_BODY_NAME_ALIASES,
+    MOTION_FILE_SUFFIX,
+    MotionFileHeader,
+    field_layout,
+    npz_motion_fields,
+    write_motion_file,
+)
+from holosoma.utils.path import resolve_data_file_path
+
+
+@dataclass
+class ConvertMotionsConfig:
+    """Motion conversion configuration."""
+
+    inputs: tuple[str, ...]
+    """``.npz`` motion files, or directories whose ``.npz`` files are converted in name order."""
+
+    output: str
+    """Output ``.hsmotion`` file."""
+
+    robot: str | None = None
+    """Robot (key of ``holosoma.config_values.robot.DEFAULTS``) whose body/joint order is stored.
+    If None, the bodies and joints of the first motion file are stored in its order."""
+
+
+def _motion_files(inputs: tuple[str, ...]) -> list[Path]:
+    motion_files = []
+    for item in inputs:
+        path = Path(resolve_data_file_path(item))
+        motion_files.extend(sorted(path.glob("*.npz")) if path.is_dir() else [path])
+    assert motion_files, f"No .npz motion files found in {inputs}"
+    return motion_files
+
+
+def _robot_names(robot: str) -> tuple[list[str], list[str]]:
+    from holosoma.config_values.robot import DEFAULTS
+
+    robot_config = DEFAULTS[robot]
+    return [FAKE_BODY_NAME_ALIASES.get(name, name) for name in robot_config.body_names], robot_config.dof_names
+
+
+def _index_of(names: list[str], available: list[str], motion_file: Path) -> np.ndarray:
+    missing = [name for name in names if name not in available]
+    assert not missing, f"{missing} are missing from {motion_file}"
+    return np.array([available.index(name) for name in names], dtype=np.int64)
+
+
+def _load_clip(
+    motion_file: Path, body_names: list[str] | None, joint_names: list[str] | None
+) -> tuple[float, list[str], list[str], dict[str, np.ndarray]]:
+    """Load a ``.npz`` clip as ``(fps, body_names, joint_names, fields)``, keeping the given bodies and joints."""
+    logger.info(f"Converting {motion_file}")
+    with cached_open(str(motion_file), "rb") as f, np.load(f) as data:
+        fps = float(np.asarray(data["fps"]).reshape(-1)[0])
+        motion_body_names = data["body_names"].tolist()
+        motion_joint_names = data["joint_names"].tolist()
+        body_names = motion_body_names if body_names is None else body_names
+        joint_names = motion_joint_names if joint_names is None else joint_names
+        body_idx = _index_of(body_names, motion_body_names, motion_file)
+        joint_idx = _index_of(joint_names, motion_joint_names, motion_file)
+        fields = npz_motion_fields(data, body_idx, joint_idx)
+    return fps, body_names, joint_names, fields
+
+
+def _pack(fields: dict[str, np.ndarray]) -> np.ndarray:
+    return np.concatenate([value.reshape(value.shape[0], -1) for value in fields.values()], axis=1)
+
+
+def convert_motions(config: ConvertMotionsConfig) -> MotionFileHeader:
+    """Convert the motion files of ``config`` and write the ``.hsmotion`` dataset."""
+    assert config.output.endswith(MOTION_FILE_SUFFIX), f"Output must be a {MOTION_FILE_SUFFIX} file"
+    motion_files = _motion_files(config.inputs)
+
+    body_names, joint_names = _robot_names(config.robot) if config.robot is not None else (None, None)
+    fps, body_names, joint_names, first_fields = _load_clip(motion_files[0], body_names, joint_names)
+    layout = field_layout(first_fields)
+
+    def clips() -> Iterator[tuple[str, np.ndarray]]:
+        yield motion_files[0].stem, _pack(first_fields)
+        for motion_file in motion_files[1:]:
+            clip_fps, _, _, fields = _load_clip(motion_file, body_names, joint_names)
+            assert clip_fps == fps, f"{motion_file} has fps {clip_fps}, expected {fps}"
+            assert field_layout(fields) == layout, f"{motion_file} does not have the fields of {motion_files[0]}"
+            yield motion_file.stem, _pack(fields)
+
+    header = write_motion_file(
+        config.output,
+        fps=fps,
+        body_names=body_names,
+        joint_names=joint_names,
+        layout=layout,
+        clips=clips(),
+    )
+    logger.info(f"Wrote {len(header.clip_names)} clip(s), {header.num_frames} frames to {config.output}")
+    return header
+
+
+def main() -> None:
+    convert_motions(tyro.cli(ConvertMotionsConfig))
+
+
+if __name__ == "__main__":
+    main()
@@ -480,6 +480,8 @@ class BaseTask:
             final_store[obs_key][env_ids] = values[env_ids]
 
     def _clip_observations(self):
+        if self.observation_manager.applies_global_clip:
+            return
         clip_limit = self.observation_manager.cfg.clip_observations
         for obs_key, obs_val in self.obs_buf_dict.items():
             self.obs_buf_dict[obs_key] = torch.clip(obs_val, -clip_limit, clip_limit)
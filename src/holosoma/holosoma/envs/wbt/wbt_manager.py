@@ -239,4 +239,4 @@ class WholeBodyTrackingManager(BaseTask):
 
         time.sleep(dt)
 
-        return motion_command.time_steps[0].item() >= motion_command.motion.time_step_total - 2
+        return motion_command.time_steps[0].item() >= motion_command.time_step_totals[0].item() - 2
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import math
 import re
-from typing import Any, List
+from pathlib import Path
+from typing import Any, Iterable, List, Tuple
 
 import numpy as np
 import torch
@@ -11,43 +11,62 @@ from loguru import logger
 from holosoma.config_types.command import MotionConfig, NoiseToInitialPoseConfig
 from holosoma.envs.wbt.wbt_manager import WholeBodyTrackingManager
 from holosoma.managers.command.base import CommandTermBase
-from holosoma.utils.file_cache import cached_open
+from holosoma.utils.file_cache import cached_open, get_cached_file_path
+from holosoma.utils.motion_format import (
+    FAKE_BODY_NAME_ALIASES,
+    MOTION_FILE_SUFFIX,
+    field_layout,
+    is_motion_file,
+    npz_motion_fields,
+    open_motion_file,
+    read_motion_header,
+    reorder_columns,
+)
 from holosoma.utils.path import resolve_data_file_path
 from holosoma.utils.rotations import (
     get_euler_xyz,
-    quat_apply,
+    motion_to_robot_frame_jit,
     quat_error_magnitude,
     quat_from_euler_xyz,
-    quat_inverse,
     quat_mul,
     slerp,
-    yaw_quat,
 )
 from holosoma.utils.simulator_config import SimulatorType
 
 
 #########################################################################################################
-## MotionLoader and AdaptiveTimestepsSampler
+## MotionLoader, MotionLibrary and AdaptiveTimestepsSampler
 #########################################################################################################
 class MotionLoader:
+    """Motion clip stored once, in robot body/joint order, as a packed time-major ``[T, features]`` tensor.
+
+    Each field (``joint_pos``, ``body_pos``, ...) occupies a contiguous column range of :attr:`frames`, so all
+    fields of a set of time steps are gathered with one indexed read and then split with :meth:`unpack`.
+
+    Clips are read from ``.npz`` files or from native ``.hsmotion`` files (see :mod:`holosoma.utils.motion_format`),
+    which may hold several clips selected by ``clip_index``. A ``.hsmotion`` file stored in robot order is memory
+    mapped without any copy when ``device`` is ``"cpu"``.
+    """
+
     def __init__(
         self,
         motion_file: str,
         robot_body_names: list[str],
         robot_joint_names: list[str],
         device: str = "cpu",
+        clip_index: int = 0,
     ):
         # Resolve the motion file path using importlib.resources
         motion_file = resolve_data_file_path(motion_file)
 
         logger.info(f"Loading motion file: {motion_file}")
-        body_names_in_motion_data, joint_names_in_motion_data = self._load_data_from_motion_npz(motion_file, device)
-        body_indexes = self._get_index_of_a_in_b(robot_body_names, body_names_in_motion_data, device)
-        joint_indexes = self._get_index_of_a_in_b(robot_joint_names, joint_names_in_motion_data, device)
-
-        self._joint_indexes = joint_indexes
-        self._body_indexes = body_indexes
-        self.time_step_total = self._joint_pos.shape[0]
+        if is_motion_file(motion_file):
+            self._load_data_from_motion_file(motion_file, robot_body_names, robot_joint_names, device, clip_index)
+        else:
+            assert clip_index == 0, f"{motion_file} holds a single clip, got clip_index {clip_index}"
+            self._load_data_from_motion_npz(motion_file, robot_body_names, robot_joint_names, device)
+        self.has_object = "object_pos" in self.layout
+        self.time_step_total = self.frames.shape[0]
 
     def _get_index_of_a_in_b(self, a_names: List[str], b_names: List[str], device: str = "cpu") -> torch.Tensor:
         indexes = []
@@ -56,125 +75,225 @@ class MotionLoader:
             indexes.append(b_names.index(name))
         return torch.tensor(indexes, dtype=torch.long, device=device)
 
-    def _load_data_from_motion_npz(self, motion_file: str, device: str) -> tuple[list[str], list[str]]:
+    def _load_data_from_motion_npz(
+        self, motion_file: str, robot_body_names: list[str], robot_joint_names: list[str], device: str
+    ) -> None:
         with cached_open(motion_file, "rb") as f, np.load(f) as data:
             self.fps = data["fps"]
 
             body_names = data["body_names"].tolist()
             joint_names = data["joint_names"].tolist()
+            self._body_indexes = self._get_index_of_a_in_b(robot_body_names, body_names, device)
+            self._joint_indexes = self._get_index_of_a_in_b(robot_joint_names, joint_names, device)
 
-            # The first 7 joints_pos are [xyz, wxyz] of the pelvis, omit them from the joint_pos
-            # The first 6 joints_vel are [vel_xyz, vel_wxyz] of the pelvis, omit them from the joint_vel
-            # We'll use the pelvis position and quaternion from body_pos_w[:, 0] and body_quat_w[:, 0] directly.
-            self._joint_pos = torch.tensor(data["joint_pos"][:, 7:], dtype=torch.float32, device=device)
-            self._joint_vel = torch.tensor(data["joint_vel"][:, 6:], dtype=torch.float32, device=device)
-            assert len(joint_names) == self._joint_pos.shape[1], "Joint names in motion data does not match"
-
-            self._body_pos_w = torch.tensor(data["body_pos_w"], dtype=torch.float32, device=device)
-            assert len(body_names) == self._body_pos_w.shape[1], "Body names in motion data does not match"
-
-            # NOTE: wxyz after loading from npz
-            body_quat_w_wxyz = torch.tensor(data["body_quat_w"], dtype=torch.float32, device=device)  # This is wxyz
-            self._body_quat_w = body_quat_w_wxyz[:, :, [1, 2, 3, 0]]  # Change to xyzw
-
-            self._body_lin_vel_w = torch.tensor(data["body_lin_vel_w"], dtype=torch.float32, device=device)
-            self._body_ang_vel_w = torch.tensor(data["body_ang_vel_w"], dtype=torch.float32, device=device)
-
-            # add object pos and quat
-            self.has_object = "object_pos_w" in data
-            if self.has_object:
-                # NOTE: wxyz after loading from npz
-                self._object_pos_w = torch.tensor(data["object_pos_w"], dtype=torch.float32, device=device)
-                object_quat_w = torch.tensor(data["object_quat_w"], dtype=torch.float32, device=device)
-                self._object_quat_w = object_quat_w[:, [1, 2, 3, 0]]  # Change to xyzw
-                self._object_lin_vel_w = torch.tensor(data["object_lin_vel_w"], dtype=torch.float32, device=device)
-            else:
-                self._object_pos_w = torch.zeros(0, 3, device=device)
-                self._object_quat_w = torch.zeros(0, 4, device=device)
-                self._object_lin_vel_w = torch.zeros(0, 3, device=device)
-        return body_names, joint_names
+            # Gather robot bodies/joints once at load time
+            fields = npz_motion_fields(data, self._body_indexes.cpu().numpy(), self._joint_indexes.cpu().numpy())
+
+        self.layout = field_layout(fields)
+        self.frames = self.pack({name: torch.from_numpy(np.asarray(value)) for name, value in fields.items()}).to(
+            device=device, dtype=torch.float32
+        )
+
+    def _load_data_from_motion_file(
+        self,
+        motion_file: str,
+        robot_body_names: list[str],
+        robot_joint_names: list[str],
+        device: str,
+        clip_index: int,
+    ) -> None:
+        header, frames = open_motion_file(get_cached_file_path(motion_file))
+        self.fps = header.fps
+        self._body_indexes = self._get_index_of_a_in_b(robot_body_names, header.body_names, device)
+        self._joint_indexes = self._get_index_of_a_in_b(robot_joint_names, header.joint_names, device)
+
+        start = header.clip_starts[clip_index]
+        frames = frames[start : start + header.clip_lengths[clip_index]]
+        self.layout = header.field_layout()
+        if header.body_names != robot_body_names or header.joint_names != robot_joint_names:
+            # Not stored in robot order: gather the robot columns once
+            logger.info(f"{motion_file} is not stored in robot body/joint order; reconvert it to load without copies")
+            self.layout, columns = reorder_columns(
+                self.layout, self._body_indexes.cpu().numpy(), self._joint_indexes.cpu().numpy()
+            )
+            frames = frames[:, torch.from_numpy(columns)]
+        self.frames = frames.to(device=device, dtype=torch.float32)
+
+    def pack(self, fields: dict[str, torch.Tensor]) -> torch.Tensor:
+        """Pack per-field ``[T, ...]`` tensors into a ``[T, features]`` tensor following :attr:`layout`."""
+        return torch.cat([fields[name].flatten(1) for name in self.layout], dim=1)
+
+    def unpack(self, frames: torch.Tensor, name: str) -> torch.Tensor:
+        """View of field ``name`` in ``frames`` (``[..., features]``), shaped ``[..., *field_shape]``."""
+        columns, shape = self.layout[name]
+        return frames[..., columns].unflatten(-1, shape)
 
     @property
     def joint_pos(self) -> torch.Tensor:
-        return self._joint_pos[:, self._joint_indexes]
+        return self.unpack(self.frames, "joint_pos")
 
     @property
     def joint_vel(self) -> torch.Tensor:
-        return self._joint_vel[:, self._joint_indexes]
+        return self.unpack(self.frames, "joint_vel")
 
     @property
     def body_pos_w(self) -> torch.Tensor:
-        return self._body_pos_w[:, self._body_indexes]
+        return self.unpack(self.frames, "body_pos")
 
     @property
     def body_quat_w(self) -> torch.Tensor:
-        return self._body_quat_w[:, self._body_indexes]
+        return self.unpack(self.frames, "body_quat")
 
     @property
     def body_lin_vel_w(self) -> torch.Tensor:
-        return self._body_lin_vel_w[:, self._body_indexes]
+        return self.unpack(self.frames, "body_lin_vel")
 
     @property
     def body_ang_vel_w(self) -> torch.Tensor:
-        return self._body_ang_vel_w[:, self._body_indexes]
+        return self.unpack(self.frames, "body_ang_vel")
 
     @property
     def object_pos_w(self) -> torch.Tensor:
-        return self._object_pos_w[:]
+        if not self.has_object:
+            return self.frames.new_zeros(0, 3)
+        return self.unpack(self.frames, "object_pos")
 
     @property
     def object_quat_w(self) -> torch.Tensor:
-        return self._object_quat_w[:]
+        if not self.has_object:
+            return self.frames.new_zeros(0, 4)
+        return self.unpack(self.frames, "object_quat")
 
     @property
     def object_lin_vel_w(self) -> torch.Tensor:
-        return self._object_lin_vel_w[:]
+        if not self.has_object:
+            return self.frames.new_zeros(0, 3)
+        return self.unpack(self.frames, "object_lin_vel")
 
     def extend_with_segments(self, segments: dict[str, torch.Tensor], prepend: bool) -> MotionLoader:
-        """Merge interpolated segments with motion data, mutating this MotionLoader."""
-        concat_targets = [
-            ("joint_pos", "_joint_pos"),
-            ("joint_vel", "_joint_vel"),
-            ("body_pos", "_body_pos_w"),
-            ("body_quat", "_body_quat_w"),
-            ("body_lin_vel", "_body_lin_vel_w"),
-            ("body_ang_vel", "_body_ang_vel_w"),
-        ]
-        if self.has_object:
-            concat_targets.extend(
-                [
-                    ("object_pos", "_object_pos_w"),
-                    ("object_quat", "_object_quat_w"),
-                    ("object_lin_vel", "_object_lin_vel_w"),
-                ]
-            )
+        """Merge interpolated segments (in robot body/joint order) with motion data, mutating this MotionLoader."""
+        segment_frames = self.pack(segments).to(self.frames)
+        tensors = (segment_frames, self.frames) if prepend else (self.frames, segment_frames)
+        self.frames = torch.cat(tensors, dim=0)
+        self.time_step_total = self.frames.shape[0]
+        return self
 
-        for seg_key, attr_name in concat_targets:
-            existing = getattr(self, attr_name)
-            tensors = (segments[seg_key], existing) if prepend else (existing, segments[seg_key])
-            setattr(self, attr_name, torch.cat(tensors, dim=0))
 
-        self.time_step_total = self._joint_pos.shape[0]
-        return self
+class MotionLibrary:
+    """Many motion clips concatenated along time into one packed ``[sum(T), features]`` tensor.
+
+    Clip ``c`` occupies rows ``clip_starts[c]:clip_starts[c] + clip_lengths[c]`` of :attr:`frames`, so the frames of
+    ``(clip_id, time_step)`` pairs of all envs are gathered with one indexed read at ``clip_starts[clip_ids] +
+    time_steps``, the same per-step cost as a single clip.
+
+    Clips are consumed one at a time from ``clips`` (typically a generator that loads and post-processes each file),
+    so only the packed float32 frames stay resident. ``storage_device`` may differ from ``device``: keeping the
+    library in host memory (``"cpu"``) bounds the dataset size by host rather than accelerator memory, at the cost of
+    a ``[num_envs, features]`` host-to-device copy per step. Clips that are adjacent views of one storage, such as the
+    clips of a memory-mapped ``.hsmotion`` file, are not copied.
+    """
+
+    def __init__(
+        self,
+        clips: Iterable[MotionLoader],
+        clip_names: list[str],
+        device: str = "cpu",
+        storage_device: str | None = None,
+        clip_weights: list[float] | None = None,
+    ):
+        storage_device = storage_device or device
+        clip_frames: List[torch.Tensor] = []
+        for clip in clips:
+            if not clip_frames:
+                self.layout = clip.layout
+                self.has_object = clip.has_object
+                self.fps = clip.fps
+            assert clip.layout == self.layout, "All motion clips must have the same bodies, joints and object fields"
+            assert clip.fps == self.fps, f"All motion clips must have the same fps, got {clip.fps} and {self.fps}"
+            clip_frames.append(clip.frames.to(storage_device))
+        assert clip_frames, "Motion library needs at least one clip"
+        assert len(clip_frames) == len(clip_names), "Number of clip names does not match number of clips"
+
+        self.clip_names = clip_names
+        self.num_clips = len(clip_frames)
+        self.clip_lengths = torch.tensor([frames.shape[0] for frames in clip_frames], dtype=torch.long, device=device)
+        self.clip_starts = torch.cumsum(self.clip_lengths, dim=0) - self.clip_lengths
+        self.frames = _concat_frames(clip_frames)
+
+        # Default to sampling clips proportionally to their length, i.e. uniformly over all frames
+        if clip_weights is None:
+            weights = self.clip_lengths.float()
+        else:
+            assert len(clip_weights) == self.num_clips, (
+                f"Got {len(clip_weights)} clip weights for {self.num_clips} motion clips"
+            )
+            weights = torch.tensor(clip_weights, dtype=torch.float, device=device)
+        self.clip_weights = weights / weights.sum()
+
+    def unpack(self, frames: torch.Tensor, name: str) -> torch.Tensor:
+        """View of field ``name`` in ``frames`` (``[..., features]``), shaped ``[..., *field_shape]``."""
+        columns, shape = self.layout[name]
+        return frames[..., columns].unflatten(-1, shape)
+
+    def clip_frames(self, clip_id: int) -> torch.Tensor:
+        """Frames ``[T_clip, features]`` of clip ``clip_id``."""
+        start = int(self.clip_starts[clip_id])
+        return self.frames[start : start + int(self.clip_lengths[clip_id])]
+
+    def sample_clips(self, num_samples: int) -> torch.Tensor:
+        """Sample clip ids following :attr:`clip_weights`."""
+        return torch.multinomial(self.clip_weights, num_samples, replacement=True)
+
+    def gather(self, frame_index: torch.Tensor, out: torch.Tensor | None = None) -> torch.Tensor:
+        """Read the rows ``frame_index`` of :attr:`frames` onto ``frame_index``'s device (into ``out`` if given)."""
+        if self.frames.device == frame_index.device:
+            return torch.index_select(self.frames, 0, frame_index, out=out)  # type: ignore[call-overload]
+        frames = self.frames.index_select(0, frame_index.to(self.frames.device))
+        if out is None:
+            return frames.to(frame_index.device)
+        return out.copy_(frames)
+
+
+def _concat_frames(clip_frames: list[torch.Tensor]) -> torch.Tensor:
+    """Concatenate clip frames along time, as a view when they are adjacent in a single storage."""
+    first = clip_frames[0]
+    offset = first.storage_offset()
+    for frames in clip_frames:
+        if (
+            not frames.is_contiguous()
+            or frames.untyped_storage().data_ptr() != first.untyped_storage().data_ptr()
+            or frames.storage_offset() != offset
+        ):
+            return torch.cat(clip_frames, dim=0)
+        offset += frames.numel()
+    num_frames = sum(frames.shape[0] for frames in clip_frames)
+    return first.new_empty(0).set_(first.untyped_storage(), first.storage_offset(), (num_frames, first.shape[1]))
 
 
 class AdaptiveTimestepsSampler:
-    """Prioritizes training on motion segments where the robot fails most often."""
+    """Prioritizes training on motion segments where the robot fails most often.
+
+    With a motion library every clip gets its own bins; failures are smoothed within a clip only, and clips are
+    first drawn following ``clip_weights`` before a bin is drawn inside the clip.
+    """
 
     def __init__(
         self,
-        motion_time_step_total: int,
+        motion_time_step_total: int | torch.Tensor,
         device: str,
         env_fps: int,
         bin_size_s: float = 1.0,
         kernel_size: int = 3,
         decay_lambda: float = 0.001,
         kernel_lambda: float = 0.8,
+        clip_weights: torch.Tensor | None = None,
     ):
         # TODO: think better about the decay_lambda, will 0.001 be too small?
         self.device = device
-        # length of the motion in rl environment time steps
-        self.motion_time_step_total = motion_time_step_total
+        # length of the motion (or of every clip of a motion library) in rl environment time steps
+        self.clip_lengths = torch.as_tensor(motion_time_step_total, dtype=torch.long, device=device).reshape(-1)
+        self.num_clips = self.clip_lengths.numel()
+        self.motion_time_step_total = int(self.clip_lengths.sum())
         # fps of the rl environment
         self.env_fps = env_fps
 
@@ -187,8 +306,14 @@ class AdaptiveTimestepsSampler:
 
         self.decay_lambda = decay_lambda
 
-        # number of bins in the motion
-        self.num_bins = math.ceil((self.motion_time_step_total / self.env_fps) / self.bin_size_s)
+        # number of bins in every clip, laid out clip after clip
+        self.clip_num_bins = torch.ceil((self.clip_lengths / self.env_fps) / self.bin_size_s).long()
+        self.clip_bin_starts = torch.cumsum(self.clip_num_bins, dim=0) - self.clip_num_bins
+        self.num_bins = int(self.clip_num_bins.sum())
+        self.bin_clip_ids = torch.repeat_interleave(torch.arange(self.num_clips, device=device), self.clip_num_bins)
+        if clip_weights is None:
+            clip_weights = torch.ones(self.num_clips, device=device)
+        self.clip_weights = clip_weights.to(device=device, dtype=torch.float) / clip_weights.sum()
 
         # initialize exponential 1d decay kernel, used for smoothing the failure counts over time.
         assert self.kernel_size % 2 == 1, "Kernel size must be odd"
@@ -197,6 +322,11 @@ class AdaptiveTimestepsSampler:
             device=self.device,
         )
         self.kernel = self.kernel / self.kernel.sum()
+        # Non-causal kernel over the following bins, replicating the last bin of each clip
+        bin_ids = torch.arange(self.num_bins, device=device)
+        clip_last_bin = (self.clip_bin_starts + self.clip_num_bins - 1)[self.bin_clip_ids]
+        offsets = torch.arange(self.kernel_size, device=device)
+        self.kernel_bin_ids = torch.minimum(bin_ids[:, None] + offsets, clip_last_bin[:, None])
 
         # key data: failure counts
         self.init_buffers()
@@ -207,10 +337,16 @@ class AdaptiveTimestepsSampler:
         self.current_bin_failed_count = torch.zeros(self.num_bins, dtype=torch.float, device=self.device)
         self.bin_failed_count = torch.zeros(self.num_bins, dtype=torch.float, device=self.device)
 
-    def update_current_bin_failed_count(self, failed_at_time_step: torch.Tensor):
-        """Update the current bin failed count with terminated time steps."""
-        failed_bin = torch.floor(failed_at_time_step / self.motion_time_step_total * self.num_bins).long()
-        assert failed_bin.min() >= 0 and failed_bin.max() < self.num_bins, "Failed bin is out of range"
+    def update_current_bin_failed_count(
+        self, failed_at_time_step: torch.Tensor, failed_clip_ids: torch.Tensor | None = None
+    ):
+        """Update the current bin failed count with terminated time steps (of clips ``failed_clip_ids``)."""
+        if failed_clip_ids is None:
+            failed_clip_ids = torch.zeros_like(failed_at_time_step)
+        clip_num_bins = self.clip_num_bins[failed_clip_ids]
+        failed_bin = torch.floor(failed_at_time_step / self.clip_lengths[failed_clip_ids] * clip_num_bins).long()
+        assert failed_bin.min() >= 0 and (failed_bin < clip_num_bins).all(), "Failed bin is out of range"
+        failed_bin += self.clip_bin_starts[failed_clip_ids]
         self.current_bin_failed_count[:] = torch.bincount(failed_bin, minlength=self.num_bins)
 
     def update_bin_failed_count(self):
@@ -223,19 +359,22 @@ class AdaptiveTimestepsSampler:
     @property
     def sampling_probabilities(self) -> torch.Tensor:
         sampling_probabilities = self.bin_failed_count + 1e-6
-        sampling_probabilities = torch.nn.functional.pad(
-            sampling_probabilities.unsqueeze(0).unsqueeze(0),
-            (0, self.kernel_size - 1),  # Non-causal kernel
-            mode="replicate",
-        )
-        sampling_probabilities = torch.nn.functional.conv1d(sampling_probabilities, self.kernel.view(1, 1, -1)).view(-1)
+        sampling_probabilities = (sampling_probabilities[self.kernel_bin_ids] * self.kernel).sum(dim=1)
         sampling_probabilities += 0.01
-        return sampling_probabilities / sampling_probabilities.sum()
+        # Normalize within each clip, then weight the clips
+        clip_sums = torch.zeros(self.num_clips, device=self.device).index_add_(
+            0, self.bin_clip_ids, sampling_probabilities
+        )
+        return sampling_probabilities / clip_sums[self.bin_clip_ids] * self.clip_weights[self.bin_clip_ids]
 
-    def sample(self, num_samples: int) -> torch.Tensor:
+    def sample(self, num_samples: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample clip ids and motion phases in ``[0, 1)`` within those clips."""
         sampled_bins = torch.multinomial(self.sampling_probabilities, num_samples, replacement=True)
+        clip_ids = self.bin_clip_ids[sampled_bins]
+        local_bins = sampled_bins - self.clip_bin_starts[clip_ids]
         # inside of each bin, randomly sample a time step, ignoring the borders
-        return (sampled_bins + torch.rand(num_samples, device=self.device)) / self.num_bins
+        phase = (local_bins + torch.rand(num_samples, device=self.device)) / self.clip_num_bins[clip_ids]
+        return clip_ids, phase
 
     def get_stats(self):
         # Metrics
@@ -251,15 +390,6 @@ class AdaptiveTimestepsSampler:
 #########################################################################################################
 ## Helper functions
 #########################################################################################################
-FAKE_BODY_NAME_ALIASES: dict[str, str] = {
-    # Fake foot contact bodies are authored in the URDF purely for height computation.
-    # They do not exist in the motion-capture dataset, so we alias them back to the
-    # closest real body when indexing into motion data. These are not actually used in training.
-    "left_foot_contact_point": "left_ankle_roll_link",
-    "right_foot_contact_point": "right_ankle_roll_link",
-}
-
-
 def get_filtered_body_names(body_list: List[str], pattern: str) -> List[str]:
     return [body_name for body_name in body_list if re.match(pattern, body_name)]
 
@@ -286,23 +416,22 @@ class MotionCommand(CommandTermBase):
 
         robot_joint_names = self._env.simulator.dof_names  # type: ignore[attr-defined]
 
-        # 1. load motion data
-        self.motion: MotionLoader = MotionLoader(
-            self.motion_cfg.motion_file,
-            robot_body_names_alias,
-            robot_joint_names,
+        # 1. load motion data, one clip at a time, into the motion library
+        motion_clips = self._resolve_motion_clips(self.motion_cfg.motion_file)
+        self.motion: MotionLibrary = MotionLibrary(
+            (
+                self._load_clip(motion_file, clip_index, robot_body_names_alias, robot_joint_names)
+                for motion_file, clip_index, _ in motion_clips
+            ),
+            clip_names=[clip_name for _, _, clip_name in motion_clips],
             device=self.device,
+            storage_device=self.motion_cfg.motion_storage_device,
+            clip_weights=self.motion_cfg.motion_clip_weights,
+        )
+        logger.info(
+            f"Motion library: {self.motion.num_clips} clip(s), {self.motion.frames.shape[0]} frames "
+            f"stored on {self.motion.frames.device}"
         )
-
-        # Store body and joint indexes for interpolation
-        self._body_indexes_in_motion = self.motion._body_indexes
-        self._joint_indexes_in_motion = self.motion._joint_indexes
-
-        # Maybe prepend interpolated transition from default pose
-        self._maybe_add_default_pose_transition(prepend=True)
-
-        # Maybe append interpolated transition back to default pose
-        self._maybe_add_default_pose_transition(prepend=False)
 
         # 2. get the indexes of the root link and the tracked links
         self.ref_body_index = robot_body_names.index(self.motion_cfg.body_name_ref[0])  # int
@@ -323,7 +452,10 @@ class MotionCommand(CommandTermBase):
         # 4. get the adaptive timesteps sampler
         if self.motion_cfg.use_adaptive_timesteps_sampler:
             self.adaptive_timesteps_sampler = AdaptiveTimestepsSampler(
-                self.motion.time_step_total, self.device, int(1 / (self._env.dt))
+                self.motion.clip_lengths,
+                self.device,
+                int(1 / (self._env.dt)),
+                clip_weights=self.motion.clip_weights,
             )
 
         # 5. metrics
@@ -341,16 +473,22 @@ class MotionCommand(CommandTermBase):
         if env_ids.numel() == 0:
             return
 
-        # 0. Sample the time steps
+        # 0. Sample the clips and time steps
         if self.motion_cfg.use_adaptive_timesteps_sampler:
-            phase = self.adaptive_timesteps_sampler.sample(env_ids.numel())
+            clip_ids, phase = self.adaptive_timesteps_sampler.sample(env_ids.numel())
         else:
+            clip_ids = self.motion.sample_clips(env_ids.numel())
             phase = torch.rand(env_ids.numel(), device=self.device)
 
         if self._env.is_evaluating:
+            # Cover the clips deterministically, each from the start
+            clip_ids = env_ids % self.motion.num_clips
             phase = torch.zeros_like(phase)
 
-        self.time_steps[env_ids] = (phase * (self.motion.time_step_total - 1)).long()
+        self.clip_ids[env_ids] = clip_ids
+        self.time_step_totals[env_ids] = self.motion.clip_lengths[clip_ids]
+        self._clip_starts[env_ids] = self.motion.clip_starts[clip_ids]
+        self.time_steps[env_ids] = (phase * (self.time_step_totals[env_ids] - 1)).long()
 
         # Handle start_at_timestep_zero_prob
         prob = self.motion_cfg.start_at_timestep_zero_prob
@@ -364,10 +502,11 @@ class MotionCommand(CommandTermBase):
 
         # If the motion is at the last timestep, set it to the second last timestep;
         # Otherwise, update_tasks_callback will advance the timestep to the next timestep -> out of bounds error.
-        already_last_timestep_mask = self.time_steps[env_ids] == self.motion.time_step_total - 1
+        already_last_timestep_mask = self.time_steps[env_ids] == self.time_step_totals[env_ids] - 1
         self.time_steps[env_ids] = torch.where(
-            already_last_timestep_mask, self.motion.time_step_total - 2, self.time_steps[env_ids]
+            already_last_timestep_mask, self.time_step_totals[env_ids] - 2, self.time_steps[env_ids]
         )
+        self._update_frame_cache(env_ids)
 
         # 1. Get the reference root/body poses
         root_pos = self.body_pos_w[env_ids, 0].clone()
@@ -487,6 +626,7 @@ class MotionCommand(CommandTermBase):
                 advance_mask = advance_mask & ~freeze_mask
 
         self.time_steps += advance_mask.long()
+        self._update_frame_cache()
 
         # 1. update body_pos_relative_w and body_quat_relative_w
         # definition of body_pos/quat_relative_w:
@@ -509,35 +649,20 @@ class MotionCommand(CommandTermBase):
         # ------------------------------------------------------------
         # if episode_length_buf == 0, use robot_root_pos_w and robot_root_quat_w as reference body.
         # else, use configured reference body as reference body.
-        use_root = (self._env.episode_length_buf == 0).unsqueeze(1).float()
-
-        ref_pos_w = self.root_pos_w * use_root + self.ref_pos_w * (1 - use_root)
-        ref_quat_w = self.root_quat_w * use_root + self.ref_quat_w * (1 - use_root)
-        robot_ref_pos_w = self.robot_root_pos_w * use_root + self.robot_ref_pos_w * (1 - use_root)
-        robot_ref_quat_w = self.robot_root_quat_w * use_root + self.robot_ref_quat_w * (1 - use_root)
-
-        ## 1.1 repeat to match the number of body parts
-        ref_pos_w_repeat = ref_pos_w[:, None, :].repeat(1, len(self.motion_cfg.body_names_to_track), 1)  # type: ignore[arg-type]
-        ref_quat_w_repeat = ref_quat_w[:, None, :].repeat(1, len(self.motion_cfg.body_names_to_track), 1)  # type: ignore[arg-type]
-        robot_ref_pos_w_repeat = robot_ref_pos_w[:, None, :].repeat(1, len(self.motion_cfg.body_names_to_track), 1)  # type: ignore[arg-type]
-        robot_ref_quat_w_repeat = robot_ref_quat_w[:, None, :].repeat(1, len(self.motion_cfg.body_names_to_track), 1)  # type: ignore[arg-type]
-
-        ## 1.2 compute the relative body poses
-        delta_quat_w = yaw_quat(
-            quat_mul(robot_ref_quat_w_repeat, quat_inverse(ref_quat_w_repeat, w_last=True), w_last=True), w_last=True
-        )
-        ### 1.2.1 body_quat_relative_w
-        self.body_quat_relative_w = quat_mul(delta_quat_w, self.body_quat_w, w_last=True)
-        ### 1.2.2 body_pos_relative_w
-        delta_pos_w_height = ref_pos_w_repeat - robot_ref_pos_w_repeat
-        delta_pos_w_height[..., :2] = 0.0  # adjusting for height differences
-        self.body_pos_relative_w = (
-            robot_ref_pos_w_repeat
-            + delta_pos_w_height
-            + quat_apply(delta_quat_w, self.body_pos_w - ref_pos_w_repeat, w_last=True)
+        use_root = (self._env.episode_length_buf == 0).unsqueeze(1)
+
+        ref_pos_w = torch.where(use_root, self.root_pos_w, self.ref_pos_w)
+        ref_quat_w = torch.where(use_root, self.root_quat_w, self.ref_quat_w)
+        robot_ref_pos_w = torch.where(use_root, self.robot_root_pos_w, self.robot_ref_pos_w)
+        robot_ref_quat_w = torch.where(use_root, self.robot_root_quat_w, self.robot_ref_quat_w)
+
+        ## 1.1 compute the relative body poses
+        # The per-env reference poses are broadcast over the tracked bodies by the fused kernel
+        self.body_pos_relative_w, self.body_quat_relative_w = motion_to_robot_frame_jit(
+            ref_pos_w, ref_quat_w, robot_ref_pos_w, robot_ref_quat_w, self.body_pos_w, self.body_quat_w
         )
 
-        ### 1.3 update the adaptive timesteps sampler
+        ### 1.2 update the adaptive timesteps sampler
         if self.motion_cfg.use_adaptive_timesteps_sampler:
             self.adaptive_timesteps_sampler.update_bin_failed_count()
 
@@ -550,54 +675,56 @@ class MotionCommand(CommandTermBase):
     #########################################################################################
     @property
     def joint_pos(self) -> torch.Tensor:
-        return self.motion.joint_pos[self.time_steps]
+        return self.motion.unpack(self._frame, "joint_pos")
 
     @property
     def joint_vel(self) -> torch.Tensor:
-        return self.motion.joint_vel[self.time_steps]
+        return self.motion.unpack(self._frame, "joint_vel")
 
     @property
     def body_pos_w(self) -> torch.Tensor:
         return (
-            self.motion.body_pos_w[self.time_steps][:, self.tracked_body_indexes]
+            self.motion.unpack(self._frame, "body_pos")[:, self.tracked_body_indexes]
             + self._env.simulator.scene.env_origins[:, None, :]
         )
 
     @property
     def body_quat_w(self) -> torch.Tensor:
-        return self.motion.body_quat_w[self.time_steps][:, self.tracked_body_indexes]
+        return self.motion.unpack(self._frame, "body_quat")[:, self.tracked_body_indexes]
 
     @property
     def body_lin_vel_w(self) -> torch.Tensor:
-        return self.motion.body_lin_vel_w[self.time_steps][:, self.tracked_body_indexes]
+        return self.motion.unpack(self._frame, "body_lin_vel")[:, self.tracked_body_indexes]
 
     @property
     def body_ang_vel_w(self) -> torch.Tensor:
-        return self.motion.body_ang_vel_w[self.time_steps][:, self.tracked_body_indexes]
+        return self.motion.unpack(self._frame, "body_ang_vel")[:, self.tracked_body_indexes]
 
     @property
     def ref_pos_w(self) -> torch.Tensor:
-        return self.motion.body_pos_w[self.time_steps, self.ref_body_index] + self._env.simulator.scene.env_origins
+        return (
+            self.motion.unpack(self._frame, "body_pos")[:, self.ref_body_index] + self._env.simulator.scene.env_origins
+        )
 
     @property
     def ref_quat_w(self) -> torch.Tensor:
-        return self.motion.body_quat_w[self.time_steps, self.ref_body_index]
+        return self.motion.unpack(self._frame, "body_quat")[:, self.ref_body_index]
 
     @property
     def root_pos_w(self) -> torch.Tensor:
-        return self.motion.body_pos_w[self.time_steps, 0] + self._env.simulator.scene.env_origins
+        return self.motion.unpack(self._frame, "body_pos")[:, 0] + self._env.simulator.scene.env_origins
 
     @property
     def root_quat_w(self) -> torch.Tensor:
-        return self.motion.body_quat_w[self.time_steps, 0]
+        return self.motion.unpack(self._frame, "body_quat")[:, 0]
 
     @property
     def ref_lin_vel_w(self) -> torch.Tensor:
-        return self.motion.body_lin_vel_w[self.time_steps, self.ref_body_index]
+        return self.motion.unpack(self._frame, "body_lin_vel")[:, self.ref_body_index]
 
     @property
     def ref_ang_vel_w(self) -> torch.Tensor:
-        return self.motion.body_ang_vel_w[self.time_steps, self.ref_body_index]
+        return self.motion.unpack(self._frame, "body_ang_vel")[:, self.ref_body_index]
 
     #########################################################################################
     ## Robot from simulator
@@ -664,15 +791,15 @@ class MotionCommand(CommandTermBase):
     @property
     def object_pos_w(self) -> torch.Tensor:
         # Applies env origins, but ideally we should rely on the simulator
-        return self.motion.object_pos_w[self.time_steps] + self._env.simulator.scene.env_origins
+        return self.motion.unpack(self._frame, "object_pos") + self._env.simulator.scene.env_origins
 
     @property
     def object_quat_w(self) -> torch.Tensor:
-        return self.motion.object_quat_w[self.time_steps]
+        return self.motion.unpack(self._frame, "object_quat")
 
     @property
     def object_lin_vel_w(self) -> torch.Tensor:
-        return self.motion.object_lin_vel_w[self.time_steps]
+        return self.motion.unpack(self._frame, "object_lin_vel")
 
     #########################################################################################
     ## Object from simulator
@@ -695,6 +822,13 @@ class MotionCommand(CommandTermBase):
 
     def init_buffers(self):
         self.time_steps = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        # Motion library clip of every env, its length and its first row in the library frames
+        self.clip_ids = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self.time_step_totals = self.motion.clip_lengths[self.clip_ids]
+        self._clip_starts = self.motion.clip_starts[self.clip_ids]
+        self._frame_index = self._clip_starts + self.time_steps
+        # Motion frames at the current time steps, [num_envs, features]; the motion properties slice it
+        self._frame = self.motion.gather(self._frame_index)
         self.body_pos_relative_w = torch.zeros(
             self.num_envs, len(self.motion_cfg.body_names_to_track), 3, device=self.device
         )  # type: ignore[arg-type]
@@ -746,7 +880,53 @@ class MotionCommand(CommandTermBase):
     #########################################################################################
     ## Internal helpers
     #########################################################################################
-    def _maybe_add_default_pose_transition(self, *, prepend: bool) -> None:
+    def _update_frame_cache(self, env_ids: torch.Tensor | None = None) -> None:
+        """Gather the motion frames at ``time_steps`` with a single indexed read; call after changing them."""
+        if env_ids is None:
+            torch.add(self._clip_starts, self.time_steps, out=self._frame_index)
+            self.motion.gather(self._frame_index, out=self._frame)
+        else:
+            self._frame_index[env_ids] = self._clip_starts[env_ids] + self.time_steps[env_ids]
+            self._frame[env_ids] = self.motion.gather(self._frame_index[env_ids])
+
+    def _resolve_motion_clips(self, motion_file: str) -> list[tuple[str, int, str]]:
+        """Motion clips to load as ``(motion_file, clip_index, clip_name)``.
+
+        ``motion_file`` is a ``.npz`` file, a ``.hsmotion`` file (all of its clips), or a directory of such files,
+        loaded in name order.
+        """
+        resolved = Path(resolve_data_file_path(motion_file))
+        if resolved.is_dir():
+            motion_files = sorted(
+                str(path) for path in resolved.iterdir() if path.suffix in (".npz", MOTION_FILE_SUFFIX)
+            )
+            assert motion_files, f"No .npz or {MOTION_FILE_SUFFIX} motion files found in {resolved}"
+        else:
+            motion_files = [motion_file]
+
+        motion_clips: List[Tuple[str, int, str]] = []
+        for path in motion_files:
+            if is_motion_file(path):
+                header, _ = read_motion_header(get_cached_file_path(resolve_data_file_path(path)))
+                motion_clips.extend((path, clip_index, name) for clip_index, name in enumerate(header.clip_names))
+            else:
+                motion_clips.append((path, 0, Path(path).stem))
+        return motion_clips
+
+    def _load_clip(
+        self, motion_file: str, clip_index: int, robot_body_names: list[str], robot_joint_names: list[str]
+    ) -> MotionLoader:
+        """Load one clip on the host and add its default-pose transitions."""
+        clip = MotionLoader(motion_file, robot_body_names, robot_joint_names, device="cpu", clip_index=clip_index)
+
+        # Maybe prepend interpolated transition from default pose
+        self._maybe_add_default_pose_transition(clip, prepend=True)
+
+        # Maybe append interpolated transition back to default pose
+        self._maybe_add_default_pose_transition(clip, prepend=False)
+        return clip
+
+    def _maybe_add_default_pose_transition(self, clip: MotionLoader, *, prepend: bool) -> None:
         """Shared path for optionally inserting default-pose interpolation before/after the clip."""
         enabled = self.motion_cfg.enable_default_pose_prepend if prepend else self.motion_cfg.enable_default_pose_append
         if not enabled:
@@ -770,12 +950,12 @@ class MotionCommand(CommandTermBase):
             )
             return
 
-        default_state = self._build_default_pose_state(use_motion_end=not prepend)
+        default_state = self._build_default_pose_state(clip, use_motion_end=not prepend)
 
         action = "prepend" if prepend else "append"
         log_str = f"{action} {num_steps} interpolated frames ({duration}s) from default pose to motion"
         try:
-            self._add_transition_to_motion(default_state, num_steps, prepend=prepend)
+            self._add_transition_to_motion(clip, default_state, num_steps, prepend=prepend)
             logger.info(log_str)
         except Exception as exc:
             logger.error(f"Failed to {action} default pose transition: {exc}")
@@ -785,7 +965,7 @@ class MotionCommand(CommandTermBase):
                 "Please check that the motion file and robot configuration are compatible."
             ) from exc
 
-    def _build_default_pose_state(self, use_motion_end: bool = False) -> dict[str, torch.Tensor]:
+    def _build_default_pose_state(self, clip: MotionLoader, use_motion_end: bool = False) -> dict[str, torch.Tensor]:
         """Build the state dict representing the robot's default standing pose.
 
         By default, anchor root pos/yaw to the motion start; when use_motion_end is True, anchor to motion end.
@@ -800,8 +980,8 @@ class MotionCommand(CommandTermBase):
         motion_idx = -1 if use_motion_end else 0
 
         # Assume the pelvis is the first in robot_body_names
-        motion_root_pos = self.motion.body_pos_w[motion_idx, 0].to(self.device)
-        motion_root_quat = self.motion.body_quat_w[motion_idx, 0].to(self.device).unsqueeze(0)
+        motion_root_pos = clip.body_pos_w[motion_idx, 0].to(self.device)
+        motion_root_quat = clip.body_quat_w[motion_idx, 0].to(self.device).unsqueeze(0)
         _, _, motion_yaw = get_euler_xyz(motion_root_quat, w_last=True)
 
         # Keep z from init config but adopt the clip's x,y at the chosen anchor frame.
@@ -828,15 +1008,10 @@ class MotionCommand(CommandTermBase):
             default_root_ang_vel,
         )
 
-        default_body_pos = self._map_robot_bodies_to_motion_order(body_states["pos"])
-        default_body_quat = self._map_robot_bodies_to_motion_order(body_states["quat"])
-        default_body_lin_vel = self._map_robot_bodies_to_motion_order(body_states["lin_vel"])
-        default_body_ang_vel = self._map_robot_bodies_to_motion_order(body_states["ang_vel"])
-
-        if self.motion.has_object:
-            object_pos = self.motion._object_pos_w[motion_idx].to(self.device)
-            object_quat = self.motion._object_quat_w[motion_idx].to(self.device)
-            object_lin_vel = self.motion._object_lin_vel_w[motion_idx].to(self.device)
+        if clip.has_object:
+            object_pos = clip.object_pos_w[motion_idx].to(self.device)
+            object_quat = clip.object_quat_w[motion_idx].to(self.device)
+            object_lin_vel = clip.object_lin_vel_w[motion_idx].to(self.device)
         else:
             object_pos = torch.zeros(0, 3, device=self.device, dtype=torch.float32)
             object_quat = torch.zeros(0, 4, device=self.device, dtype=torch.float32)
@@ -849,34 +1024,36 @@ class MotionCommand(CommandTermBase):
             "root_quat": default_root_quat,
             "root_lin_vel": default_root_lin_vel,
             "root_ang_vel": default_root_ang_vel,
-            "body_pos": default_body_pos,
-            "body_quat": default_body_quat,
-            "body_lin_vel": default_body_lin_vel,
-            "body_ang_vel": default_body_ang_vel,
+            "body_pos": body_states["pos"],
+            "body_quat": body_states["quat"],
+            "body_lin_vel": body_states["lin_vel"],
+            "body_ang_vel": body_states["ang_vel"],
             "object_pos": object_pos,
             "object_quat": object_quat,
             "object_lin_vel": object_lin_vel,
         }
 
-    def _add_transition_to_motion(self, default_state: dict[str, torch.Tensor], num_steps: int, prepend: bool) -> None:
+    def _add_transition_to_motion(
+        self, clip: MotionLoader, default_state: dict[str, torch.Tensor], num_steps: int, prepend: bool
+    ) -> None:
         """Add interpolated frames either before or after the motion data."""
-        assert self._body_indexes_in_motion is not None
-        assert self._joint_indexes_in_motion is not None
-
         if num_steps <= 0:
             return
 
         device = self.device
-        dtype = self.motion._joint_pos.dtype
+        dtype = clip.frames.dtype
 
-        default_motion_state = self._default_motion_state(default_state, dtype=dtype, device=device)
-        motion_state = self._motion_state(0 if prepend else -1, dtype=dtype, device=device)
+        default_motion_state = {
+            key: value.to(device=device, dtype=dtype) for key, value in default_state.items() if key in clip.layout
+        }
+        motion_state = self._motion_state(clip, 0 if prepend else -1, dtype=dtype, device=device)
 
         start_state = default_motion_state if prepend else motion_state
         target_state = motion_state if prepend else default_motion_state
         drop_first, drop_last = (False, True) if prepend else (True, False)
 
         self._build_and_apply_transition(
+            clip,
             start_state=start_state,
             target_state=target_state,
             num_steps=num_steps,
@@ -957,69 +1134,16 @@ class MotionCommand(CommandTermBase):
             "ang_vel": body_ang_vel,
         }
 
-    def _map_robot_bodies_to_motion_order(self, robot_tensor: torch.Tensor) -> torch.Tensor:
-        """Map robot body tensor to motion data order using body indexes."""
-        assert self._body_indexes_in_motion is not None
-        num_motion_bodies = self.motion._body_pos_w.shape[1]
-        motion_shape = (num_motion_bodies,) + robot_tensor.shape[1:]
-        motion_tensor = torch.zeros(motion_shape, device=robot_tensor.device, dtype=robot_tensor.dtype)
-        motion_tensor[self._body_indexes_in_motion] = robot_tensor
-        return motion_tensor
-
-    def _map_robot_joints_to_motion_order(
-        self, robot_tensor: torch.Tensor, num_motion_joints: int | None = None
-    ) -> torch.Tensor:
-        """Map robot joint tensor to motion data order using joint indexes."""
-        assert self._joint_indexes_in_motion is not None
-        if num_motion_joints is None:
-            num_motion_joints = self.motion._joint_pos.shape[1]
-        motion_shape = robot_tensor.shape[:-1] + (num_motion_joints,)
-        motion_tensor = torch.zeros(motion_shape, device=robot_tensor.device, dtype=robot_tensor.dtype)
-        motion_tensor[..., self._joint_indexes_in_motion] = robot_tensor
-        return motion_tensor
-
-    def _motion_state(self, idx: int, dtype: torch.dtype, device: torch.device) -> dict[str, torch.Tensor]:
-        """Slice motion tensors at a given index into a state dict."""
-        state = {
-            "joint_pos": self.motion._joint_pos[idx].to(device=device, dtype=dtype),
-            "joint_vel": self.motion._joint_vel[idx].to(device=device, dtype=dtype),
-            "body_pos": self.motion._body_pos_w[idx].to(device=device, dtype=dtype),
-            "body_quat": self.motion._body_quat_w[idx].to(device=device, dtype=dtype),
-            "body_lin_vel": self.motion._body_lin_vel_w[idx].to(device=device, dtype=dtype),
-            "body_ang_vel": self.motion._body_ang_vel_w[idx].to(device=device, dtype=dtype),
-        }
-        if self.motion.has_object:
-            state["object_pos"] = self.motion._object_pos_w[idx].to(device=device, dtype=dtype)
-            state["object_quat"] = self.motion._object_quat_w[idx].to(device=device, dtype=dtype)
-            state["object_lin_vel"] = self.motion._object_lin_vel_w[idx].to(device=device, dtype=dtype)
-        return state
-
-    def _default_motion_state(
-        self, default_state: dict[str, torch.Tensor], dtype: torch.dtype, device: torch.device
+    def _motion_state(
+        self, clip: MotionLoader, idx: int, dtype: torch.dtype, device: torch.device
     ) -> dict[str, torch.Tensor]:
-        """Map default robot-state tensors into motion order for interpolation."""
-        state = {
-            "joint_pos": self._map_robot_joints_to_motion_order(
-                default_state["joint_pos"].to(device=device, dtype=dtype),
-                num_motion_joints=self.motion._joint_pos.shape[1],
-            ),
-            "joint_vel": self._map_robot_joints_to_motion_order(
-                default_state["joint_vel"].to(device=device, dtype=dtype),
-                num_motion_joints=self.motion._joint_vel.shape[1],
-            ),
-            "body_pos": default_state["body_pos"].to(device=device, dtype=dtype),
-            "body_quat": default_state["body_quat"].to(device=device, dtype=dtype),
-            "body_lin_vel": default_state["body_lin_vel"].to(device=device, dtype=dtype),
-            "body_ang_vel": default_state["body_ang_vel"].to(device=device, dtype=dtype),
-        }
-        if self.motion.has_object:
-            state["object_pos"] = default_state["object_pos"].to(device=device, dtype=dtype)
-            state["object_quat"] = default_state["object_quat"].to(device=device, dtype=dtype)
-            state["object_lin_vel"] = default_state["object_lin_vel"].to(device=device, dtype=dtype)
-        return state
+        """Slice motion frames at a given index into a state dict."""
+        frame = clip.frames[idx].to(device=device, dtype=dtype)
+        return {name: clip.unpack(frame, name) for name in clip.layout}
 
     def _build_transition_segments(
         self,
+        clip: MotionLoader,
         start: dict[str, torch.Tensor],
         target: dict[str, torch.Tensor],
         alphas: torch.Tensor,
@@ -1040,7 +1164,7 @@ class MotionCommand(CommandTermBase):
             "body_quat": self._slerp_quat_sequence(start["body_quat"], target["body_quat"], alphas),
         }
 
-        if self.motion.has_object:
+        if clip.has_object:
             segments["object_pos"] = _lerp(start["object_pos"], target["object_pos"], alphas_joint)
             segments["object_lin_vel"] = _lerp(start["object_lin_vel"], target["object_lin_vel"], alphas_joint)
             segments["object_quat"] = self._slerp_quat_sequence(
@@ -1049,12 +1173,13 @@ class MotionCommand(CommandTermBase):
 
         return segments
 
-    def _apply_transition_segments(self, segments: dict[str, torch.Tensor], prepend: bool) -> None:
+    def _apply_transition_segments(self, clip: MotionLoader, segments: dict[str, torch.Tensor], prepend: bool) -> None:
         """Splice interpolated segments into motion data, either prepending or appending."""
-        self.motion = self.motion.extend_with_segments(segments, prepend=prepend)
+        clip.extend_with_segments(segments, prepend=prepend)
 
     def _build_and_apply_transition(
         self,
+        clip: MotionLoader,
         start_state: dict[str, torch.Tensor],
         target_state: dict[str, torch.Tensor],
         num_steps: int,
@@ -1079,8 +1204,8 @@ class MotionCommand(CommandTermBase):
         alphas_joint = alphas.view(num_steps, 1)
         alphas_body = alphas.view(num_steps, 1, 1)
 
-        segments = self._build_transition_segments(start_state, target_state, alphas, alphas_joint, alphas_body)
-        self._apply_transition_segments(segments, prepend=prepend)
+        segments = self._build_transition_segments(clip, start_state, target_state, alphas, alphas_joint, alphas_body)
+        self._apply_transition_segments(clip, segments, prepend=prepend)
 
     def _setup_visualization_markers_for_isaacsim(self):
         from isaaclab.markers import VisualizationMarkers
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, cast
+
+import numpy as np
+import pytest
+import torch
+
+from holosoma.config_types.command import MotionConfig
+from holosoma.envs.wbt.wbt_manager import WholeBodyTrackingManager
+from holosoma.managers.command.terms.wbt import AdaptiveTimestepsSampler, MotionCommand, MotionLibrary, MotionLoader
+
+NUM_FRAMES = 20
+MOTION_BODIES = ["pelvis", "torso", "left_foot", "right_foot", "head"]
+MOTION_JOINTS = ["j0", "j1", "j2", "j3"]
+ROBOT_BODIES = ["pelvis", "left_foot", "right_foot", "torso"]
+ROBOT_JOINTS = ["j3", "j0", "j2"]
+
+
+@pytest.fixture
+def motion_file(tmp_path) -> tuple[str, dict[str, np.ndarray]]:
+    rng = np.random.default_rng(0)
+    num_bodies, num_joints = len(MOTION_BODIES), len(MOTION_JOINTS)
+    data: Dict[str, np.ndarray] = {
+        "fps": np.array(50),
+        "body_names": np.array(MOTION_BODIES),
+        "joint_names": np.array(MOTION_JOINTS),
+        "joint_pos": rng.standard_normal((NUM_FRAMES, 7 + num_joints)).astype(np.float32),
+        "joint_vel": rng.standard_normal((NUM_FRAMES, 6 + num_joints)).astype(np.float32),
+        "body_pos_w": rng.standard_normal((NUM_FRAMES, num_bodies, 3)).astype(np.float32),
+        "body_quat_w": rng.standard_normal((NUM_FRAMES, num_bodies, 4)).astype(np.float32),
+        "body_lin_vel_w": rng.standard_normal((NUM_FRAMES, num_bodies, 3)).astype(np.float32),
+        "body_ang_vel_w": rng.standard_normal((NUM_FRAMES, num_bodies, 3)).astype(np.float32),
+    }
+    path = tmp_path / "motion.npz"
+    # Any: numpy's stubs match ** mappings against the bool allow_pickle keyword
+    np.savez(path, **cast("Dict[str, Any]", data))
+    return str(path), data
+
+
+def test_motion_loader_stores_fields_in_robot_order(motion_file):
+    path, data = motion_file
+    motion = MotionLoader(path, ROBOT_BODIES, ROBOT_JOINTS)
+    body_idx = [MOTION_BODIES.index(name) for name in ROBOT_BODIES]
+    joint_idx = [MOTION_JOINTS.index(name) for name in ROBOT_JOINTS]
+
+    assert motion.frames.is_contiguous()
+    assert motion.time_step_total == NUM_FRAMES
+    torch.testing.assert_close(motion.joint_pos, torch.from_numpy(data["joint_pos"][:, 7:][:, joint_idx]))
+    torch.testing.assert_close(motion.joint_vel, torch.from_numpy(data["joint_vel"][:, 6:][:, joint_idx]))
+    torch.testing.assert_close(motion.body_pos_w, torch.from_numpy(data["body_pos_w"][:, body_idx]))
+    torch.testing.assert_close(
+        motion.body_quat_w, torch.from_numpy(data["body_quat_w"][:, body_idx][..., [1, 2, 3, 0]])
+    )
+    torch.testing.assert_close(motion.body_ang_vel_w, torch.from_numpy(data["body_ang_vel_w"][:, body_idx]))
+    assert motion.object_pos_w.shape == (0, 3)
+
+
+def test_extend_with_segments_round_trips_packed_fields(motion_file):
+    path, _ = motion_file
+    motion = MotionLoader(path, ROBOT_BODIES, ROBOT_JOINTS)
+    original = motion.frames.clone()
+    segments = {name: motion.unpack(original[:3] + 1.0, name) for name in motion.layout}
+
+    motion.extend_with_segments(segments, prepend=True)
+
+    assert motion.time_step_total == NUM_FRAMES + 3
+    torch.testing.assert_close(motion.frames[:3], original[:3] + 1.0)
+    torch.testing.assert_close(motion.frames[3:], original)
+
+
+def _make_motion_command(motion: MotionLibrary, num_envs: int) -> tuple[MotionCommand, torch.Tensor]:
+    command = MotionCommand.__new__(MotionCommand)
+    command.motion = motion
+    command.num_envs = num_envs
+    command.device = "cpu"
+    command.motion_cfg = cast(
+        "MotionConfig",
+        SimpleNamespace(body_names_to_track=["torso", "left_foot"], use_adaptive_timesteps_sampler=False),
+    )
+    command.tracked_body_indexes = torch.tensor([3, 1])
+    command.ref_body_index = 3
+    env_origins = torch.arange(num_envs * 3, dtype=torch.float).view(num_envs, 3)
+    command._env = cast(
+        "WholeBodyTrackingManager",
+        SimpleNamespace(simulator=SimpleNamespace(scene=SimpleNamespace(env_origins=env_origins))),
+    )
+    command.init_buffers()
+    return command, env_origins
+
+
+def test_motion_command_properties_read_the_frame_cache(motion_file):
+    path, _ = motion_file
+    clip = MotionLoader(path, ROBOT_BODIES, ROBOT_JOINTS)
+    command, env_origins = _make_motion_command(MotionLibrary([clip], ["motion"]), num_envs=3)
+
+    command.time_steps[:] = torch.tensor([4, 0, 17])
+    command._update_frame_cache()
+    command.time_steps[1] = 9
+    command._update_frame_cache(torch.tensor([1]))
+
+    time_steps = torch.tensor([4, 9, 17])
+    torch.testing.assert_close(command.joint_pos, clip.joint_pos[time_steps])
+    torch.testing.assert_close(command.body_pos_w, clip.body_pos_w[time_steps][:, [3, 1]] + env_origins[:, None, :])
+    torch.testing.assert_close(command.body_quat_w, clip.body_quat_w[time_steps][:, [3, 1]])
+    torch.testing.assert_close(command.ref_pos_w, clip.body_pos_w[time_steps, 3] + env_origins)
+    torch.testing.assert_close(command.root_quat_w, clip.body_quat_w[time_steps, 0])
+    torch.testing.assert_close(command.ref_ang_vel_w, clip.body_ang_vel_w[time_steps, 3])
+
+
+def test_motion_library_reads_each_env_clip(motion_file):
+    path, _ = motion_file
+    clips = [MotionLoader(path, ROBOT_BODIES, ROBOT_JOINTS) for _ in range(3)]
+    clips[1].extend_with_segments(
+        {name: clips[1].unpack(clips[1].frames[:5] + 1.0, name) for name in clips[1].layout}, True
+    )
+    clips[2].frames = clips[2].frames[:7] - 1.0
+    motion = MotionLibrary(clips, ["a", "b", "c"], clip_weights=[0.0, 1.0, 3.0])
+
+    assert motion.clip_lengths.tolist() == [NUM_FRAMES, NUM_FRAMES + 5, 7]
+    assert motion.clip_starts.tolist() == [0, NUM_FRAMES, 2 * NUM_FRAMES + 5]
+    torch.testing.assert_close(motion.clip_weights, torch.tensor([0.0, 0.25, 0.75]))
+    assert set(motion.sample_clips(100).tolist()) <= {1, 2}
+
+    command, _ = _make_motion_command(motion, num_envs=3)
+    command.clip_ids[:] = torch.tensor([2, 0, 1])
+    command._clip_starts[:] = motion.clip_starts[command.clip_ids]
+    command.time_steps[:] = torch.tensor([6, 3, 2])
+    command._update_frame_cache()
+
+    for env_id, (clip_id, time_step) in enumerate([(2, 6), (0, 3), (1, 2)]):
+        torch.testing.assert_close(command._frame[env_id], clips[clip_id].frames[time_step])
+
+
+def test_adaptive_sampler_smooths_failures_within_clips():
+    single = AdaptiveTimestepsSampler(250, "cpu", env_fps=50)
+    single.bin_failed_count = torch.tensor([0.0, 3.0, 0.0, 0.0, 5.0])
+    padded = torch.nn.functional.pad(single.bin_failed_count[None, None] + 1e-6, (0, 2), mode="replicate")
+    expected = torch.nn.functional.conv1d(padded, single.kernel.view(1, 1, -1)).view(-1) + 0.01
+    torch.testing.assert_close(single.sampling_probabilities, expected / expected.sum())
+
+    sampler = AdaptiveTimestepsSampler(
+        torch.tensor([100, 150]), "cpu", env_fps=50, clip_weights=torch.tensor([1.0, 3.0])
+    )
+    assert sampler.num_bins == 5
+    sampler.update_current_bin_failed_count(torch.tensor([0, 149, 149]), torch.tensor([1, 1, 1]))
+    assert sampler.current_bin_failed_count.tolist() == [0.0, 0.0, 1.0, 0.0, 2.0]
+    sampler.update_bin_failed_count()
+
+    prob = sampler.sampling_probabilities
+    # Failures in the second clip do not leak into the last bin of the first clip
+    torch.testing.assert_close(prob[:2], torch.tensor([0.125, 0.125]))
+    torch.testing.assert_close(prob[2:].sum(), torch.tensor(0.75))
+    clip_ids, phase = sampler.sample(1000)
+    assert ((phase >= 0) & (phase < 1)).all()
+    assert 0.65 < (clip_ids == 1).float().mean() < 0.85
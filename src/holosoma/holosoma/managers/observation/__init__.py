@@ -8,11 +8,13 @@ configurable way while maintaining exact equivalence with the direct observation
 from holosoma.config_types.observation import ObservationManagerCfg, ObsGroupCfg, ObsTermCfg
 
 from .base import ObservationTermBase
+from .history import ObservationHistory
 from .manager import ObservationManager
 
 __all__ = [
     "ObsGroupCfg",
     "ObsTermCfg",
+    "ObservationHistory",
     "ObservationManager",
     "ObservationManagerCfg",
     "ObservationTermBase",
@@ -0,0 +1,147 @@
+"""Fused noise/scale/clip pipeline over preallocated observation group buffers."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import torch
+
+from holosoma.config_types.observation import ObsGroupCfg
+
+
+def fused_noise_scale_clip(
+    obs: torch.Tensor,
+    noise: torch.Tensor,
+    scale: torch.Tensor,
+    clip_min: torch.Tensor,
+    clip_max: torch.Tensor,
+    add_noise: bool,
+) -> torch.Tensor:
+    """Apply uniform noise, scaling and clipping to a whole observation group.
+
+    The per-term operations of :class:`ObservationManager` are expressed with
+    per-column vectors, keeping their order (noise, then scale, then clip).
+
+    Parameters
+    ----------
+    obs : torch.Tensor
+        Raw group observations with shape ``[num_envs, group_dim]``.
+    noise : torch.Tensor
+        Per-column noise magnitude with shape ``[group_dim]``.
+    scale : torch.Tensor
+        Per-column scale with shape ``[group_dim]``.
+    clip_min, clip_max : torch.Tensor
+        Per-column clip bounds with shape ``[group_dim]`` (``-inf``/``inf`` where unclipped).
+    add_noise : bool
+        Whether to sample noise at all.
+
+    Returns
+    -------
+    torch.Tensor
+        Processed observations with shape ``[num_envs, group_dim]``.
+    """
+    if add_noise:
+        obs = obs + (torch.rand_like(obs) * 2.0 - 1.0) * noise
+    return torch.clamp(obs * scale, clip_min, clip_max)
+
+
+class FusedObservationGroup:
+    """Preallocated column layout and fused processing for one observation group.
+
+    Terms are laid out in alphabetically sorted order (the concatenation order of
+    :class:`ObservationManager`) so every term owns a fixed column slice of a
+    persistent raw buffer. Term outputs are copied straight into their slice and
+    the whole group is processed by :func:`fused_noise_scale_clip` in one call.
+
+    Parameters
+    ----------
+    group_cfg : ObsGroupCfg
+        Configuration of the observation group.
+    term_dims : dict[str, int]
+        Output dimension of every term.
+    num_envs : int
+        Number of environments.
+    clip_observations : float
+        Global clip threshold folded into the fused clip when requested.
+    device : str
+        Device to place buffers on.
+    dtype : torch.dtype
+        Observation dtype.
+    use_compile : bool, optional
+        Whether to wrap the fused op with ``torch.compile``. Defaults to ``False``.
+    """
+
+    def __init__(
+        self,
+        group_cfg: ObsGroupCfg,
+        term_dims: dict[str, int],
+        num_envs: int,
+        clip_observations: float,
+        device: str,
+        dtype: torch.dtype,
+        *,
+        use_compile: bool = False,
+    ):
+        self.term_names = sorted(term_dims)
+        self.slices: dict[str, slice] = {}
+        offset = 0
+        for name in self.term_names:
+            self.slices[name] = slice(offset, offset + term_dims[name])
+            offset += term_dims[name]
+        self.group_dim = offset
+        self.add_noise = group_cfg.enable_noise and any(group_cfg.terms[name].noise > 0 for name in self.term_names)
+
+        self.raw = torch.zeros(num_envs, self.group_dim, device=device, dtype=dtype)
+
+        noise = torch.zeros(self.group_dim, device=device, dtype=dtype)
+        scale = torch.ones(self.group_dim, device=device, dtype=dtype)
+        clip_min = torch.full((self.group_dim,), -torch.inf, device=device, dtype=dtype)
+        clip_max = torch.full((self.group_dim,), torch.inf, device=device, dtype=dtype)
+        for name in self.term_names:
+            term_cfg = group_cfg.terms[name]
+            cols = self.slices[name]
+            if group_cfg.enable_noise and term_cfg.noise > 0:
+                noise[cols] = term_cfg.noise
+            scale[cols] = torch.as_tensor(term_cfg.scale, device=device, dtype=dtype)
+            if term_cfg.clip is not None:
+                clip_min[cols] = term_cfg.clip[0]
+                clip_max[cols] = term_cfg.clip[1]
+        self.noise = noise
+        self.scale = scale
+        self.clip_min = clip_min
+        self.clip_max = clip_max
+        # Clipping twice is equivalent to clipping once with both bounds clamped into the global range
+        self.global_clip_min = clip_min.clamp(-clip_observations, clip_observations)
+        self.global_clip_max = clip_max.clamp(-clip_observations, clip_observations)
+
+        self._op: Callable[..., torch.Tensor] = fused_noise_scale_clip
+        if use_compile:
+            self._op = torch.compile(fused_noise_scale_clip)
+
+    def write(self, term_name: str, obs: torch.Tensor) -> None:
+        """Copy a term output into its column slice of the raw buffer."""
+        self.raw[:, self.slices[term_name]] = obs
+
+    def process(self, *, apply_global_clip: bool) -> torch.Tensor:
+        """Run noise, scale and clipping over the raw buffer.
+
+        Parameters
+        ----------
+        apply_global_clip : bool
+            If ``True``, also clip to ``clip_observations`` (what ``BaseTask``
+            otherwise applies to the step observations).
+
+        Returns
+        -------
+        torch.Tensor
+            Processed observations with shape ``[num_envs, group_dim]`` in sorted term order.
+        """
+        if apply_global_clip:
+            clip_min, clip_max = self.global_clip_min, self.global_clip_max
+        else:
+            clip_min, clip_max = self.clip_min, self.clip_max
+        return self._op(self.raw, self.noise, self.scale, clip_min, clip_max, self.add_noise)
+
+    def split(self, obs: torch.Tensor) -> dict[str, torch.Tensor]:
+        """Split processed group observations into per-term column views."""
+        return {name: obs[:, self.slices[name]] for name in self.term_names}
@@ -0,0 +1,127 @@
+"""Preallocated history buffers for observation groups."""
+
+from __future__ import annotations
+
+import torch
+
+
+class ObservationHistory:
+    """Ring buffer holding the observation history of every term in a group.
+
+    All terms of a group share a single preallocated tensor that is written in
+    place each step. Each term owns a contiguous block of ``2 * history_length``
+    frames in which every observation is written twice (at ``head`` and
+    ``head + history_length``). The last ``history_length`` frames are therefore
+    always available, oldest first, as a contiguous window that can be returned
+    as a flattened view without re-stacking.
+
+    Storage is allocated lazily on the first :meth:`push` since term dimensions
+    are only known once the terms have been evaluated.
+
+    Parameters
+    ----------
+    num_envs : int
+        Number of environments.
+    history_length : int
+        Number of timesteps retained per term.
+    device : str
+        Device to place the buffer on.
+    """
+
+    def __init__(self, num_envs: int, history_length: int, device: str):
+        if history_length < 1:
+            raise ValueError(f"history_length must be >= 1, got {history_length}")
+        self.num_envs = num_envs
+        self.history_length = history_length
+        self.device = device
+
+        self._storage: torch.Tensor | None = None
+        self._term_frames: dict[str, torch.Tensor] = {}
+        self._head = 0
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the backing storage has been allocated."""
+        return self._storage is not None
+
+    def _allocate(self, terms: dict[str, torch.Tensor]) -> None:
+        """Allocate the group storage and per-term frame views.
+
+        Parameters
+        ----------
+        terms : dict[str, torch.Tensor]
+            Current observations keyed by term name, each ``[num_envs, obs_dim]``.
+        """
+        num_frames = 2 * self.history_length
+        dims = {name: obs.shape[1] for name, obs in terms.items()}
+        dtype = next(iter(terms.values())).dtype
+        total_width = num_frames * sum(dims.values())
+        self._storage = torch.zeros(self.num_envs, total_width, device=self.device, dtype=dtype)
+
+        offset = 0
+        for name, dim in dims.items():
+            width = num_frames * dim
+            # Column slice of a row-major tensor, viewed as [num_envs, 2 * history_length, obs_dim]
+            self._term_frames[name] = self._storage[:, offset : offset + width].view(self.num_envs, num_frames, dim)
+            offset += width
+
+    def push(self, terms: dict[str, torch.Tensor], *, modify_history: bool = True) -> dict[str, torch.Tensor]:
+        """Append the current observations and return the stacked histories.
+
+        Parameters
+        ----------
+        terms : dict[str, torch.Tensor]
+            Current observations keyed by term name, each ``[num_envs, obs_dim]``.
+            The same set of terms must be pushed every step.
+        modify_history : bool, optional
+            If ``True``, write the observations into the buffer. If ``False``,
+            leave the buffer untouched and build the history from the most recent
+            ``history_length - 1`` frames plus the current observation (used for
+            bootstrapping). Defaults to ``True``.
+
+        Returns
+        -------
+        dict[str, torch.Tensor]
+            Histories keyed by term name, each ``[num_envs, history_length * obs_dim]``
+            ordered oldest to newest. When ``modify_history`` is ``True`` these are
+            views into the buffer and are only valid until the next ``push``.
+        """
+        if self._storage is None:
+            self._allocate(terms)
+
+        hist_len = self.history_length
+        head = self._head
+        histories: dict[str, torch.Tensor] = {}
+
+        if not modify_history:
+            for name, obs in terms.items():
+                recent = self._term_frames[name][:, head + 1 : head + hist_len]
+                stacked = torch.cat([recent, obs.unsqueeze(1)], dim=1)
+                histories[name] = stacked.reshape(self.num_envs, -1)
+            return histories
+
+        for name, obs in terms.items():
+            frames = self._term_frames[name]
+            frames[:, head] = obs
+            frames[:, head + hist_len] = obs
+            histories[name] = frames[:, head + 1 : head + 1 + hist_len].reshape(self.num_envs, -1)
+        self._head = (head + 1) % hist_len
+        return histories
+
+    def reset(self, env_ids: torch.Tensor | None = None) -> None:
+        """Zero the history of the given environments.
+
+        Parameters
+        ----------
+        env_ids : torch.Tensor or None, optional
+            Environment IDs to reset. If ``None``, clear the history of all environments.
+        """
+        if self._storage is None:
+            return
+        if env_ids is None:
+            self._storage.zero_()
+            self._head = 0
+            return
+        if env_ids.numel() == 0:
+            return
+        self._storage[env_ids] = 0.0
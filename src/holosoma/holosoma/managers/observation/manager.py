@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Any, Callable
 
 import torch
@@ -11,6 +10,8 @@ from holosoma.config_types.observation import ObservationManagerCfg, ObsGroupCfg
 from holosoma.managers.utils import resolve_callable
 
 from .base import ObservationTermBase
+from .fused import FusedObservationGroup
+from .history import ObservationHistory
 
 
 class ObservationManager:
@@ -41,8 +42,11 @@ class ObservationManager:
         self._term_funcs: dict[str, dict[str, Callable]] = {}
         self._term_instances: dict[str, dict[str, ObservationTermBase]] = {}
 
-        # History buffers: group_name -> term_name -> deque
-        self._history_buffers: dict[str, dict[str, deque]] = {}
+        # History buffers: group_name -> preallocated ring buffer shared by the group's terms
+        self._history_buffers: dict[str, ObservationHistory] = {}
+
+        # Fused group layouts (only when ``cfg.fused``), built lazily once term dimensions are known
+        self._fused_groups: dict[str, FusedObservationGroup] = {}
 
         # Initialize groups
         self._initialize_groups()
@@ -52,7 +56,12 @@ class ObservationManager:
         for group_name, group_cfg in self.cfg.groups.items():
             self._term_funcs[group_name] = {}
             self._term_instances[group_name] = {}
-            self._history_buffers[group_name] = {}
+
+            # Initialize history buffer if needed (using group-level history_length)
+            if group_cfg.history_length > 1:
+                self._history_buffers[group_name] = ObservationHistory(
+                    self.env.num_envs, group_cfg.history_length, self.device
+                )
 
             for term_name, term_cfg in group_cfg.terms.items():
                 # Resolve function
@@ -67,9 +76,10 @@ class ObservationManager:
                     # Stateless function
                     self._term_funcs[group_name][term_name] = func
 
-                # Initialize history buffer if needed (using group-level history_length)
-                if group_cfg.history_length > 1:
-                    self._history_buffers[group_name][term_name] = deque(maxlen=group_cfg.history_length)
+    @property
+    def applies_global_clip(self) -> bool:
+        """Whether ``compute`` already clips observations to ``cfg.clip_observations``."""
+        return self.cfg.fused
 
     def compute(self, *, modify_history: bool = True) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
         """Compute all observation groups.
@@ -111,6 +121,9 @@ class ObservationManager:
             a dictionary of tensors keyed by term name.
         """
         group_cfg = self.cfg.groups[group_name]
+        if self.cfg.fused:
+            return self._compute_group_fused(group_name, group_cfg, modify_history=modify_history)
+
         obs_tensors = {}
 
         for term_name, term_cfg in group_cfg.terms.items():
@@ -128,12 +141,15 @@ class ObservationManager:
             if term_cfg.clip is not None:
                 obs = obs.clip(term_cfg.clip[0], term_cfg.clip[1])
 
-            # 5. Handle history buffering
-            if group_cfg.history_length > 1:
-                obs = self._apply_history(group_name, term_name, obs, group_cfg, modify_buffer=modify_history)
-
             obs_tensors[term_name] = obs
 
+        # 5. Handle history buffering
+        if group_cfg.history_length > 1:
+            obs_tensors = self._apply_history(group_name, obs_tensors, modify_buffer=modify_history)
+            if not group_cfg.concatenate:
+                # History views alias the ring buffer; hand out tensors that survive the next step
+                obs_tensors = {key: value.clone() for key, value in obs_tensors.items()}
+
         # Concatenate or return dict
         if group_cfg.concatenate:
             # Concatenate in alphabetically sorted order (to match direct system behavior)
@@ -142,6 +158,81 @@ class ObservationManager:
             return torch.cat([obs_tensors[key] for key in sorted_keys], dim=-1)
         return obs_tensors
 
+    def _compute_group_fused(
+        self, group_name: str, group_cfg: ObsGroupCfg, *, modify_history: bool = True
+    ) -> torch.Tensor | dict[str, torch.Tensor]:
+        """Compute a group through its preallocated buffer and fused processing op.
+
+        Produces the same values as the unfused path (noise, scale and term clipping in
+        that order), except that noise is sampled with a single draw for the whole group.
+        Step observations (``modify_history=True``) are also clipped to
+        ``cfg.clip_observations``, so ``BaseTask`` does not need to clip them again.
+        History buffers store observations without that clip, like the unfused path,
+        so final observations (``modify_history=False``) match it too.
+
+        Parameters
+        ----------
+        group_name : str
+            Name of the observation group to compute.
+        group_cfg : ObsGroupCfg
+            Configuration of the observation group.
+        modify_history : bool, optional
+            If ``True``, update history buffers; if ``False``, preserve them
+            for bootstrapping. Defaults to ``True``.
+
+        Returns
+        -------
+        torch.Tensor | dict[str, torch.Tensor]
+            Concatenated tensor when ``group.concatenate`` is ``True``; otherwise
+            a dictionary of tensors keyed by term name.
+        """
+        fused = self._fused_groups.get(group_name)
+        if fused is None:
+            term_outputs = {
+                term_name: self._evaluate_term(group_name, term_name, term_cfg)
+                for term_name, term_cfg in group_cfg.terms.items()
+            }
+            fused = FusedObservationGroup(
+                group_cfg,
+                {term_name: obs.shape[1] for term_name, obs in term_outputs.items()},
+                self.env.num_envs,
+                self.cfg.clip_observations,
+                self.device,
+                next(iter(term_outputs.values())).dtype,
+                use_compile=self.cfg.compile,
+            )
+            self._fused_groups[group_name] = fused
+            for term_name, obs in term_outputs.items():
+                fused.write(term_name, obs)
+        else:
+            for term_name, term_cfg in group_cfg.terms.items():
+                fused.write(term_name, self._evaluate_term(group_name, term_name, term_cfg))
+
+        if group_cfg.history_length > 1:
+            # The global clip is applied to the stacked history instead of folded into the fused op
+            clip_limit = self.cfg.clip_observations
+            obs = fused.process(apply_global_clip=False)
+            obs_tensors = self._apply_history(group_name, fused.split(obs), modify_buffer=modify_history)
+            if group_cfg.concatenate:
+                obs = torch.cat([obs_tensors[key] for key in fused.term_names], dim=-1)
+                return obs.clamp_(-clip_limit, clip_limit) if modify_history else obs
+            obs_tensors = {key: value.clone() for key, value in obs_tensors.items()}
+            if modify_history:
+                for value in obs_tensors.values():
+                    value.clamp_(-clip_limit, clip_limit)
+            return obs_tensors
+
+        obs = fused.process(apply_global_clip=modify_history)
+        if group_cfg.concatenate:
+            return obs
+        return fused.split(obs)
+
+    def _evaluate_term(self, group_name: str, term_name: str, term_cfg: ObsTermCfg) -> torch.Tensor:
+        """Call a term's function or instance without copying its output."""
+        if term_name in self._term_instances[group_name]:
+            return self._term_instances[group_name][term_name](self.env, **term_cfg.params)
+        return self._term_funcs[group_name][term_name](self.env, **term_cfg.params)
+
     def _compute_term(self, group_name: str, term_name: str, term_cfg: ObsTermCfg) -> torch.Tensor:
         """Compute a single observation term.
 
@@ -159,17 +250,7 @@ class ObservationManager:
         torch.Tensor
             Observation tensor with shape ``[num_envs, obs_dim]``.
         """
-        # Check if stateful or stateless
-        if term_name in self._term_instances[group_name]:
-            # Stateful term
-            instance = self._term_instances[group_name][term_name]
-            obs = instance(self.env, **term_cfg.params)
-        else:
-            # Stateless function
-            func = self._term_funcs[group_name][term_name]
-            obs = func(self.env, **term_cfg.params)
-
-        return obs.clone()
+        return self._evaluate_term(group_name, term_name, term_cfg).clone()
 
     def _apply_noise(self, obs: torch.Tensor, noise_scale: float) -> torch.Tensor:
         """Apply uniform observation noise.
@@ -211,57 +292,32 @@ class ObservationManager:
         return obs * scale
 
     def _apply_history(
-        self, group_name: str, term_name: str, obs: torch.Tensor, group_cfg: ObsGroupCfg, *, modify_buffer: bool = True
-    ) -> torch.Tensor:
-        """Apply history buffering to an observation term.
+        self, group_name: str, obs_tensors: dict[str, torch.Tensor], *, modify_buffer: bool = True
+    ) -> dict[str, torch.Tensor]:
+        """Apply history buffering to the observation terms of a group.
 
-        Maintains a circular buffer of past observations and returns them
-        concatenated along the feature dimension.
+        Appends the current observations to the group's preallocated ring buffer
+        and returns, for each term, its past observations concatenated along the
+        feature dimension (oldest first, zero-padded until the buffer is full).
 
         Parameters
         ----------
         group_name : str
             Name of the observation group.
-        term_name : str
-            Name of the observation term.
-        obs : torch.Tensor
-            Current observation tensor with shape ``[num_envs, obs_dim]``.
-        group_cfg : ObsGroupCfg
-            Configuration for the observation group (contains ``history_length``).
+        obs_tensors : dict[str, torch.Tensor]
+            Current observation tensors keyed by term name, each with shape
+            ``[num_envs, obs_dim]``.
         modify_buffer : bool, optional
             If ``True``, append to the history buffer; if ``False``, preserve the
             buffer contents. Defaults to ``True``.
 
         Returns
         -------
-        torch.Tensor
-            Historical observations with shape ``[num_envs, obs_dim * history_length]``.
+        dict[str, torch.Tensor]
+            Historical observations keyed by term name, each with shape
+            ``[num_envs, obs_dim * history_length]``.
         """
-        buffer = self._history_buffers[group_name][term_name]
-
-        if modify_buffer:
-            # Add current observation to buffer
-            buffer.append(obs)
-            history = list(buffer)
-        else:
-            # Don't modify buffer - create temporary history with current obs
-            history = list(buffer) + [obs]
-            # Trim to history_length if needed
-            if len(history) > group_cfg.history_length:
-                history = history[-group_cfg.history_length :]
-
-        # If buffer not full yet, pad with zeros (same as direct behavior)
-        if len(history) < group_cfg.history_length:
-            num_missing = group_cfg.history_length - len(history)
-            obs_dim = obs.shape[1]
-            padding = [torch.zeros(self.env.num_envs, obs_dim, device=self.device) for _ in range(num_missing)]
-            history = padding + history
-
-        # Stack along time dimension: [num_envs, history_length, obs_dim]
-        stacked = torch.stack(history, dim=1)
-
-        # Flatten to [num_envs, history_length * obs_dim]
-        return stacked.reshape(self.env.num_envs, -1)
+        return self._history_buffers[group_name].push(obs_tensors, modify_history=modify_buffer)
 
     def reset(self, env_ids: torch.Tensor | None = None) -> None:
         """Reset observation history and stateful terms.
@@ -281,15 +337,8 @@ class ObservationManager:
             env_ids_tensor = torch.as_tensor(env_ids, device=self.device, dtype=torch.long)
 
         # Reset or clear history buffers
-        for group_buffers in self._history_buffers.values():
-            for buffer in group_buffers.values():
-                if env_ids_tensor is None:
-                    buffer.clear()
-                else:
-                    if env_ids_tensor.numel() == 0:
-                        continue
-                    for history in buffer:
-                        history[env_ids_tensor] = 0.0
+        for history in self._history_buffers.values():
+            history.reset(env_ids_tensor)
 
         # Reset stateful term instances
         for group_instances in self._term_instances.values():
@@ -7,7 +7,12 @@ from typing import TYPE_CHECKING
 import torch
 
 from holosoma.managers.command.terms.wbt import MotionCommand
-from holosoma.utils.rotations import quat_rotate_inverse, quaternion_to_matrix, subtract_frame_transforms
+from holosoma.utils.rotations import (
+    quat_rotate_inverse,
+    quaternion_to_matrix,
+    subtract_frame_transforms,
+    subtract_frame_transforms_broadcast_jit,
+)
 from holosoma.utils.torch_utils import get_axis_params, to_torch
 
 if TYPE_CHECKING:
@@ -161,10 +166,9 @@ def motion_ref_ori_b(env: WholeBodyTrackingManager) -> torch.Tensor:
 def robot_body_pos_b(env: WholeBodyTrackingManager) -> torch.Tensor:
     motion_command = _get_motion_command_and_assert_type(env)
 
-    num_bodies = len(motion_command.motion_cfg.body_names_to_track)
-    pos_b, _ = subtract_frame_transforms(
-        motion_command.robot_ref_pos_w[:, None, :].repeat(1, num_bodies, 1),
-        motion_command.robot_ref_quat_w[:, None, :].repeat(1, num_bodies, 1),
+    pos_b, _ = subtract_frame_transforms_broadcast_jit(
+        motion_command.robot_ref_pos_w,
+        motion_command.robot_ref_quat_w,
         motion_command.robot_body_pos_w,
         motion_command.robot_body_quat_w,
     )
@@ -175,10 +179,9 @@ def robot_body_pos_b(env: WholeBodyTrackingManager) -> torch.Tensor:
 def robot_body_ori_b(env: WholeBodyTrackingManager) -> torch.Tensor:
     motion_command = _get_motion_command_and_assert_type(env)
 
-    num_bodies = len(motion_command.motion_cfg.body_names_to_track)
-    _, ori_b = subtract_frame_transforms(
-        motion_command.robot_ref_pos_w[:, None, :].repeat(1, num_bodies, 1),
-        motion_command.robot_ref_quat_w[:, None, :].repeat(1, num_bodies, 1),
+    _, ori_b = subtract_frame_transforms_broadcast_jit(
+        motion_command.robot_ref_pos_w,
+        motion_command.robot_ref_quat_w,
         motion_command.robot_body_pos_w,
         motion_command.robot_body_quat_w,
     )
@@ -0,0 +1,90 @@
+"""Tests for the fused observation group pipeline."""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from holosoma.managers.observation import ObservationManager
+
+NUM_ENVS = 8
+
+
+def _make_cfg(*, fused: bool, history_length: int, enable_noise: bool = False, concatenate: bool = True):
+    def term_vel(env):
+        return env.state[:, :3] * 50.0
+
+    def term_pos(env):
+        return env.state[:, 3:7]
+
+    terms = {
+        "vel": SimpleNamespace(func=term_vel, params={}, scale=2.0, noise=0.0, clip=(-40.0, 150.0)),
+        "pos": SimpleNamespace(func=term_pos, params={}, scale=0.25, noise=0.1, clip=None),
+    }
+    group = SimpleNamespace(
+        terms=terms, concatenate=concatenate, enable_noise=enable_noise, history_length=history_length
+    )
+    return SimpleNamespace(groups={"actor_obs": group}, clip_observations=100.0, fused=fused, compile=False)
+
+
+@pytest.mark.parametrize("history_length", [1, 3])
+def test_fused_matches_default_pipeline(history_length):
+    env = SimpleNamespace(num_envs=NUM_ENVS, state=torch.zeros(NUM_ENVS, 7))
+    default_cfg = _make_cfg(fused=False, history_length=history_length)
+    fused_cfg = _make_cfg(fused=True, history_length=history_length)
+    default = ObservationManager(default_cfg, env, "cpu")
+    fused = ObservationManager(fused_cfg, env, "cpu")
+    assert fused.applies_global_clip
+    assert not default.applies_global_clip
+
+    torch.manual_seed(0)
+    for step in range(5):
+        env.state = torch.randn(NUM_ENVS, 7)
+
+        final_default = default.compute(modify_history=False)["actor_obs"]
+        final_fused = fused.compute(modify_history=False)["actor_obs"]
+        torch.testing.assert_close(final_fused, final_default, rtol=0, atol=0)
+
+        # BaseTask clips the default pipeline's step observations afterwards
+        expected = default.compute()["actor_obs"].clip(-100.0, 100.0)
+        torch.testing.assert_close(fused.compute()["actor_obs"], expected, rtol=0, atol=0)
+
+        if step == 2:
+            env_ids = torch.tensor([1, 4])
+            default.reset(env_ids)
+            fused.reset(env_ids)
+
+
+@pytest.mark.parametrize("concatenate", [True, False])
+def test_fused_final_observations_with_history(concatenate):
+    env = SimpleNamespace(num_envs=NUM_ENVS, state=torch.zeros(NUM_ENVS, 7))
+    default = ObservationManager(_make_cfg(fused=False, history_length=3, concatenate=concatenate), env, "cpu")
+    fused = ObservationManager(_make_cfg(fused=True, history_length=3, concatenate=concatenate), env, "cpu")
+
+    torch.manual_seed(0)
+    for _ in range(4):
+        # Velocities beyond the global clip of 100, stored in the history
+        env.state = torch.randn(NUM_ENVS, 7) * 2.0
+        default.compute()
+        fused.compute()
+
+    # Final observations are not globally clipped, neither their history
+    final_default = default.compute(modify_history=False)["actor_obs"]
+    final_fused = fused.compute(modify_history=False)["actor_obs"]
+    torch.testing.assert_close(final_fused, final_default, rtol=0, atol=0)
+    if concatenate:
+        assert final_fused.abs().max() > 100.0
+
+
+def test_fused_noise_only_touches_noisy_terms():
+    env = SimpleNamespace(num_envs=NUM_ENVS, state=torch.randn(NUM_ENVS, 7))
+    cfg = _make_cfg(fused=True, history_length=1, enable_noise=True)
+    manager = ObservationManager(cfg, env, "cpu")
+
+    obs = manager.compute()["actor_obs"]
+    # Sorted term order: pos (4 columns, noisy) then vel (3 columns, noiseless)
+    expected_vel = (env.state[:, :3] * 50.0 * 2.0).clip(-40.0, 100.0)
+    torch.testing.assert_close(obs[:, 4:], expected_vel, rtol=0, atol=0)
+    pos_error = obs[:, :4] - env.state[:, 3:7] * 0.25
+    assert pos_error.abs().max() <= 0.1 * 0.25 + 1e-6
+    assert pos_error.abs().max() > 0.0
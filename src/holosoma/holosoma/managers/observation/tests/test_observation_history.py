@@ -0,0 +1,99 @@
+"""Tests for the preallocated observation history buffer."""
+
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from holosoma.managers.observation import ObservationHistory, ObservationManager
+
+NUM_ENVS = 4
+TERM_DIMS = {"a": 3, "b": 5}
+
+
+def _reference_history(buffer: deque, obs: torch.Tensor, history_length: int, *, modify: bool) -> torch.Tensor:
+    """Deque-based history stacking used before the ring buffer was introduced."""
+    if modify:
+        buffer.append(obs)
+        history = list(buffer)
+    else:
+        history = (list(buffer) + [obs])[-history_length:]
+    padding = [torch.zeros_like(obs) for _ in range(history_length - len(history))]
+    return torch.stack(padding + history, dim=1).reshape(obs.shape[0], -1)
+
+
+@pytest.mark.parametrize("history_length", [1, 2, 5])
+def test_push_matches_deque_reference(history_length):
+    torch.manual_seed(0)
+    history = ObservationHistory(NUM_ENVS, history_length, "cpu")
+    reference = {name: deque(maxlen=history_length) for name in TERM_DIMS}
+
+    for step in range(3 * history_length + 2):
+        terms = {name: torch.randn(NUM_ENVS, dim) for name, dim in TERM_DIMS.items()}
+
+        # Bootstrapping path must not modify the buffer
+        peek = history.push(terms, modify_history=False)
+        for name, obs in terms.items():
+            expected = _reference_history(reference[name], obs, history_length, modify=False)
+            torch.testing.assert_close(peek[name], expected, rtol=0, atol=0)
+
+        out = history.push(terms)
+        for name, obs in terms.items():
+            expected = _reference_history(reference[name], obs, history_length, modify=True)
+            torch.testing.assert_close(out[name], expected, rtol=0, atol=0)
+
+        if step == history_length:
+            env_ids = torch.tensor([0, 2])
+            history.reset(env_ids)
+            for buffer in reference.values():
+                for frame in buffer:
+                    frame[env_ids] = 0.0
+
+
+def test_full_reset_clears_history():
+    history = ObservationHistory(NUM_ENVS, 3, "cpu")
+    for _ in range(4):
+        history.push({"a": torch.ones(NUM_ENVS, 2)})
+    history.reset()
+    out = history.push({"a": torch.full((NUM_ENVS, 2), 2.0)})
+    expected = torch.cat([torch.zeros(NUM_ENVS, 4), torch.full((NUM_ENVS, 2), 2.0)], dim=1)
+    torch.testing.assert_close(out["a"], expected)
+
+
+def test_manager_concatenates_histories_in_sorted_term_order():
+    counter = {"step": 0}
+
+    def term_b(env):
+        return torch.full((env.num_envs, 2), float(counter["step"]))
+
+    def term_a(env):
+        return torch.full((env.num_envs, 1), -float(counter["step"]))
+
+    # Plain namespaces so term callables can be passed directly instead of import paths
+    cfg = SimpleNamespace(
+        groups={
+            "actor_obs": SimpleNamespace(
+                terms={
+                    "b": SimpleNamespace(func=term_b, params={}, scale=1.0, noise=0.0, clip=None),
+                    "a": SimpleNamespace(func=term_a, params={}, scale=1.0, noise=0.0, clip=None),
+                },
+                concatenate=True,
+                enable_noise=False,
+                history_length=2,
+            )
+        },
+        clip_observations=100.0,
+        fused=False,
+        compile=False,
+    )
+    env = SimpleNamespace(num_envs=NUM_ENVS)
+    manager = ObservationManager(cfg, env, "cpu")
+
+    counter["step"] = 1
+    manager.compute()
+    counter["step"] = 2
+    obs = manager.compute()["actor_obs"]
+
+    expected_row = torch.tensor([-1.0, -2.0, 1.0, 1.0, 2.0, 2.0])
+    torch.testing.assert_close(obs, expected_row.expand(NUM_ENVS, -1))
@@ -45,15 +45,25 @@ class RewardManager:
         # Initialize terms
         self._initialize_terms()
 
+        num_terms = len(self._term_names)
+
         # Buffers for reward tracking
         self._reward_buf = torch.zeros(self.env.num_envs, dtype=torch.float, device=self.device)
 
-        # Episode sums for each term (for logging)
+        # Raw term outputs of the current step, one row per term: [num_terms, num_envs]
+        self._term_values = torch.zeros(num_terms, self.env.num_envs, dtype=torch.float, device=self.device)
+        # Term weights, kept in sync with ``_term_cfgs`` by ``set_term_cfg``
+        self._term_weights = torch.tensor(
+            [term_cfg.weight for term_cfg in self._term_cfgs], dtype=torch.float, device=self.device
+        )
+
+        # Episode sums for each term (for logging): [2, num_terms, num_envs] holding scaled and raw sums
+        self._episode_sums_buf = torch.zeros(2, num_terms, self.env.num_envs, dtype=torch.float, device=self.device)
         self._episode_sums: dict[str, torch.Tensor] = {}
         self._episode_sums_raw: dict[str, torch.Tensor] = {}
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.env.num_envs, dtype=torch.float, device=self.device)
-            self._episode_sums_raw[term_name] = torch.zeros(self.env.num_envs, dtype=torch.float, device=self.device)
+        for idx, term_name in enumerate(self._term_names):
+            self._episode_sums[term_name] = self._episode_sums_buf[0, idx]
+            self._episode_sums_raw[term_name] = self._episode_sums_buf[1, idx]
 
     def _initialize_terms(self) -> None:
         """Initialize reward terms and resolve their functions/classes."""
@@ -126,9 +136,10 @@ class RewardManager:
     def compute(self, dt: float) -> torch.Tensor:
         """Compute the total reward as a weighted sum of individual terms.
 
-        Each reward term is evaluated, scaled by its configured weight and the
-        environment time step, and accumulated into the total reward. Episodic
-        sums are updated for logging purposes.
+        Each reward term is evaluated into its row of a ``[num_terms, num_envs]``
+        buffer. Scaling by the term weights and the environment time step, the
+        total reward and the episodic sums used for logging are then computed
+        with batched ops over all terms.
 
         Notes
         -----
@@ -145,11 +156,8 @@ class RewardManager:
         torch.Tensor
             Net reward tensor with shape ``[num_envs]``.
         """
-        # Reset computation
-        self._reward_buf[:] = 0.0
-
-        # Iterate over all reward terms
-        for term_name, term_cfg in zip(self._term_names, self._term_cfgs):
+        # Evaluate all reward terms into their rows of the term buffer
+        for idx, (term_name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
             # Compute raw reward value
             if term_name in self._term_instances:
                 # Stateful term
@@ -167,19 +175,21 @@ class RewardManager:
                     f"Expected [{self.env.num_envs}], got {rew_raw.shape}"
                 )
 
-            # Scale by weight and dt
-            rew_scaled = rew_raw * term_cfg.weight * dt
+            self._term_values[idx] = rew_raw
+
+        # Scale by weight and dt
+        rew_scaled = self._term_values * self._term_weights.unsqueeze(1) * dt
 
-            # Accumulate
-            self._reward_buf += rew_scaled
+        # Accumulate
+        torch.sum(rew_scaled, dim=0, out=self._reward_buf)
 
-            # Track episodic sums
-            self._episode_sums[term_name] += rew_scaled
-            self._episode_sums_raw[term_name] += rew_raw
+        # Track episodic sums
+        self._episode_sums_buf[0] += rew_scaled
+        self._episode_sums_buf[1] += self._term_values
 
         # Optionally clip to positive
         if self.cfg.only_positive_rewards:
-            self._reward_buf[:] = torch.clip(self._reward_buf, min=0.0)
+            self._reward_buf.clamp_(min=0.0)
 
         return self._reward_buf
 
@@ -222,32 +232,21 @@ class RewardManager:
 
             env_ids_slice = env_ids_tensor
 
-        # Helper to detach values before zeroing internal buffers
-        def _clone(tensor: torch.Tensor) -> torch.Tensor:
-            return tensor.detach().clone()
+        # Average over the episode length (this also detaches values from the internal buffers)
+        sums_all = self._episode_sums_buf / self.env.max_episode_length_s
+        sums_reset = sums_all if env_ids_tensor is None else sums_all[:, :, env_ids_slice]
 
-        # Populate scaled reward statistics
-        for term_name in self._term_names:
-            rew_all = self._episode_sums[term_name] / self.env.max_episode_length_s
-            extras["episode_all"][f"rew_{term_name}"] = _clone(rew_all)
-            if env_ids_tensor is None:
-                extras["episode"][f"rew_{term_name}"] = _clone(rew_all)
-            else:
-                extras["episode"][f"rew_{term_name}"] = _clone(rew_all[env_ids_slice])
-
-            # Reset episodic sums for the completed environments
-            self._episode_sums[term_name][env_ids_slice] = 0.0
+        for idx, term_name in enumerate(self._term_names):
+            # Populate scaled reward statistics
+            extras["episode_all"][f"rew_{term_name}"] = sums_all[0, idx]
+            extras["episode"][f"rew_{term_name}"] = sums_reset[0, idx]
 
-        # Populate raw (unscaled) reward statistics
-        for term_name in self._term_names:
-            rew_raw_all = self._episode_sums_raw[term_name] / self.env.max_episode_length_s
-            extras["raw_episode_all"][f"raw_rew_{term_name}"] = _clone(rew_raw_all)
-            if env_ids_tensor is None:
-                extras["raw_episode"][f"raw_rew_{term_name}"] = _clone(rew_raw_all)
-            else:
-                extras["raw_episode"][f"raw_rew_{term_name}"] = _clone(rew_raw_all[env_ids_slice])
+            # Populate raw (unscaled) reward statistics
+            extras["raw_episode_all"][f"raw_rew_{term_name}"] = sums_all[1, idx]
+            extras["raw_episode"][f"raw_rew_{term_name}"] = sums_reset[1, idx]
 
-            self._episode_sums_raw[term_name][env_ids_slice] = 0.0
+        # Reset episodic sums for the completed environments
+        self._episode_sums_buf[:, :, env_ids_slice] = 0.0
 
         # Reset stateful reward terms
         for instance in self._term_instances.values():
@@ -320,9 +319,10 @@ class RewardManager:
         """
         try:
             idx = self._term_names.index(name)
-            self._term_cfgs[idx] = cfg
         except ValueError:
             raise KeyError(f"Reward term '{name}' not found")
+        self._term_cfgs[idx] = cfg
+        self._term_weights[idx] = cfg.weight
 
     def __str__(self) -> str:
         """String representation of reward manager."""
@@ -0,0 +1,51 @@
+"""Tests for the batched reward manager."""
+
+from types import SimpleNamespace
+
+import torch
+
+from holosoma.config_types.reward import RewardManagerCfg, RewardTermCfg
+from holosoma.managers.reward import RewardManager
+
+NUM_ENVS = 6
+DT = 0.02
+TERMS = "holosoma.managers.reward.terms.locomotion"
+
+
+def _make_manager():
+    env = SimpleNamespace(num_envs=NUM_ENVS, max_episode_length_s=20.0, device="cpu")
+    cfg = RewardManagerCfg(
+        terms={
+            "alive": RewardTermCfg(func=f"{TERMS}:alive", weight=1.5),
+            "disabled": RewardTermCfg(func=f"{TERMS}:alive", weight=0.0),
+            "penalty": RewardTermCfg(func=f"{TERMS}:alive", weight=-0.5),
+        }
+    )
+    return RewardManager(cfg, env, "cpu")
+
+
+def test_compute_and_reset_match_per_term_loop():
+    manager = _make_manager()
+    assert manager.active_terms == ["alive", "penalty"]
+
+    for _ in range(3):
+        reward = manager.compute(DT)
+    torch.testing.assert_close(reward, torch.full((NUM_ENVS,), (1.5 - 0.5) * DT))
+    torch.testing.assert_close(manager.episode_sums["penalty"], torch.full((NUM_ENVS,), -0.5 * DT * 3))
+    torch.testing.assert_close(manager.episode_sums_raw["alive"], torch.full((NUM_ENVS,), 3.0))
+
+    env_ids = torch.tensor([1, 3])
+    extras = manager.reset(env_ids)
+    torch.testing.assert_close(extras["episode"]["rew_alive"], torch.full((2,), 1.5 * DT * 3 / 20.0))
+    torch.testing.assert_close(extras["raw_episode_all"]["raw_rew_penalty"], torch.full((NUM_ENVS,), 3.0 / 20.0))
+    assert manager.episode_sums["alive"][env_ids].eq(0).all()
+    assert manager.episode_sums_raw["alive"][[0, 2, 4, 5]].eq(3.0).all()
+
+
+def test_set_term_cfg_updates_weights():
+    manager = _make_manager()
+    cfg = manager.get_term_cfg("penalty")
+    manager.set_term_cfg("penalty", RewardTermCfg(func=cfg.func, weight=-2.0))
+
+    reward = manager.compute(DT)
+    torch.testing.assert_close(reward, torch.full((NUM_ENVS,), (1.5 - 2.0) * DT))
@@ -22,7 +22,7 @@ from holosoma.utils.safe_torch_import import torch
 def motion_ends(env, **_) -> torch.Tensor:
     """Terminate if the motion ends."""
     motion_command = env.command_manager.get_state("motion_command")
-    return motion_command.time_steps >= motion_command.motion.time_step_total - 2
+    return motion_command.time_steps >= motion_command.time_step_totals - 2
 
 
 class BadTracking(TerminationTermBase):
@@ -77,7 +77,10 @@ class BadTracking(TerminationTermBase):
 
         if motion_command.motion_cfg.use_adaptive_timesteps_sampler and torch.any(bad_tracking):
             failed_at_time_step = motion_command.time_steps[bad_tracking]
-            motion_command.adaptive_timesteps_sampler.update_current_bin_failed_count(failed_at_time_step)
+            failed_clip_ids = motion_command.clip_ids[bad_tracking]
+            motion_command.adaptive_timesteps_sampler.update_current_bin_failed_count(
+                failed_at_time_step, failed_clip_ids
+            )
 
         return bad_tracking
 
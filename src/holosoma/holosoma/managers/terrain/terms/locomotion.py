@@ -6,7 +6,8 @@ from typing import Any, Tuple
 
 from holosoma.managers.terrain.base import TerrainTermBase
 from holosoma.simulator.shared.terrain import Terrain
-from holosoma.utils import draw, warp_utils
+from holosoma.utils import draw
+from holosoma.utils.heightfield import HeightfieldSampler
 from holosoma.utils.rotations import quat_apply_yaw
 from holosoma.utils.safe_torch_import import torch
 
@@ -41,9 +42,8 @@ class TerrainLocomotion(TerrainTermBase):
         super().__init__(cfg, env)
         self._terrain = Terrain(self._cfg, self.num_envs)
         assert hasattr(self._terrain, "mesh")
-        self._warp_mesh = warp_utils.convert_to_wp_mesh(
-            self._terrain.mesh.vertices, self._terrain.mesh.faces, self.device
-        )
+        self._height_sampler = self._init_height_sampler()
+        self._warp_mesh = None
         self._env_origins = torch.zeros(self.num_envs, 3, device=self.device, requires_grad=False)
         self._get_env_origins()
 
@@ -57,8 +57,34 @@ class TerrainLocomotion(TerrainTermBase):
 
     @property
     def warp_mesh(self):
+        if self._warp_mesh is None:
+            from holosoma.utils import warp_utils  # Warp is only needed to ray cast against the mesh
+
+            self._warp_mesh = warp_utils.convert_to_wp_mesh(
+                self._terrain.mesh.vertices, self._terrain.mesh.faces, self.device
+            )
         return self._warp_mesh
 
+    @property
+    def height_sampler(self) -> HeightfieldSampler | None:
+        """Heightfield sampler used for height queries, None when they ray cast against the mesh."""
+        return self._height_sampler
+
+    def _init_height_sampler(self) -> HeightfieldSampler | None:
+        height_query = self._cfg.height_query
+        if height_query == "raycast" or (height_query == "auto" and not self._terrain.has_height_field):
+            return None
+        return self._terrain.height_field_sampler(self.device, self._cfg.heightfield_interpolation)
+
+    def _terrain_hits(self, ray_starts_world: torch.Tensor, ray_directions_world: torch.Tensor) -> torch.Tensor:
+        """Terrain points straight below ``ray_starts_world``, from the heightfield or by ray casting."""
+        if self._height_sampler is not None:
+            heights = self._height_sampler.sample(ray_starts_world[..., :2])
+            return torch.cat([ray_starts_world[..., :2], heights.unsqueeze(-1)], dim=-1)
+        from holosoma.utils import warp_utils
+
+        return warp_utils.ray_cast(ray_starts_world, ray_directions_world, self.warp_mesh)
+
     def setup(self) -> None:
         self._base_heights = torch.zeros(self.num_envs, device=self.device, requires_grad=False)
         self._base_height_points, self._ray_directions, self._num_base_height_points = self._init_base_height_points()
@@ -176,7 +202,7 @@ class TerrainLocomotion(TerrainTermBase):
         ) + (self.env.simulator.robot_root_states[idx, :3]).unsqueeze(1)
         ray_starts_world = base_positions + self._offset_pos[None, None, ...]
         ray_directions_world = self._ray_directions[idx]
-        ray_hits_world = warp_utils.ray_cast(ray_starts_world, ray_directions_world, self.warp_mesh)
+        ray_hits_world = self._terrain_hits(ray_starts_world, ray_directions_world)
         base_heights = (base_positions - ray_hits_world)[..., 2]
         return interquartile_mean(base_heights, dim=1), ray_hits_world
 
@@ -186,7 +212,7 @@ class TerrainLocomotion(TerrainTermBase):
         foot_positions = self.env.simulator._rigid_body_pos[idx, self.env.feet_height_indices, :].clone()
         ray_starts_world = foot_positions + self._offset_pos[None, None, ...]
         ray_directions_world = self._ray_directions_feet[idx]
-        ray_hits_world = warp_utils.ray_cast(ray_starts_world, ray_directions_world, self.warp_mesh)
+        ray_hits_world = self._terrain_hits(ray_starts_world, ray_directions_world)
         return (foot_positions - ray_hits_world)[..., 2], ray_hits_world
 
     def query_terrain_heights(
@@ -196,11 +222,12 @@ class TerrainLocomotion(TerrainTermBase):
         grid_size: int = 3,
         grid_spacing: float = 0.3,
     ) -> torch.Tensor:
-        """Query terrain height at arbitrary XY positions using ray casting.
+        """Query terrain height at arbitrary XY positions.
 
-        This method casts rays straight down from high above the terrain to find
-        the actual terrain height at each XY position. Useful for determining
-        spawn heights, checking clearances, or any arbitrary height query.
+        Heights are found by casting rays straight down from high above the terrain mesh, or
+        looked up on the device heightfield when ``height_query`` selects it (see
+        ``height_sampler``). Useful for determining spawn heights, checking clearances, or any
+        arbitrary height query.
 
         Args:
             xy_positions: XY coordinates to query. Shape: (N, 2)
@@ -245,6 +272,19 @@ class TerrainLocomotion(TerrainTermBase):
             xy_flat = xy_positions
             num_points = num_robots
 
+        if self._height_sampler is not None:
+            terrain_heights = self._height_sampler.sample(xy_flat)
+        else:
+            terrain_heights = self._ray_cast_heights(xy_flat, num_points)
+
+        if use_grid_sampling:
+            # Takes max height across grid to improve likelihood robot clears all terrain
+            return terrain_heights.reshape(num_robots, grid_size * grid_size).max(dim=1)[0]  # Shape: (N,)
+        return terrain_heights
+
+    def _ray_cast_heights(self, xy_flat: torch.Tensor, num_points: int) -> torch.Tensor:
+        from holosoma.utils import warp_utils
+
         # Create ray starts high above terrain (100m should be above any realistic terrain)
         ray_starts = torch.zeros(num_points, 3, device=self.device)
         ray_starts[:, :2] = xy_flat
@@ -256,14 +296,6 @@ class TerrainLocomotion(TerrainTermBase):
 
         # Cast rays to find terrain height
         ray_hits = warp_utils.ray_cast(ray_starts, ray_directions, self.warp_mesh)
-
-        if use_grid_sampling:
-            # Reshape and take max per robot.
-            terrain_heights_raw = ray_hits[:, 2]
-            grid_points_per_robot = grid_size * grid_size
-            terrain_heights_grid = terrain_heights_raw.reshape(num_robots, grid_points_per_robot)
-            # Takes max height across grid to improve likelihood robot clears all terrain
-            return terrain_heights_grid.max(dim=1)[0]  # Shape: (N,)
         # Extract Z coordinates (assumes above terrain heights)
         return ray_hits[:, 2]
 
@@ -1,7 +1,8 @@
 """MuJoCo backend module with optional Warp support.
 
-This module provides two backends for MuJoCo simulation:
+This module provides three backends for MuJoCo simulation:
 - ClassicBackend: CPU-based single-environment simulation (always available)
+- ThreadedBackend: CPU-based multi-environment simulation on a thread pool (always available)
 - WarpBackend: GPU-accelerated multi-environment simulation (optional)
 
 WarpBackend requires additional dependencies:
@@ -21,6 +22,7 @@ from typing import TYPE_CHECKING
 
 from .base import IMujocoBackend
 from .classic_backend import ClassicBackend
+from .threaded_backend import ThreadedBackend
 
 # Try to import WarpBackend - gracefully handle if warp not installed
 WARP_AVAILABLE = False
@@ -38,4 +40,4 @@ else:
         # WarpBackend will remain None and WARP_AVAILABLE will be False
         pass
 
-__all__ = ["WARP_AVAILABLE", "ClassicBackend", "IMujocoBackend", "WarpBackend"]
+__all__ = ["WARP_AVAILABLE", "ClassicBackend", "IMujocoBackend", "ThreadedBackend", "WarpBackend"]
@@ -8,7 +8,7 @@ data synchronization.
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import numpy as np
 import torch
@@ -86,6 +86,30 @@ class IMujocoBackend(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def get_render_data_batch(self, world_ids: Sequence[int]) -> list[mujoco.MjData]:
+        """Get MjData for rendering several environments at once.
+
+        The returned data are owned by the backend and overwritten by the next call.
+
+        Parameters
+        ----------
+        world_ids : Sequence[int]
+            Environments to render (0 to num_envs-1).
+
+        Returns
+        -------
+        list[mujoco.MjData]
+            One MjData per entry of ``world_ids``, in order.
+        """
+        ...
+
+    def _grow_render_datas(self, render_datas: list[mujoco.MjData], size: int) -> list[mujoco.MjData]:
+        """Extend a backend's render data pool to ``size`` MjData and return its first ``size`` entries."""
+        while len(render_datas) < size:
+            render_datas.append(mujoco.MjData(self.model))
+        return render_datas[:size]
+
     @abc.abstractmethod
     def get_ctrl_tensor(self) -> torch.Tensor | None:
         """Get control tensor for direct writing (None if not supported).
@@ -7,13 +7,14 @@ environment simulation code.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
+import mujoco
 import numpy as np
 import torch
 from loguru import logger
 
-import mujoco
+from holosoma.simulator.mujoco.contact_forces import accumulate_body_forces, push_contact_history
 
 from .base import IMujocoBackend
 
@@ -32,7 +33,7 @@ class ClassicBackend(IMujocoBackend):
     Key characteristics:
     - Single environment only (num_envs must be 1)
     - CPU-based computation
-    - Manual contact force extraction via mj_contactForce
+    - Vectorized contact force extraction (equivalent to mj_contactForce per contact)
     - Numpy arrays with PyTorch tensor conversion
     - Compatible with existing tensor_views.py proxy system
     """
@@ -66,6 +67,8 @@ class ClassicBackend(IMujocoBackend):
 
         # Pre-allocate contact force tensor
         self._force_tensor = torch.zeros(1, model.nbody, 3, device=device)
+        # Contact forces are reported per MuJoCo body
+        self._body_lookup = np.arange(model.nbody)
 
         logger.info(f"ClassicBackend initialized: {model.nbody} bodies, device={device}")
 
@@ -88,6 +91,10 @@ class ClassicBackend(IMujocoBackend):
         """
         return self.data
 
+    def get_render_data_batch(self, world_ids: Sequence[int]) -> list[mujoco.MjData]:
+        """Return the backend's data for each requested world (single environment only, no copy needed)."""
+        return [self.data for _ in world_ids]
+
     def get_ctrl_tensor(self) -> None:
         """Classic backend doesn't support direct tensor writes.
 
@@ -101,44 +108,20 @@ class ClassicBackend(IMujocoBackend):
     def refresh_sim_tensors(self, contact_history_tensor: torch.Tensor) -> None:
         """Update contact forces using manual extraction.
 
-        Extracts contact forces from MuJoCo's contact system using mj_contactForce,
-        accumulates them per body, and updates the contact history.
+        Extracts the forces of all contacts at once, accumulates them per body, and
+        updates the contact history in place.
 
         Parameters
         ----------
         contact_history_tensor : torch.Tensor
             Contact force history buffer [num_envs, history_len, num_bodies, 3]
         """
-        # Reset force accumulator
-        self._force_tensor.fill_(0.0)
-
-        # Pre-allocate force/torque buffer for mj_contactForce
-        forcetorque = np.zeros(6, dtype=np.float64)
-
-        # Extract and accumulate contact forces
-        for i in range(self.data.ncon):
-            contact = self.data.contact[i]
-
-            # Get 6D force/torque vector
-            mujoco.mj_contactForce(self.model, self.data, i, forcetorque)
-
-            # Convert to torch tensor (forces only, ignore torques)
-            force = torch.from_numpy(forcetorque[:3]).float().to(self.device)
-
-            # Map geoms to bodies
-            b1 = self.model.geom_bodyid[contact.geom1]
-            b2 = self.model.geom_bodyid[contact.geom2]
-
-            # Apply Newton's 3rd law: body1 gets -force, body2 gets +force
-            if b1 < self.model.nbody:
-                self._force_tensor[0, b1] -= force
-            if b2 < self.model.nbody:
-                self._force_tensor[0, b2] += force
+        # Apply Newton's 3rd law: body1 gets -force, body2 gets +force
+        forces = accumulate_body_forces(self.model, self.data, self._body_lookup, self.model.nbody)
+        self._force_tensor[0].copy_(torch.from_numpy(forces))
 
         # Update history: shift old values right, add current at position 0
-        contact_history_tensor[:] = torch.cat(
-            [self._force_tensor.clone().unsqueeze(1), contact_history_tensor[:, :-1]], dim=1
-        )
+        push_contact_history(contact_history_tensor, self._force_tensor)
 
     def create_root_view(self, addrs: dict) -> BaseMujocoView:
         """Create root state view using existing tensor_views.
@@ -0,0 +1,483 @@
+"""CPU-based multi-environment MuJoCo backend using a worker thread pool.
+
+This backend simulates several environments on the CPU by holding one MjData
+per environment over a shared MjModel and stepping them in parallel. MuJoCo
+releases the GIL inside mj_step, so a plain thread pool scales across cores
+without process boundaries or shared-memory plumbing.
+
+Key features:
+- Multi-environment support on machines without a GPU
+- Batched float32 PyTorch tensors with the same layout as WarpBackend
+- Vectorized contact force extraction per environment
+- Writes to the batched tensors are detected and applied before the next step
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Sequence
+
+import mujoco
+import numpy as np
+import torch
+from loguru import logger
+
+from holosoma.simulator.mujoco.contact_forces import accumulate_body_forces, push_contact_history
+
+from .base import IMujocoBackend
+
+if TYPE_CHECKING:
+    from holosoma.config_types.full_sim import FullSimConfig
+    from holosoma.simulator.mujoco.tensor_views import BaseMujocoView
+
+
+class ThreadedBackend(IMujocoBackend):
+    """CPU-based multi-environment MuJoCo backend.
+
+    Each environment owns an MjData instance; all share the frontend's MjModel.
+    The simulation state is exposed through batched float32 tensors
+    (``qpos_t``, ``qvel_t``, ...) that mirror the float64 MjData arrays and are
+    refreshed after every step.
+
+    Writes to ``qpos_t`` and ``qvel_t`` (directly or through the views) are
+    detected by comparing against the values published after the last step.
+    Only the changed elements are copied into MjData, so untouched state keeps
+    its full float64 precision. ``ctrl_t`` and ``xfrc_applied_t`` are inputs and
+    are copied into every environment before each step.
+
+    Key characteristics:
+    - Multi-environment support (1 to num CPU cores and beyond)
+    - CPU-based computation, device must be 'cpu'
+    - Vectorized contact force extraction (equivalent to mj_contactForce per contact)
+    - Shared MjModel, so per-environment model randomization is not supported
+    """
+
+    def __init__(self, model: mujoco.MjModel, data: mujoco.MjData, config: FullSimConfig, device: str):
+        """Initialize ThreadedBackend with per-environment data and the worker pool.
+
+        Parameters
+        ----------
+        model : mujoco.MjModel
+            Compiled MuJoCo model (shared by all environments)
+        data : mujoco.MjData
+            MuJoCo data structure (used as template and for rendering)
+        config : FullSimConfig
+            Full simulation configuration
+        device : str
+            Device string (must be 'cpu')
+
+        Raises
+        ------
+        ValueError
+            If device is not a CPU device
+        """
+        super().__init__(model, data, config, device)
+
+        if torch.device(device).type != "cpu":
+            raise ValueError(f"ThreadedBackend requires device='cpu', got {device}")
+
+        num_threads = config.simulator.mujoco_threaded.num_threads or os.cpu_count() or 1
+        self.num_threads = max(1, min(num_threads, self.num_envs))
+
+        # One MjData per environment, all over the shared model
+        self.datas = [copy.copy(data) for _ in range(self.num_envs)]
+        self.render_data = data
+        # MjData reused across get_render_data_batch() calls, grown on demand
+        self._render_datas: list[mujoco.MjData] = []
+
+        # Batched state mirrors, layout matches WarpBackend
+        n, nbody = self.num_envs, model.nbody
+        self.qpos_t = torch.zeros(n, model.nq)
+        self.qvel_t = torch.zeros(n, model.nv)
+        self.qacc_t = torch.zeros(n, model.nv)
+        self.ctrl_t = torch.zeros(n, model.nu)
+        self.xfrc_applied_t = torch.zeros(n, nbody, 6)
+        self.xpos_t = torch.zeros(n, nbody, 3)
+        self.xquat_t = torch.zeros(n, nbody, 4)
+        self.cvel_t = torch.zeros(n, nbody, 6)
+        self.force_t = torch.zeros(n, nbody, 3)
+
+        # Numpy views sharing memory with the tensors, used by the workers
+        self._qpos = self.qpos_t.numpy()
+        self._qvel = self.qvel_t.numpy()
+        self._qacc = self.qacc_t.numpy()
+        self._ctrl = self.ctrl_t.numpy()
+        self._xfrc_applied = self.xfrc_applied_t.numpy()
+        self._xpos = self.xpos_t.numpy()
+        self._xquat = self.xquat_t.numpy()
+        self._cvel = self.cvel_t.numpy()
+        self._force = self.force_t.numpy()
+
+        # Values published after the last step, used to detect external writes
+        self._published_qpos = np.zeros_like(self._qpos)
+        self._published_qvel = np.zeros_like(self._qvel)
+
+        # Contact forces are reported per MuJoCo body
+        self._body_lookup = np.arange(nbody)
+
+        self._chunks = np.array_split(np.arange(n), self.num_threads)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=self.num_threads, thread_name_prefix="mujoco-step")
+            if self.num_threads > 1
+            else None
+        )
+
+        self._gather(range(n))
+        self._publish()
+
+        logger.info(f"ThreadedBackend initialized: {n} envs, {self.num_threads} threads, {nbody} bodies")
+
+    def initialize_state(self, model: mujoco.MjModel, data: mujoco.MjData) -> None:
+        """Copy the initial state from the frontend data into every environment.
+
+        Parameters
+        ----------
+        model : mujoco.MjModel
+            MuJoCo model (for context)
+        data : mujoco.MjData
+            CPU MjData with initial state to replicate
+        """
+        for env_data in self.datas:
+            env_data.qpos[:] = data.qpos
+            env_data.qvel[:] = data.qvel
+            mujoco.mj_forward(model, env_data)
+        self._gather(range(self.num_envs))
+        self._publish()
+
+    def _apply_writes(self, env_id: int, qpos_dirty: np.ndarray, qvel_dirty: np.ndarray) -> None:
+        """Copy changed state elements and the control inputs of one environment into its MjData."""
+        env_data = self.datas[env_id]
+        if qpos_dirty.any():
+            env_data.qpos[qpos_dirty] = self._qpos[env_id, qpos_dirty]
+        if qvel_dirty.any():
+            env_data.qvel[qvel_dirty] = self._qvel[env_id, qvel_dirty]
+        env_data.ctrl[:] = self._ctrl[env_id]
+        env_data.xfrc_applied[:] = self._xfrc_applied[env_id]
+
+    def _gather(self, env_ids) -> None:
+        """Refresh the batched mirrors of the given environments from their MjData."""
+        for env_id in env_ids:
+            env_data = self.datas[env_id]
+            self._qpos[env_id] = env_data.qpos
+            self._qvel[env_id] = env_data.qvel
+            self._qacc[env_id] = env_data.qacc
+            self._xpos[env_id] = env_data.xpos
+            self._xquat[env_id] = env_data.xquat
+            self._cvel[env_id] = env_data.cvel
+            self._force[env_id] = accumulate_body_forces(self.model, env_data, self._body_lookup, self.model.nbody)
+
+    def _publish(self) -> None:
+        """Record the mirrored state so later writes can be detected."""
+        self._published_qpos[:] = self._qpos
+        self._published_qvel[:] = self._qvel
+
+    def _step_chunk(self, env_ids: np.ndarray, qpos_dirty: np.ndarray, qvel_dirty: np.ndarray) -> None:
+        for env_id in env_ids:
+            self._apply_writes(env_id, qpos_dirty[env_id], qvel_dirty[env_id])
+            mujoco.mj_step(self.model, self.datas[env_id])
+        self._gather(env_ids)
+
+    def step(self) -> None:
+        """Advance all environments by one timestep using mj_step on the worker pool."""
+        qpos_dirty = self._qpos != self._published_qpos
+        qvel_dirty = self._qvel != self._published_qvel
+
+        if self._executor is None:
+            self._step_chunk(self._chunks[0], qpos_dirty, qvel_dirty)
+        else:
+            futures = [self._executor.submit(self._step_chunk, chunk, qpos_dirty, qvel_dirty) for chunk in self._chunks]
+            for future in futures:
+                future.result()
+        self._publish()
+
+    def get_render_data(self, world_id: int = 0) -> mujoco.MjData:
+        """Copy the data of one environment for rendering.
+
+        Parameters
+        ----------
+        world_id : int, default=0
+            Which environment to render (0 to num_envs-1)
+
+        Returns
+        -------
+        mujoco.MjData
+            CPU MjData with state from the specified environment
+        """
+        if world_id < 0 or world_id >= self.num_envs:
+            logger.warning(f"Invalid world_id {world_id}, clamping to [0, {self.num_envs - 1}]")
+            world_id = max(0, min(world_id, self.num_envs - 1))
+
+        mujoco.mj_copyData(self.render_data, self.model, self.datas[world_id])
+        return self.render_data
+
+    def get_render_data_batch(self, world_ids: Sequence[int]) -> list[mujoco.MjData]:
+        """Copy the data of several environments for rendering.
+
+        Parameters
+        ----------
+        world_ids : Sequence[int]
+            Environments to render (0 to num_envs-1)
+
+        Returns
+        -------
+        list[mujoco.MjData]
+            One CPU MjData per entry of ``world_ids``, owned by the backend
+        """
+        render_datas = self._grow_render_datas(self._render_datas, len(world_ids))
+        for render_data, world_id in zip(render_datas, world_ids):
+            mujoco.mj_copyData(render_data, self.model, self.datas[world_id])
+        return render_datas
+
+    def get_ctrl_tensor(self) -> torch.Tensor:
+        """Return control tensor for direct writing.
+
+        Returns
+        -------
+        torch.Tensor
+            Control tensor [num_envs, nu], copied into each MjData before the next step
+        """
+        return self.ctrl_t
+
+    def refresh_sim_tensors(self, contact_history_tensor: torch.Tensor) -> None:
+        """Update contact force history.
+
+        Contact forces are extracted for every environment at the end of each
+        step, so only the rolling history buffer is updated here.
+
+        Parameters
+        ----------
+        contact_history_tensor : torch.Tensor
+            Contact force history buffer [num_envs, history_len, num_bodies, 3]
+        """
+        push_contact_history(contact_history_tensor, self.force_t)
+
+    def create_root_view(self, addrs: dict) -> BaseMujocoView:
+        """Create root state view over the batched tensors.
+
+        Parameters
+        ----------
+        addrs : dict
+            Address dictionary with slices for pos, quat, vel, ang_vel
+
+        Returns
+        -------
+        MjwRootStateView
+            Root state view with quaternion conversion
+        """
+        from holosoma.simulator.mujoco.mjw_views import MjwRootStateView
+
+        return MjwRootStateView(
+            qpos=self.qpos_t,
+            qvel=self.qvel_t,
+            pos_slice=addrs["pos_indices"],
+            quat_slice=addrs["quat_indices"],
+            vel_slice=addrs["vel_indices"],
+            ang_vel_slice=addrs["ang_vel_indices"],
+            num_envs=self.num_envs,
+        )
+
+    def create_dof_pos_view(self, indices: slice, num_dof: int) -> torch.Tensor:
+        """Return DOF position tensor directly.
+
+        Parameters
+        ----------
+        indices : slice
+            Slice into qpos array
+        num_dof : int
+            Number of degrees of freedom (unused, for interface compatibility)
+
+        Returns
+        -------
+        torch.Tensor
+            DOF positions [num_envs, num_dof]
+        """
+        return self.qpos_t[:, indices]
+
+    def create_dof_vel_view(self, indices: slice, num_dof: int) -> torch.Tensor:
+        """Return DOF velocity tensor directly.
+
+        Parameters
+        ----------
+        indices : slice
+            Slice into qvel array
+        num_dof : int
+            Number of degrees of freedom (unused, for interface compatibility)
+
+        Returns
+        -------
+        torch.Tensor
+            DOF velocities [num_envs, num_dof]
+        """
+        return self.qvel_t[:, indices]
+
+    def create_dof_acc_view(self, indices: slice, num_dof: int) -> torch.Tensor:
+        """Return DOF acceleration tensor directly.
+
+        Parameters
+        ----------
+        indices : slice
+            Slice into qacc array
+        num_dof : int
+            Number of degrees of freedom (unused, for interface compatibility)
+
+        Returns
+        -------
+        torch.Tensor
+            DOF accelerations [num_envs, num_dof]
+        """
+        return self.qacc_t[:, indices]
+
+    def create_force_view(self, num_bodies: int) -> torch.Tensor:
+        """Return contact force tensor directly.
+
+        Parameters
+        ----------
+        num_bodies : int
+            Number of bodies (unused, for interface compatibility)
+
+        Returns
+        -------
+        torch.Tensor
+            Contact forces [num_envs, num_bodies, 3]
+        """
+        return self.force_t
+
+    def create_dof_state_view(self, dof_addrs: dict, num_dof: int) -> BaseMujocoView:
+        """Create DOF state view over the batched tensors.
+
+        Parameters
+        ----------
+        dof_addrs : dict
+            Dictionary with 'dof_pos_indices' and 'dof_vel_indices' slices
+        num_dof : int
+            Number of degrees of freedom
+
+        Returns
+        -------
+        MjwDofStateView
+            DOF state view with IsaacGym flattened format [num_envs * num_dof, 2]
+        """
+        from holosoma.simulator.mujoco.mjw_views import MjwDofStateView
+
+        return MjwDofStateView(
+            qpos=self.qpos_t,
+            qvel=self.qvel_t,
+            dof_pos_indices=dof_addrs["dof_pos_indices"],
+            dof_vel_indices=dof_addrs["dof_vel_indices"],
+            num_envs=self.num_envs,
+            num_dof=num_dof,
+        )
+
+    def get_applied_forces_view(self) -> torch.Tensor:
+        """Get writable view for external applied forces.
+
+        Returns
+        -------
+        torch.Tensor
+            Writable tensor [num_envs, num_bodies, 6], copied into each MjData before the next step
+            - [:, :, 0:3] = forces [fx, fy, fz]
+            - [:, :, 3:6] = torques [tx, ty, tz]
+        """
+        return self.xfrc_applied_t
+
+    def create_quaternion_view(self, quat_slice: slice):
+        """Create quaternion view with format conversion.
+
+        Parameters
+        ----------
+        quat_slice : slice
+            Slice for extracting quaternion from qpos
+
+        Returns
+        -------
+        MjwQuaternionView
+            Quaternion view with [w,x,y,z] -> [x,y,z,w] conversion
+        """
+        from holosoma.simulator.mujoco.mjw_views import MjwQuaternionView
+
+        return MjwQuaternionView(qpos=self.qpos_t, quat_slice=quat_slice, num_envs=self.num_envs)
+
+    def create_angular_velocity_view(self, ang_vel_slice: slice):
+        """Create angular velocity view with proper reshaping.
+
+        Parameters
+        ----------
+        ang_vel_slice : slice
+            Slice for extracting angular velocity from qvel
+
+        Returns
+        -------
+        MjwAngularVelocityView
+            Angular velocity view with multi-env access
+        """
+        from holosoma.simulator.mujoco.mjw_views import MjwAngularVelocityView
+
+        return MjwAngularVelocityView(qvel=self.qvel_t, ang_vel_slice=ang_vel_slice, num_envs=self.num_envs)
+
+    def get_rigid_body_state_views(self) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Get batched rigid body states refreshed after the last step.
+
+        Returns
+        -------
+        tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]
+            (positions, orientations, linear_vel, angular_vel):
+            - positions: [num_envs, num_bodies, 3] - body positions
+            - orientations: [num_envs, num_bodies, 4] - quaternions in [x,y,z,w] format
+            - linear_vel: [num_envs, num_bodies, 3] - linear velocities
+            - angular_vel: [num_envs, num_bodies, 3] - angular velocities
+        """
+        # Same conventions as WarpBackend: reorder xquat, split cvel [angular(3), linear(3)]
+        orientations = self.xquat_t[..., [1, 2, 3, 0]]
+        return self.xpos_t, orientations, self.cvel_t[..., 3:6], self.cvel_t[..., 0:3]
+
+    def set_root_state(self, env_ids: torch.Tensor, root_states: torch.Tensor, root_addrs: dict) -> None:
+        """Set robot root states for specified environments.
+
+        Writes into the batched tensors; the changes reach MjData on the next step.
+
+        Parameters
+        ----------
+        env_ids : torch.Tensor
+            Environment IDs to update [num_selected_envs]
+        root_states : torch.Tensor
+            Root states [num_selected_envs, 13] in holosoma format:
+            [x, y, z, qx, qy, qz, qw, vx, vy, vz, wx, wy, wz]
+        root_addrs : dict
+            Address dictionary with 'robot_qpos_addr' and 'robot_qvel_addr'
+        """
+        env_ids = env_ids.cpu().unsqueeze(1)
+        root_states = root_states.detach().cpu()
+        qpos_addr = root_addrs["robot_qpos_addr"]
+        qvel_addr = root_addrs["robot_qvel_addr"]
+
+        # Convert quaternion: holosoma [qx,qy,qz,qw] -> MuJoCo [qw,qx,qy,qz]
+        qpos = torch.cat([root_states[:, :3], root_states[:, [6, 3, 4, 5]]], dim=1)
+        self.qpos_t[env_ids, torch.arange(qpos_addr, qpos_addr + 7)] = qpos
+        self.qvel_t[env_ids, torch.arange(qvel_addr, qvel_addr + 6)] = root_states[:, 7:13]
+
+    def set_dof_state(self, env_ids: torch.Tensor, dof_states: torch.Tensor, dof_addrs: dict) -> None:
+        """Set DOF states for specified environments.
+
+        Writes into the batched tensors; the changes reach MjData on the next step.
+
+        Parameters
+        ----------
+        env_ids : torch.Tensor
+            Environment IDs to update [num_selected_envs]
+        dof_states : torch.Tensor
+            DOF states [num_all_envs * num_dofs, 2] in IsaacGym format
+            where [:, 0] = positions, [:, 1] = velocities
+            NOTE: Contains states for ALL environments, we select based on env_ids
+        dof_addrs : dict
+            Address dictionary with 'dof_qpos_addrs' and 'dof_qvel_addrs' lists
+        """
+        env_ids = env_ids.cpu()
+        qpos_addrs = torch.tensor(dof_addrs["dof_qpos_addrs"])
+        qvel_addrs = torch.tensor(dof_addrs["dof_qvel_addrs"])
+        num_dof = len(qpos_addrs)
+
+        selected = dof_states[:].detach().cpu().view(-1, num_dof, 2)[env_ids]  # [num_selected_envs, num_dof, 2]
+        self.qpos_t[env_ids.unsqueeze(1), qpos_addrs] = selected[..., 0]
+        self.qvel_t[env_ids.unsqueeze(1), qvel_addrs] = selected[..., 1]
@@ -32,7 +32,7 @@ to ClassicBackend (CPU-only simulation).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import mujoco
 import torch
@@ -152,6 +152,8 @@ class WarpBackend(IMujocoBackend):
 
         # Keep reference to CPU data for rendering (synced on demand)
         self.render_data = data
+        # MjData reused across get_render_data_batch() calls, grown on demand
+        self._render_datas: list[mujoco.MjData] = []
 
         # Capture simulation step as CUDA graph for optimal performance
         # This eliminates per-kernel launch overhead (~20-30 kernels per step)
@@ -258,6 +260,49 @@ class WarpBackend(IMujocoBackend):
 
         return self.render_data
 
+    def get_render_data_batch(self, world_ids: Sequence[int]) -> list[mujoco.MjData]:
+        """Sync several environments from GPU to CPU for rendering.
+
+        Instead of copying the full data of each world like get_render_data(), the
+        generalized positions (and mocap poses) of all requested worlds are gathered
+        on the GPU and copied to the host in one transfer. The poses needed for
+        rendering are then recomputed on the CPU with mj_kinematics/mj_camlight.
+
+        Parameters
+        ----------
+        world_ids : Sequence[int]
+            Which environments to sync for visualization (0 to num_envs-1)
+
+        Returns
+        -------
+        list[mujoco.MjData]
+            One CPU MjData per entry of ``world_ids``, owned by the backend
+        """
+        import warp as wp
+
+        nq, nmocap = self.model.nq, self.model.nmocap
+        index = torch.as_tensor(world_ids, dtype=torch.long, device=self.qpos_t.device).clamp(0, self.num_envs - 1)
+
+        with wp.ScopedDevice(self.mjw_device):
+            # CRITICAL: Synchronize GPU before copying to CPU
+            wp.synchronize()
+            states = [self.qpos_t[index]]
+            if nmocap > 0:
+                states.append(wp.to_torch(self.mjw_data.mocap_pos)[index].flatten(1))
+                states.append(wp.to_torch(self.mjw_data.mocap_quat)[index].flatten(1))
+            # Single bulk GPU->CPU transfer for all requested worlds
+            host_states = torch.cat(states, dim=1).cpu().double().numpy()
+
+        render_datas = self._grow_render_datas(self._render_datas, len(world_ids))
+        for render_data, state in zip(render_datas, host_states):
+            render_data.qpos[:] = state[:nq]
+            if nmocap > 0:
+                render_data.mocap_pos[:] = state[nq : nq + 3 * nmocap].reshape(nmocap, 3)
+                render_data.mocap_quat[:] = state[nq + 3 * nmocap :].reshape(nmocap, 4)
+            mujoco.mj_kinematics(self.model, render_data)
+            mujoco.mj_camlight(self.model, render_data)
+        return render_datas
+
     def get_ctrl_tensor(self) -> torch.Tensor:
         """Return control tensor for direct zero-copy writing.
 
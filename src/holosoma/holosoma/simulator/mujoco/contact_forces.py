@@ -0,0 +1,120 @@
+"""Vectorized contact force extraction for CPU MuJoCo data.
+
+Replaces per-contact ``mj_contactForce`` calls with array operations over all active
+contacts, and accumulates the forces per body with ``np.bincount``.
+"""
+
+from __future__ import annotations
+
+import mujoco
+import numpy as np
+import torch
+
+
+def contact_forces(model: mujoco.MjModel, data: mujoco.MjData) -> np.ndarray:
+    """Compute the contact-frame forces of all active contacts.
+
+    Equivalent to calling ``mj_contactForce`` for every contact and keeping the first
+    three components (normal and two tangential forces), including the pyramidal cone
+    decoding of ``mju_decodePyramid``.
+
+    Parameters
+    ----------
+    model : mujoco.MjModel
+        Compiled MuJoCo model.
+    data : mujoco.MjData
+        MuJoCo data after a step (or ``mj_forward``).
+
+    Returns
+    -------
+    np.ndarray
+        Forces that ``geom1`` exerts on ``geom2`` with shape ``[ncon, 3]``.
+    """
+    ncon = data.ncon
+    forces = np.zeros((ncon, 3), dtype=np.float64)
+    if ncon == 0:
+        return forces
+
+    contact = data.contact
+    efc_address = contact.efc_address[:ncon]
+    dims = contact.dim[:ncon]
+    # Excluded contacts have no constraint rows and zero force
+    active = efc_address >= 0
+    efc_force = data.efc_force
+
+    if model.opt.cone == mujoco.mjtCone.mjCONE_ELLIPTIC:
+        # Elliptic cones store the contact-frame force directly
+        for dim in np.unique(dims[active]):
+            mask = active & (dims == dim)
+            num = min(int(dim), 3)
+            rows = efc_address[mask, None] + np.arange(num)
+            forces[mask, :num] = efc_force[rows]
+        return forces
+
+    friction = contact.friction[:ncon]
+    for dim in np.unique(dims[active]):
+        mask = active & (dims == dim)
+        if dim == 1:
+            forces[mask, 0] = efc_force[efc_address[mask]]
+            continue
+        # Pyramidal cones: 2 * (dim - 1) edge forces per contact
+        pyramid = efc_force[efc_address[mask, None] + np.arange(2 * (dim - 1))]
+        forces[mask, 0] = pyramid.sum(axis=1)
+        forces[mask, 1:3] = (pyramid[:, 0:4:2] - pyramid[:, 1:4:2]) * friction[mask, :2]
+    return forces
+
+
+def accumulate_body_forces(
+    model: mujoco.MjModel, data: mujoco.MjData, body_lookup: np.ndarray, num_bodies: int
+) -> np.ndarray:
+    """Sum contact forces per body, applying Newton's third law.
+
+    ``geom2``'s body receives the contact force and ``geom1``'s body its opposite.
+
+    Parameters
+    ----------
+    model : mujoco.MjModel
+        Compiled MuJoCo model.
+    data : mujoco.MjData
+        MuJoCo data after a step (or ``mj_forward``).
+    body_lookup : np.ndarray
+        Output body index of every MuJoCo body, ``-1`` for bodies that are not tracked.
+        Shape ``[model.nbody]``.
+    num_bodies : int
+        Number of output bodies.
+
+    Returns
+    -------
+    np.ndarray
+        Per-body contact forces with shape ``[num_bodies, 3]``.
+    """
+    out = np.zeros((num_bodies, 3), dtype=np.float64)
+    ncon = data.ncon
+    if ncon == 0:
+        return out
+
+    forces = contact_forces(model, data)
+    geoms = data.contact.geom[:ncon]
+    bodies = body_lookup[model.geom_bodyid[geoms]]  # [ncon, 2]
+    indices = bodies.T.reshape(-1)
+    values = np.concatenate([-forces, forces])
+    tracked = indices >= 0
+    indices, values = indices[tracked], values[tracked]
+    for axis in range(3):
+        out[:, axis] = np.bincount(indices, weights=values[:, axis], minlength=num_bodies)
+    return out
+
+
+def push_contact_history(contact_history: torch.Tensor, forces: torch.Tensor) -> None:
+    """Shift the contact history by one step in place and store ``forces`` as the latest entry.
+
+    Parameters
+    ----------
+    contact_history : torch.Tensor
+        History buffer ``[num_envs, history_len, num_bodies, 3]``, newest first.
+    forces : torch.Tensor
+        Current forces ``[num_envs, num_bodies, 3]``.
+    """
+    for i in range(contact_history.shape[1] - 1, 0, -1):
+        contact_history[:, i].copy_(contact_history[:, i - 1])
+    contact_history[:, 0].copy_(forces)
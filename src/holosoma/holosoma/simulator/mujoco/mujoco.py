@@ -18,8 +18,9 @@ from holosoma.config_types.full_sim import FullSimConfig
 from holosoma.config_types.simulator import MujocoBackend
 from holosoma.managers.terrain.manager import TerrainManager
 from holosoma.simulator.base_simulator.base_simulator import BaseSimulator
-from holosoma.simulator.mujoco.backends import WARP_AVAILABLE, ClassicBackend, WarpBackend
+from holosoma.simulator.mujoco.backends import WARP_AVAILABLE, ClassicBackend, ThreadedBackend, WarpBackend
 from holosoma.simulator.mujoco.command_registry import CommandRegistry
+from holosoma.simulator.mujoco.contact_forces import accumulate_body_forces
 from holosoma.simulator.mujoco.fields import prepare_fields, prepare_manager_fields
 from holosoma.simulator.mujoco.scene_manager import MujocoSceneManager
 from holosoma.simulator.mujoco.tensor_views import (
@@ -202,6 +203,8 @@ class MuJoCo(BaseSimulator):
         bodies in the contact force tensor.
         """
         self.mujoco_to_holosoma_body_map: dict[int, int] = {}
+        assert self.root_model is not None
+        root_model = self.root_model
 
         logger.info("=== Building MuJoCo body ID to holosoma index mapping ===")
 
@@ -209,7 +212,7 @@ class MuJoCo(BaseSimulator):
         for holosoma_idx, body_name in enumerate(self.body_names):
             # Find corresponding MuJoCo body ID
             prefixed_name = self._get_prefixed_name(body_name)
-            mujoco_body_id = mujoco.mj_name2id(self.root_model, mujoco.mjtObj.mjOBJ_BODY, prefixed_name)
+            mujoco_body_id = mujoco.mj_name2id(root_model, mujoco.mjtObj.mjOBJ_BODY, prefixed_name)
             if mujoco_body_id != -1:
                 self.mujoco_to_holosoma_body_map[mujoco_body_id] = holosoma_idx
                 logger.info(
@@ -221,6 +224,11 @@ class MuJoCo(BaseSimulator):
 
         logger.info(f"=== Body mapping complete: {len(self.mujoco_to_holosoma_body_map)} mappings created ===")
 
+        # Array form of the mapping for vectorized contact force accumulation (-1 for unmapped bodies)
+        self._mujoco_to_holosoma_body_lookup = np.full(root_model.nbody, -1, dtype=np.int64)
+        for mujoco_body_id, holosoma_idx in self.mujoco_to_holosoma_body_map.items():
+            self._mujoco_to_holosoma_body_lookup[mujoco_body_id] = holosoma_idx
+
     def _get_prefixed_name(self, clean_name: str) -> str:
         """Get prefixed name from clean name using map lookup.
 
@@ -345,6 +353,9 @@ class MuJoCo(BaseSimulator):
             self.backend = WarpBackend(self.root_model, self.root_data, self.tyro_config, self.device)
             # Sync CPU initial state (set by _set_initial_joint_angles) to GPU
             self.backend.initialize_state(self.root_model, self.root_data)
+        elif self.simulator_config.mujoco_backend == MujocoBackend.THREADED:
+            logger.info("Initializing ThreadedBackend (CPU multi-environment)")
+            self.backend = ThreadedBackend(self.root_model, self.root_data, self.tyro_config, self.device)
         else:
             logger.info("Initializing ClassicBackend (CPU single-environment)")
             self.backend = ClassicBackend(self.root_model, self.root_data, self.tyro_config, self.device)
@@ -354,6 +365,10 @@ class MuJoCo(BaseSimulator):
         self._set_robot_joint_addressing()
         self._set_initial_joint_angles()
 
+        if isinstance(self.backend, ThreadedBackend):
+            # Replicate the initial state (including initial joint angles) to every environment
+            self.backend.initialize_state(self.root_model, self.root_data)
+
         # Initialize virtual gantry after the robot using config
         gantry_cfg = self.simulator_config.virtual_gantry
         self.virtual_gantry = create_virtual_gantry(
@@ -572,7 +587,7 @@ class MuJoCo(BaseSimulator):
         Parameters
         ----------
         num_envs : int
-            Number of environments to create (currently limited to 1).
+            Number of environments to create (limited to 1 for ClassicBackend).
         env_origins : torch.Tensor
             Environment origin positions.
         base_init_state : dict[str, Any]
@@ -581,12 +596,13 @@ class MuJoCo(BaseSimulator):
         Raises
         ------
         ValueError
-            If num_envs > 1 (multiple environments not yet supported).
+            If num_envs > 1 with ClassicBackend.
         """
-        if num_envs > 1 and self.simulator_config.mujoco_backend != MujocoBackend.WARP:
+        if num_envs > 1 and self.simulator_config.mujoco_backend == MujocoBackend.CLASSIC:
             raise ValueError(
                 f"MuJoCo ClassicBackend only supports single environment, got {num_envs}. "
-                f"Use --simulator.config.mujoco-backend=warp for multi-environment support."
+                f"Use --simulator.config.mujoco-backend=warp (GPU) or "
+                f"--simulator.config.mujoco-backend=threaded (CPU) for multi-environment support."
             )
 
         self.num_envs = num_envs
@@ -720,8 +736,10 @@ class MuJoCo(BaseSimulator):
 
         # Base linear acceleration: backend-specific handling
         base_lin_acc_indices = slice(0, 3)
-        if WarpBackend is not None and isinstance(self.backend, WarpBackend):
-            # WarpBackend: direct GPU tensor access
+        if isinstance(self.backend, ThreadedBackend) or (
+            WarpBackend is not None and isinstance(self.backend, WarpBackend)
+        ):
+            # WarpBackend / ThreadedBackend: direct batched tensor access
             self.base_linear_acc = self.backend.qacc_t[:, base_lin_acc_indices]  # type: ignore[assignment,attr-defined]
         else:
             # ClassicBackend: use view system
@@ -1487,7 +1505,7 @@ class MuJoCo(BaseSimulator):
             self._update_text_overlay()  # Update UI
             return
 
-        # Handle world_id toggling for multi-environment visualization (WarpBackend only)
+        # Handle world_id toggling for multi-environment visualization (WarpBackend / ThreadedBackend)
         # LEFT ARROW (263): Previous environment
         # RIGHT ARROW (262): Next environment
         # Numbers 0-9 (48-57): Jump to specific environment
@@ -1542,7 +1560,7 @@ class MuJoCo(BaseSimulator):
         logger.info("=== MuJoCo Simulator Cleanup Completed ===")
 
     def _update_contact_forces(self) -> None:
-        """Update contact forces tensor using MuJoCo's canonical mj_contactForce() API.
+        """Update contact forces tensor with a vectorized equivalent of MuJoCo's mj_contactForce() API.
 
         This method extracts contact forces from MuJoCo's contact detection system and
         accumulates them per body to match holosoma's expected interface.
@@ -1559,52 +1577,13 @@ class MuJoCo(BaseSimulator):
         assert self.root_model
         assert self.root_data
 
-        # Reset contact forces to zero before accumulating new forces
-        # This is essential because we accumulate forces from multiple contacts per body
-        self.contact_forces.fill_(0.0)
-
-        # Early return if no contacts detected
-        if self.root_data.ncon == 0:
-            return
-
-        # Temporary buffer for mj_contactForce() output: [force_x, force_y, force_z, torque_x, torque_y, torque_z]
-        forcetorque = np.zeros(6, dtype=np.float64)
-
-        # Iterate through all active contacts in the simulation
-        # Each contact represents a collision between two geoms
-        for contact_idx in range(self.root_data.ncon):
-            contact = self.root_data.contact[contact_idx]
-
-            # Extract the 6D force/torque vector for this contact using MuJoCo's canonical API
-            # This gives us the force that geom1 exerts on geom2 at the contact point
-            mujoco.mj_contactForce(self.root_model, self.root_data, contact_idx, forcetorque)
-
-            # Extract only the force components (first 3 elements), ignoring torques
-            contact_force = forcetorque[:3]  # [force_x, force_y, force_z]
-
-            # Map geoms to their parent bodies using MuJoCo's geom_bodyid mapping
-            # This is necessary because contacts are geom-level but holosoma expects body-level forces
-            geom1_id = contact.geom1
-            geom2_id = contact.geom2
-            mj_body1_id = self.root_model.geom_bodyid[geom1_id]
-            mj_body2_id = self.root_model.geom_bodyid[geom2_id]
-
-            # Map MuJoCo body IDs to holosoma indices using pre-built mapping
-            holosoma_body1_idx = self.mujoco_to_holosoma_body_map.get(mj_body1_id)
-            holosoma_body2_idx = self.mujoco_to_holosoma_body_map.get(mj_body2_id)
-
-            # Contact logging is now handled centrally in legged_robot_base._log_contact_forces()
-
-            # Apply Newton's 3rd law: mj_contactForce() result is geom1 exerts on geom2, so geom2's
-            # body gets +force, geom1's body gets -force. Note: skips bodies not in our map
-            if holosoma_body1_idx is not None:
-                self.contact_forces[0, holosoma_body1_idx] -= (
-                    torch.from_numpy(contact_force).float().to(self.sim_device)
-                )
-            if holosoma_body2_idx is not None:
-                self.contact_forces[0, holosoma_body2_idx] += (
-                    torch.from_numpy(contact_force).float().to(self.sim_device)
-                )
+        # Forces of all contacts at once, mapped from geoms to holosoma bodies through a lookup array.
+        # Newton's 3rd law: mj_contactForce() result is geom1 exerts on geom2, so geom2's body gets +force,
+        # geom1's body gets -force. Bodies not in our map are skipped.
+        forces = accumulate_body_forces(
+            self.root_model, self.root_data, self._mujoco_to_holosoma_body_lookup, self.contact_forces.shape[1]
+        )
+        self.contact_forces[0].copy_(torch.from_numpy(forces))
 
     def print_mujoco_model_tree(self) -> None:
         """Print comprehensive MuJoCo model structure for debugging."""
@@ -25,7 +25,8 @@ class MuJoCoVideoRecorder(VideoRecorderInterface):
 
     Uses property-based lazy renderer creation to provide transparent thread-local
     rendering. The same _capture_frame_impl() method works on both main thread
-    (sync mode) and recording thread (async mode).
+    (sync mode) and recording thread (async mode). Several environments can be
+    recorded at once (``record_env_ids``), as tiled or separate videos.
 
     Parameters
     ----------
@@ -35,6 +36,8 @@ class MuJoCoVideoRecorder(VideoRecorderInterface):
         Reference to the MuJoCo simulator instance.
     """
 
+    supports_batched_capture = True
+
     def __init__(self, config, simulator: MuJoCo) -> None:
         super().__init__(config, simulator)
 
@@ -44,6 +47,7 @@ class MuJoCoVideoRecorder(VideoRecorderInterface):
         # Thread-local renderer storage (created lazily via properties)
         self._renderer: mujoco.Renderer | None = None
         self._camera: mujoco.MjvCamera | None = None
+        self._env_cameras: dict[int, mujoco.MjvCamera] = {}
 
         logger.info(
             f"MuJoCo video recorder initialized - {'threaded' if config.use_recording_thread else 'synchronous'} mode"
@@ -109,45 +113,64 @@ class MuJoCoVideoRecorder(VideoRecorderInterface):
 
         Uses property-based lazy renderer creation to work transparently
         on both main thread (sync mode) and recording thread (async mode).
+        All recorded environments are rendered with the same renderer context,
+        from one batched state transfer and with one camera per environment.
 
         Raises
         ------
         RuntimeError
             If frame capture fails due to rendering issues.
         """
+        env_ids = self.recorded_env_ids
+
         # Get render data via backend (handles GPU→CPU sync for WarpBackend)
-        # Always use world_id=0 to record from first environment
-        render_data = self.simulator.backend.get_render_data(world_id=0)
+        render_datas = self.simulator.backend.get_render_data_batch(env_ids)
 
-        # Update camera position (properties create renderer/camera if needed)
-        self._update_camera_position(self.camera)
+        # Fetch all tracked robot positions with a single device→host copy
+        robot_positions = self.simulator.robot_root_states[:, :3][env_ids].cpu().tolist()
 
-        # Render frame using thread-appropriate renderer
-        self.renderer.update_scene(render_data, camera=self.camera)
-        frame = self.renderer.render()
+        frames = []
+        for env_id, render_data, robot_pos in zip(env_ids, render_datas, robot_positions):
+            # Update camera position (properties create renderer/camera if needed)
+            camera = self._get_camera(env_id)
+            self._update_camera_position(camera, tuple(robot_pos), env_id=env_id)
 
-        if frame is None:
-            raise RuntimeError("MuJoCo renderer returned None frame")
+            # Render frame using thread-appropriate renderer
+            self.renderer.update_scene(render_data, camera=camera)
+            frame = self.renderer.render()
 
-        # Convert to RGB if needed (MuJoCo returns RGB by default)
-        if len(frame.shape) == 3 and frame.shape[2] == 3:
-            frame_rgb = frame
-        else:
-            raise RuntimeError(f"Unexpected frame shape: {frame.shape}")
+            if frame is None:
+                raise RuntimeError("MuJoCo renderer returned None frame")
+
+            # Convert to RGB if needed (MuJoCo returns RGB by default)
+            if len(frame.shape) != 3 or frame.shape[2] != 3:
+                raise RuntimeError(f"Unexpected frame shape: {frame.shape}")
+
+            # Apply command overlay using shared logic
+            frames.append(self._apply_command_overlay(frame, env_id=env_id))
 
-        # Apply command overlay using shared logic
-        frame_with_overlay = self._apply_command_overlay(frame_rgb)
+        # Add frames to the videos using shared method
+        self._add_frames(frames)
 
-        # Add frame to buffer using shared method
-        self._add_frame(frame_with_overlay)
+    def _get_camera(self, env_id: int) -> mujoco.MjvCamera:
+        """Camera of a recorded environment, the main camera for ``record_env_id``."""
+        if env_id == self.config.record_env_id:
+            return self.camera
+        if env_id not in self._env_cameras:
+            self._env_cameras[env_id] = mujoco.MjvCamera()
+            mujoco.mjv_defaultCamera(self._env_cameras[env_id])
+        return self._env_cameras[env_id]
 
     def _update_camera_position(
-        self, camera: mujoco.MjvCamera, robot_pos: tuple[float, float, float] | None = None
+        self,
+        camera: mujoco.MjvCamera,
+        robot_pos: tuple[float, float, float] | None = None,
+        env_id: int | None = None,
     ) -> None:
         """Update camera position based on camera mode and configuration."""
 
         # Use camera controller via shared helper method
-        camera_params = self._get_camera_parameters(robot_pos)
+        camera_params = self._get_camera_parameters(robot_pos, env_id=env_id)
 
         # Apply to MuJoCo camera using spherical coordinates
         camera.lookat[:] = camera_params.target
@@ -166,3 +189,4 @@ class MuJoCoVideoRecorder(VideoRecorderInterface):
         # Clean up MuJoCo resources
         self._renderer = None
         self._camera = None
+        self._env_cameras = {}
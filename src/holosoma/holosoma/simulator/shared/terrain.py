@@ -2,18 +2,50 @@
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import hashlib
+import inspect
+import json
 import math
+import multiprocessing
+import os
 import pathlib
-from typing import Any
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import trimesh
+from loguru import logger
 
 from holosoma.config_types.terrain import TerrainTermCfg
 from holosoma.simulator.shared.terrain_types import TerrainInterface
 from holosoma.utils import terrain_utils
 from holosoma.utils.path import resolve_data_file_path
 
+if TYPE_CHECKING:
+    from holosoma.utils.heightfield import HeightfieldInterpolation, HeightfieldSampler
+
+# Config fields that don't change the generated heightfield or mesh, left out of the terrain cache key
+_CACHE_IGNORED_FIELDS = (
+    "func",
+    "static_friction",
+    "dynamic_friction",
+    "restitution",
+    "terrain_move_down_ratio",
+    "terrain_move_up_ratio",
+    "spawn",
+    "height_query",
+    "heightfield_interpolation",
+    "obj_file_path",
+    "name",
+    "generation_workers",
+    "cache_dir",
+    "cache_max_size_mb",
+)
+
 
 class Terrain(TerrainInterface):
     """Procedural terrain generator
@@ -28,6 +60,9 @@ class Terrain(TerrainInterface):
     locations within this grid for training or evaluation.
     """
 
+    # Raw int16 heightfield, only set for terrains generated from one (see has_height_field)
+    _height_field_raw: np.ndarray
+
     def __init__(self, cfg: TerrainTermCfg, num_robots: int) -> None:
         """Initialize the terrain generator.
 
@@ -128,15 +163,124 @@ class Terrain(TerrainInterface):
         self._total_width: float = self._num_cols * self._env_width + 2 * self._border_size
         self._total_length: float = self._num_rows * self._env_length + 2 * self._border_size
 
-        self._height_field_raw: np.ndarray = np.zeros((self._tot_rows, self._tot_cols), dtype=np.int16)
         self._max_slope: float = self._cfg.max_slope
+
+        # Without a configured seed the terrain follows the global NumPy RNG, i.e. the training seed
+        self._seed: int = self._cfg.seed if self._cfg.seed is not None else int(np.random.randint(2**31 - 1))
+        cache_path = self._cache_path()
+        if cache_path is not None and cache_path.exists():
+            try:
+                return self._load_cache(cache_path)
+            except Exception as e:
+                logger.warning(f"Failed to load cached terrain from {cache_path}, regenerating it: {e}")
+
         self.randomized_terrain()
 
         vertices, triangles = terrain_utils.convert_heightfield_to_trimesh(
-            self._height_field_raw, self._horizontal_scale, self._vertical_scale, self._slope_threshold
+            self._height_field_raw,
+            self._horizontal_scale,
+            self._vertical_scale,
+            self._slope_threshold,
+            merge_flat_regions=self._cfg.merge_flat_regions,
         )
         mesh: trimesh.Trimesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
+        if cache_path is not None:
+            self._save_cache(cache_path, mesh)
+        mesh.vertices[..., :2] -= self._border_size
+        return mesh
+
+    def _cache_path(self) -> pathlib.Path | None:
+        """Cache file of the generated terrain, ``None`` if caching is disabled or the terrain is unseeded.
+
+        The key hashes the generation-relevant config fields, the seed, the source of the terrain classes
+        and ``terrain_utils``, and the qualified name and source of each configured terrain function, so
+        editing or replacing a terrain function (e.g. in a ``Terrain`` subclass) invalidates its cached
+        terrains. Terrains whose functions have no retrievable source are not cached.
+        """
+        if self._cfg.cache_dir is None or self._cfg.seed is None:
+            return None
+        cfg = dataclasses.asdict(self._cfg)
+        for name in _CACHE_IGNORED_FIELDS:
+            cfg.pop(name, None)
+        cfg["seed"] = self._seed
+        digest = hashlib.sha256(json.dumps(cfg, sort_keys=True, default=str).encode())
+        module_names = sorted({cls.__module__ for cls in type(self).__mro__ if issubclass(cls, Terrain)})
+        try:
+            for module in [*(sys.modules[name] for name in module_names), terrain_utils]:
+                digest.update(inspect.getsource(module).encode())
+            for terrain_type in self._terrain_types:
+                terrain_func = getattr(self, f"_{terrain_type}_terrain_func")
+                digest.update(f"{terrain_func.__module__}.{terrain_func.__qualname__}".encode())
+                digest.update(inspect.getsource(terrain_func).encode())
+        except (OSError, TypeError) as e:
+            logger.warning(f"Not caching the terrain, the source of its generators is unavailable: {e}")
+            return None
+        return pathlib.Path(self._cfg.cache_dir).expanduser() / f"{digest.hexdigest()}.npz"
+
+    def _save_cache(self, cache_path: pathlib.Path, mesh: trimesh.Trimesh) -> None:
+        """Write the heightfield, env origins and processed mesh to ``cache_path``.
+
+        Parameters
+        ----------
+        cache_path : pathlib.Path
+            Destination file, written atomically so concurrent ranks never read a partial file.
+        mesh : trimesh.Trimesh
+            Processed terrain mesh before the border offset is applied. Its vertices come from float32
+            heightfield vertices, so storing them as float32 is lossless.
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp.npz")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                tmp_path,
+                height_field_raw=self._height_field_raw,
+                env_origins=self._env_origins,
+                vertices=mesh.vertices.astype(np.float32),
+                faces=mesh.faces.astype(np.int32),
+            )
+            tmp_path.replace(cache_path)
+            logger.info(f"Cached terrain to {cache_path}")
+        except OSError as e:
+            logger.warning(f"Failed to cache terrain to {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._evict_cache(cache_path)
+
+    def _evict_cache(self, cache_path: pathlib.Path) -> None:
+        """Delete the least recently used cached terrains beyond ``cache_max_size_mb``, keeping ``cache_path``.
+
+        Loading a terrain refreshes its modification time, which orders the entries.
+        """
+        entries = []
+        for path in cache_path.parent.glob("*.npz"):
+            if path.name.endswith(".tmp.npz"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:  # deleted by another rank
+                continue
+            entries.append((path == cache_path, stat.st_mtime, stat.st_size, path))
+        size_limit = self._cfg.cache_max_size_mb * 2**20
+        total_size = 0
+        for _, _, size, path in sorted(entries, reverse=True):
+            total_size += size
+            if total_size > size_limit and path != cache_path:
+                path.unlink(missing_ok=True)
+                logger.info(f"Evicted cached terrain {path}")
+
+    def _load_cache(self, cache_path: pathlib.Path) -> trimesh.Trimesh:
+        """Load a terrain written by :meth:`_save_cache`, skipping generation and mesh processing."""
+        with np.load(cache_path) as data:
+            height_field_raw = data["height_field_raw"]
+            if height_field_raw.shape != (self._tot_rows, self._tot_cols):
+                raise ValueError(f"heightfield shape {height_field_raw.shape} does not match the config")
+            self._height_field_raw = height_field_raw
+            self._env_origins = data["env_origins"]
+            mesh = trimesh.Trimesh(vertices=data["vertices"], faces=data["faces"], process=False)
         mesh.vertices[..., :2] -= self._border_size
+        with contextlib.suppress(OSError):
+            cache_path.touch()  # most recently used, evicted last
+        logger.info(f"Loaded cached terrain from {cache_path}")
         return mesh
 
     def sample_env_origins(self) -> np.ndarray:
@@ -156,6 +300,42 @@ class Terrain(TerrainInterface):
     def mesh(self) -> trimesh.Trimesh:
         return self._mesh
 
+    @property
+    def has_height_field(self) -> bool:
+        """Whether the terrain was generated from a heightfield (all mesh types except "none" and "load_obj")."""
+        return hasattr(self, "_height_field_raw")
+
+    def height_field_sampler(
+        self, device: str, interpolation: HeightfieldInterpolation = "triangle"
+    ) -> HeightfieldSampler:
+        """Create a sampler for the terrain heights of this heightfield on ``device``.
+
+        Parameters
+        ----------
+        device : str
+            Device the heightfield is stored and sampled on.
+        interpolation : {"mesh", "triangle", "bilinear", "max"}
+            Interpolation mode, see :class:`holosoma.utils.heightfield.HeightfieldSampler`.
+
+        Returns
+        -------
+        HeightfieldSampler
+            Sampler in the world frame of the terrain mesh.
+        """
+        from holosoma.utils.heightfield import HeightfieldSampler
+
+        if not self.has_height_field:
+            raise RuntimeError(f"Terrain of mesh type '{self._type}' has no heightfield.")
+        return HeightfieldSampler(
+            self._height_field_raw,
+            self._horizontal_scale,
+            self._vertical_scale,
+            origin=(-self._border_size, -self._border_size),
+            slope_threshold=self._slope_threshold,
+            device=device,
+            interpolation=interpolation,
+        )
+
     def _get_load_obj_env_origin_grid(self) -> np.ndarray:
         grid = getattr(self, "_load_obj_origin_grid", None)
         if grid is None:
@@ -208,20 +388,66 @@ class Terrain(TerrainInterface):
         a terrain type based on the configured proportions. Difficulty levels
         are also randomly assigned except for slope terrains which use
         progressive difficulty based on row position.
+
+        Every tile draws from its own seed derived from the terrain seed, so the layout does not depend
+        on the generation order and tiles can be generated in worker processes
+        (``TerrainTermCfg.generation_workers``).
         """
-        proportions = np.array(self._terrain_proportions) / np.sum(self._terrain_proportions)
-        for k in range(self._num_sub_terrains):
-            print(f"generating randomized terrains {k} / {self._num_sub_terrains}     ", end="\r")
-            # Env coordinates in the world
+        start = time.perf_counter()
+        tile_seeds = [
+            int(seed.generate_state(1)[0]) for seed in np.random.SeedSequence(self._seed).spawn(self._num_sub_terrains)
+        ]
+        tile_indices = range(self._num_sub_terrains)
+        workers = min(self._cfg.generation_workers, self._num_sub_terrains)
+        if workers > 1:
+            # Spawned workers receive this terrain before the full heightfield is allocated
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_tile_worker,
+                initargs=(self,),
+            ) as executor:
+                tiles = list(executor.map(_generate_tile_in_worker, tile_indices, tile_seeds))
+        else:
+            tiles = [self.generate_tile(k, seed) for k, seed in zip(tile_indices, tile_seeds)]
+
+        self._height_field_raw = np.zeros((self._tot_rows, self._tot_cols), dtype=np.int16)
+        for k, terrain in enumerate(tiles):
             (i, j) = np.unravel_index(k, (self._num_rows, self._num_cols))
+            self.add_terrain_to_map(terrain, int(i), int(j))
+        logger.info(
+            f"Generated {self._num_sub_terrains} terrain tiles with seed {self._seed} "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+    def generate_tile(self, k: int, seed: int) -> Any:
+        """Generate sub-terrain ``k`` of the grid from its own seed.
+
+        Parameters
+        ----------
+        k : int
+            Row-major index of the tile in the terrain grid.
+        seed : int
+            Seed of the tile's terrain type, difficulty and features.
 
+        Returns
+        -------
+        terrain_utils.SubTerrain
+            Generated sub-terrain object with populated heightfield data.
+        """
+        # The terrain functions draw from the global NumPy RNG, restore the caller's state afterwards
+        rng_state = np.random.get_state()
+        np.random.seed(seed)
+        try:
+            i, _ = np.unravel_index(k, (self._num_rows, self._num_cols))
+            proportions = np.array(self._terrain_proportions) / np.sum(self._terrain_proportions)
             terrain_type = np.random.choice(self._terrain_types, p=proportions)
             difficulty = np.random.choice([0.5, 0.75, 0.9])
             if terrain_type in {"smooth_slope", "rough_slope", "slope"}:
                 difficulty = i / self._num_rows
-            terrain = self.make_terrain(terrain_type, difficulty)
-            self.add_terrain_to_map(terrain, int(i), int(j))
-        print("\n generated all randomized terrains!")
+            return self.make_terrain(terrain_type, difficulty)
+        finally:
+            np.random.set_state(rng_state)
 
     def make_terrain(self, terrain_type: str, difficulty: float) -> Any:
         """Create a single sub-terrain of the specified type and difficulty.
@@ -579,3 +805,17 @@ class Terrain(TerrainInterface):
         y1 = max(0, cy - half)
         y2 = min(H, cy + half)
         terrain.height_field_raw[y1:y2, x1:x2] = 0
+
+
+# Terrain of the current tile worker process, set once by the pool initializer
+_worker_terrain: Terrain | None = None
+
+
+def _init_tile_worker(terrain: Terrain) -> None:
+    global _worker_terrain  # noqa: PLW0603
+    _worker_terrain = terrain
+
+
+def _generate_tile_in_worker(k: int, seed: int) -> Any:
+    assert _worker_terrain is not None, "Tile worker was not initialized"
+    return _worker_terrain.generate_tile(k, seed)
@@ -21,7 +21,14 @@ import numpy.typing as npt
 from loguru import logger
 
 from holosoma.simulator.shared.camera_controller import CameraController, CameraParameters
-from holosoma.utils.video_utils import create_video, format_command_labels, overlay_text_on_image
+from holosoma.utils.video_utils import (
+    StreamingVideoWriter,
+    finish_video,
+    format_command_labels,
+    open_video_writer,
+    overlay_text_on_image,
+    tile_frames,
+)
 
 if TYPE_CHECKING:
     from holosoma.config_types.video import VideoConfig
@@ -51,6 +58,9 @@ class VideoRecorderInterface(ABC):
         Reference to the simulator instance for accessing simulation state.
     """
 
+    # Whether the simulator can render several environments per capture step (``record_env_ids``)
+    supports_batched_capture: bool = False
+
     # Default tracking body names to try in order of preference
     DEFAULT_TRACKING_BODY_NAMES = [
         "Trunk",  # Common in humanoid robots (e.g., user's example)
@@ -78,11 +88,21 @@ class VideoRecorderInterface(ABC):
         self._current_episode = 0
         self._total_episodes = 0
 
-        # Shared frame buffer for all simulators
-        self.video_frames: list[npt.NDArray[np.uint8]] = []
+        # Environments rendered at every captured step, record_env_id first
+        self.recorded_env_ids: list[int] = [config.record_env_id]
+        if config.record_env_ids and not self.supports_batched_capture:
+            logger.warning(f"{type(self).__name__} records a single environment, ignoring record_env_ids")
+        elif config.record_env_ids:
+            self.recorded_env_ids += [i for i in dict.fromkeys(config.record_env_ids) if i != config.record_env_id]
+
+        # Streaming encoders of the episode being recorded, shared for all simulators
+        self._video_writers: list[StreamingVideoWriter] = []
 
-        # Camera controller for unified camera positioning
-        self.camera_controller = CameraController(config.camera, simulator)
+        # Camera controllers for unified camera positioning, one per recorded environment
+        self.camera_controllers = {
+            env_id: CameraController(config.camera, simulator) for env_id in self.recorded_env_ids
+        }
+        self.camera_controller = self.camera_controllers[config.record_env_id]
 
         # Frame decimation counter for capturing at control frequency
         self._frame_counter: int = 0
@@ -117,12 +137,12 @@ class VideoRecorderInterface(ABC):
             If tracking body cannot be resolved for tracking modes.
         """
         try:
-            # Only create camera for the recording environment (typically env 0)
-            if self.config.record_env_id >= self.simulator.num_envs:
-                raise RuntimeError(
-                    f"Record environment ID {self.config.record_env_id} exceeds available environments "
-                    f"({self.simulator.num_envs})"
-                )
+            # Only create cameras for the recorded environments (typically env 0)
+            for env_id in self.recorded_env_ids:
+                if env_id >= self.simulator.num_envs:
+                    raise RuntimeError(
+                        f"Record environment ID {env_id} exceeds available environments ({self.simulator.num_envs})"
+                    )
 
             # Camera controller already resolved tracking body in __init__
 
@@ -383,80 +403,115 @@ class VideoRecorderInterface(ABC):
     # ===== Shared Frame Buffer Management =====
 
     def _clear_frame_buffer(self) -> None:
-        """Clear the video frame buffer."""
-        self.video_frames = []
+        """Discard the videos being recorded, if any."""
+        for writer in self._video_writers:
+            writer.discard()
+        self._video_writers = []
 
     def _add_frame(self, frame: npt.NDArray[np.uint8]) -> None:
-        """Add a frame to the video buffer.
+        """Add a frame to the video being recorded.
+
+        Frames are queued to the streaming encoder, which holds at most ``config.recording_queue_size`` of them. When
+        the queue is full, this blocks until the encoder catches up, or drops the frame if
+        ``config.drop_frames_when_queue_full`` is set.
 
         Parameters
         ----------
         frame : npt.NDArray[np.uint8]
-            RGB frame to add to the buffer, shape (H, W, 3).
+            RGB frame to add to the video, shape (H, W, 3).
+        """
+        self._add_frames([frame])
+
+    def _add_frames(self, frames: list[npt.NDArray[np.uint8]]) -> None:
+        """Add the frames of all recorded environments for one capture step.
+
+        Parameters
+        ----------
+        frames : list[npt.NDArray[np.uint8]]
+            RGB frames in the order of ``recorded_env_ids``, each of shape (H, W, 3). They are tiled into one frame
+            if ``config.tile_recorded_envs`` is set, otherwise each goes to the video of its environment.
         """
-        self.video_frames.append(frame)
+        if len(frames) > 1 and self.config.tile_recorded_envs:
+            frames = [tile_frames(frames)]
+        for writer, frame in zip(self._video_writers, frames):
+            writer.write(frame)
 
     def _get_frame_count(self) -> int:
-        """Get the number of frames in the buffer.
+        """Get the number of frames of the video being recorded.
 
         Returns
         -------
         int
-            Number of frames currently in the buffer.
+            Number of frames written to the video so far.
         """
-        return len(self.video_frames)
+        return self._video_writers[0].num_frames if self._video_writers else 0
 
     # ===== Shared Video Encoding and Saving =====
 
-    def _encode_and_save_video(self) -> None:
-        """Encode frames and save video using shared logic.
-
-        This method handles the common video encoding and saving logic
-        that is the same across all simulators.
+    def _open_video_writers(self) -> list[StreamingVideoWriter]:
+        """Open the streaming encoders for new videos using shared logic.
 
-        Raises
-        ------
-        RuntimeError
-            If video encoding or saving fails.
+        Returns
+        -------
+        list[StreamingVideoWriter]
+            One writer per recorded environment, or a single one if only one environment is recorded or the
+            environments are tiled. Writers encode frames into files in the save directory as they are added.
         """
-        if not self.video_frames:
-            return
+        # Calculate actual video FPS based on control frequency and playback rate
+        # Frames are captured at control_frequency = sim_fps / control_decimation
+        # To achieve desired playback rate: actual_fps = control_frequency * playback_rate
+        sim_config = self.simulator.simulator_config.sim
+        control_frequency = sim_config.fps / sim_config.control_decimation
+        display_fps = control_frequency * self.config.playback_rate
+
+        if len(self.recorded_env_ids) == 1 or self.config.tile_recorded_envs:
+            env_ids: list[int | None] = [None]
+        else:
+            env_ids = list(self.recorded_env_ids)
 
-        try:
-            # Convert frames to numpy array
-            video_array = np.array(self.video_frames)
-            video_array_uint8 = video_array.astype(np.uint8)
-
-            # Calculate actual video FPS based on control frequency and playback rate
-            # Frames are captured at control_frequency = sim_fps / control_decimation
-            # To achieve desired playback rate: actual_fps = control_frequency * playback_rate
-            sim_config = self.simulator.simulator_config.sim
-            control_frequency = sim_config.fps / sim_config.control_decimation
-            display_fps = control_frequency * self.config.playback_rate
-
-            # Get save directory
-            save_dir = self._get_save_directory()
-            save_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create and save video
-            create_video(
-                video_frames=video_array_uint8,
+        return [
+            open_video_writer(
+                save_dir=self._get_save_directory(),
                 fps=display_fps,
-                save_dir=save_dir,
                 output_format=self.config.output_format,
                 wandb_logging=self.config.upload_to_wandb,
                 episode_id=self._current_episode,
+                queue_size=self.config.recording_queue_size,
+                drop_when_full=self.config.drop_frames_when_queue_full,
+                env_id=env_id,
             )
+            for env_id in env_ids
+        ]
 
-        except Exception as e:
-            raise RuntimeError(f"Video encoding failed: {e}") from e
-        finally:
-            # Clear frame buffer
-            self._clear_frame_buffer()
+    def _encode_and_save_video(self) -> None:
+        """Finish encoding and save videos using shared logic.
+
+        This method handles the common video finalization and saving logic
+        that is the same across all simulators. Frames have already been
+        encoded while recording, so only the queued frames remain.
+
+        Raises
+        ------
+        RuntimeError
+            If video encoding or saving fails.
+        """
+        writers, self._video_writers = self._video_writers, []
+        errors = []
+        for i, writer in enumerate(writers):
+            wandb_key = "Training rollout" if len(writers) == 1 else f"Training rollout/env_{self.recorded_env_ids[i]}"
+            try:
+                finish_video(writer, wandb_logging=self.config.upload_to_wandb, wandb_key=wandb_key)
+            except Exception as e:
+                writer.discard()
+                errors.append(e)
+        if errors:
+            raise RuntimeError(f"Video encoding failed: {errors[0]}") from errors[0]
 
     # ===== Camera Helper Methods =====
 
-    def _get_camera_parameters(self, robot_pos: tuple[float, float, float] | None = None) -> CameraParameters:
+    def _get_camera_parameters(
+        self, robot_pos: tuple[float, float, float] | None = None, env_id: int | None = None
+    ) -> CameraParameters:
         """Get camera parameters from camera controller.
 
         This is a convenience method for simulator-specific implementations.
@@ -466,6 +521,9 @@ class VideoRecorderInterface(ABC):
         ----------
         robot_pos : tuple[float, float, float] | None, default=None
             Optional pre-fetched robot position. If None, camera controller fetches it.
+        env_id : int | None, default=None
+            Recorded environment to track, defaults to ``record_env_id``. Each recorded
+            environment has its own camera controller.
 
         Returns
         -------
@@ -473,22 +531,26 @@ class VideoRecorderInterface(ABC):
             Camera parameters for simulator API.
         """
         # For video recording, we want to use the record_env_id
+        env_id = self.config.record_env_id if env_id is None else env_id
         if robot_pos is None:
-            record_env_id = self.config.record_env_id
-            robot_pos_array = self.simulator.robot_root_states[record_env_id, :3]
+            robot_pos_array = self.simulator.robot_root_states[env_id, :3]
             robot_pos = (float(robot_pos_array[0]), float(robot_pos_array[1]), float(robot_pos_array[2]))
 
-        return self.camera_controller.update(robot_pos=robot_pos)
+        return self.camera_controllers[env_id].update(robot_pos=robot_pos)
 
     # ===== Shared Command Overlay Logic =====
 
-    def _apply_command_overlay(self, image_rgb: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+    def _apply_command_overlay(
+        self, image_rgb: npt.NDArray[np.uint8], env_id: int | None = None
+    ) -> npt.NDArray[np.uint8]:
         """Apply command overlay to the image if enabled.
 
         Parameters
         ----------
         image_rgb : npt.NDArray[np.uint8]
             Input RGB image, shape (H, W, 3).
+        env_id : int | None, default=None
+            Environment whose commands are shown, defaults to ``record_env_id``.
 
         Returns
         -------
@@ -498,8 +560,8 @@ class VideoRecorderInterface(ABC):
         if not self.config.show_command_overlay:
             return image_rgb
 
-        record_env_id = self.config.record_env_id
-        command_text = format_command_labels(getattr(self.simulator, "commands", None), env_id=record_env_id)
+        env_id = self.config.record_env_id if env_id is None else env_id
+        command_text = format_command_labels(getattr(self.simulator, "commands", None), env_id=env_id)
         return overlay_text_on_image(image_rgb.copy(), command_text, position=(50, 50), font_scale=0.8)
 
     # ===== Impl Functions (can be overridden) =====
@@ -515,14 +577,16 @@ class VideoRecorderInterface(ABC):
         episode_id : int
             The ID of the episode being recorded.
         """
-        # Initialize frame buffer for new episode
+        # Start streaming encoders for the new episode
         self._clear_frame_buffer()
+        self._video_writers = self._open_video_writers()
 
         # Reset frame counter for decimation tracking
         self._frame_counter = 0
 
-        # Reset camera controller to start from current robot position
-        self.camera_controller.reset()
+        # Reset camera controllers to start from current robot positions
+        for camera_controller in self.camera_controllers.values():
+            camera_controller.reset()
 
         # Reset frame timing statistics
         self._frame_times.clear()
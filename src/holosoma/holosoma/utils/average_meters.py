@@ -80,3 +80,95 @@ class TensorAverageMeterDict:
         mean = self.mean()
         self.clear()
         return mean
+
+
+class StreamingMeanDict:
+    """Running per-key means of tensors, accumulated on ``device``.
+
+    Unlike :class:`TensorAverageMeterDict`, which keeps every added tensor until it is cleared, only a running sum and
+    element count per key are kept, so memory does not grow with the number of :meth:`add` calls. The values of one
+    :meth:`add` call are reduced together per number of elements, and :meth:`mean` reads every key back with a
+    single host sync.
+    """
+
+    def __init__(self, device="cpu"):
+        self.device = torch.device(device)
+        self.keys: dict[str, int] = {}
+        self.sums = torch.zeros(0, dtype=torch.float64, device=self.device)
+        self.counts = torch.zeros(0, dtype=torch.float64, device=self.device)
+        self._index_cache: dict[tuple[str, ...], torch.Tensor] = {}
+        # Keys added since the last clear, including those whose values had no elements
+        self._added: set[str] = set()
+
+    def _index(self, keys):
+        index = self._index_cache.get(keys)
+        if index is None:
+            new_keys = [k for k in keys if k not in self.keys]
+            for k in new_keys:
+                self.keys[k] = len(self.keys)
+            padding = torch.zeros(len(new_keys), dtype=torch.float64, device=self.device)
+            self.sums = torch.cat((self.sums, padding))
+            self.counts = torch.cat((self.counts, padding))
+            index = torch.tensor([self.keys[k] for k in keys], device=self.device)
+            self._index_cache[keys] = index
+        return index
+
+    def add(self, data_dict):
+        """Accumulate the elements of every value of ``data_dict``.
+
+        Parameters
+        ----------
+        data_dict : dict[str, torch.Tensor | float]
+            Values to accumulate. Tensors of any shape contribute all of their elements.
+
+        Notes
+        -----
+        There is no per-env mask: callers pass only the elements to count, e.g. the episode statistics of the
+        envs reset at this step, which the reward manager already slices out of its per-env buffers.
+        """
+        self._added.update(data_dict)
+        groups = {}
+        for k, v in data_dict.items():
+            value = torch.as_tensor(v).to(self.device, torch.float32, non_blocking=True).reshape(-1)
+            keys, values = groups.setdefault(value.numel(), ([], []))
+            keys.append(k)
+            values.append(value)
+
+        for numel, (keys, values) in groups.items():
+            index = self._index(tuple(keys))
+            if numel == 0:
+                continue
+            sums = torch.stack(values).sum(dim=1, dtype=torch.float64)
+            self.sums.index_add_(0, index, sums)
+            self.counts.index_add_(0, index, sums.new_full((len(keys),), numel))
+
+    def mean(self, return_counts=False):
+        """Means of the keys added since the last clear as Python floats, 0 for keys without elements.
+
+        Parameters
+        ----------
+        return_counts : bool, optional
+            Also return the number of accumulated elements per key, e.g. to skip keys without elements.
+
+        Returns
+        -------
+        dict[str, float] | tuple[dict[str, float], dict[str, int]]
+            Means, or means and element counts with ``return_counts``.
+        """
+        if not self._added:
+            return ({}, {}) if return_counts else {}
+        means, counts = torch.stack((self.sums / self.counts.clamp(min=1), self.counts)).tolist()
+        mean = {k: means[i] for k, i in self.keys.items() if k in self._added}
+        if return_counts:
+            return mean, {k: int(counts[self.keys[k]]) for k in mean}
+        return mean
+
+    def clear(self):
+        self.sums.zero_()
+        self.counts.zero_()
+        self._added.clear()
+
+    def mean_and_clear(self, return_counts=False):
+        mean = self.mean(return_counts=return_counts)
+        self.clear()
+        return mean
@@ -0,0 +1,213 @@
+"""Tensorized terrain height lookups on a heightfield stored on the device."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+
+from holosoma.utils.safe_torch_import import torch
+from holosoma.utils.terrain_utils import heightfield_slope_offsets
+
+HeightfieldInterpolation = Literal["mesh", "triangle", "bilinear", "max"]
+
+# Cell-local (row, col) corners of the two triangles of a heightfield cell, in the vertex order of
+# ``terrain_utils.convert_heightfield_to_trimesh``: the cell is split along its (0, 0) -> (1, 1) diagonal.
+_TRIANGLE_CORNERS = np.array([[[0, 0], [1, 1], [0, 1]], [[0, 0], [1, 0], [1, 1]]])
+
+
+class HeightfieldSampler:
+    """Sample terrain heights at arbitrary XY positions from a device heightfield.
+
+    Heightfield vertex ``(i, j)`` lies at ``origin + (i, j) * horizontal_scale`` with height
+    ``height_field_raw[i, j] * vertical_scale``, matching the vertices produced by
+    :func:`holosoma.utils.terrain_utils.convert_heightfield_to_trimesh`. A lookup is a few gathers
+    per point, so it runs on any torch device and needs neither Warp nor a mesh BVH.
+
+    Interpolation modes:
+
+    - ``"mesh"``: the surface of the converted trimesh including its slope-threshold correction, i.e.
+      the height a vertical ray cast against the terrain mesh returns. Each point tests the triangles
+      of its cell plus the few neighbouring triangles that were stretched over it.
+    - ``"triangle"``: piecewise-linear over the two triangles of each cell. Same as ``"mesh"`` except
+      within one cell of the vertical walls the slope correction creates, but cheaper.
+    - ``"bilinear"``: bilinear interpolation of the four cell corners.
+    - ``"max"``: highest of the four cell corners. Conservative for clearance checks, except next to
+      vertical walls where ``"mesh"`` stretches a neighbouring cell's triangle over the cell.
+
+    Positions outside the heightfield are clamped to its border.
+    """
+
+    def __init__(
+        self,
+        height_field_raw: np.ndarray,
+        horizontal_scale: float,
+        vertical_scale: float,
+        origin: tuple[float, float] = (0.0, 0.0),
+        slope_threshold: float | None = None,
+        device: str | torch.device = "cpu",
+        interpolation: HeightfieldInterpolation = "triangle",
+    ) -> None:
+        """Upload the heightfield to ``device``.
+
+        Parameters
+        ----------
+        height_field_raw : np.ndarray
+            Discretized heights of shape ``(num_rows, num_cols)``, at least 2 x 2.
+        horizontal_scale : float
+            Distance between heightfield vertices in meters.
+        vertical_scale : float
+            Meters per height unit of ``height_field_raw``.
+        origin : tuple[float, float]
+            World XY position of vertex ``(0, 0)``.
+        slope_threshold : float, optional
+            Slope threshold the terrain mesh was converted with, only used by ``"mesh"`` interpolation.
+        device : str | torch.device
+            Device the heightfield is stored and sampled on.
+        interpolation : {"mesh", "triangle", "bilinear", "max"}
+            How heights between vertices are computed, see the class docstring.
+        """
+        if interpolation not in ("mesh", "triangle", "bilinear", "max"):
+            raise ValueError(f"Unknown heightfield interpolation: {interpolation}")
+        num_rows, num_cols = height_field_raw.shape
+        if num_rows < 2 or num_cols < 2:
+            raise ValueError(f"Heightfield must be at least 2 x 2, got {height_field_raw.shape}")
+
+        self.heights = torch.as_tensor(
+            np.asarray(height_field_raw, dtype=np.float32) * np.float32(vertical_scale), device=device
+        )
+        self.horizontal_scale = float(horizontal_scale)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.interpolation = interpolation
+        self._flat_heights = self.heights.view(-1)
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+
+        if interpolation == "mesh":
+            self._init_mesh_triangles(height_field_raw, vertical_scale, slope_threshold, device)
+
+    def _init_mesh_triangles(
+        self,
+        height_field_raw: np.ndarray,
+        vertical_scale: float,
+        slope_threshold: float | None,
+        device: str | torch.device,
+    ) -> None:
+        """Precompute the slope-corrected vertex positions and, per cell, the triangles of other cells covering it."""
+        num_rows, num_cols = self._num_rows, self._num_cols
+        vertex_x, vertex_y = np.meshgrid(np.arange(num_rows), np.arange(num_cols), indexing="ij")
+        if slope_threshold is not None:
+            offset_x, offset_y = heightfield_slope_offsets(
+                height_field_raw, self.horizontal_scale, vertical_scale, slope_threshold
+            )
+            vertex_x, vertex_y = vertex_x + offset_x, vertex_y + offset_y
+        # Vertex positions in grid cells, flattened like the heights
+        self._vertex_x = torch.as_tensor(vertex_x.reshape(-1), dtype=torch.float32, device=device)
+        self._vertex_y = torch.as_tensor(vertex_y.reshape(-1), dtype=torch.float32, device=device)
+        corner_vertices = _TRIANGLE_CORNERS[..., 0] * num_cols + _TRIANGLE_CORNERS[..., 1]
+        self._triangle_vertices = torch.as_tensor(corner_vertices, device=device)
+
+        # Vertex indices and positions of the two triangles of every cell: (num_cells, 2, 3)
+        cell_i, cell_j = np.meshgrid(np.arange(num_rows - 1), np.arange(num_cols - 1), indexing="ij")
+        cell_i3, cell_j3 = cell_i.reshape(-1, 1, 1), cell_j.reshape(-1, 1, 1)
+        tri_vertices = cell_i3 * num_cols + cell_j3 + corner_vertices
+        tri_x, tri_y = vertex_x.reshape(-1)[tri_vertices], vertex_y.reshape(-1)[tri_vertices]
+
+        # Triangles stretched beyond their own cell by the slope correction also cover the cells they reach.
+        # Vertices move by at most one cell, so these are within the 3 x 3 cells around the owning cell.
+        lo_x, hi_x = np.maximum(tri_x.min(-1), 0), np.minimum(tri_x.max(-1), num_rows - 1)
+        lo_y, hi_y = np.maximum(tri_y.min(-1), 0), np.minimum(tri_y.max(-1), num_cols - 1)
+        cells, triangles = [], []
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                if di == 0 and dj == 0:
+                    continue
+                x, y = cell_i3[..., 0] + di, cell_j3[..., 0] + dj
+                owner_cell, half = np.nonzero((x >= lo_x) & (x < hi_x) & (y >= lo_y) & (y < hi_y))
+                cells.append(x[owner_cell, 0] * (num_cols - 1) + y[owner_cell, 0])
+                triangles.append(tri_vertices[owner_cell, half])
+        cells_np, triangles_np = np.concatenate(cells), np.concatenate(triangles)
+
+        # Pack the extra triangles into one padded row per covered cell, row 0 is the empty row of all other cells
+        self._extra_triangles: torch.Tensor | None = None
+        if len(cells_np) == 0:
+            return
+        order = np.argsort(cells_np, kind="stable")
+        cells_np, triangles_np = cells_np[order], triangles_np[order]
+        covered_cells, first, counts = np.unique(cells_np, return_index=True, return_counts=True)
+        cell_row = np.zeros((num_rows - 1) * (num_cols - 1), dtype=np.int32)
+        cell_row[covered_cells] = np.arange(1, len(covered_cells) + 1)
+        extra = np.full((len(covered_cells) + 1, counts.max(), 3), -1, dtype=np.int32)
+        extra[cell_row[cells_np], np.arange(len(cells_np)) - np.repeat(first, counts)] = triangles_np
+        self._cell_row = torch.as_tensor(cell_row, device=device)
+        self._extra_triangles = torch.as_tensor(extra, device=device)
+
+    def sample(self, xy: torch.Tensor) -> torch.Tensor:
+        """Return the terrain heights at ``xy``.
+
+        Parameters
+        ----------
+        xy : torch.Tensor
+            World XY positions of shape ``(..., 2)``, on the sampler's device.
+
+        Returns
+        -------
+        torch.Tensor
+            Terrain heights of shape ``(...)``.
+        """
+        # Continuous vertex coordinates, clamped to the heightfield
+        u = ((xy[..., 0] - self.origin[0]) / self.horizontal_scale).clamp(0.0, self._num_rows - 1)
+        v = ((xy[..., 1] - self.origin[1]) / self.horizontal_scale).clamp(0.0, self._num_cols - 1)
+        # Lower corner of the cell, the last row/column belongs to the cell before it
+        i0 = u.floor().clamp(max=self._num_rows - 2)
+        j0 = v.floor().clamp(max=self._num_cols - 2)
+
+        if self.interpolation == "mesh":
+            return self._sample_mesh(u, v, i0.long(), j0.long())
+
+        fu = u - i0
+        fv = v - j0
+        idx00 = i0.long() * self._num_cols + j0.long()
+        h00 = self._flat_heights[idx00]
+        h01 = self._flat_heights[idx00 + 1]
+        h10 = self._flat_heights[idx00 + self._num_cols]
+        h11 = self._flat_heights[idx00 + self._num_cols + 1]
+
+        if self.interpolation == "max":
+            return torch.maximum(torch.maximum(h00, h01), torch.maximum(h10, h11))
+        if self.interpolation == "bilinear":
+            return torch.lerp(torch.lerp(h00, h01, fv), torch.lerp(h10, h11, fv), fu)
+        return torch.where(
+            fv > fu,
+            h00 + fu * (h11 - h01) + fv * (h01 - h00),
+            h00 + fu * (h10 - h00) + fv * (h11 - h10),
+        )
+
+    def _sample_mesh(self, u: torch.Tensor, v: torch.Tensor, i0: torch.Tensor, j0: torch.Tensor) -> torch.Tensor:
+        """Highest slope-corrected mesh triangle containing ``(u, v)``, as seen by a ray cast from above."""
+        vertex00 = i0 * self._num_cols + j0
+        # Vertex indices of the candidate triangles: (..., num_triangles, 3)
+        triangles = vertex00[..., None, None] + self._triangle_vertices
+        if self._extra_triangles is not None:
+            extra = self._extra_triangles[self._cell_row[i0 * (self._num_cols - 1) + j0]]
+            triangles = torch.cat([triangles, extra.long()], dim=-2)
+        valid = triangles[..., 0] >= 0
+        triangles = triangles.clamp(min=0)
+        px, py, pz = self._vertex_x[triangles], self._vertex_y[triangles], self._flat_heights[triangles]
+
+        # Barycentric coordinates of the query point, skipping triangles collapsed into vertical walls
+        e1x, e1y = px[..., 1] - px[..., 0], py[..., 1] - py[..., 0]
+        e2x, e2y = px[..., 2] - px[..., 0], py[..., 2] - py[..., 0]
+        qx, qy = u.unsqueeze(-1) - px[..., 0], v.unsqueeze(-1) - py[..., 0]
+        det = e1x * e2y - e2x * e1y
+        valid &= det != 0.0
+        det = torch.where(valid, det, torch.ones_like(det))
+        b1 = (qx * e2y - e2x * qy) / det
+        b2 = (e1x * qy - qx * e1y) / det
+        eps = 1e-5
+        valid &= (b1 >= -eps) & (b2 >= -eps) & (b1 + b2 <= 1.0 + eps)
+
+        heights = pz[..., 0] + b1 * (pz[..., 1] - pz[..., 0]) + b2 * (pz[..., 2] - pz[..., 0])
+        heights = torch.where(valid, heights, torch.full_like(heights, -torch.inf)).amax(dim=-1)
+        # Gaps the correction opens at the outer border of the mesh fall back to the cell's corner height
+        return torch.where(torch.isinf(heights), self._flat_heights[vertex00], heights)
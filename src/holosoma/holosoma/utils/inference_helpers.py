@@ -7,6 +7,7 @@ from typing import Any, Tuple
 
 import onnx
 import torch
+from loguru import logger
 
 from holosoma.config_types.robot import RobotConfig
 from holosoma.envs.base_task.base_task import BaseTask
@@ -149,12 +150,18 @@ class _OnnxMotionPolicyExporter(torch.nn.Module):
         self._wrapped_actor = self._create_actor_wrapper(actor_model)
 
         motion = motion_command.motion
-
-        joint_pos = motion.joint_pos
-        joint_vel = motion.joint_vel
-
-        body_pos_w = motion.body_pos_w
-        body_quat_w = motion.body_quat_w
+        # The exported policy replays a single reference clip: the first clip of the motion library
+        if motion.num_clips > 1:
+            logger.warning(
+                f"Motion library has {motion.num_clips} clips; exporting only '{motion.clip_names[0]}' to ONNX"
+            )
+        frames = motion.clip_frames(0)
+
+        joint_pos = motion.unpack(frames, "joint_pos")
+        joint_vel = motion.unpack(frames, "joint_vel")
+
+        body_pos_w = motion.unpack(frames, "body_pos")
+        body_quat_w = motion.unpack(frames, "body_quat")
         ref_body_index = motion_command.ref_body_index
         ref_body_pos_w = body_pos_w[:, ref_body_index, :]
         ref_body_quat_w = body_quat_w[:, ref_body_index, :]  # in xyzw
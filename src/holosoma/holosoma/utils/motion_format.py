@@ -0,0 +1,253 @@
+"""Native, memory-mappable motion dataset format.
+
+A ``.hsmotion`` file stores one or more motion clips as a single uncompressed float32 ``[num_frames, num_features]``
+array, already in the packed layout of :class:`~holosoma.managers.command.terms.wbt.MotionLoader` (bodies and joints
+in the stored order, quaternions in xyzw). The file is laid out as::
+
+    b"HSMOTION" | uint64 header size | JSON header | zero padding to 64 bytes | float32 frames (little endian)
+
+The JSON header holds the body/joint names, fps, the column layout of every field and the per-clip frame offsets.
+Frames are memory-mapped rather than read, so loading is independent of the dataset size and every process on a
+machine (e.g. the ranks of a multi-GPU run) shares the same page cache.
+
+Use ``python -m holosoma.convert_motions`` to convert ``.npz`` motion files.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import struct
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Tuple
+
+import numpy as np
+import torch
+
+MOTION_FILE_SUFFIX = ".hsmotion"
+MOTION_FILE_VERSION = 1
+
+_MAGIC = b"HSMOTION"
+_HEADER_SIZE_FORMAT = "<Q"
+_ALIGNMENT = 64
+_DTYPE = np.dtype("<f4")
+
+# Fake foot contact bodies are authored in the URDF purely for height computation.
+# They do not exist in the motion-capture dataset, so we alias them back to the
+# closest real body when indexing into motion data. These are not actually used in training.
+FAKE_BODY_NAME_ALIASES: dict[str, str] = {
+    "left_foot_contact_point": "left_ankle_roll_link",
+    "right_foot_contact_point": "right_ankle_roll_link",
+}
+
+# typing generics, the alias is evaluated at import time and subscripting builtins needs Python 3.9
+Layout = Dict[str, Tuple[slice, Tuple[int, ...]]]
+
+
+@dataclass
+class MotionFileHeader:
+    """JSON header of a ``.hsmotion`` file."""
+
+    fps: float
+    body_names: list[str]
+    joint_names: list[str]
+    layout: dict[str, tuple[int, int, list[int]]]
+    """Field name -> (first column, end column, per-frame shape)."""
+    clip_names: list[str]
+    clip_starts: list[int]
+    clip_lengths: list[int]
+    version: int = MOTION_FILE_VERSION
+
+    @property
+    def num_frames(self) -> int:
+        return sum(self.clip_lengths)
+
+    @property
+    def num_features(self) -> int:
+        return max(stop for _, stop, _ in self.layout.values())
+
+    def field_layout(self) -> Layout:
+        """Layout as used by ``MotionLoader``: field name -> (column slice, per-frame shape)."""
+        return {name: (slice(start, stop), tuple(shape)) for name, (start, stop, shape) in self.layout.items()}
+
+
+def is_motion_file(path: str) -> bool:
+    """Whether ``path`` is a native ``.hsmotion`` motion file (by suffix)."""
+    return path.endswith(MOTION_FILE_SUFFIX)
+
+
+def field_layout(fields: Mapping[str, np.ndarray | torch.Tensor]) -> Layout:
+    """Assign consecutive column ranges to ``[T, ...]`` fields, in insertion order."""
+    layout: Layout = {}
+    offset = 0
+    for name, value in fields.items():
+        shape = tuple(value.shape[1:])
+        width = math.prod(shape)
+        layout[name] = (slice(offset, offset + width), shape)
+        offset += width
+    return layout
+
+
+def npz_motion_fields(data: Mapping[str, np.ndarray], body_idx: np.ndarray, joint_idx: np.ndarray) -> dict:
+    """Extract the motion fields of a loaded ``.npz`` motion for the given body/joint indices.
+
+    Parameters
+    ----------
+    data : Mapping[str, np.ndarray]
+        Arrays of the ``.npz`` file, see :class:`~holosoma.config_types.command.MotionConfig` for the format.
+    body_idx : np.ndarray
+        Indices into ``data["body_names"]`` of the bodies to keep, in output order.
+    joint_idx : np.ndarray
+        Indices into ``data["joint_names"]`` of the joints to keep, in output order.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        ``joint_pos``, ``joint_vel``, ``body_pos``, ``body_quat`` (xyzw), ``body_lin_vel``, ``body_ang_vel`` and, if
+        the motion has an object, ``object_pos``, ``object_quat`` (xyzw) and ``object_lin_vel``.
+    """
+    # The first 7 joints_pos are [xyz, wxyz] of the pelvis, omit them from the joint_pos
+    # The first 6 joints_vel are [vel_xyz, vel_wxyz] of the pelvis, omit them from the joint_vel
+    # We'll use the pelvis position and quaternion from body_pos_w[:, 0] and body_quat_w[:, 0] directly.
+    joint_pos = data["joint_pos"][:, 7:]
+    assert len(data["joint_names"]) == joint_pos.shape[1], "Joint names in motion data does not match"
+    body_pos_w = data["body_pos_w"]
+    assert len(data["body_names"]) == body_pos_w.shape[1], "Body names in motion data does not match"
+
+    fields = {
+        "joint_pos": joint_pos[:, joint_idx],
+        "joint_vel": data["joint_vel"][:, 6:][:, joint_idx],
+        "body_pos": body_pos_w[:, body_idx],
+        # NOTE: wxyz after loading from npz, change to xyzw
+        "body_quat": data["body_quat_w"][:, body_idx][..., [1, 2, 3, 0]],
+        "body_lin_vel": data["body_lin_vel_w"][:, body_idx],
+        "body_ang_vel": data["body_ang_vel_w"][:, body_idx],
+    }
+    if "object_pos_w" in data:
+        fields["object_pos"] = data["object_pos_w"]
+        fields["object_quat"] = data["object_quat_w"][:, [1, 2, 3, 0]]  # Change to xyzw
+        fields["object_lin_vel"] = data["object_lin_vel_w"]
+    return fields
+
+
+def reorder_columns(layout: Layout, body_idx: np.ndarray, joint_idx: np.ndarray) -> tuple[Layout, np.ndarray]:
+    """Columns selecting bodies ``body_idx`` and joints ``joint_idx`` out of packed frames with ``layout``.
+
+    Returns the layout of the selected frames and the column index into the original frames.
+    """
+    columns = []
+    selected = {}
+    for name, (cols, shape) in layout.items():
+        field_columns = np.arange(cols.start, cols.stop).reshape(shape)
+        if name.startswith("body_"):
+            field_columns = field_columns[body_idx]
+        elif name.startswith("joint_"):
+            field_columns = field_columns[joint_idx]
+        selected[name] = field_columns[None]
+        columns.append(field_columns.reshape(-1))
+    return field_layout(selected), np.concatenate(columns)
+
+
+def write_motion_file(
+    path: str | Path,
+    *,
+    fps: float,
+    body_names: list[str],
+    joint_names: list[str],
+    layout: Layout,
+    clips: Iterable[tuple[str, np.ndarray]],
+) -> MotionFileHeader:
+    """Write ``(name, frames)`` clips to a ``.hsmotion`` file.
+
+    Clips are streamed to a temporary file next to ``path`` while their offsets are collected, so only one clip
+    needs to be in memory at a time.
+
+    Parameters
+    ----------
+    path : str | Path
+        Output file.
+    fps : float
+        Frame rate shared by all clips.
+    body_names, joint_names : list[str]
+        Names of the stored bodies and joints, in column order.
+    layout : Layout
+        Column layout of the packed frames, see :func:`field_layout`.
+    clips : Iterable[tuple[str, np.ndarray]]
+        Clip names and ``[T, num_features]`` packed frames.
+
+    Returns
+    -------
+    MotionFileHeader
+        Header written to the file.
+    """
+    path = Path(path)
+    num_features = max(cols.stop for cols, _ in layout.values())
+    header = MotionFileHeader(
+        fps=float(fps),
+        body_names=list(body_names),
+        joint_names=list(joint_names),
+        layout={name: (cols.start, cols.stop, list(shape)) for name, (cols, shape) in layout.items()},
+        clip_names=[],
+        clip_starts=[],
+        clip_lengths=[],
+    )
+    with tempfile.TemporaryFile(dir=path.parent) as data_file:
+        for name, frames in clips:
+            assert frames.ndim == 2 and frames.shape[1] == num_features, (
+                f"Clip {name} has shape {frames.shape}, expected [T, {num_features}]"
+            )
+            header.clip_names.append(name)
+            header.clip_starts.append(header.num_frames)
+            header.clip_lengths.append(frames.shape[0])
+            data_file.write(np.ascontiguousarray(frames, dtype=_DTYPE).tobytes())
+
+        header_bytes = json.dumps(asdict(header)).encode()
+        prefix = len(_MAGIC) + struct.calcsize(_HEADER_SIZE_FORMAT) + len(header_bytes)
+        with path.open("wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack(_HEADER_SIZE_FORMAT, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(b"\0" * (-prefix % _ALIGNMENT))
+            data_file.seek(0)
+            while chunk := data_file.read(1 << 24):
+                f.write(chunk)
+    return header
+
+
+def read_motion_header(path: str) -> tuple[MotionFileHeader, int]:
+    """Read the header of a ``.hsmotion`` file and the byte offset of its frames."""
+    with open(path, "rb") as f:
+        magic = f.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a {MOTION_FILE_SUFFIX} motion file")
+        (header_size,) = struct.unpack(_HEADER_SIZE_FORMAT, f.read(struct.calcsize(_HEADER_SIZE_FORMAT)))
+        header = MotionFileHeader(**json.loads(f.read(header_size)))
+    if header.version != MOTION_FILE_VERSION:
+        raise ValueError(f"{path} has motion file version {header.version}, expected {MOTION_FILE_VERSION}")
+    prefix = len(_MAGIC) + struct.calcsize(_HEADER_SIZE_FORMAT) + header_size
+    return header, prefix + (-prefix % _ALIGNMENT)
+
+
+def open_motion_file(path: str) -> tuple[MotionFileHeader, torch.Tensor]:
+    """Memory-map a ``.hsmotion`` file.
+
+    Returns the header and a CPU ``[num_frames, num_features]`` float32 tensor backed by the file. The mapping is
+    copy-on-write: writes to the tensor stay private to the process. Repeated calls for an unchanged file return the
+    same tensor, so clips opened separately remain views of one storage.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _open_motion_file(str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _open_motion_file(path: str, mtime_ns: int, size: int) -> tuple[MotionFileHeader, torch.Tensor]:
+    header, data_offset = read_motion_header(path)
+    shape = (header.num_frames, header.num_features)
+    if header.num_frames == 0:
+        return header, torch.zeros(shape, dtype=torch.float32)
+    frames = np.memmap(path, dtype=_DTYPE, mode="c", offset=data_offset, shape=shape)
+    return header, torch.from_numpy(frames)
@@ -741,3 +741,129 @@ def quat_rotate_batched(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
     c = q_vec * dot * 2.0
 
     return a + b + c
+
+
+# ============================================================================
+# Fused Motion-Relative Transforms
+# Broadcast one reference frame per env over [N, B, ...] bodies instead of
+# repeating it, and fuse the quaternion chains into single expressions
+# ============================================================================
+
+
+def _quat_mul_broadcast(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """Hamilton product of (x, y, z, w) quaternions, broadcasting over the leading dimensions."""
+    ax, ay, az, aw = a.unbind(-1)
+    bx, by, bz, bw = b.unbind(-1)
+    return torch.stack(
+        (
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+            aw * bw - ax * bx - ay * by - az * bz,
+        ),
+        dim=-1,
+    )
+
+
+def _quat_apply_broadcast(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
+    """Rotate vectors by (x, y, z, w) quaternions, broadcasting over the leading dimensions."""
+    qx, qy, qz, qw = q.unbind(-1)
+    vx, vy, vz = v.unbind(-1)
+    # t = 2 * cross(q_xyz, v); v' = v + w * t + cross(q_xyz, t)
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+    return torch.stack(
+        (
+            vx + qw * tx + qy * tz - qz * ty,
+            vy + qw * ty + qz * tx - qx * tz,
+            vz + qw * tz + qx * ty - qy * tx,
+        ),
+        dim=-1,
+    )
+
+
+def motion_to_robot_frame(
+    ref_pos_w: torch.Tensor,
+    ref_quat_w: torch.Tensor,
+    robot_ref_pos_w: torch.Tensor,
+    robot_ref_quat_w: torch.Tensor,
+    body_pos_w: torch.Tensor,
+    body_quat_w: torch.Tensor,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Move motion body poses so that the motion reference body matches the robot's in x/y position and yaw.
+
+    Fused, broadcasting equivalent of::
+
+        delta_quat = yaw_quat(quat_mul(robot_ref_quat_w, quat_inverse(ref_quat_w)))
+        body_quat = quat_mul(delta_quat, body_quat_w)
+        body_pos = [robot_ref_xy, ref_z] + quat_apply(delta_quat, body_pos_w - ref_pos_w)
+
+    with the per-env reference poses broadcast over the bodies instead of repeated. The yaw rotation is applied in
+    closed form from the yaw angle. This is the eager implementation; :func:`motion_to_robot_frame_jit` is the
+    TorchScript one and the function can also be wrapped with ``torch.compile``.
+
+    Args:
+        ref_pos_w: Motion reference body position of shape (N, 3).
+        ref_quat_w: Motion reference body orientation in (x, y, z, w) of shape (N, 4).
+        robot_ref_pos_w: Robot reference body position of shape (N, 3).
+        robot_ref_quat_w: Robot reference body orientation in (x, y, z, w) of shape (N, 4).
+        body_pos_w: Motion body positions of shape (N, B, 3).
+        body_quat_w: Motion body orientations in (x, y, z, w) of shape (N, B, 4).
+
+    Returns:
+        Relative body positions and orientations (x, y, z, w) of shapes (N, B, 3) and (N, B, 4).
+    """
+    # Yaw of robot_ref_quat * ref_quat^-1
+    ref_inverse = torch.cat((-ref_quat_w[:, :3], ref_quat_w[:, 3:]), dim=-1)
+    qx, qy, qz, qw = _quat_mul_broadcast(robot_ref_quat_w, ref_inverse).unbind(-1)
+    yaw = torch.atan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz)).unsqueeze(-1)
+    sin_half, cos_half = torch.sin(0.5 * yaw), torch.cos(0.5 * yaw)
+    sin_yaw, cos_yaw = torch.sin(yaw), torch.cos(yaw)
+
+    # Left-multiply by the yaw quaternion (0, 0, sin_half, cos_half)
+    bx, by, bz, bw = body_quat_w.unbind(-1)
+    body_quat = torch.stack(
+        (
+            cos_half * bx - sin_half * by,
+            cos_half * by + sin_half * bx,
+            cos_half * bz + sin_half * bw,
+            cos_half * bw - sin_half * bz,
+        ),
+        dim=-1,
+    )
+
+    # Rotate the offsets to the reference body about z, keep the motion reference height
+    rx, ry, rz = (body_pos_w - ref_pos_w.unsqueeze(1)).unbind(-1)
+    body_pos = torch.stack(
+        (
+            robot_ref_pos_w[:, 0:1] + cos_yaw * rx - sin_yaw * ry,
+            robot_ref_pos_w[:, 1:2] + sin_yaw * rx + cos_yaw * ry,
+            ref_pos_w[:, 2:3] + rz,
+        ),
+        dim=-1,
+    )
+    return body_pos, body_quat
+
+
+def subtract_frame_transforms_broadcast(
+    t01: torch.Tensor, q01: torch.Tensor, t02: torch.Tensor, q02: torch.Tensor
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Broadcasting :func:`subtract_frame_transforms` for one frame 1 per env and B frames 2.
+
+    Args:
+        t01: Position of frame 1 w.r.t. frame 0. Shape is (N, 3).
+        q01: Quaternion orientation of frame 1 w.r.t. frame 0 in (x, y, z, w). Shape is (N, 4).
+        t02: Positions of frames 2 w.r.t. frame 0. Shape is (N, B, 3).
+        q02: Quaternion orientations of frames 2 w.r.t. frame 0 in (x, y, z, w). Shape is (N, B, 4).
+
+    Returns:
+        A tuple containing the positions and orientations of frames 2 w.r.t. frame 1.
+        Shape of the tensors are (N, B, 3) and (N, B, 4) respectively.
+    """
+    q10 = torch.cat((-q01[:, :3], q01[:, 3:]), dim=-1).unsqueeze(1)
+    return _quat_apply_broadcast(q10, t02 - t01.unsqueeze(1)), _quat_mul_broadcast(q10, q02)
+
+
+motion_to_robot_frame_jit = torch_jit_script(motion_to_robot_frame)
+subtract_frame_transforms_broadcast_jit = torch_jit_script(subtract_frame_transforms_broadcast)
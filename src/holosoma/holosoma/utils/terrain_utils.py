@@ -210,11 +210,69 @@ def pyramid_stairs_terrain(
     return terrain
 
 
+def heightfield_slope_offsets(
+    height_field_raw: np.ndarray,
+    horizontal_scale: float,
+    vertical_scale: float,
+    slope_threshold: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the vertex offsets that turn steep heightfield slopes into vertical surfaces.
+
+    A vertex next to a rise steeper than the threshold is moved by one grid cell onto the position of
+    the higher vertex, so the mesh has a vertical wall there instead of a steep ramp.
+
+    Parameters
+    ----------
+    height_field_raw : np.ndarray
+        Input heightfield as a 2D array of integers representing discretized heights.
+    horizontal_scale : float
+        Horizontal discretization scale in meters per pixel.
+    vertical_scale : float
+        Vertical discretization scale in meters per height unit.
+    slope_threshold : float
+        The slope threshold (rise/run) above which surfaces are made vertical.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Offsets in grid cells (-1, 0 or 1) along x (rows) and y (columns), each of the heightfield's shape.
+    """
+    num_rows, num_cols = height_field_raw.shape
+    hf = height_field_raw
+
+    # Scale threshold based on discretization
+    slope_threshold *= horizontal_scale / vertical_scale
+
+    # Arrays to track vertex movement
+    move_x = np.zeros((num_rows, num_cols))
+    move_y = np.zeros((num_rows, num_cols))
+    move_corners = np.zeros((num_rows, num_cols))
+
+    # Detect steep slopes in x direction and mark for correction
+    move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
+    move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
+
+    # Detect steep slopes in y direction and mark for correction
+    move_y[:, : num_cols - 1] += hf[:, 1:num_cols] - hf[:, : num_cols - 1] > slope_threshold
+    move_y[:, 1:num_cols] -= hf[:, : num_cols - 1] - hf[:, 1:num_cols] > slope_threshold
+
+    # Detect steep slopes at corners (diagonal)
+    move_corners[: num_rows - 1, : num_cols - 1] += (
+        hf[1:num_rows, 1:num_cols] - hf[: num_rows - 1, : num_cols - 1] > slope_threshold
+    )
+    move_corners[1:num_rows, 1:num_cols] -= (
+        hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
+    )
+
+    return move_x + move_corners * (move_x == 0), move_y + move_corners * (move_y == 0)
+
+
 def convert_heightfield_to_trimesh(
     height_field_raw: np.ndarray,
     horizontal_scale: float,
     vertical_scale: float,
     slope_threshold: float | None = None,
+    merge_flat_regions: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Convert a heightfield array to a triangle mesh.
 
@@ -239,6 +297,11 @@ def convert_heightfield_to_trimesh(
     slope_threshold : float, optional
         The slope threshold (rise/run) above which surfaces are made vertical.
         If None, no correction is applied. Default is None.
+    merge_flat_regions : bool, optional
+        Replace the two triangles per cell of flat regions (flat tiles, stair treads, platforms) by
+        two triangles per maximal rectangle of equal height, see :func:`merge_flat_heightfield_cells`.
+        The surface is unchanged, but the merged rectangles create T-junctions with the vertices of
+        their non-flat neighbours, and unused vertices are dropped. Default is False.
 
     Returns
     -------
@@ -260,34 +323,13 @@ def convert_heightfield_to_trimesh(
     hf = height_field_raw.copy()
 
     # Apply slope threshold correction if specified
+    moved = None
     if slope_threshold is not None:
-        # Scale threshold based on discretization
-        slope_threshold *= horizontal_scale / vertical_scale
-
-        # Arrays to track vertex movement
-        move_x = np.zeros((num_rows, num_cols))
-        move_y = np.zeros((num_rows, num_cols))
-        move_corners = np.zeros((num_rows, num_cols))
-
-        # Detect steep slopes in x direction and mark for correction
-        move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
-        move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
-
-        # Detect steep slopes in y direction and mark for correction
-        move_y[:, : num_cols - 1] += hf[:, 1:num_cols] - hf[:, : num_cols - 1] > slope_threshold
-        move_y[:, 1:num_cols] -= hf[:, : num_cols - 1] - hf[:, 1:num_cols] > slope_threshold
-
-        # Detect steep slopes at corners (diagonal)
-        move_corners[: num_rows - 1, : num_cols - 1] += (
-            hf[1:num_rows, 1:num_cols] - hf[: num_rows - 1, : num_cols - 1] > slope_threshold
-        )
-        move_corners[1:num_rows, 1:num_cols] -= (
-            hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
-        )
-
         # Apply corrections: move vertices to create vertical surfaces
-        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
-        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        offset_x, offset_y = heightfield_slope_offsets(hf, horizontal_scale, vertical_scale, slope_threshold)
+        xx += offset_x * horizontal_scale
+        yy += offset_y * horizontal_scale
+        moved = (offset_x != 0) | (offset_y != 0)
 
     # Create vertex array
     vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
@@ -296,30 +338,98 @@ def convert_heightfield_to_trimesh(
     vertices[:, 2] = hf.flatten() * vertical_scale
 
     # Create triangle indices
-    # Each grid cell becomes 2 triangles
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        # Calculate vertex indices for current row
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-
-        # Calculate triangle range for this row
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-
-        # First triangle of each quad
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-
-        # Second triangle of each quad
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
-
-    return vertices, triangles
+    # Each grid cell becomes 2 triangles, cell (i, j) has the lower vertex i * num_cols + j
+    ind0 = (np.arange(num_rows - 1)[:, None] * num_cols + np.arange(num_cols - 1)).astype(np.uint32)
+    if not merge_flat_regions:
+        return vertices, _cell_triangles(ind0.reshape(-1), num_cols)
+
+    flat, rect_rows, rect_cols = merge_flat_heightfield_cells(hf, moved)
+    rect_ind0 = rect_rows[:, 0] * num_cols + rect_cols[:, 0]
+    triangles = np.concatenate(
+        [
+            _cell_triangles(ind0[~flat], num_cols),
+            _cell_triangles(
+                rect_ind0.astype(np.uint32),
+                num_cols,
+                rows=(rect_rows[:, 1] - rect_rows[:, 0]).astype(np.uint32),
+                cols=(rect_cols[:, 1] - rect_cols[:, 0]).astype(np.uint32),
+            ),
+        ]
+    )
+
+    # Drop the vertices inside the merged rectangles
+    used, triangles = np.unique(triangles, return_inverse=True)
+    return vertices[used], triangles.reshape(-1, 3).astype(np.uint32)
+
+
+def _cell_triangles(
+    ind0: np.ndarray, num_cols: int, rows: np.ndarray | int = 1, cols: np.ndarray | int = 1
+) -> np.ndarray:
+    """Two triangles per grid rectangle with lower vertex ``ind0`` spanning ``rows`` x ``cols`` cells."""
+    ind1 = ind0 + cols
+    ind2 = ind0 + rows * num_cols
+    ind3 = ind2 + cols
+    # First triangle (0, 3, 1) and second triangle (0, 2, 3) of each quad
+    triangles = np.stack([ind0, ind3, ind1, ind0, ind2, ind3], axis=-1)
+    return triangles.reshape(-1, 3).astype(np.uint32)
+
+
+def merge_flat_heightfield_cells(
+    height_field_raw: np.ndarray, moved: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cover the flat cells of a heightfield with rectangles of equal height.
+
+    A cell is flat if its four corners have the same height and none of them is moved by the slope
+    correction, so its two triangles form a horizontal square. Flat cells of equal height are first
+    merged into maximal runs along each row of cells, then runs spanning the same columns at the same
+    height are stacked over consecutive rows. Both steps are vectorized.
+
+    Parameters
+    ----------
+    height_field_raw : np.ndarray
+        Input heightfield as a 2D array of integers representing discretized heights.
+    moved : np.ndarray, optional
+        Boolean mask of the vertices moved by the slope correction, of the heightfield's shape.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        - flat : np.ndarray of shape (num_rows - 1, num_cols - 1)
+            Mask of the cells covered by the rectangles.
+        - rect_rows, rect_cols : np.ndarray of shape (num_rects, 2)
+            First and one-past-last cell row and column of each rectangle. Rectangles don't overlap.
+    """
+    hf = height_field_raw
+    height = hf[:-1, :-1]
+    flat = (height == hf[1:, :-1]) & (height == hf[:-1, 1:]) & (height == hf[1:, 1:])
+    if moved is not None:
+        flat &= ~(moved[:-1, :-1] | moved[1:, :-1] | moved[:-1, 1:] | moved[1:, 1:])
+
+    # Runs of flat cells of equal height along each row of cells
+    joined = flat[:, :-1] & flat[:, 1:] & (height[:, :-1] == height[:, 1:])
+    run_starts = flat.copy()
+    run_starts[:, 1:] &= ~joined
+    run_ends = flat.copy()
+    run_ends[:, :-1] &= ~joined
+    run_row, run_first = np.nonzero(run_starts)
+    run_last = np.nonzero(run_ends)[1]
+    run_height = height[run_row, run_first]
+
+    # Stack runs with the same columns and height in consecutive rows
+    order = np.lexsort((run_row, run_height, run_last, run_first))
+    run_row, run_first, run_last, run_height = run_row[order], run_first[order], run_last[order], run_height[order]
+    continues = np.zeros(len(order), dtype=bool)
+    continues[1:] = (
+        (run_first[1:] == run_first[:-1])
+        & (run_last[1:] == run_last[:-1])
+        & (run_height[1:] == run_height[:-1])
+        & (run_row[1:] == run_row[:-1] + 1)
+    )
+    rect_first_run = np.flatnonzero(~continues)
+    rect_last_run = np.append(rect_first_run[1:], len(order)) - 1
+    rect_rows = np.stack([run_row[rect_first_run], run_row[rect_last_run] + 1], axis=-1)
+    rect_cols = np.stack([run_first[rect_first_run], run_last[rect_first_run] + 1], axis=-1)
+    return flat, rect_rows, rect_cols
 
 
 def sloped_terrain(terrain: SubTerrain, slope: float = 1) -> SubTerrain:
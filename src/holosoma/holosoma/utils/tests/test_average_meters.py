@@ -0,0 +1,41 @@
+import pytest
+import torch
+
+from holosoma.utils.average_meters import StreamingMeanDict, TensorAverageMeterDict
+
+
+def test_streaming_mean_matches_tensor_average_meter():
+    generator = torch.Generator().manual_seed(0)
+    streaming = StreamingMeanDict()
+    reference = TensorAverageMeterDict()
+    for step in range(50):
+        data = {
+            "per_env": torch.randn(step % 4, generator=generator),
+            "scalar": torch.randn((), generator=generator),
+            "other_per_env": torch.randn(3, generator=generator),
+            "empty": torch.zeros(0),
+        }
+        streaming.add(data)
+        reference.add(data)
+
+    means = streaming.mean_and_clear()
+    expected = reference.mean_and_clear()
+    assert means.keys() == expected.keys()
+    for key, value in expected.items():
+        assert means[key] == pytest.approx(float(value), abs=1e-6)
+    assert means["empty"] == 0.0
+    assert streaming.mean() == {}
+
+
+def test_streaming_mean_keys_since_clear():
+    streaming = StreamingMeanDict()
+    streaming.add({"a": torch.tensor([1.0, 2.0]), "b": torch.tensor([3.0])})
+    streaming.clear()
+    streaming.add({"b": torch.zeros(0)})
+    streaming.add({"c": torch.tensor([4.0, float("nan")])})
+
+    means, counts = streaming.mean(return_counts=True)
+    assert counts == {"b": 0, "c": 2}
+    assert list(means) == ["b", "c"]
+    assert means["b"] == 0.0
+    assert torch.isnan(torch.tensor(means["c"]))
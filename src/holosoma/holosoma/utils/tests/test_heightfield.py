@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import torch
+
+from holosoma.config_types.terrain import TerrainTermCfg
+from holosoma.simulator.shared.terrain import Terrain
+from holosoma.utils.heightfield import HeightfieldSampler
+
+
+def _terrain(terrain_type):
+    cfg = TerrainTermCfg(
+        func="holosoma.managers.terrain.terms.locomotion:TerrainLocomotion",
+        static_friction=1.0,
+        dynamic_friction=1.0,
+        restitution=0.0,
+        mesh_type="trimesh",
+        num_rows=2,
+        num_cols=2,
+        terrain_length=4.0,
+        terrain_width=4.0,
+        border_size=1,
+        terrain_config={terrain_type: 1.0},
+        cache_dir=None,
+    )
+    return Terrain(cfg, num_robots=4)
+
+
+def test_interpolation_modes():
+    # Vertex (i, j) is at (2 + 0.5 i, -1 + 0.5 j), heights in units of 0.1 m
+    height_field_raw = np.array([[0, 10], [20, 50]], dtype=np.int16)
+    xy = torch.tensor([[2.0, -1.0], [2.25, -0.75], [2.5, -0.5], [2.1, -0.6], [2.4, -0.9], [10.0, 10.0]])
+
+    def sample(interpolation):
+        sampler = HeightfieldSampler(height_field_raw, 0.5, 0.1, origin=(2.0, -1.0), interpolation=interpolation)
+        return sampler.sample(xy)
+
+    torch.testing.assert_close(sample("bilinear"), torch.tensor([0.0, 2.0, 5.0, 1.52, 2.12, 5.0]))
+    torch.testing.assert_close(sample("max"), torch.full((6,), 5.0))
+    # The cell is split along its (0, 0) -> (1, 1) diagonal, each half is planar
+    expected = torch.tensor([0.0, 2.5, 5.0, 0.2 * 4.0 + 0.8 * 1.0, 0.8 * 2.0 + 0.2 * 3.0, 5.0])
+    torch.testing.assert_close(sample("triangle"), expected)
+    torch.testing.assert_close(sample("mesh"), expected)
+
+    with pytest.raises(ValueError, match="interpolation"):
+        sample("nearest")
+
+
+def test_mesh_interpolation_matches_ray_casting():
+    warp_utils = pytest.importorskip("holosoma.utils.warp_utils")
+    np.random.seed(0)
+    terrain = _terrain("smooth_stairs")
+    generator = torch.Generator().manual_seed(0)
+    xy = torch.rand(20000, 2, generator=generator) * 10.0 - 1.0
+
+    ray_starts = torch.cat([xy, torch.full((len(xy), 1), 100.0)], dim=1)
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[:, 2] = -1.0
+    mesh = warp_utils.convert_to_wp_mesh(terrain.mesh.vertices, terrain.mesh.faces, "cpu")
+    ray_heights = warp_utils.ray_cast(ray_starts, ray_directions, mesh)[:, 2]
+    on_mesh = torch.isfinite(ray_heights)
+
+    errors = (terrain.height_field_sampler("cpu", "mesh").sample(xy) - ray_heights)[on_mesh].abs()
+    # Only points exactly on a vertical wall may end up on the other side of it
+    assert (errors > 1e-4).sum() <= 2
+
+    # Without the vertical walls the cheaper triangle interpolation differs next to the steps
+    triangle_errors = (terrain.height_field_sampler("cpu", "triangle").sample(xy) - ray_heights)[on_mesh].abs()
+    assert (triangle_errors > 1e-4).float().mean() > 0.01
+
+
+def test_triangle_interpolation_matches_mesh_without_walls():
+    np.random.seed(0)
+    terrain = _terrain("smooth_slope")
+    xy = torch.rand(5000, 2, generator=torch.Generator().manual_seed(0)) * 12.0 - 2.0
+
+    mesh_heights = terrain.height_field_sampler("cpu", "mesh").sample(xy)
+    torch.testing.assert_close(terrain.height_field_sampler("cpu", "triangle").sample(xy), mesh_heights)
+    assert (terrain.height_field_sampler("cpu", "max").sample(xy) >= mesh_heights - 1e-6).all()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+
+from holosoma.convert_motions import ConvertMotionsConfig, convert_motions
+from holosoma.managers.command.terms.wbt import MotionLibrary, MotionLoader
+from holosoma.utils.motion_format import open_motion_file, read_motion_header
+
+MOTION_BODIES = ["pelvis", "torso", "left_foot", "right_foot", "head"]
+MOTION_JOINTS = ["j0", "j1", "j2", "j3"]
+ROBOT_BODIES = ["pelvis", "left_foot", "right_foot", "torso"]
+ROBOT_JOINTS = ["j3", "j0", "j2"]
+
+
+def _write_npz(path, num_frames: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    num_bodies, num_joints = len(MOTION_BODIES), len(MOTION_JOINTS)
+    np.savez_compressed(
+        path,
+        fps=np.array([30]),
+        body_names=np.array(MOTION_BODIES),
+        joint_names=np.array(MOTION_JOINTS),
+        joint_pos=rng.standard_normal((num_frames, 7 + num_joints)),
+        joint_vel=rng.standard_normal((num_frames, 6 + num_joints)),
+        body_pos_w=rng.standard_normal((num_frames, num_bodies, 3)),
+        body_quat_w=rng.standard_normal((num_frames, num_bodies, 4)),
+        body_lin_vel_w=rng.standard_normal((num_frames, num_bodies, 3)),
+        body_ang_vel_w=rng.standard_normal((num_frames, num_bodies, 3)),
+        object_pos_w=rng.standard_normal((num_frames, 3)),
+        object_quat_w=rng.standard_normal((num_frames, 4)),
+        object_lin_vel_w=rng.standard_normal((num_frames, 3)),
+    )
+
+
+@pytest.fixture
+def npz_dir(tmp_path):
+    directory = tmp_path / "clips"
+    directory.mkdir()
+    for i, num_frames in enumerate([12, 5, 9]):
+        _write_npz(directory / f"clip_{i}.npz", num_frames, seed=i)
+    return directory
+
+
+def test_converted_clips_match_npz_clips(npz_dir, tmp_path):
+    output = str(tmp_path / "dataset.hsmotion")
+    convert_motions(ConvertMotionsConfig(inputs=(str(npz_dir),), output=output))
+
+    header, _ = read_motion_header(output)
+    assert header.clip_names == ["clip_0", "clip_1", "clip_2"]
+    assert header.clip_starts == [0, 12, 17]
+    assert header.fps == 30.0
+    for clip_index in range(3):
+        expected = MotionLoader(str(npz_dir / f"clip_{clip_index}.npz"), ROBOT_BODIES, ROBOT_JOINTS)
+        clip = MotionLoader(output, ROBOT_BODIES, ROBOT_JOINTS, clip_index=clip_index)
+        assert clip.layout == expected.layout
+        assert clip.has_object
+        torch.testing.assert_close(clip.frames, expected.frames)
+
+
+def test_clips_in_stored_order_are_memory_mapped_without_copies(npz_dir, tmp_path):
+    output = str(tmp_path / "dataset.hsmotion")
+    header = convert_motions(ConvertMotionsConfig(inputs=(str(npz_dir),), output=output))
+    _, frames = open_motion_file(output)
+
+    clips = [MotionLoader(output, header.body_names, header.joint_names, clip_index=i) for i in range(3)]
+    motion = MotionLibrary(clips, header.clip_names)
+
+    assert motion.frames.data_ptr() == frames.data_ptr()
+    assert motion.clip_starts.tolist() == header.clip_starts
+    torch.testing.assert_close(motion.clip_frames(1), clips[1].frames)
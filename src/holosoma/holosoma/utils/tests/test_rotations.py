@@ -4,14 +4,20 @@ import torch
 from scipy.spatial.transform import Rotation
 
 from holosoma.utils.rotations import (
+    motion_to_robot_frame,
+    motion_to_robot_frame_jit,
     normalize_angle,
     quat_apply,
     quat_apply_yaw,
     quat_conjugate,
     quat_from_angle_axis,
+    quat_inverse,
     quat_mul,
     quat_rotate,
     quat_unit,
+    subtract_frame_transforms,
+    subtract_frame_transforms_broadcast,
+    subtract_frame_transforms_broadcast_jit,
     yaw_quat,
 )
 
@@ -171,3 +177,61 @@ def test_normalize_angle_range():
     normalized_cos = torch.cos(normalized)
     assert torch.allclose(original_sin, normalized_sin, atol=1e-6)
     assert torch.allclose(original_cos, normalized_cos, atol=1e-6)
+
+
+# ==============================================================================
+# Fused motion-relative transforms
+# ==============================================================================
+
+
+@pytest.fixture
+def frame_data():
+    num_envs, num_bodies = 32, 14
+    ref_quat, robot_ref_quat = Rotation.random(2 * num_envs, random_state=0).as_quat().reshape(2, num_envs, 4)
+    body_quat = Rotation.random(num_envs * num_bodies, random_state=1).as_quat().reshape(num_envs, num_bodies, 4)
+    generator = torch.Generator().manual_seed(0)
+    return {
+        "ref_pos_w": torch.randn(num_envs, 3, generator=generator),
+        "ref_quat_w": torch.tensor(ref_quat, dtype=torch.float32),
+        "robot_ref_pos_w": torch.randn(num_envs, 3, generator=generator),
+        "robot_ref_quat_w": torch.tensor(robot_ref_quat, dtype=torch.float32),
+        "body_pos_w": torch.randn(num_envs, num_bodies, 3, generator=generator),
+        "body_quat_w": torch.tensor(body_quat, dtype=torch.float32),
+    }
+
+
+@pytest.mark.parametrize("fn", [motion_to_robot_frame, motion_to_robot_frame_jit])
+def test_motion_to_robot_frame_matches_repeated_ops(frame_data, fn):
+    num_bodies = frame_data["body_pos_w"].shape[1]
+    repeat = {name: value[:, None].repeat(1, num_bodies, 1) for name, value in frame_data.items() if "ref" in name}
+
+    delta_quat = yaw_quat(
+        quat_mul(repeat["robot_ref_quat_w"], quat_inverse(repeat["ref_quat_w"], w_last=True), w_last=True),
+        w_last=True,
+    )
+    expected_quat = quat_mul(delta_quat, frame_data["body_quat_w"], w_last=True)
+    delta_pos_height = repeat["ref_pos_w"] - repeat["robot_ref_pos_w"]
+    delta_pos_height[..., :2] = 0.0
+    expected_pos = (
+        repeat["robot_ref_pos_w"]
+        + delta_pos_height
+        + quat_apply(delta_quat, frame_data["body_pos_w"] - repeat["ref_pos_w"], w_last=True)
+    )
+
+    body_pos, body_quat = fn(**frame_data)
+    assert torch.allclose(body_pos, expected_pos, atol=1e-5)
+    assert torch.allclose(body_quat, expected_quat, atol=1e-5)
+
+
+@pytest.mark.parametrize("fn", [subtract_frame_transforms_broadcast, subtract_frame_transforms_broadcast_jit])
+def test_subtract_frame_transforms_broadcast(frame_data, fn):
+    num_bodies = frame_data["body_pos_w"].shape[1]
+    t01, q01 = frame_data["robot_ref_pos_w"], frame_data["robot_ref_quat_w"]
+    t02, q02 = frame_data["body_pos_w"], frame_data["body_quat_w"]
+
+    expected_pos, expected_quat = subtract_frame_transforms(
+        t01[:, None].repeat(1, num_bodies, 1), q01[:, None].repeat(1, num_bodies, 1), t02, q02
+    )
+    pos, quat = fn(t01, q01, t02, q02)
+    assert torch.allclose(pos, expected_pos, atol=1e-5)
+    assert torch.allclose(quat, expected_quat, atol=1e-5)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import torch
+import trimesh
+
+from holosoma.utils import terrain_utils
+
+
+def _stairs_heightfield():
+    # Pyramid of 3 steps on a flat border, plus a rough patch that can't be merged
+    height_field_raw = np.zeros((30, 40), dtype=np.int16)
+    for step in range(3):
+        height_field_raw[5 + 3 * step : 25 - 3 * step, 5 + 3 * step : 35 - 3 * step] = 40 * (step + 1)
+    height_field_raw[26:29, 2:12] = np.random.default_rng(0).integers(-3, 3, (3, 10))
+    return height_field_raw
+
+
+def test_merge_flat_cells_covers_each_flat_cell_once():
+    height_field_raw = _stairs_heightfield()
+    flat, rect_rows, rect_cols = terrain_utils.merge_flat_heightfield_cells(height_field_raw)
+
+    coverage = np.zeros(flat.shape, dtype=int)
+    for (row0, row1), (col0, col1) in zip(rect_rows, rect_cols):
+        coverage[row0:row1, col0:col1] += 1
+        corners = height_field_raw[row0 : row1 + 1, col0 : col1 + 1]
+        assert (corners == corners[0, 0]).all()
+    np.testing.assert_array_equal(coverage, flat.astype(int))
+    # The border ring and the step rings merge into a handful of rectangles
+    assert len(rect_rows) < 40
+
+
+@pytest.mark.parametrize("slope_threshold", [None, 0.75])
+def test_merged_mesh_keeps_the_surface(slope_threshold):
+    height_field_raw = _stairs_heightfield()
+    args = (height_field_raw, 0.1, 0.005, slope_threshold)
+    vertices, triangles = terrain_utils.convert_heightfield_to_trimesh(*args)
+    merged_vertices, merged_triangles = terrain_utils.convert_heightfield_to_trimesh(*args, merge_flat_regions=True)
+
+    assert len(merged_triangles) < len(triangles) / 2
+    assert merged_triangles.max() == len(merged_vertices) - 1
+    mesh = trimesh.Trimesh(vertices, triangles, process=False)
+    merged_mesh = trimesh.Trimesh(merged_vertices, merged_triangles, process=False)
+    assert merged_mesh.area == pytest.approx(mesh.area)
+    # Same orientation, every merged face points up or is a vertical wall like the grid faces
+    assert (merged_mesh.face_normals[:, 2] > -1e-6).all()
+
+    warp_utils = pytest.importorskip("holosoma.utils.warp_utils")
+    xy = torch.rand(20000, 2, generator=torch.Generator().manual_seed(0)) * torch.tensor([2.9, 3.9])
+    ray_starts = torch.cat([xy, torch.full((len(xy), 1), 10.0)], dim=1)
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[:, 2] = -1.0
+    heights = [
+        warp_utils.ray_cast(ray_starts, ray_directions, warp_utils.convert_to_wp_mesh(v, t, "cpu"))[:, 2]
+        for v, t in ((vertices, triangles), (merged_vertices, merged_triangles))
+    ]
+    torch.testing.assert_close(heights[1], heights[0])
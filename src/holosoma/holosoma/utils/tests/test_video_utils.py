@@ -0,0 +1,78 @@
+import threading
+
+import cv2
+import numpy as np
+
+from holosoma.utils.video_utils import StreamingVideoWriter, create_video, tile_frames
+
+
+def _frames(num_frames, h=48, w=64):
+    return [np.full((h, w, 3), 4 * i, dtype=np.uint8) for i in range(num_frames)]
+
+
+def _frame_count(path):
+    capture = cv2.VideoCapture(str(path))
+    try:
+        return int(capture.get(cv2.CAP_PROP_FRAME_COUNT)), int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+    finally:
+        capture.release()
+
+
+def test_streaming_writer_encodes_all_frames(tmp_path):
+    writer = StreamingVideoWriter(tmp_path / "video.mp4", fps=30, output_format="mp4", queue_size=2)
+    for frame in _frames(40):
+        writer.write(frame)
+    path = writer.close()
+
+    assert path == tmp_path / "video.mp4"
+    assert writer.num_frames == 40
+    assert writer.num_dropped == 0
+    assert _frame_count(path) == (40, 64)
+
+
+def test_streaming_writer_drops_frames_when_queue_is_full(tmp_path, monkeypatch):
+    release = threading.Event()
+    encode = StreamingVideoWriter._encode
+
+    def slow_encode(self, frame):
+        release.wait()
+        encode(self, frame)
+
+    monkeypatch.setattr(StreamingVideoWriter, "_encode", slow_encode)
+    writer = StreamingVideoWriter(tmp_path / "video.mp4", fps=30, queue_size=2, drop_when_full=True)
+    for frame in _frames(10):
+        writer.write(frame)
+    # The encoder holds at most one frame and the queue two, the rest are dropped instead of buffered
+    assert writer.num_frames <= 3
+    assert writer.num_frames + writer.num_dropped == 10
+
+    release.set()
+    path = writer.close()
+    assert _frame_count(path)[0] == writer.num_frames
+
+
+def test_streaming_writer_without_frames_or_discarded(tmp_path):
+    writer = StreamingVideoWriter(tmp_path / "empty.mp4", fps=30)
+    assert writer.close() is None
+    assert not (tmp_path / "empty.mp4").exists()
+
+    writer = StreamingVideoWriter(tmp_path / "discarded.mp4", fps=30)
+    for frame in _frames(5):
+        writer.write(frame)
+    writer.discard()
+    assert not (tmp_path / "discarded.mp4").exists()
+
+
+def test_create_video(tmp_path):
+    path = create_video(iter(_frames(12)), fps=10, save_dir=tmp_path, wandb_logging=False, episode_id=3)
+    assert path.name.startswith("episode_3_")
+    assert _frame_count(path) == (12, 64)
+
+
+def test_tile_frames():
+    frames = [np.full((2, 3, 3), i + 1, dtype=np.uint8) for i in range(3)]
+    grid = tile_frames(frames)
+    assert grid.shape == (4, 6, 3)
+    assert grid[0, 0, 0] == 1 and grid[0, 3, 0] == 2 and grid[2, 0, 0] == 3
+    assert not grid[2:, 3:].any()  # empty cell is black
+    assert tile_frames(frames, columns=3).shape == (2, 9, 3)
@@ -1,8 +1,15 @@
+import contextlib
+import math
+import queue
+import shutil
 import subprocess
+import threading
 import time
 import uuid
+from pathlib import Path
 
 import cv2
+import numpy as np
 import wandb
 from loguru import logger
 
@@ -110,75 +117,136 @@ def format_command_labels(commands, env_id=0):
     return ", ".join(labels) if labels else "Commands: No data"
 
 
-def create_video(video_frames, fps, save_dir, output_format="mp4", wandb_logging=True, episode_id=None):
-    """Create video with configurable output format and destination.
+class StreamingVideoWriter:
+    """Encode RGB frames into a video file as they are written.
 
-    Handles both local saving and wandb upload based on configuration.
-    Respects output format preference and provides proper wandb validation.
+    Frames are handed to an encoder thread through a bounded queue, so at most ``queue_size`` frames are held in
+    memory regardless of the video length. When the queue is full, :meth:`write` blocks until the encoder catches up
+    or, with ``drop_when_full``, drops the frame. The frame size is taken from the first frame.
 
     Parameters
     ----------
-    video_frames : np.ndarray
-        Video frames array with shape (T, H, W, 3) and dtype uint8.
-    fps : int
+    path : Path
+        Output video file.
+    fps : float
         Frames per second for video playback.
-    save_dir : Path
-        Directory to save video files.
     output_format : str, default="mp4"
-        Output format: "mp4" (mp4v codec) or "h264" (H.264 codec).
-    wandb_logging : bool, default=True
-        Whether to upload to wandb (if available) or save locally.
-    episode_id : int | None, default=None
-        Episode ID for filename generation.
-
-    Returns
-    -------
-    Path | None
-        Path to the saved video file, or None if saving failed.
+        Output format: "mp4" (OpenCV mp4v codec) or "h264" (frames piped into an ffmpeg libx264 process). Falls back
+        to "mp4" if ffmpeg is not available.
+    queue_size : int, default=100
+        Maximum number of frames waiting to be encoded.
+    drop_when_full : bool, default=False
+        Whether to drop frames instead of blocking the caller when the queue is full.
     """
-    h, w = video_frames.shape[1:3]
-
-    # Ensure the directory exists
-    save_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate file names
-    timestamp = int(time.time())
-    episode_str = f"episode_{episode_id}_" if episode_id is not None else ""
 
-    if wandb_logging and _is_wandb_available():
-        # Wandb path: use temp files, upload, then cleanup
-        temp_id = str(uuid.uuid4())[:8]
-        temp_raw = save_dir / f"temp_raw_{timestamp}_{temp_id}.mp4"
-        final_video = save_dir / f"temp_{output_format}_{timestamp}_{temp_id}.mp4"
-        cleanup_files = True
-    else:
-        # Local path: create permanent files
-        final_video = save_dir / f"{episode_str}{timestamp}.mp4"
-        temp_raw = save_dir / f"{episode_str}temp_raw_{timestamp}.mp4"
-        cleanup_files = False
-
-    temp_files_to_cleanup = []
-
-    try:
-        # Step 1: Create intermediate video with OpenCV
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        out = cv2.VideoWriter(str(temp_raw), fourcc, fps, (w, h))
-        temp_files_to_cleanup.append(temp_raw)
-
-        for frame in video_frames:
+    def __init__(self, path, fps, output_format="mp4", queue_size=100, drop_when_full=False):
+        if output_format == "h264" and shutil.which("ffmpeg") is None:
+            logger.warning("[VIDEO] ffmpeg not found, using mp4v format (may have browser compatibility issues)")
+            output_format = "mp4"
+        self.path = Path(path)
+        self.fps = fps
+        self.output_format = output_format
+        self.num_frames = 0
+        self.num_dropped = 0
+        self._drop_when_full = drop_when_full
+        self._frame_shape = None
+        self._cv2_writer = None
+        self._ffmpeg = None
+        self._error = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._encode_worker, daemon=True, name="VideoEncoder")
+        self._thread.start()
+
+    def write(self, frame):
+        """Queue an RGB frame of shape (H, W, 3) for encoding. Frames written after :meth:`close` are dropped."""
+        with self._lock:
+            if self._closed:
+                self.num_dropped += 1
+                return
+            try:
+                self._queue.put(frame, block=not self._drop_when_full)
+            except queue.Full:
+                self.num_dropped += 1
+                return
+            self.num_frames += 1
+
+    def close(self):
+        """Encode the queued frames and finalize the file.
+
+        Returns
+        -------
+        Path | None
+            Path to the video file, or None if no frame was written.
+        """
+        with self._lock:
+            if self._closed:
+                return self.path if self._frame_shape is not None else None
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+        if self._cv2_writer is not None:
+            self._cv2_writer.release()
+        if self._ffmpeg is not None:
+            self._ffmpeg.stdin.close()
+            stderr = self._ffmpeg.stderr.read().decode(errors="replace")
+            if self._ffmpeg.wait() != 0 and self._error is None:
+                self._error = RuntimeError(f"FFmpeg encoding failed: {stderr}")
+        if self._error is not None:
+            raise RuntimeError(f"Video encoding failed for {self.path}") from self._error
+        if self.num_dropped:
+            logger.warning(f"[VIDEO] Dropped {self.num_dropped} frames, the encoder could not keep up")
+        return self.path if self._frame_shape is not None else None
+
+    def discard(self):
+        """Stop encoding and delete the video file."""
+        with contextlib.suppress(RuntimeError):
+            self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _encode_worker(self):
+        while (frame := self._queue.get()) is not None:
+            # After an error, keep draining the queue so that writers never block
+            if self._error is not None:
+                continue
+            try:
+                self._encode(frame)
+            except Exception as e:
+                self._error = e
+
+    def _encode(self, frame):
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if self._frame_shape is None:
+            self._open(*frame.shape[:2])
+        if frame.shape != self._frame_shape:
+            raise ValueError(f"Frame has shape {frame.shape}, expected {self._frame_shape}")
+        if self._ffmpeg is not None:
+            self._ffmpeg.stdin.write(frame.data)
+        else:
             # Convert RGB to BGR for OpenCV
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            out.write(frame_bgr)
-        out.release()
+            self._cv2_writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
 
-        # Step 2: Apply output format
-        if output_format == "h264":
-            # Convert to H.264 using ffmpeg
+    def _open(self, h, w):
+        self._frame_shape = (h, w, 3)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.output_format == "h264":
             ffmpeg_cmd = [
                 "ffmpeg",
                 "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb24",
+                "-s",
+                f"{w}x{h}",
+                "-r",
+                str(self.fps),
                 "-i",
-                str(temp_raw),
+                "-",
                 "-c:v",
                 "libx264",
                 "-pix_fmt",
@@ -189,38 +257,123 @@ def create_video(video_frames, fps, save_dir, output_format="mp4", wandb_logging
                 "300k",
                 "-preset",
                 "medium",
-                str(final_video),
+                str(self.path),
             ]
-
-            result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, check=True)
-            if result.returncode != 0:
-                logger.warning(f"[VIDEO] FFmpeg conversion failed: {result.stderr}")
-                logger.info("[VIDEO] Falling back to mp4v format (may have browser compatibility issues)")
-                # Fallback to original video
-                final_video = temp_raw
+            self._ffmpeg = subprocess.Popen(
+                ffmpeg_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
         else:
-            # Use mp4v format directly - rename and remove from cleanup list
-            temp_raw.rename(final_video)
-            temp_files_to_cleanup.remove(temp_raw)
+            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+            self._cv2_writer = cv2.VideoWriter(str(self.path), fourcc, self.fps, (w, h))
+
+
+def tile_frames(frames, columns=None):
+    """Tile equally sized (H, W, 3) frames into one grid frame, row-major, padding empty cells with black.
+
+    Parameters
+    ----------
+    frames : Sequence[np.ndarray]
+        Frames to tile.
+    columns : int | None, default=None
+        Number of grid columns. Defaults to ``ceil(sqrt(len(frames)))``.
+
+    Returns
+    -------
+    np.ndarray
+        Tiled frame of shape (rows * H, columns * W, 3).
+    """
+    if columns is None:
+        columns = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / columns)
+    h, w = frames[0].shape[:2]
+    grid = np.zeros((rows * h, columns * w, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        row, column = divmod(i, columns)
+        grid[row * h : (row + 1) * h, column * w : (column + 1) * w] = frame
+    return grid
+
+
+def open_video_writer(
+    save_dir,
+    fps,
+    output_format="mp4",
+    wandb_logging=True,
+    episode_id=None,
+    queue_size=100,
+    drop_when_full=False,
+    env_id=None,
+):
+    """Open a :class:`StreamingVideoWriter` for a new video in ``save_dir``.
+
+    Videos that will be uploaded to wandb are written to a temporary file, which :func:`finish_video` deletes
+    after the upload. ``env_id`` adds the recorded environment to the file name, see :class:`StreamingVideoWriter`
+    for the other parameters.
+    """
+    timestamp = int(time.time())
+    env_str = f"env_{env_id}_" if env_id is not None else ""
+    if wandb_logging and _is_wandb_available():
+        temp_id = str(uuid.uuid4())[:8]
+        path = save_dir / f"temp_{output_format}_{env_str}{timestamp}_{temp_id}.mp4"
+    else:
+        episode_str = f"episode_{episode_id}_" if episode_id is not None else ""
+        path = save_dir / f"{episode_str}{env_str}{timestamp}.mp4"
+    return StreamingVideoWriter(
+        path, fps, output_format=output_format, queue_size=queue_size, drop_when_full=drop_when_full
+    )
+
+
+def finish_video(writer, wandb_logging=True, wandb_key="Training rollout"):
+    """Finalize the video of ``writer`` and upload it to wandb under ``wandb_key`` if requested.
+
+    Returns
+    -------
+    Path | None
+        Path to the saved video file, or None if there were no frames or the video was uploaded to wandb.
+    """
+    final_video = writer.close()
+    if final_video is None:
+        return None
+    logger.info(f"Successfully saved video file: {final_video}")
+
+    if wandb_logging and _is_wandb_available():
+        wandb.log({wandb_key: wandb.Video(str(final_video), format="mp4")})
+        final_video.unlink()
+        return None
+    return final_video
 
-        # Log successful video file creation
-        logger.info(f"Successfully saved video file: {final_video}")
 
-        # Step 3: Handle wandb upload if requested
-        if wandb_logging and _is_wandb_available():
-            wandb.log({"Training rollout": wandb.Video(str(final_video), format="mp4")})
+def create_video(video_frames, fps, save_dir, output_format="mp4", wandb_logging=True, episode_id=None):
+    """Create video with configurable output format and destination.
 
-        # Step 4: Cleanup temp files if needed
-        if cleanup_files:
-            if final_video.exists():
-                final_video.unlink()
-            return None
-        return final_video
+    Handles both local saving and wandb upload based on configuration.
+    Respects output format preference and provides proper wandb validation.
+    To encode frames as they are produced, use :func:`open_video_writer` and :func:`finish_video` instead.
 
+    Parameters
+    ----------
+    video_frames : Iterable[np.ndarray]
+        Video frames with shape (H, W, 3) and dtype uint8.
+    fps : int
+        Frames per second for video playback.
+    save_dir : Path
+        Directory to save video files.
+    output_format : str, default="mp4"
+        Output format: "mp4" (mp4v codec) or "h264" (H.264 codec).
+    wandb_logging : bool, default=True
+        Whether to upload to wandb (if available) or save locally.
+    episode_id : int | None, default=None
+        Episode ID for filename generation.
+
+    Returns
+    -------
+    Path | None
+        Path to the saved video file, or None if saving failed.
+    """
+    writer = open_video_writer(save_dir, fps, output_format, wandb_logging, episode_id)
+    try:
+        for frame in video_frames:
+            writer.write(frame)
+        return finish_video(writer, wandb_logging)
     except Exception as e:
+        writer.discard()
         raise RuntimeError("Video creation failed") from e
-    finally:
-        # Always cleanup any remaining temp files
-        for temp_file in temp_files_to_cleanup:
-            if temp_file.exists():
-                temp_file.unlink()
@@ -0,0 +1 @@
+"""Tests for MuJoCo simulator implementation."""
@@ -0,0 +1,92 @@
+"""Unit tests for vectorized MuJoCo contact force extraction."""
+
+from __future__ import annotations
+
+import mujoco
+import numpy as np
+import pytest
+import torch
+
+from holosoma.simulator.mujoco.contact_forces import accumulate_body_forces, contact_forces, push_contact_history
+
+SCENE_XML = """
+<mujoco>
+  <option cone="{cone}"/>
+  <worldbody>
+    <geom name="floor" type="plane" size="5 5 0.1"/>
+    <body name="box1" pos="0 0 0.1">
+      <freejoint/>
+      <geom type="box" size="0.1 0.1 0.1" condim="1"/>
+    </body>
+    <body name="box3" pos="0.5 0 0.1">
+      <freejoint/>
+      <geom type="box" size="0.1 0.1 0.1" condim="3"/>
+    </body>
+    <body name="box4" pos="1.0 0 0.1">
+      <freejoint/>
+      <geom type="box" size="0.1 0.1 0.1" condim="4"/>
+    </body>
+    <body name="ball6" pos="1.5 0 0.1">
+      <freejoint/>
+      <geom type="sphere" size="0.1" condim="6"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+def _simulate(cone: str) -> tuple[mujoco.MjModel, mujoco.MjData]:
+    model = mujoco.MjModel.from_xml_string(SCENE_XML.format(cone=cone))
+    data = mujoco.MjData(model)
+    data.qvel[0::6] = 0.5  # slide the bodies so friction forces are non-zero
+    for _ in range(20):
+        mujoco.mj_step(model, data)
+    assert data.ncon > 0
+    return model, data
+
+
+def _reference_forces(model: mujoco.MjModel, data: mujoco.MjData) -> np.ndarray:
+    forcetorque = np.zeros(6)
+    forces = np.zeros((data.ncon, 3))
+    for i in range(data.ncon):
+        mujoco.mj_contactForce(model, data, i, forcetorque)
+        forces[i] = forcetorque[:3]
+    return forces
+
+
+@pytest.mark.parametrize("cone", ["pyramidal", "elliptic"])
+def test_contact_forces_match_mj_contact_force(cone):
+    model, data = _simulate(cone)
+    np.testing.assert_allclose(contact_forces(model, data), _reference_forces(model, data), rtol=0, atol=1e-12)
+
+
+def test_accumulate_body_forces_applies_lookup_and_third_law():
+    model, data = _simulate("pyramidal")
+    # Track every body except box3, in reverse order
+    body_lookup = np.arange(model.nbody)[::-1].copy()
+    box3 = model.body("box3").id
+    body_lookup[box3] = -1
+
+    expected = np.zeros((model.nbody, 3))
+    for force, (geom1, geom2) in zip(_reference_forces(model, data), data.contact.geom[: data.ncon]):
+        body1, body2 = body_lookup[model.geom_bodyid[geom1]], body_lookup[model.geom_bodyid[geom2]]
+        if body1 >= 0:
+            expected[body1] -= force
+        if body2 >= 0:
+            expected[body2] += force
+
+    forces = accumulate_body_forces(model, data, body_lookup, model.nbody)
+    np.testing.assert_allclose(forces, expected, rtol=0, atol=1e-12)
+    # The output slot box3 would have used receives nothing
+    assert not forces[model.nbody - 1 - box3].any()
+
+
+def test_push_contact_history_shifts_in_place():
+    history = torch.arange(2 * 3 * 4 * 3, dtype=torch.float).view(2, 3, 4, 3)
+    expected = torch.cat([torch.full((2, 1, 4, 3), -1.0), history[:, :-1]], dim=1)
+    data_ptr = history.data_ptr()
+
+    push_contact_history(history, torch.full((2, 4, 3), -1.0))
+
+    torch.testing.assert_close(history, expected)
+    assert history.data_ptr() == data_ptr
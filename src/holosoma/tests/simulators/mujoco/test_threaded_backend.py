@@ -0,0 +1,113 @@
+"""Unit tests for the threaded multi-environment MuJoCo backend."""
+
+from __future__ import annotations
+
+import copy
+from types import SimpleNamespace
+
+import mujoco
+import numpy as np
+import pytest
+import torch
+
+from holosoma.config_types.simulator import MujocoThreadedConfig
+from holosoma.simulator.mujoco.backends import ThreadedBackend
+from holosoma.simulator.mujoco.contact_forces import accumulate_body_forces
+
+NUM_ENVS = 4
+
+SCENE_XML = """
+<mujoco>
+  <worldbody>
+    <geom name="floor" type="plane" size="5 5 0.1"/>
+    <body name="base" pos="0 0 0.3">
+      <freejoint/>
+      <geom type="box" size="0.1 0.1 0.05"/>
+      <body name="leg" pos="0 0 -0.1">
+        <joint name="hinge" type="hinge" axis="0 1 0"/>
+        <geom type="capsule" fromto="0 0 0 0 0 -0.15" size="0.02"/>
+      </body>
+    </body>
+  </worldbody>
+  <actuator>
+    <motor joint="hinge"/>
+  </actuator>
+</mujoco>
+"""
+
+
+def _make_backend(num_threads: int) -> tuple[ThreadedBackend, mujoco.MjModel, mujoco.MjData]:
+    model = mujoco.MjModel.from_xml_string(SCENE_XML)
+    data = mujoco.MjData(model)
+    mujoco.mj_forward(model, data)
+    config = SimpleNamespace(
+        simulator=SimpleNamespace(mujoco_threaded=MujocoThreadedConfig(num_threads=num_threads)),
+        training=SimpleNamespace(num_envs=NUM_ENVS),
+    )
+    return ThreadedBackend(model, data, config, "cpu"), model, data  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_matches_independent_mjdata(num_threads):
+    backend, model, data = _make_backend(num_threads)
+    references = [copy.copy(data) for _ in range(NUM_ENVS)]
+    ctrl = torch.linspace(-1.0, 1.0, NUM_ENVS).unsqueeze(1)
+
+    for _ in range(50):
+        backend.get_ctrl_tensor()[:] = ctrl
+        backend.step()
+        for env_id, reference in enumerate(references):
+            reference.ctrl[:] = ctrl[env_id].numpy()
+            mujoco.mj_step(model, reference)
+
+    for env_id, reference in enumerate(references):
+        # Backend state is untouched by the float32 mirrors
+        np.testing.assert_array_equal(backend.datas[env_id].qpos, reference.qpos)
+        np.testing.assert_array_equal(backend.qpos_t[env_id].numpy(), reference.qpos.astype(np.float32))
+        forces = accumulate_body_forces(model, reference, np.arange(model.nbody), model.nbody)
+        np.testing.assert_array_equal(backend.force_t[env_id].numpy(), forces.astype(np.float32))
+    assert not torch.equal(backend.qpos_t[0], backend.qpos_t[-1])
+
+
+def test_writes_reach_only_the_written_environments():
+    backend, model, data = _make_backend(num_threads=2)
+    reference = copy.copy(data)
+    for _ in range(5):
+        backend.step()
+        mujoco.mj_step(model, reference)
+
+    root_states = torch.zeros(1, 13)
+    root_states[0, :3] = torch.tensor([1.0, 2.0, 0.5])
+    root_states[0, 6] = 1.0  # identity quaternion [x, y, z, w]
+    backend.set_root_state(torch.tensor([2]), root_states, {"robot_qpos_addr": 0, "robot_qvel_addr": 0})
+    backend.create_dof_pos_view(slice(7, 8), 1)[1] = 0.25
+
+    backend.step()
+    mujoco.mj_step(model, reference)
+
+    # Written elements were applied before stepping
+    assert backend.qpos_t[2, 0].item() == pytest.approx(1.0, abs=1e-3)
+    assert backend.qpos_t[2, 1].item() == pytest.approx(2.0, abs=1e-3)
+    assert backend.datas[1].qpos[7] == pytest.approx(0.25, abs=1e-2)
+    # Unwritten environments keep their full float64 state
+    for env_id in (0, 3):
+        np.testing.assert_array_equal(backend.datas[env_id].qpos, reference.qpos)
+        np.testing.assert_array_equal(backend.datas[env_id].qvel, reference.qvel)
+
+
+def test_render_data_batch_copies_requested_environments():
+    backend, model, _ = _make_backend(num_threads=2)
+    backend.get_ctrl_tensor()[:] = torch.linspace(-1.0, 1.0, NUM_ENVS).unsqueeze(1)
+    for _ in range(20):
+        backend.step()
+
+    world_ids = [3, 1]
+    render_datas = backend.get_render_data_batch(world_ids)
+    assert len(render_datas) == 2
+    for render_data, world_id in zip(render_datas, world_ids):
+        assert render_data is not backend.datas[world_id]
+        assert render_data is not backend.render_data
+        np.testing.assert_array_equal(render_data.qpos, backend.datas[world_id].qpos)
+        np.testing.assert_array_equal(render_data.geom_xpos, backend.datas[world_id].geom_xpos)
+    # The pool is reused across calls
+    assert backend.get_render_data_batch([0])[0] is render_datas[0]
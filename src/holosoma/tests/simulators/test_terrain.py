@@ -0,0 +1,121 @@
+"""Tests for seeded terrain generation and the on-disk terrain cache."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from holosoma.config_types.terrain import TerrainTermCfg
+from holosoma.simulator.shared.terrain import Terrain
+
+
+def _cfg(**kwargs) -> TerrainTermCfg:
+    defaults = {
+        "func": "holosoma.managers.terrain.terms.locomotion:TerrainLocomotion",
+        "static_friction": 1.0,
+        "dynamic_friction": 1.0,
+        "restitution": 0.0,
+        "mesh_type": "trimesh",
+        "num_rows": 3,
+        "num_cols": 3,
+        "terrain_length": 4.0,
+        "terrain_width": 4.0,
+        "border_size": 1,
+        "terrain_config": {"smooth_stairs": 0.4, "rough_slope": 0.3, "stepping_stone": 0.3},
+        "cache_dir": None,
+    }
+    return TerrainTermCfg(**{**defaults, **kwargs})
+
+
+def _assert_same_terrain(a: Terrain, b: Terrain) -> None:
+    np.testing.assert_array_equal(a._height_field_raw, b._height_field_raw)
+    np.testing.assert_array_equal(a._env_origins, b._env_origins)
+    np.testing.assert_array_equal(a.mesh.vertices, b.mesh.vertices)
+    np.testing.assert_array_equal(a.mesh.faces, b.mesh.faces)
+
+
+def test_seeded_terrain_is_deterministic():
+    np.random.seed(0)
+    terrain = Terrain(_cfg(seed=7), num_robots=4)
+    rng_state = np.random.get_state()
+    np.random.seed(1)
+    _assert_same_terrain(terrain, Terrain(_cfg(seed=7), num_robots=4))
+    assert not np.array_equal(terrain._height_field_raw, Terrain(_cfg(seed=8), num_robots=4)._height_field_raw)
+
+    # A configured seed leaves the global RNG untouched, without one the terrain follows it
+    np.random.seed(0)
+    Terrain(_cfg(seed=7), num_robots=4)
+    assert np.array_equal(np.random.get_state()[1], rng_state[1])
+    np.random.seed(0)
+    unseeded = Terrain(_cfg(), num_robots=4)
+    np.random.seed(0)
+    _assert_same_terrain(unseeded, Terrain(_cfg(), num_robots=4))
+
+
+def test_terrain_cache_round_trip(tmp_path):
+    cfg = _cfg(seed=3, cache_dir=str(tmp_path))
+    generated = Terrain(cfg, num_robots=4)
+    (cache_file,) = tmp_path.iterdir()
+
+    loaded = Terrain(cfg, num_robots=4)
+    _assert_same_terrain(generated, loaded)
+    # Settings that don't change the geometry share the cache entry, the seed does not
+    Terrain(_cfg(seed=3, cache_dir=str(tmp_path), static_friction=0.5), num_robots=4)
+    assert list(tmp_path.iterdir()) == [cache_file]
+    Terrain(_cfg(seed=4, cache_dir=str(tmp_path)), num_robots=4)
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # Corrupt cache files are regenerated
+    cache_file.write_bytes(b"not a terrain")
+    _assert_same_terrain(generated, Terrain(cfg, num_robots=4))
+
+    # Unseeded terrains are never cached
+    Terrain(_cfg(cache_dir=str(tmp_path)), num_robots=4)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+class RaisedSteppingStoneTerrain(Terrain):
+    """Terrain whose stepping stones are all raised by a fixed height."""
+
+    def _stepping_stone_terrain_func(self, terrain, difficulty):
+        super()._stepping_stone_terrain_func(terrain, difficulty)
+        terrain.height_field_raw += 10
+
+
+def test_terrain_cache_keys_terrain_functions(tmp_path):
+    cfg = _cfg(seed=3, cache_dir=str(tmp_path))
+    Terrain(cfg, num_robots=4)
+    custom = RaisedSteppingStoneTerrain(cfg, num_robots=4)
+    assert len(list(tmp_path.iterdir())) == 2
+    # Loaded from its own cache entry, not the one of the base terrain
+    _assert_same_terrain(custom, RaisedSteppingStoneTerrain(cfg, num_robots=4))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_terrain_cache_eviction(tmp_path):
+    Terrain(_cfg(seed=1, cache_dir=str(tmp_path)), num_robots=4)
+    (first,) = tmp_path.iterdir()
+    size_mb = first.stat().st_size / 2**20
+    Terrain(_cfg(seed=2, cache_dir=str(tmp_path)), num_robots=4)
+    (second,) = set(tmp_path.iterdir()) - {first}
+    os.utime(first, (0, 0))
+    os.utime(second, (1, 1))
+
+    # Loading marks a terrain as recently used, the least recently used one is evicted beyond the limit
+    Terrain(_cfg(seed=1, cache_dir=str(tmp_path)), num_robots=4)
+    Terrain(_cfg(seed=3, cache_dir=str(tmp_path), cache_max_size_mb=2.5 * size_mb), num_robots=4)
+    assert first.exists()
+    assert not second.exists()
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # The new terrain is kept even if it exceeds the limit alone
+    Terrain(_cfg(seed=4, cache_dir=str(tmp_path), cache_max_size_mb=0.0), num_robots=4)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_worker_processes_generate_the_same_terrain():
+    _assert_same_terrain(
+        Terrain(_cfg(seed=5), num_robots=4),
+        Terrain(_cfg(seed=5, generation_workers=2), num_robots=4),
+    )
@@ -0,0 +1,79 @@
+"""Tests for the shared video recording logic with several recorded environments."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+import torch
+
+from holosoma.config_types.video import FixedCameraConfig, VideoConfig
+from holosoma.simulator.shared.video_recorder import VideoRecorderInterface
+
+HEIGHT, WIDTH = 36, 64
+
+
+class _BatchedRecorder(VideoRecorderInterface):
+    supports_batched_capture = True
+
+    def _capture_frame_impl(self) -> None:
+        self._add_frames([np.full((HEIGHT, WIDTH, 3), 50 * env_id, dtype=np.uint8) for env_id in self.recorded_env_ids])
+
+
+class _SingleRecorder(_BatchedRecorder):
+    supports_batched_capture = False
+
+
+def _record_episode(recorder_cls, tmp_path, **config_kwargs):
+    simulator = SimpleNamespace(
+        num_envs=4,
+        simulator_config=SimpleNamespace(sim=SimpleNamespace(fps=200, control_decimation=4)),
+        robot_root_states=torch.zeros(4, 13),
+    )
+    config = VideoConfig(
+        save_dir=str(tmp_path),
+        upload_to_wandb=False,
+        camera=FixedCameraConfig(),
+        show_command_overlay=False,
+        output_format="mp4",
+        interval=1,
+        **config_kwargs,
+    )
+    recorder = recorder_cls(config, simulator)
+    recorder.on_episode_start(config.record_env_id)
+    for _ in range(5 * simulator.simulator_config.sim.control_decimation):
+        recorder.capture_frame(config.record_env_id)
+    recorder.on_episode_end(config.record_env_id)
+    return recorder
+
+
+def _videos(tmp_path):
+    videos = {}
+    for path in sorted(tmp_path.glob("*.mp4")):
+        capture = cv2.VideoCapture(str(path))
+        videos[path.name] = (
+            int(capture.get(cv2.CAP_PROP_FRAME_COUNT)),
+            int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        )
+        capture.release()
+    return videos
+
+
+def test_one_video_per_recorded_env(tmp_path):
+    recorder = _record_episode(_BatchedRecorder, tmp_path, record_env_id=1, record_env_ids=[0, 1, 3])
+    assert recorder.recorded_env_ids == [1, 0, 3]
+
+    videos = _videos(tmp_path)
+    assert sorted(name.split("_")[3] for name in videos) == ["0", "1", "3"]
+    assert set(videos.values()) == {(5, HEIGHT, WIDTH)}
+
+
+@pytest.mark.parametrize(
+    ("recorder_cls", "shape"), [(_BatchedRecorder, (2 * HEIGHT, 2 * WIDTH)), (_SingleRecorder, (HEIGHT, WIDTH))]
+)
+def test_tiled_video(tmp_path, recorder_cls, shape):
+    _record_episode(recorder_cls, tmp_path, record_env_ids=[1, 2], tile_recorded_envs=True)
+    assert list(_videos(tmp_path).values()) == [(5, *shape)]
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Offline ONNX Policy Inference Benchmark
+
+Times policy inference on random inputs and reports p50/p99/max latency per model, for a default
+onnxruntime session fed with a fresh dict per call (the previous deployment path) and for the configured
+OnnxInferenceEngine.
+
+Usage:
+    python -m holosoma_inference.benchmark_inference --model-paths policy.onnx
+    python -m holosoma_inference.benchmark_inference --model-paths a.onnx b.onnx \\
+        --onnx-runtime.intra-op-num-threads 1 --onnx-runtime.allow-spinning False
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from pathlib import Path
+
+import numpy as np
+import onnxruntime
+import tyro
+
+from holosoma_inference.config.config_types.onnx_runtime import OnnxRuntimeConfig
+from holosoma_inference.utils.onnx_engine import OnnxInferenceEngine, pin_process_to_cpus
+
+
+@dataclasses.dataclass
+class BenchmarkConfig:
+    """Inference benchmark configuration."""
+
+    model_paths: list[str]
+    """ONNX models to benchmark."""
+
+    onnx_runtime: OnnxRuntimeConfig = dataclasses.field(default_factory=OnnxRuntimeConfig)
+    """Engine settings, the same as --task.onnx-runtime of run_policy.py."""
+
+    iters: int = 5000
+    """Timed inferences per model and path."""
+
+    rate: float = 0.0
+    """Call rate in Hz to mimic the control loop (e.g. 50), 0 runs back to back."""
+
+    seed: int = 0
+    """Seed of the random inputs."""
+
+
+def _percentiles(latencies_ms: np.ndarray) -> str:
+    p50, p99 = np.percentile(latencies_ms, [50, 99])
+    return f"{p50:>9.4f} {p99:>9.4f} {latencies_ms.max():>9.4f}"
+
+
+def _time_calls(fn, iters: int, rate: float) -> np.ndarray:
+    """Latency of ``iters`` calls of ``fn`` in milliseconds, sleeping between calls at ``rate`` Hz."""
+    latencies = np.empty(iters)
+    period = 1.0 / rate if rate > 0 else 0.0
+    for i in range(iters):
+        start = time.perf_counter()
+        fn()
+        latencies[i] = time.perf_counter() - start
+        if period:
+            time.sleep(max(0.0, period - latencies[i]))
+    return latencies * 1000.0
+
+
+def benchmark(config: BenchmarkConfig) -> None:
+    """Benchmark every model of ``config`` and print one latency row per inference path."""
+    if config.onnx_runtime.cpu_affinity:
+        pin_process_to_cpus(config.onnx_runtime.cpu_affinity)
+    rng = np.random.default_rng(config.seed)
+
+    print(f"{'model':>24} {'path':>12} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for model_path in config.model_paths:
+        engine = OnnxInferenceEngine(model_path, config.onnx_runtime)
+        feed = {
+            name: rng.normal(size=buffer.shape).astype(buffer.dtype, copy=False)
+            for name, buffer in engine.inputs.items()
+        }
+        # Fresh session without tuning or warm-up, fed with a new dict and freshly allocated outputs per call
+        session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+
+        def session_run(session: onnxruntime.InferenceSession = session, feed: dict = feed) -> None:
+            session.run(None, {name: value.copy() for name, value in feed.items()})
+
+        def engine_run(engine: OnnxInferenceEngine = engine, feed: dict = feed) -> None:
+            engine.run(feed)
+
+        name = Path(model_path).name
+        print(f"{name:>24} {'session.run':>12} {_percentiles(_time_calls(session_run, config.iters, config.rate))}")
+        print(f"{name:>24} {'engine':>12} {_percentiles(_time_calls(engine_run, config.iters, config.rate))}")
+
+
+def main():
+    benchmark(tyro.cli(BenchmarkConfig, config=(tyro.conf.FlagConversionOff,)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,17 @@
 """Type definitions for holosoma_inference configuration system."""
 
+from .control_loop import ControlLoopConfig
 from .inference import InferenceConfig
 from .observation import ObservationConfig
+from .onnx_runtime import OnnxRuntimeConfig
 from .robot import RobotConfig
 from .task import TaskConfig
 
 __all__ = [
+    "ControlLoopConfig",
     "InferenceConfig",
     "ObservationConfig",
+    "OnnxRuntimeConfig",
     "RobotConfig",
     "TaskConfig",
 ]
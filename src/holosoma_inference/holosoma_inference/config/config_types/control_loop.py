@@ -0,0 +1,42 @@
+"""Control loop configuration types for holosoma_inference."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic.dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ControlLoopConfig:
+    """Scheduling of state reads, inference and command publishing."""
+
+    pipelined: bool = False
+    """Publish commands at the fixed rate from the control thread while inference runs on a worker thread.
+
+    When False, state read, inference and publish run serially and an inference spike delays the command."""
+
+    inference_deadline: float = 0.5
+    """Fraction of the control period the publisher waits for the action of the current tick before applying
+    the deadline policy."""
+
+    deadline_policy: Literal["hold", "decay", "extrapolate"] = "hold"
+    """Action published when inference misses its deadline: hold the last action, decay it towards the default
+    pose, or extrapolate it linearly from the last two actions."""
+
+    decay_factor: float = 0.9
+    """Per missed tick factor on the last action offset from the default pose, for the ``decay`` policy."""
+
+    max_extrapolation_steps: int = 2
+    """Missed ticks the ``extrapolate`` policy extrapolates over before holding the extrapolated action."""
+
+    wait_for_fresh_state: bool = False
+    """Start each control tick on the arrival of a new robot state instead of free-running, so the state is as
+    fresh as possible when inference starts."""
+
+    fresh_state_timeout: float = 0.01
+    """Seconds to wait for a new robot state before running on the last one, counted as ``stale_state``."""
+
+    publisher_priority: int | None = None
+    """SCHED_FIFO priority (1-99) of the publishing thread (Linux, needs CAP_SYS_NICE). None keeps the default
+    scheduling."""
@@ -0,0 +1,36 @@
+"""ONNX Runtime configuration types for holosoma_inference."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic.dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class OnnxRuntimeConfig:
+    """ONNX Runtime session and execution settings for policy inference."""
+
+    intra_op_num_threads: int = 0
+    """Threads used to parallelize a single operator. 0 lets ONNX Runtime choose (one per physical core).
+
+    Small policy MLPs usually have the lowest and steadiest latency with 1 thread."""
+
+    inter_op_num_threads: int = 0
+    """Threads used to run independent operators in parallel. 0 lets ONNX Runtime choose."""
+
+    graph_optimization_level: Literal["disable", "basic", "extended", "all"] = "all"
+    """Graph optimizations applied when the session is created."""
+
+    allow_spinning: bool = True
+    """Let idle intra-op threads busy-wait for work. Disable to free the cores between control ticks."""
+
+    cpu_affinity: list[int] | None = None
+    """CPU cores the policy process is pinned to (Linux only), e.g. [2, 3] for isolated cores. None keeps
+    the default affinity."""
+
+    use_io_binding: bool = True
+    """Run through an IOBinding on preallocated input and output buffers instead of a feed dict per tick."""
+
+    warmup_iters: int = 10
+    """Inference runs on zero inputs after loading a model, so the first control cycles don't spike."""
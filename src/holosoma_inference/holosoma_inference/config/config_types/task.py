@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import field
+
 from pydantic.dataclasses import dataclass
 
+from .control_loop import ControlLoopConfig
+from .onnx_runtime import OnnxRuntimeConfig
+
 
 @dataclass(frozen=True)
 class TaskConfig:
@@ -45,6 +50,12 @@ class TaskConfig:
     wandb_download_dir: str = "/tmp"
     """Directory for downloading W&B checkpoints."""
 
+    onnx_runtime: OnnxRuntimeConfig = field(default_factory=OnnxRuntimeConfig)
+    """ONNX Runtime session tuning, IO binding and warm-up."""
+
+    control_loop: ControlLoopConfig = field(default_factory=ControlLoopConfig)
+    """Control loop scheduling: pipelining, inference deadline policy and sync to state arrival."""
+
     # Deprecation candidates:
     desired_base_height: float = 0.75
     """Target base height in meters."""
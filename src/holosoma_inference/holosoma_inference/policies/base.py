@@ -5,14 +5,12 @@ import json
 import sys
 import threading
 import time
-from collections import deque
 from dataclasses import replace
 from pathlib import Path
 
 import netifaces as ni
 import numpy as np
 import onnx
-import onnxruntime
 from loguru import logger
 from sshkeyboard import listen_keyboard
 from termcolor import colored
@@ -20,8 +18,11 @@ from termcolor import colored
 from holosoma_inference.config.config_types.inference import InferenceConfig
 from holosoma_inference.config.config_types.robot import RobotConfig
 from holosoma_inference.sdk.interface_wrapper import InterfaceWrapper
+from holosoma_inference.utils.control_loop import DeadlineFallback, DoubleBuffer, set_thread_realtime_priority
 from holosoma_inference.utils.latency import LatencyTracker
 from holosoma_inference.utils.math.quat import quat_rotate_inverse
+from holosoma_inference.utils.observation import ObservationAssembler
+from holosoma_inference.utils.onnx_engine import OnnxInferenceEngine, pin_process_to_cpus
 from holosoma_inference.utils.rate import RateLimiter
 from holosoma_inference.utils.wandb import load_checkpoint
 
@@ -56,6 +57,8 @@ class BasePolicy:
         self._init_phase_components()
         # Initialize latency tracking
         self._init_latency_tracking()
+        # Initialize pipelined control loop components
+        self._init_control_loop()
 
     # ============================================================================
     # Initialization Methods
@@ -113,27 +116,17 @@ class BasePolicy:
         self.obs_dim_dict = self._calculate_obs_dim_dict()
         self.history_length_dict = self.obs_config.history_length_dict
 
-        # Initialize per-term history buffers using deques
+        # Initialize the preallocated per-group observation buffers
         self._initialize_history_state()
 
     def _initialize_history_state(self):
-        """Create per-term history deques and zero-initialized flattened buffers."""
-        self.obs_history_buffers: dict[str, dict[str, deque[np.ndarray]]] = {}
-        self.obs_terms_sorted: dict[str, list[str]] = {}
-        self.obs_buf_dict: dict[str, np.ndarray] = {}
-
-        for group, term_names in self.obs_dict.items():
-            self.obs_terms_sorted[group] = sorted(term_names)
-            history_len = self.history_length_dict.get(group, 1)
-            self.obs_history_buffers[group] = {}
-            flattened_terms: list[np.ndarray] = []
-
-            for term in self.obs_terms_sorted[group]:
-                term_dim = self.obs_dims[term]
-                self.obs_history_buffers[group][term] = deque(maxlen=history_len)
-                flattened_terms.append(np.zeros((1, term_dim * history_len), dtype=np.float32))
-
-            self.obs_buf_dict[group] = np.concatenate(flattened_terms, axis=1) if flattened_terms else np.zeros((1, 0))
+        """Create the observation assembler and its zero-initialized flattened buffers."""
+        self.obs_assembler = ObservationAssembler(
+            self.obs_dict, self.obs_dims, self.obs_scales, self.history_length_dict
+        )
+        self.obs_terms_sorted: dict[str, list[str]] = self.obs_assembler.terms
+        # Persistent (1, group_dim) float32 arrays, overwritten in place every control tick
+        self.obs_buf_dict: dict[str, np.ndarray] = self.obs_assembler.buffers
 
     def _init_communication_components(self):
         """Initialize state processor and command sender using the wrapper."""
@@ -148,6 +141,8 @@ class BasePolicy:
         """Initialize policy-related components."""
         self.policy_action_scale = policy_action_scale
         self.rl_rate = rl_rate
+        if self.config.task.onnx_runtime.cpu_affinity:
+            pin_process_to_cpus(self.config.task.onnx_runtime.cpu_affinity)
         self.model_paths = self._collect_model_paths(model_path)
         self._policy_states: list[dict] = []
         self.last_policy_action = np.zeros((1, self.num_dofs))
@@ -292,6 +287,37 @@ class BasePolicy:
         """Initialize latency tracking components."""
         self.latency_tracker = LatencyTracker(window_size=int(self.rl_rate))
 
+    def _init_control_loop(self):
+        """Initialize the buffers and events of the pipelined control loop."""
+        loop_config = self.config.task.control_loop
+        # Robot state read by the control loop, other threads read their own copies
+        self._low_state = np.zeros(self.interface.state_shape)
+        # Robot state handed from the publisher to the inference worker, allocated on the first state read
+        self._state_buffer: DoubleBuffer | None = None
+        # Policy actions (offsets from the default pose), stamped with the receive time of their input state
+        self._action_buffer = DoubleBuffer((1, self.num_dofs))
+        self._latest_action = np.zeros((1, self.num_dofs))
+        self._consumed_action_seq = 0
+        # Sequence numbers of the last state handed to the worker and of the last state it finished inference on
+        self._requested_state_seq = 0
+        self._completed_state_seq = 0
+        self._action_stamp = 0.0
+        self._policy_active_since: float | None = None
+        # Serializes inference with the input handlers changing policy state. States received before the last policy
+        # mode change (start, stop, init, switch) are not run through the policy.
+        self._policy_lock = threading.RLock()
+        self._mode_changed_at = 0.0
+        self._action_fallback = DeadlineFallback(
+            loop_config.deadline_policy,
+            (1, self.num_dofs),
+            decay_factor=loop_config.decay_factor,
+            max_extrapolation_steps=loop_config.max_extrapolation_steps,
+        )
+        self._inference_request = threading.Event()
+        self._action_ready = threading.Event()
+        self._stop_inference = threading.Event()
+        self._inference_error: BaseException | None = None
+
     def _init_input_handlers(self):
         """Initialize input handlers (ROS, joystick, keyboard)."""
         self._init_rate_handler()
@@ -352,12 +378,10 @@ class BasePolicy:
 
     def setup_policy(self, model_path):
         """Setup ONNX policy model and extract metadata."""
-        self.onnx_policy_session = onnxruntime.InferenceSession(model_path)
-        input_names = [inp.name for inp in self.onnx_policy_session.get_inputs()]
-        output_names = [out.name for out in self.onnx_policy_session.get_outputs()]
-
-        self.onnx_input_names = input_names
-        self.onnx_output_names = output_names
+        engine = OnnxInferenceEngine(model_path, self.config.task.onnx_runtime)
+        self.onnx_policy_session = engine.session
+        self.onnx_input_names = engine.input_names
+        self.onnx_output_names = engine.output_names
 
         # Extract metadata from ONNX model (hard fault if fails)
         onnx_model = onnx.load(model_path)
@@ -379,8 +403,7 @@ class BasePolicy:
             #     'actor_obs_upper_body': np.array([...]),
             #     'estimator_obs': np.array([...])
             # }
-            input_feed = {name: obs_dict[name] for name in self.onnx_input_names}
-            outputs = self.onnx_policy_session.run(self.onnx_output_names, input_feed)
+            outputs = engine.run(obs_dict)
             return outputs[0]  # just return outputs[0] as only "action" is needed
 
         self.policy = policy_act
@@ -473,68 +496,17 @@ class BasePolicy:
 
         return current_obs_buffer_dict
 
-    def parse_current_obs_dict(self, current_obs_buffer_dict):
-        """Parse observation buffer into observation dictionary with per-term scaling."""
-        current_obs_dict: dict[str, dict[str, np.ndarray]] = {}
-        for group, term_names in self.obs_terms_sorted.items():
-            grouped_terms: dict[str, np.ndarray] = {}
-            for term in term_names:
-                if term not in current_obs_buffer_dict:
-                    raise KeyError(f"Observation term '{term}' missing from current observation buffer.")
-                term_obs = current_obs_buffer_dict[term]
-                if term_obs.ndim == 1:
-                    term_obs = term_obs.reshape(1, -1)
-                scale = self.obs_scales[term]
-                grouped_terms[term] = (term_obs * scale).astype(np.float32, copy=False)
-            current_obs_dict[group] = grouped_terms
-        return current_obs_dict
-
     def _prepare_group_observations(self, robot_state_data):
         """Return flattened observations per group with history applied per term."""
         current_obs_buffer_dict = self.get_current_obs_buffer_dict(robot_state_data)
-        current_obs_dict = self.parse_current_obs_dict(current_obs_buffer_dict)
-        return self._update_obs_history(current_obs_dict)
-
-    def _update_obs_history(self, current_obs_dict: dict[str, dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
-        """Update observation history buffers and return flattened observations per group."""
-        group_outputs: dict[str, np.ndarray] = {}
-
-        for group, term_dict in current_obs_dict.items():
-            history_len = self.history_length_dict.get(group, 1)
-            flattened_terms: list[np.ndarray] = []
-
-            for term in self.obs_terms_sorted[group]:
-                obs = np.asarray(term_dict[term], dtype=np.float32, order="C")
-                if obs.ndim == 1:
-                    obs = obs.reshape(1, -1)
-
-                buffer = self.obs_history_buffers[group][term]
-                buffer.append(obs.copy())
-
-                history = list(buffer)
-                if len(history) < history_len:
-                    missing = history_len - len(history)
-                    history = [np.zeros_like(obs)] * missing + history
-
-                # Match training order: time dimension first, then flatten into [history_len * term_dim].
-                stacked = np.stack(history[-history_len:], axis=1)
-                flattened_terms.append(stacked.reshape(obs.shape[0], -1))
-
-            group_outputs[group] = (
-                np.concatenate(flattened_terms, axis=1).astype(np.float32, copy=False)
-                if flattened_terms
-                else np.zeros((1, 0), dtype=np.float32)
-            )
-
-        self.obs_buf_dict = {group: value.copy() for group, value in group_outputs.items()}
-        return group_outputs
+        return self.obs_assembler.update(current_obs_buffer_dict)
 
     def prepare_obs_for_rl(self, robot_state_data):
         """Prepare observations for RL inference."""
         group_outputs = self._prepare_group_observations(robot_state_data)
         if "actor_obs" not in group_outputs:
             raise KeyError("Observation group 'actor_obs' is not configured for this policy.")
-        return {"actor_obs": group_outputs["actor_obs"].astype(np.float32, copy=False)}
+        return {"actor_obs": group_outputs["actor_obs"]}
 
     # ============================================================================
     # Control/Command Methods
@@ -558,7 +530,7 @@ class BasePolicy:
 
         # Stage 1: Read State
         with self.latency_tracker.measure("read_state"):
-            robot_state_data = self.interface.get_low_state()
+            robot_state_data = self._read_low_state()
 
         # Stage 2: Pre-processing
         with self.latency_tracker.measure("preprocessing"):
@@ -586,14 +558,7 @@ class BasePolicy:
         # Stage 4: Post-processing
         with self.latency_tracker.measure("postprocessing"):
             if self.use_policy_action and not self.get_ready_state:
-                if scaled_policy_action.shape[1] != self.num_dofs:
-                    if not self.upper_body_controller:
-                        scaled_policy_action = np.concatenate(
-                            [np.zeros((1, self.num_dofs - scaled_policy_action.shape[1])), scaled_policy_action], axis=1
-                        )
-                    else:
-                        raise NotImplementedError("Upper body controller not implemented")
-                q_target = scaled_policy_action + self.default_dof_angles
+                q_target = self._pad_policy_action(scaled_policy_action) + self.default_dof_angles
 
             # Prepare command (reuse pre-allocated arrays)
             self.cmd_q[:] = q_target[0]
@@ -608,6 +573,175 @@ class BasePolicy:
                 kp_override=kp_override,
                 kd_override=kd_override,
             )
+        self.latency_tracker.record("sensor_to_action", (time.perf_counter() - self._state_stamp) * 1000)
+
+    def _read_low_state(self):
+        """Read the latest robot state and record its age.
+
+        With ``control_loop.wait_for_fresh_state`` first wait for a state newer than the previous tick's, so the
+        tick starts on sensor arrival.
+        """
+        loop_config = self.config.task.control_loop
+        if loop_config.wait_for_fresh_state and not self.interface.wait_for_fresh_state(
+            loop_config.fresh_state_timeout
+        ):
+            self.latency_tracker.count("stale_state")
+        robot_state_data, state_age = self.interface.get_low_state(return_age=True, out=self._low_state)
+        # Receive time of the state, the start of the sensor-to-action latency
+        self._state_stamp = time.perf_counter() - state_age
+        self.latency_tracker.record("state_age", state_age * 1000)
+        return robot_state_data
+
+    def _pad_policy_action(self, scaled_policy_action):
+        """Zero-pad actions of policies controlling fewer DOFs than the robot has (leading DOFs)."""
+        if scaled_policy_action.shape[1] != self.num_dofs:
+            if not self.upper_body_controller:
+                scaled_policy_action = np.concatenate(
+                    [np.zeros((1, self.num_dofs - scaled_policy_action.shape[1])), scaled_policy_action], axis=1
+                )
+            else:
+                raise NotImplementedError("Upper body controller not implemented")
+        return scaled_policy_action
+
+    def pipelined_policy_action(self):
+        """Send the command of one control tick, with inference running on the worker thread.
+
+        The state read this tick is handed to the worker, then the publisher waits for the action computed from it
+        until the inference deadline. Without one it publishes the action of the deadline policy and counts a
+        ``deadline_miss``, so inference spikes never delay the command. Until the first action after a (re)start
+        arrives, the last command is published again.
+        """
+        tick_start = time.perf_counter()
+        kp_override = None
+        kd_override = None
+
+        # Stage 1: Read State
+        with self.latency_tracker.measure("read_state"):
+            robot_state_data = self._read_low_state()
+
+        # Stage 2: Pre-processing
+        policy_active = self.use_policy_action and not self.get_ready_state
+        with self.latency_tracker.measure("preprocessing"):
+            if policy_active:
+                mode_changed_at = self._mode_changed_at
+                if self._policy_active_since is None or self._policy_active_since < mode_changed_at:
+                    # Policy (re)started: ignore actions computed from states received before
+                    self._policy_active_since = max(self._state_stamp, mode_changed_at)
+                    self._action_fallback.reset()
+                self._request_inference(robot_state_data, self._state_stamp)
+            else:
+                self._policy_active_since = None
+                if self.get_ready_state:
+                    q_target = self.get_init_target(robot_state_data)
+                    self.init_count = min(self.init_count, 500)
+                else:
+                    manual_cmd = self._get_manual_command(robot_state_data)
+                    if manual_cmd is not None:
+                        q_target = manual_cmd["q"]
+                        kp_override = manual_cmd.get("kp")
+                        kd_override = manual_cmd.get("kd")
+                    else:
+                        q_target = robot_state_data[:, 7 : 7 + self.num_dofs]
+
+        # Stage 3: Wait for the action of this tick, up to the deadline
+        if policy_active:
+            with self.latency_tracker.measure("inference_wait"):
+                deadline = tick_start + self.config.task.control_loop.inference_deadline / self.rl_rate
+                action = self._collect_action(deadline)
+
+        # Stage 4: Post-processing
+        with self.latency_tracker.measure("postprocessing"):
+            if not policy_active:
+                self.cmd_q[:] = q_target[0]
+            elif action is not None:
+                self.cmd_q[:] = action[0] + self.default_dof_angles
+
+        # Stage 5: Action Pub
+        with self.latency_tracker.measure("action_pub"):
+            self.interface.send_low_command(
+                self.cmd_q,
+                self.cmd_dq,
+                self.cmd_tau,
+                robot_state_data[0, 7 : 7 + self.num_dofs],
+                kp_override=kp_override,
+                kd_override=kd_override,
+            )
+        # Published actions may come from the state of an earlier tick, there is none yet right after a (re)start
+        if not policy_active:
+            self.latency_tracker.record("sensor_to_action", (time.perf_counter() - self._state_stamp) * 1000)
+        elif action is not None:
+            self.latency_tracker.record("sensor_to_action", (time.perf_counter() - self._action_stamp) * 1000)
+
+    def _request_inference(self, robot_state_data, stamp):
+        """Hand the latest state, received at ``stamp``, to the inference worker and wake it up."""
+        if self._state_buffer is None:
+            self._state_buffer = DoubleBuffer(robot_state_data.shape)
+        self._requested_state_seq = self._state_buffer.write(robot_state_data, stamp=stamp)
+        self._inference_request.set()
+
+    def _collect_action(self, deadline):
+        """Return the action computed from this tick's state, waiting for it until ``deadline``.
+
+        Past the deadline the tick counts as a ``deadline_miss`` and gets the newest unpublished action computed
+        from an earlier state if there is one, the deadline policy action otherwise. Returns None while there is
+        no action since the policy (re)started.
+        """
+        while True:
+            self._action_ready.clear()
+            if self._inference_error is not None:
+                raise RuntimeError("Policy inference worker failed") from self._inference_error
+            # The worker only writes actions of requested states, the current one is the newest it can write
+            if self._completed_state_seq >= self._requested_state_seq:
+                action = self._consume_action()
+                if action is not None:
+                    return action
+                # The state was dropped on a policy mode change
+                break
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                self.latency_tracker.count("deadline_miss")
+                action = self._consume_action()
+                if action is not None:
+                    return action
+                break
+            self._action_ready.wait(timeout)
+        return self._action_fallback.missed() if self._action_fallback.has_action else None
+
+    def _consume_action(self):
+        """Return the newest action if it was not published yet and comes from a state of the current run."""
+        seq, stamp = self._action_buffer.read(self._latest_action)
+        if seq <= self._consumed_action_seq or stamp < self._policy_active_since:
+            return None
+        self._consumed_action_seq = seq
+        self._action_stamp = stamp
+        return self._action_fallback.fresh(self._latest_action)
+
+    def _inference_worker(self):
+        """Run inference on the latest state whenever the publisher requests it."""
+        robot_state_data = None
+        try:
+            while True:
+                self._inference_request.wait()
+                self._inference_request.clear()
+                if self._stop_inference.is_set():
+                    return
+                if robot_state_data is None:
+                    robot_state_data = np.zeros(self._state_buffer.shape)
+
+                with self._policy_lock:
+                    state_seq, state_stamp = self._state_buffer.read(robot_state_data)
+                    if state_stamp >= self._mode_changed_at:
+                        if self.use_phase:
+                            self.update_phase_time()
+                        with self.latency_tracker.measure("inference"):
+                            scaled_policy_action = self.rl_inference(robot_state_data)
+                        self._action_buffer.write(self._pad_policy_action(scaled_policy_action), stamp=state_stamp)
+                    self._completed_state_seq = state_seq
+                self._action_ready.set()
+        except Exception as e:
+            logger.exception("Policy inference worker failed")
+            self._inference_error = e
+            self._action_ready.set()
 
     def _get_manual_command(self, robot_state_data):
         """Optional manual command when policy control is disabled."""
@@ -634,7 +768,7 @@ class BasePolicy:
 
         def on_press(keycode):
             try:
-                self.handle_keyboard_button(keycode)
+                self._handle_input(self.handle_keyboard_button, keycode)
             except AttributeError:
                 pass  # Handle special keys if needed
 
@@ -663,9 +797,25 @@ class BasePolicy:
         self.key_states = new_key_states
         for key, is_pressed in self.key_states.items():
             if is_pressed and not self.last_key_states.get(key, False):
-                self.handle_joystick_button(key)
+                self._handle_input(self.handle_joystick_button, key)
                 self._print_control_status()
 
+    def _handle_input(self, handler, *args):
+        """Run an input handler with inference paused, so it never changes policy state mid-inference.
+
+        When the handler changes the policy mode, states read before are dropped instead of being run through
+        the policy.
+        """
+        with self._policy_lock:
+            mode = self._policy_mode()
+            handler(*args)
+            if self._policy_mode() != mode:
+                self._mode_changed_at = time.perf_counter()
+
+    def _policy_mode(self):
+        """State of the input handlers that (re)starts the policy when it changes."""
+        return self.use_policy_action, self.get_ready_state, self.active_policy_index
+
     # ============================================================================
     # Button Handler Methods
     # ============================================================================
@@ -778,16 +928,48 @@ class BasePolicy:
 
     def run(self):
         """Main run loop for the policy."""
+        if self.config.task.control_loop.pipelined:
+            self.run_pipelined()
+            return
+        try:
+            for it in itertools.count():
+                self.latency_tracker.start_cycle()
+
+                if self.use_joystick and self.interface.get_joystick_msg() is not None:
+                    self.process_joystick_input()
+                # The keyboard listener thread changes policy state too
+                with self._policy_lock:
+                    if self.use_phase:
+                        self.update_phase_time()
+                    self.policy_action()
+
+                self.latency_tracker.end_cycle()
+
+                if it % 50 == 0 and self.use_policy_action:
+                    debug_str = f"RL FPS: {self.latency_tracker.get_fps():.2f} | {self.latency_tracker.get_stats_str()}"
+                    self.logger.info(debug_str, flush=True)
+
+                self.rate.sleep()
+
+        except KeyboardInterrupt:
+            pass
+
+    def run_pipelined(self):
+        """Run loop publishing commands at the fixed rate while inference runs on a worker thread."""
+        loop_config = self.config.task.control_loop
+        if loop_config.publisher_priority is not None:
+            set_thread_realtime_priority(loop_config.publisher_priority)
+        worker = threading.Thread(target=self._inference_worker, name="policy_inference", daemon=True)
+        worker.start()
+        logger.info(f"Pipelined control loop with deadline policy '{loop_config.deadline_policy}'")
         try:
             for it in itertools.count():
                 self.latency_tracker.start_cycle()
 
                 if self.use_joystick and self.interface.get_joystick_msg() is not None:
                     self.process_joystick_input()
-                if self.use_phase:
-                    self.update_phase_time()
 
-                self.policy_action()
+                self.pipelined_policy_action()
 
                 self.latency_tracker.end_cycle()
 
@@ -799,3 +981,7 @@ class BasePolicy:
 
         except KeyboardInterrupt:
             pass
+        finally:
+            self._stop_inference.set()
+            self._inference_request.set()
+            worker.join(timeout=1.0)
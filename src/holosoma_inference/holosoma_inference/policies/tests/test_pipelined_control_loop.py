@@ -0,0 +1,195 @@
+"""
+Unit tests for the pipelined control loop of holosoma_inference.policies.base.BasePolicy.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from loguru import logger
+
+from holosoma_inference.config.config_types import ControlLoopConfig
+from holosoma_inference.utils.latency import LatencyTracker
+
+pytest.importorskip("pinocchio")  # holosoma_inference.policies imports the WBT policy
+from holosoma_inference.policies.base import BasePolicy
+
+NUM_DOFS = 3
+
+
+class FakeInterface:
+    """Robot whose joint positions equal the number of the tick they are read in, recording sent commands."""
+
+    state_shape = (1, 7 + NUM_DOFS + 6 + NUM_DOFS)
+
+    def __init__(self):
+        self.tick = -1
+        self.sent = []
+
+    def get_low_state(self, return_age=False, out=None):
+        self.tick += 1
+        state = np.zeros(self.state_shape) if out is None else out
+        state[:, 7 : 7 + NUM_DOFS] = self.tick
+        return (state, 0.0) if return_age else state
+
+    def send_low_command(self, cmd_q, cmd_dq, cmd_tau, dof_pos_latest=None, kp_override=None, kd_override=None):
+        self.sent.append(float(cmd_q[0]))
+
+
+class FakeRate:
+    """Rate limiter without sleeping: calls ``on_tick`` after each tick and ends the loop after ``num_ticks``."""
+
+    def __init__(self, num_ticks, on_tick):
+        self.num_ticks = num_ticks
+        self.on_tick = on_tick
+        self.tick = -1
+
+    def sleep(self):
+        self.tick += 1
+        self.on_tick(self.tick)
+        if self.tick + 1 == self.num_ticks:
+            raise KeyboardInterrupt
+
+
+def _make_policy(loop_config, use_policy_action=True):
+    """BasePolicy driven by FakeInterface, whose action is the joint position of its input state."""
+    policy = BasePolicy.__new__(BasePolicy)
+    policy.config = SimpleNamespace(task=SimpleNamespace(control_loop=loop_config))
+    policy.num_dofs = NUM_DOFS
+    policy.rl_rate = 50
+    policy.default_dof_angles = np.zeros(NUM_DOFS)
+    policy.use_policy_action = use_policy_action
+    policy.get_ready_state = False
+    policy.active_policy_index = 0
+    policy.use_phase = False
+    policy.use_joystick = False
+    policy.upper_body_controller = None
+    policy.cmd_q = np.zeros(NUM_DOFS)
+    policy.cmd_dq = np.zeros(NUM_DOFS)
+    policy.cmd_tau = np.zeros(NUM_DOFS)
+    policy.interface = FakeInterface()
+    policy.latency_tracker = LatencyTracker(window_size=50)
+    policy.logger = logger
+    policy._init_control_loop()
+
+    # Inference of the state of a tick in ``policy.gates`` blocks until its gate is set
+    policy.gates = {}
+
+    def rl_inference(robot_state_data):
+        tick = int(robot_state_data[0, 7])
+        if tick in policy.gates:
+            policy.gates[tick].wait()
+        return robot_state_data[:, 7 : 7 + NUM_DOFS].copy()
+
+    policy.rl_inference = rl_inference
+    return policy
+
+
+def _wait_for_worker(policy, timeout=1.0):
+    """Wait until the worker finished inference on every requested state."""
+    deadline = time.perf_counter() + timeout
+    while policy._completed_state_seq < policy._requested_state_seq:
+        assert time.perf_counter() < deadline, "inference worker stalled"
+        time.sleep(0.001)
+
+
+def _run(policy, num_ticks, on_tick):
+    policy.rate = FakeRate(num_ticks, on_tick)
+    policy.run_pipelined()
+    assert len(policy.interface.sent) == num_ticks
+
+
+class TestPipelinedControlLoop:
+    """Test cases for BasePolicy.run_pipelined."""
+
+    @pytest.mark.parametrize(
+        ("deadline_policy", "missed"),
+        [("hold", [2.0, 2.0]), ("decay", [1.0, 0.5]), ("extrapolate", [3.0, 4.0])],
+    )
+    def test_tick_alignment_and_deadline(self, deadline_policy, missed):
+        """Each tick publishes the action of its own state, ticks whose inference is late the deadline action."""
+        policy = _make_policy(ControlLoopConfig(pipelined=True, deadline_policy=deadline_policy, decay_factor=0.5))
+        policy.gates[3] = threading.Event()
+
+        def on_tick(tick):
+            if tick == 4:
+                policy.gates[3].set()
+            if tick != 3:
+                _wait_for_worker(policy)
+
+        _run(policy, 8, on_tick)
+        assert policy.interface.sent == [0.0, 1.0, 2.0, *missed, 5.0, 6.0, 7.0]
+        assert policy.latency_tracker.counters["deadline_miss"] == 2
+
+    def test_slow_first_inference(self):
+        """Until the first action after a start arrives, the last command is published again every tick."""
+        policy = _make_policy(ControlLoopConfig(pipelined=True), use_policy_action=False)
+        policy.gates[2] = threading.Event()
+
+        def on_tick(tick):
+            if tick == 1:
+                policy._handle_input(policy._handle_start_policy)
+            elif tick == 4:
+                policy.gates[2].set()
+                _wait_for_worker(policy)
+
+        _run(policy, 7, on_tick)
+        assert policy.interface.sent == [0.0, 1.0, 1.0, 1.0, 1.0, 5.0, 6.0]
+        assert policy.latency_tracker.counters["deadline_miss"] == 3
+
+    def test_input_waits_for_inference(self):
+        """Input handlers wait for a running inference, its action from before the restart is not published."""
+        policy = _make_policy(ControlLoopConfig(pipelined=True))
+        policy.gates[2] = threading.Event()
+        events = []
+        rl_inference = policy.rl_inference
+
+        def logged_rl_inference(robot_state_data):
+            action = rl_inference(robot_state_data)
+            events.append("inference")
+            return action
+
+        def restart():
+            policy._handle_input(policy._handle_stop_policy)
+            policy._handle_input(policy._handle_start_policy)
+            events.append("restart")
+
+        policy.rl_inference = logged_rl_inference
+
+        def on_tick(tick):
+            if tick == 2:
+                handler = threading.Thread(target=restart)
+                handler.start()
+                handler.join(0.05)
+                assert handler.is_alive()  # blocked by the running inference
+                policy.gates[2].set()
+                handler.join()
+            _wait_for_worker(policy)
+
+        _run(policy, 5, on_tick)
+        assert events[2:4] == ["inference", "restart"]
+        # Tick 2 missed its deadline, the action of its state is from before the restart and never published
+        assert policy.interface.sent == [0.0, 1.0, 1.0, 3.0, 4.0]
+
+    def test_drop_states_before_mode_change(self):
+        """Requests of states read before a policy mode change complete without inference."""
+        policy = _make_policy(ControlLoopConfig(pipelined=True))
+        inferred = []
+        policy.rl_inference = lambda robot_state_data: inferred.append(robot_state_data) or np.zeros((1, NUM_DOFS))
+        worker = threading.Thread(target=policy._inference_worker)
+        worker.start()
+        try:
+            state = policy.interface.get_low_state()
+            policy._request_inference(state, time.perf_counter())
+            _wait_for_worker(policy)
+            policy._handle_input(policy._handle_stop_policy)
+            policy._request_inference(state, policy._mode_changed_at - 1e-3)
+            _wait_for_worker(policy)
+        finally:
+            policy._stop_inference.set()
+            policy._inference_request.set()
+            worker.join()
+        assert len(inferred) == 1
+        assert policy._action_buffer.seq == 1
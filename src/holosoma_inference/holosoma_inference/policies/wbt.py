@@ -3,7 +3,6 @@ import sys
 
 import numpy as np
 import onnx
-import onnxruntime
 import pinocchio as pin
 from defusedxml import ElementTree
 from loguru import logger
@@ -23,6 +22,7 @@ from holosoma_inference.utils.math.quat import (
     wxyz_to_xyzw,
     xyzw_to_wxyz,
 )
+from holosoma_inference.utils.onnx_engine import OnnxInferenceEngine
 
 
 class PinocchioRobot:
@@ -167,9 +167,14 @@ class WholeBodyTrackingPolicy(BasePolicy):
         return xyzw_to_wxyz(ref_ori_xyzw)
 
     def setup_policy(self, model_path):
-        self.onnx_policy_session = onnxruntime.InferenceSession(model_path)
-        self.onnx_input_names = [inp.name for inp in self.onnx_policy_session.get_inputs()]
-        self.onnx_output_names = [out.name for out in self.onnx_policy_session.get_outputs()]
+        engine = OnnxInferenceEngine(
+            model_path,
+            self.config.task.onnx_runtime,
+            output_names=["actions", "joint_pos", "joint_vel", "ref_quat_xyzw"],
+        )
+        self.onnx_policy_session = engine.session
+        self.onnx_input_names = engine.input_names
+        self.onnx_output_names = engine.output_names
 
         # Extract KP/KD from ONNX metadata (same as base class)
         onnx_model = onnx.load(model_path)
@@ -190,28 +195,29 @@ class WholeBodyTrackingPolicy(BasePolicy):
             logger.info(f"Loaded KP/KD from ONNX metadata: {Path(model_path).name}")
 
         # get initial command and ref quat xyzw
-        time_step = np.zeros((1, 1), dtype=np.float32)
+        self._time_step_input = np.zeros((1, 1), dtype=np.float32)
 
         # Use configured observation dimensions (including history) instead of a hard-coded value.
         actor_obs_template = self.obs_buf_dict.get("actor_obs")
         if actor_obs_template is None:
             raise ValueError("Observation group 'actor_obs' must be configured for WBT policy.")
         obs = actor_obs_template.copy()
-        input_feed = {"obs": obs, "time_step": time_step}
-        outputs = self.onnx_policy_session.run(["joint_pos", "joint_vel", "ref_quat_xyzw"], input_feed)
+        input_feed = {"obs": obs, "time_step": self._time_step_input}
+        outputs = engine.run(input_feed)
 
         # motion_command_t/ref_quat_xyzw_t will be used in get_current_obs_buffer_dict
-        self.motion_command_t = np.concatenate(outputs[0:2], axis=1)  # (1, 58)
-        self.ref_quat_xyzw_t = outputs[2]
+        self.motion_command_t = np.concatenate(outputs[1:3], axis=1)  # (1, 58)
+        self.ref_quat_xyzw_t = outputs[3].copy()
         # duplicate, will be used in _get_init_target and _handle_stop_policy
         self.motion_command_0 = self.motion_command_t.copy()
         self.ref_quat_xyzw_0 = self.ref_quat_xyzw_t.copy()
 
+        # Written in place every tick, like the engine's output buffers
+        motion_command = np.empty_like(self.motion_command_t)
+
         def policy_act(input_feed):
-            output = self.onnx_policy_session.run(["actions", "joint_pos", "joint_vel", "ref_quat_xyzw"], input_feed)
-            action = output[0]
-            motion_command = np.concatenate(output[1:3], axis=1)
-            ref_quat_xyzw = output[3]
+            action, joint_pos, joint_vel, ref_quat_xyzw = engine.run(input_feed)
+            np.concatenate([joint_pos, joint_vel], axis=1, out=motion_command)
             return action, motion_command, ref_quat_xyzw
 
         self.policy = policy_act
@@ -301,7 +307,8 @@ class WholeBodyTrackingPolicy(BasePolicy):
             self._last_clock_reading = None
 
         obs = self.prepare_obs_for_rl(robot_state_data)
-        input_feed = {"time_step": np.array([[self.motion_timestep]], dtype=np.float32), "obs": obs["actor_obs"]}
+        self._time_step_input[0, 0] = self.motion_timestep
+        input_feed = {"time_step": self._time_step_input, "obs": obs["actor_obs"]}
         policy_action, self.motion_command_t, self.ref_quat_xyzw_t = self.policy(input_feed)
 
         # clip policy action
@@ -320,7 +327,7 @@ class WholeBodyTrackingPolicy(BasePolicy):
         return self.scaled_policy_action
 
     def _get_manual_command(self, robot_state_data):
-        # TODO: instead of adding kp/kd_override in def _set_motor_command,
+        # TODO: instead of adding kp/kd_override in def _encode_motor_commands,
         # just use the motor_kp/motor_kd when calling it in _fill_motor_commands
         if not self._stiff_hold_active:
             return None
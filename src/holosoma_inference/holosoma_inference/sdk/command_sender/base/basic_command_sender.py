@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from holosoma_inference.config.config_types.robot import RobotConfig
 
 
@@ -44,6 +46,24 @@ class BasicCommandSender(ABC):
 
         self.no_action = 0
 
+        # Joint to motor remapping: motors driven by a joint and their joints. Motor-ordered command rows q, dq, tau,
+        # kp, kd are reused every send, motors without a joint (-1) keep the default pose with zero gains.
+        motor2joint = np.asarray(_get_config_value(self.config, "motor2joint"), dtype=np.intp)
+        self._mapped_motors = np.flatnonzero(motor2joint != -1)
+        self._mapped_joints = motor2joint[self._mapped_motors]
+        self._idle_command = np.zeros((5, len(motor2joint)))
+        self._idle_command[0] = _get_config_value(self.config, "default_motor_angles")
+        self._motor_command = self._idle_command.copy()
+        # Joint-ordered command rows and configured gains of each joint's motor
+        num_joints = len(self._mapped_joints)
+        self._joint_command = np.zeros((5, num_joints))
+        self._joint_gains = np.zeros((2, num_joints))
+        for row, key in enumerate(("motor_kp", "motor_kd")):
+            motor_gains = _get_config_value(self.config, key)
+            if motor_gains is not None:
+                self._joint_gains[row, self._mapped_joints] = np.take(motor_gains, self._mapped_motors)
+        self._gain_levels = np.ones((2, 1))
+
         # Initialize SDK-specific components
         self._init_sdk_components()
 
@@ -59,63 +79,33 @@ class BasicCommandSender(ABC):
         """Check if a motor is a weak motor."""
         return motor_index in self.weak_motor_joint_index
 
-    def _set_motor_command(
-        self,
-        motor_cmd,
-        motor_id,
-        joint_id,
-        cmd_q,
-        cmd_dq,
-        cmd_tau,
-        motor_kp,
-        motor_kd,
-        kp_override=None,
-        kd_override=None,
-    ):
-        """Set motor command for a specific motor."""
-        default_q = _get_config_value(self.config, "default_motor_angles")
-
-        if joint_id == -1 or self.no_action:
-            motor_cmd.q = default_q[motor_id]
-            motor_cmd.dq = 0.0
-            motor_cmd.tau = 0.0
-            motor_cmd.kp = 0.0
-            motor_cmd.kd = 0.0
-        else:
-            motor_cmd.q = cmd_q[joint_id]
-            motor_cmd.dq = cmd_dq[joint_id]
-            motor_cmd.tau = cmd_tau[joint_id]
-
-            kp_value = motor_kp[motor_id]
-            kd_value = motor_kd[motor_id]
-            if kp_override is not None and joint_id != -1:
-                kp_value = kp_override[joint_id]
-            if kd_override is not None and joint_id != -1:
-                kd_value = kd_override[joint_id]
-
-            motor_cmd.kp = kp_value * self.kp_level
-            motor_cmd.kd = kd_value * self.kd_level
+    def _encode_motor_commands(self, cmd_q, cmd_dq, cmd_tau, kp_override=None, kd_override=None):
+        """Remap joint-ordered commands to motor order.
+
+        Returns:
+            Motor-ordered q, dq, tau, kp and kd rows (scaled by the gain levels), overwritten by the next call.
+        """
+        if self.no_action:
+            np.copyto(self._motor_command, self._idle_command)
+            return self._motor_command
+
+        joint_command = self._joint_command
+        joint_command[0] = cmd_q
+        joint_command[1] = cmd_dq
+        joint_command[2] = cmd_tau
+        joint_command[3] = kp_override if kp_override is not None else self._joint_gains[0]
+        joint_command[4] = kd_override if kd_override is not None else self._joint_gains[1]
+        self._gain_levels[:, 0] = (self.kp_level, self.kd_level)
+        joint_command[3:] *= self._gain_levels
+        self._motor_command[:, self._mapped_motors] = joint_command[:, self._mapped_joints]
+        return self._motor_command
 
     def _fill_motor_commands(self, motor_cmd, cmd_q, cmd_dq, cmd_tau, kp_override=None, kd_override=None):
         """Fill motor commands for all motors."""
-        motor2joint = _get_config_value(self.config, "motor2joint")
-        num_motors = _get_config_value(self.config, "num_motors")
-        motor_kp = _get_config_value(self.config, "motor_kp")
-        motor_kd = _get_config_value(self.config, "motor_kd")
-
-        for i in range(num_motors):
-            m_id = i
-            j_id = motor2joint[i]
-            cmd = motor_cmd[m_id]
-            self._set_motor_command(
-                cmd,
-                m_id,
-                j_id,
-                cmd_q,
-                cmd_dq,
-                cmd_tau,
-                motor_kp,
-                motor_kd,
-                kp_override=kp_override,
-                kd_override=kd_override,
-            )
+        motor_command = self._encode_motor_commands(cmd_q, cmd_dq, cmd_tau, kp_override, kd_override)
+        for cmd, q, dq, tau, kp, kd in zip(motor_cmd, *motor_command.tolist()):
+            cmd.q = q
+            cmd.dq = dq
+            cmd.tau = tau
+            cmd.kp = kp
+            cmd.kd = kd
@@ -1,3 +1,5 @@
+import time
+
 import numpy as np
 from loguru import logger
 from termcolor import colored
@@ -36,6 +38,20 @@ class InterfaceWrapper:
         self._kp_level = 1.0
         self._kd_level = 1.0
 
+        # Freshness of the control loop's states: sequence number and receive time of the last state read into an
+        # ``out`` buffer by get_low_state. The binding backend counts a state as new when its tick changes and stamps
+        # it when first read, so its age is a lower bound. ``_binding_received`` is (tick, sequence number, receive
+        # time) of the newest binding state, replaced as a whole so reads from other threads stay consistent.
+        self._state_seq = 0
+        self.state_stamp = float("-inf")
+        self._binding_tick = None
+        self._binding_received = (None, 0, float("-inf"))
+
+        # Joint to motor remapping of the binding backend: motor index of each joint and the motor-ordered command
+        # rows q, dq, tau, kp override, kd override, kp, kd. Motors without a joint keep zero commands.
+        self._joint2motor = np.asarray(robot_config.joint2motor, dtype=np.intp)
+        self._motor_command = np.zeros((7, robot_config.num_motors))
+
         # Initialize sdk components
         self._init_sdk_components()
 
@@ -82,42 +98,87 @@ class InterfaceWrapper:
     # Robot State and Command Interface
     # ============================================================================
 
-    def get_low_state(self):
-        """Get the latest low-level robot state as a numpy array."""
+    @property
+    def state_shape(self):
+        """Shape of the states returned by get_low_state."""
         if self.backend == "sdk2py":
-            return self.state_processor.get_robot_state_data()
+            return self.state_processor.state_shape
         if self.backend == "binding":
-            return self._convert_binding_state_to_array()
+            return (1, 13 + 2 * self.robot_config.num_joints)
         raise RuntimeError("InterfaceWrapper not initialized correctly.")
 
-    def _convert_binding_state_to_array(self):
-        """Convert binding LowState to numpy array format compatible with sdk2py."""
+    def get_low_state(self, return_age=False, out=None):
+        """Get the latest low-level robot state as a numpy array.
+
+        Args:
+            return_age: Also return the age of the state in seconds, time since it was received (inf before the
+                first state).
+            out: Array of shape ``state_shape`` to read the state into instead of a new array. The control loop
+                reads into its own buffer this way, and only states read into ``out`` are the reference of
+                wait_for_fresh_state, so reads from other threads (e.g. input handlers) leave it untouched.
+
+        Returns:
+            The state, or (state, age) with ``return_age``. The state is None before the first sdk2py message.
+        """
+        if self.backend == "sdk2py":
+            robot_state_data, tick, seq, stamp = None, None, 0, float("-inf")
+            if self.state_processor.state_seq > 0:
+                robot_state_data = np.empty(self.state_shape) if out is None else out
+                seq, stamp = self.state_processor.read_robot_state(robot_state_data)
+        elif self.backend == "binding":
+            robot_state_data = np.zeros(self.state_shape) if out is None else out
+            tick, seq, stamp = self._convert_binding_state_to_array(robot_state_data)
+        else:
+            raise RuntimeError("InterfaceWrapper not initialized correctly.")
+        if out is not None:
+            self._binding_tick, self._state_seq, self.state_stamp = tick, seq, stamp
+        if return_age:
+            return robot_state_data, time.perf_counter() - stamp
+        return robot_state_data
+
+    def wait_for_fresh_state(self, timeout=None):
+        """Block until a state newer than the last one get_low_state read into an ``out`` buffer arrives.
+
+        Lets the control loop start its tick on sensor arrival instead of free-running. The binding backend polls
+        the state tick, states without a tick cannot be told apart and count as fresh. Returns False on timeout.
+        """
+        if self.backend == "sdk2py":
+            return self.state_processor.wait_for_state(self._state_seq, timeout)
+        if self.backend == "binding":
+            deadline = None if timeout is None else time.perf_counter() + timeout
+            while True:
+                tick = getattr(self.unitree_interface.read_low_state(), "tick", None)
+                if tick is None or tick != self._binding_tick:
+                    return True
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return False
+                time.sleep(0.0001)
+        raise RuntimeError("InterfaceWrapper not initialized correctly.")
+
+    def _convert_binding_state_to_array(self, out):
+        """Convert binding LowState into ``out``, numpy array format compatible with sdk2py.
+
+        Returns:
+            Tick, sequence number and receive time of the state.
+        """
         state = self.unitree_interface.read_low_state()
+        tick = getattr(state, "tick", None)
+        received = self._binding_received
+        if tick is None or tick != received[0]:
+            received = (tick, received[1] + 1, time.perf_counter())
+            self._binding_received = received
 
-        # Compose array: [base_pos(3), quat(4), joint_pos(N), base_lin_vel(3), base_ang_vel(3), joint_vel(N), ...]
-        base_pos = np.zeros(3)
-        quat = np.array(state.imu.quat)
-        motor_pos = np.array(state.motor.q)
-        base_lin_vel = np.zeros(3)
-        base_ang_vel = np.array(state.imu.omega)
-        motor_vel = np.array(state.motor.dq)
-        joint_pos = np.zeros(self.robot_config.num_joints)
-        joint_vel = np.zeros(self.robot_config.num_joints)
-        motor_order = self.robot_config.joint2motor
-        for j_id in range(self.robot_config.num_joints):
-            m_id = motor_order[j_id]
-            joint_pos[j_id] = float(motor_pos[m_id])
-            joint_vel[j_id] = float(motor_vel[m_id])
-        return np.concatenate(
-            [
-                base_pos,
-                quat,
-                joint_pos,
-                base_lin_vel,
-                base_ang_vel,
-                joint_vel,
-            ]
-        ).reshape(1, -1)
+        # Compose array: [base_pos(3), quat(4), joint_pos(N), base_lin_vel(3), base_ang_vel(3), joint_vel(N)],
+        # base position and linear velocity are zero
+        num_joints = self.robot_config.num_joints
+        low_state = out[0]
+        low_state[:3] = 0.0
+        low_state[3:7] = state.imu.quat
+        np.take(state.motor.q, self._joint2motor, out=low_state[7 : 7 + num_joints])
+        low_state[7 + num_joints : 10 + num_joints] = 0.0
+        low_state[10 + num_joints : 13 + num_joints] = state.imu.omega
+        np.take(state.motor.dq, self._joint2motor, out=low_state[13 + num_joints :])
+        return received
 
     def send_low_command(
         self,
@@ -139,28 +200,21 @@ class InterfaceWrapper:
                 kd_override=kd_override,
             )
         elif self.backend == "binding":
-            # print(f"cmd_q: {type(cmd_q)}, {len(cmd_q)}, {cmd_q}")
-            cmd_q_target = np.zeros(self.robot_config.num_motors)
-            cmd_dq_target = np.zeros(self.robot_config.num_motors)
-            cmd_tau_target = np.zeros(self.robot_config.num_motors)
-            cmd_kp_override = np.zeros(self.robot_config.num_motors) if kp_override is not None else None
-            cmd_kd_override = np.zeros(self.robot_config.num_motors) if kd_override is not None else None
-            motor_order = self.robot_config.joint2motor
-            for j_id in range(self.robot_config.num_joints):
-                m_id = motor_order[j_id]
-                cmd_q_target[m_id] = float(cmd_q[j_id])
-                cmd_dq_target[m_id] = float(cmd_dq[j_id])
-                cmd_tau_target[m_id] = float(cmd_tau[j_id])
-                if cmd_kp_override is not None:
-                    cmd_kp_override[m_id] = float(kp_override[j_id])
-                if cmd_kd_override is not None:
-                    cmd_kd_override[m_id] = float(kd_override[j_id])
+            # Scatter the joint-ordered commands to their motors
+            motor_command = self._motor_command
+            motor_command[0, self._joint2motor] = cmd_q
+            motor_command[1, self._joint2motor] = cmd_dq
+            motor_command[2, self._joint2motor] = cmd_tau
+            if kp_override is not None:
+                motor_command[3, self._joint2motor] = kp_override
+            if kd_override is not None:
+                motor_command[4, self._joint2motor] = kd_override
             self._send_binding_command(
-                cmd_q_target,
-                cmd_dq_target,
-                cmd_tau_target,
-                kp_override=cmd_kp_override,
-                kd_override=cmd_kd_override,
+                motor_command[0],
+                motor_command[1],
+                motor_command[2],
+                kp_override=motor_command[3] if kp_override is not None else None,
+                kd_override=motor_command[4] if kd_override is not None else None,
             )
         else:
             raise RuntimeError("InterfaceWrapper not initialized correctly.")
@@ -168,13 +222,13 @@ class InterfaceWrapper:
     def _send_binding_command(self, cmd_q, cmd_dq, cmd_tau, kp_override=None, kd_override=None):
         """Send command using the C++/pybind11 binding."""
         cmd = self.unitree_interface.create_zero_command()
-        cmd.q_target = list(cmd_q)
-        cmd.dq_target = list(cmd_dq)
-        cmd.tau_ff = list(cmd_tau)
-        motor_kp = np.array(kp_override if kp_override is not None else self.robot_config.motor_kp)
-        motor_kd = np.array(kd_override if kd_override is not None else self.robot_config.motor_kd)
-        cmd.kp = list(motor_kp * self._kp_level)
-        cmd.kd = list(motor_kd * self._kd_level)
+        cmd.q_target = np.asarray(cmd_q).tolist()
+        cmd.dq_target = np.asarray(cmd_dq).tolist()
+        cmd.tau_ff = np.asarray(cmd_tau).tolist()
+        motor_kp = kp_override if kp_override is not None else self.robot_config.motor_kp
+        motor_kd = kd_override if kd_override is not None else self.robot_config.motor_kd
+        cmd.kp = np.multiply(motor_kp, self._kp_level, out=self._motor_command[5]).tolist()
+        cmd.kd = np.multiply(motor_kd, self._kd_level, out=self._motor_command[6]).tolist()
         self.unitree_interface.write_low_command(cmd)
 
     # ============================================================================
@@ -1,12 +1,23 @@
+import operator
+import threading
+import time
 from abc import ABC, abstractmethod
 
 import numpy as np
 
 from holosoma_inference.config.config_types.robot import RobotConfig
+from holosoma_inference.utils.control_loop import DoubleBuffer
+
+_MOTOR_STATE_FIELDS = operator.attrgetter("q", "dq", "tau_est")
 
 
 class BasicStateProcessor(ABC):
-    """Abstract base class for state processor implementations."""
+    """Abstract base class for state processor implementations.
+
+    SDK subscriber callbacks pass their messages to :meth:`_handle_low_state`, which publishes each decoded state
+    as a snapshot with a sequence number and a monotonic receive timestamp. The control loop reads consistent
+    snapshots without locking the callback out, can tell how old they are and can wait for the next one.
+    """
 
     def __init__(self, config: RobotConfig, lcm=None):
         self.lcm = lcm
@@ -26,6 +37,14 @@ class BasicStateProcessor(ABC):
         self.temp_first = np.zeros(self.num_dof)
         self.temp_second = np.zeros(self.num_dof)
         self.robot_state_data = None
+        self.state_shape = (1, self.q.size + self.dq.size + self.tau_est.size + self.ddq.size)
+        # Motor index of each joint, and the decoded (q, dq, tau_est) of each joint
+        self._joint2motor = [int(m_id) for m_id in self.config.joint2motor]
+        self._joint_fields = np.zeros((self.num_dof, 3))
+        self._robot_state_buffer = np.zeros(self.state_shape)
+        # Snapshots of robot_state_data handed from the SDK callback thread to the control loop
+        self._state_buffer = DoubleBuffer(self.state_shape)
+        self._state_received = threading.Event()
 
         # Initialize SDK-specific components
         self._init_sdk_components()
@@ -39,8 +58,47 @@ class BasicStateProcessor(ABC):
         """Prepare low-level state data from message. Must be implemented by subclasses."""
 
     def get_robot_state_data(self):
-        """Get the current robot state data."""
-        return self.robot_state_data
+        """Get a copy of the latest robot state data, None before the first state message."""
+        if self._state_buffer.seq == 0:
+            return None
+        robot_state_data = np.empty(self.state_shape)
+        self.read_robot_state(robot_state_data)
+        return robot_state_data
+
+    def read_robot_state(self, out):
+        """Copy the latest robot state data into ``out``.
+
+        Returns:
+            (seq, stamp): sequence number of the state (0 before the first message) and its
+            ``time.perf_counter`` receive time
+        """
+        return self._state_buffer.read(out)
+
+    @property
+    def state_seq(self):
+        """Number of state messages received so far."""
+        return self._state_buffer.seq
+
+    def wait_for_state(self, after_seq, timeout=None):
+        """Block until a state newer than ``after_seq`` is received. Returns False on timeout."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            self._state_received.clear()
+            if self._state_buffer.seq > after_seq:
+                return True
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._state_received.wait(remaining)
+
+    def _handle_low_state(self, msg):
+        """Decode a state message and publish it, stamped with its receive time."""
+        receive_time = time.perf_counter()
+        robot_state_data = self.prepare_low_state(msg)
+        if robot_state_data is None:
+            return
+        self._state_buffer.write(robot_state_data, stamp=receive_time)
+        self._state_received.set()
 
     @abstractmethod
     def _extract_imu_data(self, imu_state):
@@ -50,8 +108,14 @@ class BasicStateProcessor(ABC):
     def _extract_joint_data(self, robot_joint_state):
         """Extract joint data from state message. Must be implemented by subclasses."""
 
+    def _extract_motor_states(self, robot_joint_state):
+        """Copy q, dq and tau_est of each joint's motor from the SDK motor state messages, in joint order."""
+        self._joint_fields[:] = [_MOTOR_STATE_FIELDS(robot_joint_state[m_id]) for m_id in self._joint2motor]
+        self.q[7:] = self._joint_fields[:, 0]
+        self.dq[6:] = self._joint_fields[:, 1]
+        self.tau_est[6:] = self._joint_fields[:, 2]
+
     def _create_robot_state_data(self):
-        """Create the final robot state data array."""
-        return np.array(
-            self.q.tolist() + self.dq.tolist() + self.tau_est.tolist() + self.ddq.tolist(), dtype=np.float64
-        ).reshape(1, -1)
+        """Create the final robot state data array, a buffer reused for every message."""
+        np.concatenate((self.q, self.dq, self.tau_est, self.ddq), out=self._robot_state_buffer[0])
+        return self._robot_state_buffer
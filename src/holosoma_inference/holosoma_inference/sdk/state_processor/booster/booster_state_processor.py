@@ -53,12 +53,8 @@ class BoosterStateProcessor(BasicStateProcessor):
 
     def _extract_joint_data(self, robot_joint_state):
         """Extract joint data from Booster state message."""
-        for i in range(self.num_dof):
-            motor_idx = self.config.joint2motor[i]
-            self.q[7 + i] = robot_joint_state[motor_idx].q
-            self.dq[6 + i] = robot_joint_state[motor_idx].dq
-            self.tau_est[6 + i] = robot_joint_state[motor_idx].tau_est
+        self._extract_motor_states(robot_joint_state)
 
     def low_state_handler_b1(self, msg):
         """Handle Booster B1 low-level state messages."""
-        self.robot_state_data = self.prepare_low_state(msg)
+        self._handle_low_state(msg)
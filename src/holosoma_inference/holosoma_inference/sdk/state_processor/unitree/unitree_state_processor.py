@@ -47,16 +47,12 @@ class UnitreeStateProcessor(BasicStateProcessor):
 
     def _extract_joint_data(self, robot_joint_state):
         """Extract joint data from Unitree state message."""
-        for i in range(self.num_dof):
-            motor_idx = self.robot.JOINT2MOTOR[i]
-            self.q[7 + i] = robot_joint_state[motor_idx].q
-            self.dq[6 + i] = robot_joint_state[motor_idx].dq
-            self.tau_est[6 + i] = robot_joint_state[motor_idx].tau_est
+        self._extract_motor_states(robot_joint_state)
 
     def low_state_handler_go(self, msg):
         """Handle Unitree GO low-level state messages."""
-        self.robot_state_data = self.prepare_low_state(msg)
+        self._handle_low_state(msg)
 
     def low_state_handler_hg(self, msg):
         """Handle Unitree HG low-level state messages."""
-        self.robot_state_data = self.prepare_low_state(msg)
+        self._handle_low_state(msg)
@@ -0,0 +1,42 @@
+"""Shared fixtures for the holosoma_inference.sdk tests, which run without the robot SDKs."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from holosoma_inference.config.config_values.robot import g1_29dof
+from holosoma_inference.sdk.interface_wrapper import InterfaceWrapper
+
+
+@pytest.fixture
+def remapped_robot_config():
+    """G1 config with shuffled joint/motor orders and one extra motor without a joint."""
+    num_joints = g1_29dof.num_joints
+    joint2motor = np.random.default_rng(0).permutation(num_joints + 1)[:num_joints]
+    motor2joint = np.full(num_joints + 1, -1)
+    motor2joint[joint2motor] = np.arange(num_joints)
+    return dataclasses.replace(
+        g1_29dof,
+        num_motors=num_joints + 1,
+        joint2motor=tuple(joint2motor.tolist()),
+        motor2joint=tuple(motor2joint.tolist()),
+        default_motor_angles=(*g1_29dof.default_motor_angles, 0.5),
+        motor_kp=tuple(np.linspace(10.0, 40.0, num_joints + 1).tolist()),
+        motor_kd=tuple(np.linspace(1.0, 4.0, num_joints + 1).tolist()),
+    )
+
+
+@pytest.fixture
+def make_interface_wrapper(monkeypatch):
+    """Build InterfaceWrapper instances for ``backend`` without initializing an SDK."""
+    monkeypatch.setattr(InterfaceWrapper, "_init_sdk_components", lambda _self: None)
+
+    def make(robot_config, backend, **components):
+        wrapper = InterfaceWrapper(robot_config, use_joystick=False)
+        wrapper.backend = backend
+        for name, component in components.items():
+            setattr(wrapper, name, component)
+        return wrapper
+
+    return make
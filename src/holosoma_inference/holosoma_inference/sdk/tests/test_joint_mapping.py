@@ -0,0 +1,121 @@
+"""
+Unit tests for the joint/motor remapping of InterfaceWrapper (binding backend) and the sdk2py command senders.
+"""
+
+import dataclasses
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from holosoma_inference.sdk.command_sender.base import BasicCommandSender
+
+
+class StubUnitreeInterface:
+    """Stand-in for the unitree_interface binding: returns a fixed LowState and records written commands."""
+
+    def __init__(self, num_motors, rng):
+        self.low_state = SimpleNamespace(
+            imu=SimpleNamespace(quat=rng.normal(size=4).tolist(), omega=rng.normal(size=3).tolist()),
+            motor=SimpleNamespace(q=rng.normal(size=num_motors).tolist(), dq=rng.normal(size=num_motors).tolist()),
+            tick=1,
+        )
+        self.commands = []
+
+    def read_low_state(self):
+        return self.low_state
+
+    def create_zero_command(self):
+        return SimpleNamespace()
+
+    def write_low_command(self, cmd):
+        self.commands.append(cmd)
+
+
+class StubCommandSender(BasicCommandSender):
+    """Command sender filling SimpleNamespace motor commands, without an SDK publisher."""
+
+    def _init_sdk_components(self):
+        self.motor_cmd = [SimpleNamespace() for _ in range(self.config.num_motors)]
+
+    def send_command(self, cmd_q, cmd_dq, cmd_tau, dof_pos_latest=None, kp_override=None, kd_override=None):
+        self._fill_motor_commands(self.motor_cmd, cmd_q, cmd_dq, cmd_tau, kp_override, kd_override)
+
+
+def _joint_commands(config, rng):
+    return rng.normal(size=(5, config.num_joints))
+
+
+class TestBindingRemap:
+    """Test cases for InterfaceWrapper on the binding backend."""
+
+    def test_decode_state(self, remapped_robot_config, make_interface_wrapper):
+        """States are gathered in joint order, the layout matches the per-joint loop."""
+        config = remapped_robot_config
+        stub = StubUnitreeInterface(config.num_motors, np.random.default_rng(0))
+        wrapper = make_interface_wrapper(config, "binding", unitree_interface=stub)
+
+        state = stub.low_state
+        joint_pos = [state.motor.q[m_id] for m_id in config.joint2motor]
+        joint_vel = [state.motor.dq[m_id] for m_id in config.joint2motor]
+        expected = np.concatenate([np.zeros(3), state.imu.quat, joint_pos, np.zeros(3), state.imu.omega, joint_vel])
+        np.testing.assert_array_equal(wrapper.get_low_state(), expected.reshape(1, -1))
+
+    @pytest.mark.parametrize("override", [False, True])
+    def test_encode_command(self, remapped_robot_config, make_interface_wrapper, override):
+        """Commands are scattered to motor order, the motor without a joint gets zeros."""
+        config = remapped_robot_config
+        stub = StubUnitreeInterface(config.num_motors, np.random.default_rng(0))
+        wrapper = make_interface_wrapper(config, "binding", unitree_interface=stub)
+        wrapper.kp_level = 0.5
+        cmd_q, cmd_dq, cmd_tau, kp, kd = _joint_commands(config, np.random.default_rng(1))
+
+        for _ in range(2):  # buffers are reused
+            wrapper.send_low_command(
+                cmd_q, cmd_dq, cmd_tau, kp_override=kp if override else None, kd_override=kd if override else None
+            )
+
+        expected = np.zeros((5, config.num_motors))
+        expected[3] = config.motor_kp
+        expected[4] = config.motor_kd
+        if override:
+            expected[3:, np.asarray(config.motor2joint) == -1] = 0.0
+        for j_id, m_id in enumerate(config.joint2motor):
+            expected[0, m_id] = cmd_q[j_id]
+            expected[1, m_id] = cmd_dq[j_id]
+            expected[2, m_id] = cmd_tau[j_id]
+            if override:
+                expected[3, m_id] = kp[j_id]
+                expected[4, m_id] = kd[j_id]
+        expected[3] *= 0.5
+        cmd = stub.commands[-1]
+        np.testing.assert_array_equal(np.array([cmd.q_target, cmd.dq_target, cmd.tau_ff, cmd.kp, cmd.kd]), expected)
+
+
+class TestCommandSenderRemap:
+    """Test cases for BasicCommandSender motor command encoding."""
+
+    @pytest.mark.parametrize(("override", "no_action"), [(False, 0), (True, 0), (False, 1)])
+    def test_fill_motor_commands(self, remapped_robot_config, override, no_action):
+        """Motor commands match the per-motor loop, motors without a joint or with no_action hold the default pose."""
+        # The weak motor lookup of the base class needs the SDK robot constants
+        config = dataclasses.replace(remapped_robot_config, weak_motor_joint_index=None)
+        sender = StubCommandSender(config)
+        sender.kp_level = 0.8
+        sender.kd_level = 1.2
+        cmd_q, cmd_dq, cmd_tau, kp, kd = _joint_commands(config, np.random.default_rng(2))
+        sender.send_command(cmd_q + 1.0, cmd_dq, cmd_tau, kp_override=kp, kd_override=kd)  # buffers are reused
+        sender.no_action = no_action
+        sender.send_command(
+            cmd_q, cmd_dq, cmd_tau, kp_override=kp if override else None, kd_override=kd if override else None
+        )
+
+        for m_id, (cmd, j_id) in enumerate(zip(sender.motor_cmd, config.motor2joint)):
+            if j_id == -1 or no_action:
+                expected = (config.default_motor_angles[m_id], 0.0, 0.0, 0.0, 0.0)
+            else:
+                kp_value = kp[j_id] if override else config.motor_kp[m_id]
+                kd_value = kd[j_id] if override else config.motor_kd[m_id]
+                expected = (cmd_q[j_id], cmd_dq[j_id], cmd_tau[j_id], kp_value * 0.8, kd_value * 1.2)
+            assert (cmd.q, cmd.dq, cmd.tau, cmd.kp, cmd.kd) == expected
+            assert isinstance(cmd.q, float)
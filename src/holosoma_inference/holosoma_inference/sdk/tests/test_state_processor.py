@@ -0,0 +1,185 @@
+"""
+Unit tests for the state handoff of holosoma_inference.sdk state processors and InterfaceWrapper.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from holosoma_inference.config.config_values.robot import g1_29dof
+from holosoma_inference.sdk.state_processor.base import BasicStateProcessor
+
+
+class FakeStateProcessor(BasicStateProcessor):
+    """State processor decoding SimpleNamespace messages, without an SDK subscriber."""
+
+    def _init_sdk_components(self):
+        pass
+
+    def prepare_low_state(self, msg):
+        if not msg:
+            return None
+        self._extract_imu_data(msg.imu_state)
+        self._extract_joint_data(msg.motor_state)
+        self.robot_state_data = self._create_robot_state_data()
+        return self.robot_state_data
+
+    def _extract_imu_data(self, imu_state):
+        self.q[3:7] = imu_state.quaternion
+
+    def _extract_joint_data(self, robot_joint_state):
+        self._extract_motor_states(robot_joint_state)
+
+
+def _motor_states(q, dq=None, tau_est=None):
+    """Motor state messages in motor order."""
+    dq = np.zeros_like(q) if dq is None else dq
+    tau_est = np.zeros_like(q) if tau_est is None else tau_est
+    return [SimpleNamespace(q=q_m, dq=dq_m, tau_est=tau_m) for q_m, dq_m, tau_m in zip(q, dq, tau_est)]
+
+
+def _message(value, num_motors=29):
+    return SimpleNamespace(
+        imu_state=SimpleNamespace(quaternion=[1.0, 0.0, 0.0, 0.0]),
+        motor_state=_motor_states(np.full(num_motors, value)),
+    )
+
+
+def _binding_low_state(tick):
+    """LowState of the unitree_interface binding."""
+    return SimpleNamespace(
+        imu=SimpleNamespace(quat=[1.0, 0.0, 0.0, 0.0], omega=[0.0, 0.0, 0.0]),
+        motor=SimpleNamespace(q=[1.0] * g1_29dof.num_motors, dq=[0.0] * g1_29dof.num_motors),
+        tick=tick,
+    )
+
+
+class TestStateHandoff:
+    """Test cases for timestamped state snapshots."""
+
+    def test_snapshots(self):
+        """States are published with sequence numbers and receive times, reads return copies."""
+        processor = FakeStateProcessor(g1_29dof)
+        assert processor.get_robot_state_data() is None
+        assert processor.state_seq == 0
+
+        before = time.perf_counter()
+        processor._handle_low_state(_message(0.5))
+        processor._handle_low_state(None)  # ignored
+        assert processor.state_seq == 1
+
+        state = processor.get_robot_state_data()
+        assert state.shape == processor.state_shape
+        np.testing.assert_array_equal(state[0, 7:36], 0.5)
+        state[0, 7] = 2.0
+        out = np.zeros(processor.state_shape)
+        seq, stamp = processor.read_robot_state(out)
+        assert seq == 1
+        assert before <= stamp <= time.perf_counter()
+        assert out[0, 7] == 0.5
+
+    def test_wait_for_state(self):
+        """Waiting returns once a newer state arrives, or False on timeout."""
+        processor = FakeStateProcessor(g1_29dof)
+        assert not processor.wait_for_state(0, timeout=0.01)
+
+        timer = threading.Timer(0.02, processor._handle_low_state, args=(_message(1.0),))
+        timer.start()
+        assert processor.wait_for_state(0, timeout=1.0)
+        assert processor.state_seq == 1
+        assert processor.wait_for_state(0, timeout=0.0)
+        timer.join()
+
+    def test_interface_state_age(self, make_interface_wrapper):
+        """InterfaceWrapper returns the state age and waits for states newer than the last one returned."""
+        processor = FakeStateProcessor(g1_29dof)
+        wrapper = make_interface_wrapper(g1_29dof, "sdk2py", state_processor=processor)
+        state, age = wrapper.get_low_state(return_age=True)
+        assert state is None
+        assert age == float("inf")
+
+        processor._handle_low_state(_message(1.0))
+        time.sleep(0.01)
+        out = np.zeros(wrapper.state_shape)
+        state, age = wrapper.get_low_state(return_age=True, out=out)
+        assert state is out
+        assert state[0, 7] == 1.0
+        assert 0.01 <= age < 1.0
+
+        # The state read into ``out`` is consumed, the next one has to arrive first
+        assert not wrapper.wait_for_fresh_state(timeout=0.01)
+        processor._handle_low_state(_message(2.0))
+        assert wrapper.wait_for_fresh_state(timeout=0.0)
+        assert wrapper.get_low_state()[0, 7] == 2.0
+
+    @pytest.mark.parametrize("backend", ["sdk2py", "binding"])
+    def test_reads_outside_control_loop(self, make_interface_wrapper, backend):
+        """Reads without ``out`` return new arrays and leave the control loop's buffer and freshness untouched."""
+        low_state = _binding_low_state(tick=1)
+        processor = FakeStateProcessor(g1_29dof)
+        processor._handle_low_state(_message(1.0))
+        wrapper = make_interface_wrapper(
+            g1_29dof,
+            backend,
+            state_processor=processor,
+            unitree_interface=SimpleNamespace(read_low_state=lambda: low_state),
+        )
+        out = np.zeros(wrapper.state_shape)
+        wrapper.get_low_state(out=out)
+        expected = out.copy()
+        freshness = (wrapper._state_seq, wrapper.state_stamp)
+
+        # A new state, read by another thread
+        processor._handle_low_state(_message(2.0))
+        low_state.tick = 2
+        low_state.motor.q = [2.0] * g1_29dof.num_motors
+        state = wrapper.get_low_state()
+        assert state is not out
+        assert state[0, 7] == 2.0
+        np.testing.assert_array_equal(out, expected)
+        assert (wrapper._state_seq, wrapper.state_stamp) == freshness
+        assert wrapper.wait_for_fresh_state(timeout=0.0)
+
+    def test_binding_fresh_state(self, make_interface_wrapper):
+        """The binding backend waits for a new tick, LowStates without a tick do not wait at all."""
+        low_state = _binding_low_state(tick=1)
+        binding = SimpleNamespace(read_low_state=lambda: low_state)
+        wrapper = make_interface_wrapper(g1_29dof, "binding", unitree_interface=binding)
+        out = np.zeros(wrapper.state_shape)
+        wrapper.get_low_state(out=out)
+        assert not wrapper.wait_for_fresh_state(timeout=0.01)
+        low_state.tick = 2
+        assert wrapper.wait_for_fresh_state(timeout=0.0)
+
+        del low_state.tick
+        wrapper.get_low_state(out=out)
+        start = time.perf_counter()
+        assert wrapper.wait_for_fresh_state(timeout=1.0)
+        assert time.perf_counter() - start < 0.5
+
+
+class TestStateDecoding:
+    """Test cases for the joint remapping of motor state messages."""
+
+    def test_joint_order(self, remapped_robot_config):
+        """Joint data is gathered from each joint's motor, the layout matches the per-joint loop."""
+        config = remapped_robot_config
+        rng = np.random.default_rng(1)
+        q, dq, tau_est = rng.normal(size=(3, config.num_motors))
+        processor = FakeStateProcessor(config)
+        message = SimpleNamespace(
+            imu_state=SimpleNamespace(quaternion=[0.0, 1.0, 0.0, 0.0]), motor_state=_motor_states(q, dq, tau_est)
+        )
+        processor._handle_low_state(message)
+
+        expected_q, expected_dq, expected_tau = np.zeros(36), np.zeros(35), np.zeros(35)
+        expected_q[3:7] = [0.0, 1.0, 0.0, 0.0]
+        for j_id, m_id in enumerate(config.joint2motor):
+            expected_q[7 + j_id] = q[m_id]
+            expected_dq[6 + j_id] = dq[m_id]
+            expected_tau[6 + j_id] = tau_est[m_id]
+        expected = np.concatenate([expected_q, expected_dq, expected_tau, np.zeros(35)])
+        np.testing.assert_array_equal(processor.get_robot_state_data()[0], expected)
@@ -0,0 +1,123 @@
+"""Building blocks of the pipelined control loop: buffer handoff between threads and deadline fallbacks."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import numpy as np
+from loguru import logger
+
+
+class DoubleBuffer:
+    """Single-writer, multi-reader handoff of a fixed-shape array between threads.
+
+    The writer fills the inactive slot and then publishes it with one reference assignment, so it never waits
+    on readers. A reader copies the published slot and retries if the writer published again meanwhile, as the
+    slot it copied may have been reused for the next write (seqlock-style). Every write carries a sequence
+    number and a monotonic ``time.perf_counter`` timestamp.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype | type = np.float64):
+        self._slots = (np.zeros(shape, dtype=dtype), np.zeros(shape, dtype=dtype))
+        # (sequence number, published slot, timestamp), replaced as a whole on publish
+        self._published: tuple[int, int, float] = (0, 0, 0.0)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._slots[0].shape
+
+    @property
+    def seq(self) -> int:
+        """Number of writes so far, 0 before the first write."""
+        return self._published[0]
+
+    @property
+    def stamp(self) -> float:
+        """Timestamp of the last write."""
+        return self._published[2]
+
+    def write(self, value: np.ndarray, stamp: float | None = None) -> int:
+        """Publish a copy of ``value``, stamped with ``stamp`` or the current time. Returns its sequence number."""
+        seq, index, _ = self._published
+        slot = 1 - index
+        np.copyto(self._slots[slot], value)
+        self._published = (seq + 1, slot, time.perf_counter() if stamp is None else stamp)
+        return seq + 1
+
+    def read(self, out: np.ndarray) -> tuple[int, float]:
+        """Copy the last published value into ``out``. Returns its sequence number and timestamp."""
+        while True:
+            seq, index, stamp = self._published
+            np.copyto(out, self._slots[index])
+            if self._published[0] == seq:
+                return seq, stamp
+
+
+class DeadlineFallback:
+    """Actions to publish when inference misses its deadline.
+
+    Actions are offsets from the default pose. :meth:`fresh` records each action inference delivered in time,
+    :meth:`missed` returns the action of a missed tick according to ``policy``:
+
+    - ``hold``: the last action.
+    - ``decay``: the last action scaled by ``decay_factor`` per consecutive miss, towards the default pose.
+    - ``extrapolate``: the last action continued linearly from the last two actions, for at most
+      ``max_extrapolation_steps`` consecutive misses.
+    """
+
+    def __init__(
+        self, policy: str, shape: tuple[int, ...], decay_factor: float = 0.9, max_extrapolation_steps: int = 2
+    ):
+        if policy not in ("hold", "decay", "extrapolate"):
+            raise ValueError(f"Unknown deadline policy: {policy}")
+        self.policy = policy
+        self.decay_factor = decay_factor
+        self.max_extrapolation_steps = max_extrapolation_steps
+        self._last = np.zeros(shape)
+        self._previous = np.zeros(shape)
+        self._output = np.zeros(shape)
+        self.has_action = False
+        self.consecutive_misses = 0
+
+    def reset(self):
+        """Forget previous actions, e.g. when the policy is (re)started."""
+        self.has_action = False
+        self.consecutive_misses = 0
+
+    def fresh(self, action: np.ndarray) -> np.ndarray:
+        """Record an action delivered in time and return it."""
+        np.copyto(self._previous, self._last if self.has_action else action)
+        np.copyto(self._last, action)
+        self.has_action = True
+        self.consecutive_misses = 0
+        np.copyto(self._output, action)
+        return self._output
+
+    def missed(self) -> np.ndarray:
+        """Action for a tick without a fresh action, :meth:`fresh` must have been called before."""
+        self.consecutive_misses += 1
+        if self.policy == "hold":
+            np.copyto(self._output, self._last)
+        elif self.policy == "decay":
+            np.multiply(self._last, self.decay_factor**self.consecutive_misses, out=self._output)
+        else:
+            steps = min(self.consecutive_misses, self.max_extrapolation_steps)
+            np.subtract(self._last, self._previous, out=self._output)
+            self._output *= steps
+            self._output += self._last
+        return self._output
+
+
+def set_thread_realtime_priority(priority: int) -> None:
+    """Schedule the calling thread with SCHED_FIFO at ``priority``, warns where this is not permitted."""
+    if not hasattr(os, "sched_setscheduler"):
+        logger.warning("Real-time scheduling is not supported on this platform, ignoring publisher_priority")
+        return
+    try:
+        os.sched_setscheduler(threading.get_native_id(), os.SCHED_FIFO, os.sched_param(priority))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not set SCHED_FIFO priority {priority} for the publisher thread: {e}")
+        return
+    logger.info(f"Publisher thread scheduled with SCHED_FIFO priority {priority}")
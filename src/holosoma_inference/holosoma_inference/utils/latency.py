@@ -31,6 +31,7 @@ class LatencyTracker:
         self.cycle_start_time: float | None = None
         self.last_cycle_start_time: float | None = None
         self.fps_measurements: deque = deque(maxlen=window_size)
+        self.counters: dict[str, int] = defaultdict(int)
 
     @contextmanager
     def measure(self, stage: str):
@@ -40,9 +41,16 @@ class LatencyTracker:
             yield
         finally:
             end_time = time.perf_counter()
-            duration_ms = (end_time - start_time) * 1000
-            self.measurements[stage].append(duration_ms)
-            self.current_cycle[stage] = duration_ms
+            self.record(stage, (end_time - start_time) * 1000)
+
+    def record(self, stage: str, duration_ms: float):
+        """Record a duration measured elsewhere, e.g. the age of the robot state."""
+        self.measurements[stage].append(duration_ms)
+        self.current_cycle[stage] = duration_ms
+
+    def count(self, event: str, n: int = 1):
+        """Increment the counter of an event, e.g. a missed deadline."""
+        self.counters[event] += n
 
     def start_cycle(self):
         """Start a new measurement cycle."""
@@ -96,11 +104,23 @@ class LatencyTracker:
 
         # Create one-line latency report
         latency_parts = []
-        stage_order = ["read_state", "preprocessing", "inference", "postprocessing", "action_pub", "total"]
+        stage_order = [
+            "state_age",
+            "read_state",
+            "preprocessing",
+            "inference",
+            "inference_wait",
+            "postprocessing",
+            "action_pub",
+            "sensor_to_action",
+            "total",
+        ]
         for stage in stage_order:
             if stage in stats:
                 stat = stats[stage]
                 latency_parts.append(f"{stage}: {stat.mean_ms:.3f}±{stat.std_ms:.3f}ms")
+        for event, count in self.counters.items():
+            latency_parts.append(f"{event}: {count}")
 
         if latency_parts:
             return " | ".join(latency_parts)
@@ -116,3 +136,4 @@ class LatencyTracker:
         """Reset all measurements."""
         self.measurements.clear()
         self.current_cycle.clear()
+        self.counters.clear()
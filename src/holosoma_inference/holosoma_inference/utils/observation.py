@@ -0,0 +1,72 @@
+"""Preallocated observation assembly for the deployment loop."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class ObservationAssembler:
+    """Assemble scaled observation terms with history into persistent float32 arrays.
+
+    Each group is a single ``(1, group_dim)`` float32 array that is overwritten in place on every
+    :meth:`update` and can be fed to ONNX Runtime directly. The layout matches training: terms in sorted
+    order, each term its history oldest to newest, zero-padded until the history is full.
+
+    Every term with history keeps a ring of ``2 * history_len`` rows and writes each observation twice,
+    ``history_len`` rows apart, so the latest ``history_len`` rows are always one contiguous window that is
+    copied into the term's column slice. No arrays are allocated per update.
+    """
+
+    def __init__(
+        self,
+        obs_dict: Mapping[str, list[str]],
+        obs_dims: Mapping[str, int],
+        obs_scales: Mapping[str, float],
+        history_length_dict: Mapping[str, int],
+    ):
+        self.terms: dict[str, list[str]] = {group: sorted(term_names) for group, term_names in obs_dict.items()}
+        self.history_lengths: dict[str, int] = {group: history_length_dict.get(group, 1) for group in obs_dict}
+        self.buffers: dict[str, np.ndarray] = {}
+        # (term, scale, ring, column slice viewed as (history_len, term_dim)) per group
+        self._slots: dict[str, list[tuple[str, float, np.ndarray | None, np.ndarray]]] = {}
+        self._ring_index = 0
+
+        for group, term_names in self.terms.items():
+            history_len = self.history_lengths[group]
+            group_dim = sum(obs_dims[term] for term in term_names) * history_len
+            buffer = np.zeros((1, group_dim), dtype=np.float32)
+            slots = []
+            offset = 0
+            for term in term_names:
+                term_dim = obs_dims[term]
+                window = buffer[0, offset : offset + term_dim * history_len].reshape(history_len, term_dim)
+                ring = np.zeros((2 * history_len, term_dim), dtype=np.float32) if history_len > 1 else None
+                slots.append((term, obs_scales[term], ring, window))
+                offset += term_dim * history_len
+            self.buffers[group] = buffer
+            self._slots[group] = slots
+
+    def update(self, current_obs_buffer_dict: Mapping[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Scale and append the current observation terms, return the updated group buffers.
+
+        The returned arrays are the persistent :attr:`buffers`, copy them to keep a snapshot.
+        """
+        step = self._ring_index
+        for group, slots in self._slots.items():
+            history_len = self.history_lengths[group]
+            # Write position of this step in the group's ring, the window after it holds the history
+            row = step % history_len
+            for term, scale, ring, window in slots:
+                term_obs = current_obs_buffer_dict.get(term)
+                if term_obs is None:
+                    raise KeyError(f"Observation term '{term}' missing from current observation buffer.")
+                if ring is None:
+                    np.multiply(term_obs, scale, out=window)
+                    continue
+                np.multiply(term_obs, scale, out=ring[row : row + 1])
+                ring[row + history_len] = ring[row]
+                window[:] = ring[row + 1 : row + 1 + history_len]
+        self._ring_index = step + 1
+        return self.buffers
@@ -0,0 +1,98 @@
+"""
+Unit tests for holosoma_inference.utils.control_loop module.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from holosoma_inference.utils.control_loop import DeadlineFallback, DoubleBuffer
+
+
+class TestDoubleBuffer:
+    """Test cases for DoubleBuffer class."""
+
+    def test_write_read(self):
+        """Reads return the last write with its sequence number and timestamp."""
+        buffer = DoubleBuffer((1, 3))
+        out = np.full((1, 3), -1.0)
+        assert buffer.read(out) == (0, 0.0)
+        np.testing.assert_array_equal(out, 0.0)
+
+        assert buffer.write(np.array([[1.0, 2.0, 3.0]]), stamp=5.0) == 1
+        value = np.array([[4.0, 5.0, 6.0]])
+        assert buffer.write(value) == 2
+        value[:] = 0.0  # the buffer keeps a copy
+
+        seq, stamp = buffer.read(out)
+        assert seq == buffer.seq == 2
+        assert stamp == buffer.stamp > 5.0
+        np.testing.assert_array_equal(out, [[4.0, 5.0, 6.0]])
+
+    def test_no_torn_reads(self):
+        """A reader racing a writer always sees a value from a single write."""
+        buffer = DoubleBuffer((64,))
+        stop = threading.Event()
+
+        def writer():
+            value = np.zeros(64)
+            i = 0
+            while not stop.is_set():
+                i += 1
+                value.fill(i)
+                buffer.write(value)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            out = np.zeros(64)
+            last_seq = 0
+            for _ in range(20000):
+                seq, _ = buffer.read(out)
+                assert np.all(out == out[0])
+                assert out[0] == seq
+                assert seq >= last_seq
+                last_seq = seq
+        finally:
+            stop.set()
+            thread.join()
+
+
+class TestDeadlineFallback:
+    """Test cases for DeadlineFallback class."""
+
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [
+            ("hold", [3.0, 3.0, 3.0]),
+            ("decay", [1.5, 0.75, 0.375]),
+            ("extrapolate", [4.0, 5.0, 5.0]),
+        ],
+    )
+    def test_missed_actions(self, policy, expected):
+        """Missed ticks follow the deadline policy from the last two fresh actions."""
+        fallback = DeadlineFallback(policy, (1, 2), decay_factor=0.5, max_extrapolation_steps=2)
+        fallback.fresh(np.full((1, 2), 2.0))
+        np.testing.assert_array_equal(fallback.fresh(np.full((1, 2), 3.0)), 3.0)
+
+        for value in expected:
+            np.testing.assert_allclose(fallback.missed(), value)
+        assert fallback.consecutive_misses == 3
+
+        # A fresh action ends the miss streak
+        np.testing.assert_array_equal(fallback.fresh(np.full((1, 2), 7.0)), 7.0)
+        assert fallback.consecutive_misses == 0
+
+    def test_extrapolate_after_reset(self):
+        """After a reset the first action has zero velocity, extrapolation holds it."""
+        fallback = DeadlineFallback("extrapolate", (1, 2))
+        fallback.fresh(np.full((1, 2), 1.0))
+        fallback.reset()
+        assert not fallback.has_action
+        fallback.fresh(np.full((1, 2), 4.0))
+        np.testing.assert_array_equal(fallback.missed(), 4.0)
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="Unknown deadline policy"):
+            DeadlineFallback("skip", (1, 2))
@@ -97,6 +97,21 @@ class TestLatencyTracker(unittest.TestCase):
         assert "ms" in stats_str
         assert "|" in stats_str  # Pipe separator
 
+    def test_counters(self):
+        """Test event counters and their report."""
+        tracker = LatencyTracker()
+
+        with tracker.measure("inference"):
+            pass
+        tracker.count("deadline_miss")
+        tracker.count("deadline_miss", 2)
+
+        assert tracker.counters["deadline_miss"] == 3
+        assert "deadline_miss: 3" in tracker.get_stats_str()
+
+        tracker.reset()
+        assert len(tracker.counters) == 0
+
     def test_reset_functionality(self):
         """Test reset functionality."""
         tracker = LatencyTracker()
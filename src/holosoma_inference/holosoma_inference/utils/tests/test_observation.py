@@ -0,0 +1,93 @@
+"""
+Unit tests for holosoma_inference.utils.observation module.
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from holosoma_inference.utils.observation import ObservationAssembler
+
+OBS_DICT = {
+    "actor_obs": ["dof_pos", "base_ang_vel", "actions", "command_stand"],
+    "critic_obs": ["base_ang_vel", "dof_vel"],
+}
+OBS_DIMS = {"dof_pos": 5, "dof_vel": 5, "base_ang_vel": 3, "actions": 5, "command_stand": 1}
+OBS_SCALES = {"dof_pos": 1.0, "dof_vel": 0.05, "base_ang_vel": 0.25, "actions": 1.0, "command_stand": 1}
+
+
+class DequeObservationHistory:
+    """Per-term deque history as previously implemented in BasePolicy, the training-time layout."""
+
+    def __init__(self, history_length_dict):
+        self.history_length_dict = history_length_dict
+        self.buffers = {
+            group: {term: deque(maxlen=history_length_dict.get(group, 1)) for term in terms}
+            for group, terms in OBS_DICT.items()
+        }
+
+    def update(self, current_obs_buffer_dict):
+        group_outputs = {}
+        for group, terms in OBS_DICT.items():
+            history_len = self.history_length_dict.get(group, 1)
+            flattened_terms = []
+            for term in sorted(terms):
+                obs = np.asarray(current_obs_buffer_dict[term]).reshape(1, -1)
+                obs = (obs * OBS_SCALES[term]).astype(np.float32)
+                self.buffers[group][term].append(obs.copy())
+                history = list(self.buffers[group][term])
+                history = [np.zeros_like(obs)] * (history_len - len(history)) + history
+                flattened_terms.append(np.stack(history, axis=1).reshape(1, -1))
+            group_outputs[group] = np.concatenate(flattened_terms, axis=1)
+        return group_outputs
+
+
+def _random_obs(rng):
+    return {
+        "dof_pos": rng.normal(size=(1, 5)),
+        "dof_vel": rng.normal(size=(1, 5)).astype(np.float32),
+        "base_ang_vel": rng.normal(size=3),
+        "actions": rng.normal(size=(1, 5)),
+        "command_stand": np.array([[rng.integers(2)]]),
+    }
+
+
+class TestObservationAssembler:
+    """Test cases for ObservationAssembler class."""
+
+    @pytest.mark.parametrize("history_length_dict", [{"actor_obs": 1}, {"actor_obs": 4, "critic_obs": 3}])
+    def test_matches_deque_history(self, history_length_dict):
+        """Assembled buffers match the deque implementation bit for bit on every step."""
+        rng = np.random.default_rng(0)
+        assembler = ObservationAssembler(OBS_DICT, OBS_DIMS, OBS_SCALES, history_length_dict)
+        reference = DequeObservationHistory(history_length_dict)
+
+        for _ in range(10):
+            obs = _random_obs(rng)
+            expected = reference.update(obs)
+            outputs = assembler.update(obs)
+            assert outputs.keys() == expected.keys()
+            for group, value in outputs.items():
+                assert value.dtype == np.float32
+                np.testing.assert_array_equal(value, expected[group])
+
+    def test_buffers_are_persistent(self):
+        """Updates write into the same arrays instead of allocating new ones."""
+        assembler = ObservationAssembler(OBS_DICT, OBS_DIMS, OBS_SCALES, {"actor_obs": 3})
+        buffers = dict(assembler.buffers)
+        assert buffers["actor_obs"].shape == (1, 3 * 14)
+        assert not buffers["actor_obs"].any()
+
+        outputs = assembler.update(_random_obs(np.random.default_rng(0)))
+        for group, value in outputs.items():
+            assert value is buffers[group]
+            assert value.flags.c_contiguous
+
+    def test_missing_term_raises(self):
+        """A term configured in a group but missing from the observations raises KeyError."""
+        assembler = ObservationAssembler(OBS_DICT, OBS_DIMS, OBS_SCALES, {})
+        obs = _random_obs(np.random.default_rng(0))
+        del obs["dof_vel"]
+        with pytest.raises(KeyError, match="dof_vel"):
+            assembler.update(obs)
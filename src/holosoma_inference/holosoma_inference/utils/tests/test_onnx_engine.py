@@ -0,0 +1,93 @@
+"""
+Unit tests for holosoma_inference.utils.onnx_engine module.
+"""
+
+import numpy as np
+import onnx
+import onnxruntime
+import pytest
+from onnx import TensorProto, helper, numpy_helper
+
+from holosoma_inference.config.config_types.onnx_runtime import OnnxRuntimeConfig
+from holosoma_inference.utils.onnx_engine import OnnxInferenceEngine
+
+OBS_DIM, ACTION_DIM = 6, 4
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """MLP-like model: action = tanh(obs @ W + b), scaled_step = 2 * time_step, with a symbolic batch dim."""
+    rng = np.random.default_rng(0)
+    weight = numpy_helper.from_array(rng.normal(size=(OBS_DIM, ACTION_DIM)).astype(np.float32), "weight")
+    bias = numpy_helper.from_array(rng.normal(size=ACTION_DIM).astype(np.float32), "bias")
+    two = numpy_helper.from_array(np.array(2.0, dtype=np.float32), "two")
+    graph = helper.make_graph(
+        [
+            helper.make_node("MatMul", ["obs", "weight"], ["matmul"]),
+            helper.make_node("Add", ["matmul", "bias"], ["pre_action"]),
+            helper.make_node("Tanh", ["pre_action"], ["actions"]),
+            helper.make_node("Mul", ["time_step", "two"], ["scaled_step"]),
+        ],
+        "policy",
+        [
+            helper.make_tensor_value_info("obs", TensorProto.FLOAT, ["batch", OBS_DIM]),
+            helper.make_tensor_value_info("time_step", TensorProto.FLOAT, ["batch", 1]),
+        ],
+        [
+            helper.make_tensor_value_info("actions", TensorProto.FLOAT, ["batch", ACTION_DIM]),
+            helper.make_tensor_value_info("scaled_step", TensorProto.FLOAT, ["batch", 1]),
+        ],
+        initializer=[weight, bias, two],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    path = tmp_path / "policy.onnx"
+    onnx.save(model, str(path))
+    return str(path)
+
+
+class TestOnnxInferenceEngine:
+    """Test cases for OnnxInferenceEngine class."""
+
+    @pytest.mark.parametrize("use_io_binding", [True, False])
+    def test_matches_session_run(self, model_path, use_io_binding):
+        """Outputs match a default session fed with a fresh dict."""
+        engine = OnnxInferenceEngine(model_path, OnnxRuntimeConfig(use_io_binding=use_io_binding, warmup_iters=2))
+        reference = onnxruntime.InferenceSession(model_path)
+        assert engine.input_names == ["obs", "time_step"]
+        assert engine.output_names == ["actions", "scaled_step"]
+
+        rng = np.random.default_rng(1)
+        for step in range(3):
+            # time_step as the WBT policy feeds it, the engine casts into its float32 input buffer
+            feed = {"obs": rng.normal(size=(1, OBS_DIM)).astype(np.float32), "time_step": np.array([[step]])}
+            outputs = engine.run(feed)
+            expected = reference.run(None, {"obs": feed["obs"], "time_step": feed["time_step"].astype(np.float32)})
+            for output, value in zip(outputs, expected):
+                np.testing.assert_allclose(output, value, rtol=1e-6)
+
+    def test_outputs_are_persistent_buffers(self, model_path):
+        """Runs write into the same output arrays, warm-up leaves them zeroed."""
+        engine = OnnxInferenceEngine(model_path, OnnxRuntimeConfig(warmup_iters=3))
+        outputs = engine.outputs
+        assert [output.shape for output in outputs] == [(1, ACTION_DIM), (1, 1)]
+        assert not any(output.any() for output in outputs)
+
+        result = engine.run({"obs": np.ones((1, OBS_DIM), dtype=np.float32), "time_step": np.ones((1, 1))})
+        assert all(a is b for a, b in zip(result, outputs))
+        assert result[1][0, 0] == 2.0
+
+    def test_session_options(self, model_path):
+        """Thread counts and the selected output subset are applied to the session."""
+        config = OnnxRuntimeConfig(
+            intra_op_num_threads=1, inter_op_num_threads=1, graph_optimization_level="basic", allow_spinning=False
+        )
+        engine = OnnxInferenceEngine(model_path, config, output_names=["scaled_step"])
+        options = engine.session.get_session_options()
+        assert options.intra_op_num_threads == 1
+        assert options.inter_op_num_threads == 1
+        assert options.graph_optimization_level == onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        assert options.get_session_config_entry("session.intra_op.allow_spinning") == "0"
+
+        (scaled_step,) = engine.run({"obs": np.zeros((1, OBS_DIM)), "time_step": np.full((1, 1), 3.0)})
+        assert scaled_step[0, 0] == 6.0
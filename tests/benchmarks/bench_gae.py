@@ -0,0 +1,52 @@
+"""Benchmark the PPO GAE implementations over rollout lengths and env counts.
+
+Example:
+    python tests/benchmarks/bench_gae.py --num-steps 24 48 96 --num-envs 4096 16384
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import torch
+import tyro
+from timing import time_fn
+
+from holosoma.agents.ppo.gae import GAE_FUNCTIONS
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    num_steps: tuple[int, ...] = (24, 48, 96)
+    num_envs: tuple[int, ...] = (4096, 16384)
+    modes: tuple[str, ...] = tuple(GAE_FUNCTIONS)
+    gamma: float = 0.99
+    lam: float = 0.95
+    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    iters: int = 50
+
+
+def main(config: Config) -> None:
+    print(f"{'steps':>6s} {'envs':>7s} " + " ".join(f"{mode:>10s}" for mode in config.modes) + "  (ms)")
+    for num_steps in config.num_steps:
+        for num_envs in config.num_envs:
+            values = torch.randn(num_steps, num_envs, 1, device=config.device)
+            rewards = torch.randn(num_steps, num_envs, 1, device=config.device)
+            dones = (torch.rand(num_steps, num_envs, 1, device=config.device) < 0.02).float()
+            last_values = torch.randn(num_envs, 1, device=config.device)
+            args = (last_values, values, dones, rewards, config.gamma, config.lam)
+
+            timings = []
+            for mode in config.modes:
+
+                def run(compute_gae=GAE_FUNCTIONS[mode], args=args):
+                    compute_gae(*args)
+
+                timings.append(time_fn(run, device=config.device, iters=config.iters))
+            print(f"{num_steps:>6d} {num_envs:>7d} " + " ".join(f"{ms:>10.3f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
@@ -0,0 +1,92 @@
+"""Benchmark per-cycle observation assembly of the deployment loop: deque history versus ObservationAssembler.
+
+Runs the observation stage of ``BasePolicy`` for the G1 29-DoF locomotion observation config with synthetic
+robot data and reports per-cycle latency statistics from ``LatencyTracker``. The deque variant is the
+previous ``BasePolicy`` implementation (history deques, ``np.stack`` and ``np.concatenate`` per group).
+
+Example:
+    python tests/benchmarks/bench_inference_observations.py --history-length 1 5
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections import deque
+
+import numpy as np
+import tyro
+
+from holosoma_inference.config.config_values.observation import loco_g1_29dof
+from holosoma_inference.utils.latency import LatencyTracker
+from holosoma_inference.utils.observation import ObservationAssembler
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    history_length: tuple[int, ...] = (1, 5)
+    cycles: int = 20000
+    warmup: int = 500
+
+
+class DequeObservations:
+    """Previous ``BasePolicy`` observation pipeline: per-term deques flattened on every cycle."""
+
+    def __init__(self, obs_dict, obs_dims, obs_scales, history_length_dict):
+        self.obs_scales = obs_scales
+        self.history_length_dict = history_length_dict
+        self.terms = {group: sorted(term_names) for group, term_names in obs_dict.items()}
+        self.buffers = {
+            group: {term: deque(maxlen=history_length_dict.get(group, 1)) for term in term_names}
+            for group, term_names in self.terms.items()
+        }
+
+    def update(self, current_obs_buffer_dict):
+        current_obs_dict = {
+            group: {
+                term: (current_obs_buffer_dict[term] * self.obs_scales[term]).astype(np.float32, copy=False)
+                for term in term_names
+            }
+            for group, term_names in self.terms.items()
+        }
+        group_outputs = {}
+        for group, term_dict in current_obs_dict.items():
+            history_len = self.history_length_dict.get(group, 1)
+            flattened_terms = []
+            for term in self.terms[group]:
+                obs = np.asarray(term_dict[term], dtype=np.float32, order="C")
+                buffer = self.buffers[group][term]
+                buffer.append(obs.copy())
+                history = list(buffer)
+                if len(history) < history_len:
+                    history = [np.zeros_like(obs)] * (history_len - len(history)) + history
+                flattened_terms.append(np.stack(history[-history_len:], axis=1).reshape(obs.shape[0], -1))
+            group_outputs[group] = np.concatenate(flattened_terms, axis=1).astype(np.float32, copy=False)
+        self.obs_buf_dict = {group: value.copy() for group, value in group_outputs.items()}
+        return group_outputs
+
+
+def main(config: Config) -> None:
+    obs_config = loco_g1_29dof
+    rng = np.random.default_rng(0)
+    # Terms as BasePolicy/LocomotionPolicy pass them: (1, dim) float64 slices of the robot state
+    current_obs = {term: rng.normal(size=(1, dim)) for term, dim in obs_config.obs_dims.items()}
+
+    print(f"{'pipeline':>10} {'history':>8} {'mean ms':>9} {'std ms':>9} {'max ms':>9}")
+    for history_length in config.history_length:
+        history_length_dict = dict.fromkeys(obs_config.obs_dict, history_length)
+        args = (obs_config.obs_dict, obs_config.obs_dims, obs_config.obs_scales, history_length_dict)
+        for name, pipeline in (("deque", DequeObservations(*args)), ("assembler", ObservationAssembler(*args))):
+            tracker = LatencyTracker(window_size=config.cycles)
+            for cycle in range(config.warmup + config.cycles):
+                if cycle == config.warmup:
+                    tracker.reset()
+                with tracker.measure("preprocessing"):
+                    pipeline.update(current_obs)
+            stats = tracker.get_stats(["preprocessing"])["preprocessing"]
+            print(f"{name:>10} {history_length:>8d} {stats.mean_ms:>9.4f} {stats.std_ms:>9.4f} {stats.max_ms:>9.4f}")
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
@@ -0,0 +1,208 @@
+"""Benchmark joint/motor remapping of the deployment SDK interface: per-joint loops versus index arrays.
+
+Decodes robot states and encodes motor commands for the G1 29-DoF config with synthetic SDK messages, no robot
+SDK is needed. The loop variants are the previous implementations of ``BasicStateProcessor`` (sdk2py state
+decoding), ``InterfaceWrapper`` (binding state decoding and command encoding) and ``BasicCommandSender``
+(sdk2py command encoding). Reports the per-call time of the fastest and the median of ``repeat`` batches of
+``number`` calls, as the calls take microseconds.
+
+Example:
+    python tests/benchmarks/bench_interface_io.py --number 5000
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import timeit
+from types import SimpleNamespace
+
+import numpy as np
+import tyro
+
+from holosoma_inference.config.config_values.robot import g1_29dof
+from holosoma_inference.sdk.command_sender.base import BasicCommandSender
+from holosoma_inference.sdk.interface_wrapper import InterfaceWrapper
+from holosoma_inference.sdk.state_processor.base import BasicStateProcessor
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    number: int = 2000
+    repeat: int = 15
+
+
+class StateProcessor(BasicStateProcessor):
+    """State processor decoding synthetic motor state messages."""
+
+    def _init_sdk_components(self):
+        pass
+
+    def prepare_low_state(self, msg):
+        self._extract_joint_data(msg)
+        return self._create_robot_state_data()
+
+    def _extract_imu_data(self, imu_state):
+        pass
+
+    def _extract_joint_data(self, robot_joint_state):
+        self._extract_motor_states(robot_joint_state)
+
+
+class LoopStateProcessor(StateProcessor):
+    """Previous joint data extraction and state array creation."""
+
+    def _extract_joint_data(self, robot_joint_state):
+        for i in range(self.num_dof):
+            motor_idx = self.config.joint2motor[i]
+            self.q[7 + i] = robot_joint_state[motor_idx].q
+            self.dq[6 + i] = robot_joint_state[motor_idx].dq
+            self.tau_est[6 + i] = robot_joint_state[motor_idx].tau_est
+
+    def _create_robot_state_data(self):
+        return np.array(
+            self.q.tolist() + self.dq.tolist() + self.tau_est.tolist() + self.ddq.tolist(), dtype=np.float64
+        ).reshape(1, -1)
+
+
+class CommandSender(BasicCommandSender):
+    """Command sender filling synthetic motor command messages."""
+
+    def _init_sdk_components(self):
+        self.motor_cmd = [SimpleNamespace() for _ in range(self.config.num_motors)]
+
+    def send_command(self, cmd_q, cmd_dq, cmd_tau, dof_pos_latest=None, kp_override=None, kd_override=None):
+        self._fill_motor_commands(self.motor_cmd, cmd_q, cmd_dq, cmd_tau, kp_override, kd_override)
+
+
+class LoopCommandSender(CommandSender):
+    """Previous per-motor command encoding."""
+
+    def _fill_motor_commands(self, motor_cmd, cmd_q, cmd_dq, cmd_tau, kp_override=None, kd_override=None):
+        config = self.config
+        for m_id in range(config.num_motors):
+            j_id = config.motor2joint[m_id]
+            cmd = motor_cmd[m_id]
+            if j_id == -1 or self.no_action:
+                cmd.q = config.default_motor_angles[m_id]
+                cmd.dq = cmd.tau = cmd.kp = cmd.kd = 0.0
+                continue
+            cmd.q = cmd_q[j_id]
+            cmd.dq = cmd_dq[j_id]
+            cmd.tau = cmd_tau[j_id]
+            kp_value = kp_override[j_id] if kp_override is not None else config.motor_kp[m_id]
+            kd_value = kd_override[j_id] if kd_override is not None else config.motor_kd[m_id]
+            cmd.kp = kp_value * self.kp_level
+            cmd.kd = kd_value * self.kd_level
+
+
+class BindingInterface:
+    """Stand-in for the unitree_interface binding: a fixed LowState, commands are dropped."""
+
+    def __init__(self, num_motors, rng):
+        self.low_state = SimpleNamespace(
+            imu=SimpleNamespace(quat=rng.normal(size=4).tolist(), omega=rng.normal(size=3).tolist()),
+            motor=SimpleNamespace(q=rng.normal(size=num_motors).tolist(), dq=rng.normal(size=num_motors).tolist()),
+            tick=0,
+        )
+
+    def read_low_state(self):
+        self.low_state.tick += 1
+        return self.low_state
+
+    def create_zero_command(self):
+        return SimpleNamespace()
+
+    def write_low_command(self, cmd):
+        pass
+
+
+class BindingWrapper(InterfaceWrapper):
+    """InterfaceWrapper on the binding backend with a synthetic binding."""
+
+    def _init_sdk_components(self):
+        self.backend = "binding"
+        self.unitree_interface = BindingInterface(self.robot_config.num_motors, np.random.default_rng(0))
+
+
+class LoopBindingWrapper(BindingWrapper):
+    """Previous per-joint binding state decoding and command encoding."""
+
+    def _convert_binding_state_to_array(self, out):
+        state = self.unitree_interface.read_low_state()
+        quat = np.array(state.imu.quat)
+        motor_pos = np.array(state.motor.q)
+        base_ang_vel = np.array(state.imu.omega)
+        motor_vel = np.array(state.motor.dq)
+        joint_pos = np.zeros(self.robot_config.num_joints)
+        joint_vel = np.zeros(self.robot_config.num_joints)
+        for j_id in range(self.robot_config.num_joints):
+            m_id = self.robot_config.joint2motor[j_id]
+            joint_pos[j_id] = float(motor_pos[m_id])
+            joint_vel[j_id] = float(motor_vel[m_id])
+        out[:] = np.concatenate([np.zeros(3), quat, joint_pos, np.zeros(3), base_ang_vel, joint_vel]).reshape(1, -1)
+        return self._binding_received
+
+    def send_low_command(self, cmd_q, cmd_dq, cmd_tau, dof_pos_latest=None, kp_override=None, kd_override=None):
+        num_motors = self.robot_config.num_motors
+        cmd_q_target = np.zeros(num_motors)
+        cmd_dq_target = np.zeros(num_motors)
+        cmd_tau_target = np.zeros(num_motors)
+        cmd_kp_override = np.zeros(num_motors) if kp_override is not None else None
+        cmd_kd_override = np.zeros(num_motors) if kd_override is not None else None
+        for j_id in range(self.robot_config.num_joints):
+            m_id = self.robot_config.joint2motor[j_id]
+            cmd_q_target[m_id] = float(cmd_q[j_id])
+            cmd_dq_target[m_id] = float(cmd_dq[j_id])
+            cmd_tau_target[m_id] = float(cmd_tau[j_id])
+            if cmd_kp_override is not None:
+                cmd_kp_override[m_id] = float(kp_override[j_id])
+            if cmd_kd_override is not None:
+                cmd_kd_override[m_id] = float(kd_override[j_id])
+        cmd = self.unitree_interface.create_zero_command()
+        cmd.q_target = list(cmd_q_target)
+        cmd.dq_target = list(cmd_dq_target)
+        cmd.tau_ff = list(cmd_tau_target)
+        motor_kp = np.array(cmd_kp_override if cmd_kp_override is not None else self.robot_config.motor_kp)
+        motor_kd = np.array(cmd_kd_override if cmd_kd_override is not None else self.robot_config.motor_kd)
+        cmd.kp = list(motor_kp * self._kp_level)
+        cmd.kd = list(motor_kd * self._kd_level)
+        self.unitree_interface.write_low_command(cmd)
+
+
+def _time(name, variant, fn, config):
+    times_us = np.array(timeit.repeat(fn, number=config.number, repeat=config.repeat)) / config.number * 1e6
+    print(f"{name:>16} {variant:>8} {times_us.min():>9.2f} {np.median(times_us):>10.2f}")
+
+
+def main(config: Config) -> None:
+    # The weak motor lookup of BasicCommandSender needs the SDK robot constants
+    robot_config = dataclasses.replace(g1_29dof, weak_motor_joint_index=None)
+    rng = np.random.default_rng(0)
+    motor_states = [
+        SimpleNamespace(q=q, dq=dq, tau_est=tau) for q, dq, tau in rng.normal(size=(robot_config.num_motors, 3))
+    ]
+    cmd_q, cmd_dq, cmd_tau, kp, kd = rng.normal(size=(5, robot_config.num_joints))
+
+    print(f"{'stage':>16} {'variant':>8} {'min us':>9} {'median us':>10}")
+    for variant, cls in (("loop", LoopStateProcessor), ("indexed", StateProcessor)):
+        processor = cls(robot_config)
+        _time("sdk2py state", variant, lambda p=processor: p.prepare_low_state(motor_states), config)
+    for variant, cls in (("loop", LoopCommandSender), ("indexed", CommandSender)):
+        sender = cls(robot_config)
+        _time("sdk2py command", variant, lambda s=sender: s.send_command(cmd_q, cmd_dq, cmd_tau, None, kp, kd), config)
+    for variant, cls in (("loop", LoopBindingWrapper), ("indexed", BindingWrapper)):
+        wrapper = cls(robot_config, use_joystick=False)
+        out = np.zeros(wrapper.state_shape)
+        _time("binding state", variant, lambda w=wrapper, out=out: w.get_low_state(out=out), config)
+        _time(
+            "binding command",
+            variant,
+            lambda w=wrapper: w.send_low_command(cmd_q, cmd_dq, cmd_tau, None, kp, kd),
+            config,
+        )
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
@@ -0,0 +1,155 @@
+"""Benchmark per-control-step MotionCommand reads for short and long motion clips.
+
+Compares the packed frame cache against re-gathering the whole clip in robot body/joint order on every
+property access (the previous MotionLoader behaviour). A synthetic G1-sized clip is used; with ``--num-clips`` it
+is split into a motion library whose clips are assigned to envs at random.
+
+Example:
+    python tests/benchmarks/bench_motion_command.py --clip-minutes 1 30 --num-envs 4096 --num-clips 1 100
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+import tyro
+from timing import time_fn
+
+from holosoma.managers.command.terms.wbt import MotionCommand, MotionLibrary, MotionLoader
+
+PROPERTIES = (
+    "joint_pos",
+    "joint_vel",
+    "body_pos_w",
+    "body_quat_w",
+    "body_lin_vel_w",
+    "body_ang_vel_w",
+    "ref_pos_w",
+    "ref_quat_w",
+    "root_pos_w",
+    "root_quat_w",
+    "ref_lin_vel_w",
+    "ref_ang_vel_w",
+)
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    clip_minutes: tuple[float, ...] = (1.0, 30.0)
+    num_clips: tuple[int, ...] = (1, 100)
+    num_envs: int = 4096
+    num_bodies: int = 30
+    num_joints: int = 29
+    num_tracked_bodies: int = 14
+    fps: int = 50
+    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    iters: int = 20
+
+
+def write_motion(path: Path, config: Config, num_frames: int) -> None:
+    rng = np.random.default_rng(0)
+    np.savez(
+        path,
+        fps=np.array(config.fps),
+        body_names=np.array([f"body_{i}" for i in range(config.num_bodies)]),
+        joint_names=np.array([f"joint_{i}" for i in range(config.num_joints)]),
+        joint_pos=rng.standard_normal((num_frames, 7 + config.num_joints), dtype=np.float32),
+        joint_vel=rng.standard_normal((num_frames, 6 + config.num_joints), dtype=np.float32),
+        body_pos_w=rng.standard_normal((num_frames, config.num_bodies, 3), dtype=np.float32),
+        body_quat_w=rng.standard_normal((num_frames, config.num_bodies, 4), dtype=np.float32),
+        body_lin_vel_w=rng.standard_normal((num_frames, config.num_bodies, 3), dtype=np.float32),
+        body_ang_vel_w=rng.standard_normal((num_frames, config.num_bodies, 3), dtype=np.float32),
+    )
+
+
+def make_library(motion: MotionLoader, num_clips: int, config: Config) -> MotionLibrary:
+    clips = []
+    for frames in torch.tensor_split(motion.frames, num_clips):
+        clip = copy.copy(motion)
+        clip.frames = frames
+        clips.append(clip)
+    return MotionLibrary(clips, [f"clip_{i}" for i in range(num_clips)], device=config.device)
+
+
+def make_command(motion: MotionLibrary, config: Config) -> MotionCommand:
+    command = MotionCommand.__new__(MotionCommand)
+    command.motion = motion
+    command.num_envs = config.num_envs
+    command.device = config.device
+    command.motion_cfg = SimpleNamespace(
+        body_names_to_track=[f"body_{i}" for i in range(config.num_tracked_bodies)],
+        use_adaptive_timesteps_sampler=False,
+    )
+    command.tracked_body_indexes = torch.arange(config.num_tracked_bodies, device=config.device)
+    command.ref_body_index = 1
+    env_origins = torch.zeros(config.num_envs, 3, device=config.device)
+    command._env = SimpleNamespace(simulator=SimpleNamespace(scene=SimpleNamespace(env_origins=env_origins)))
+    command.init_buffers()
+    command.clip_ids[:] = motion.sample_clips(config.num_envs)
+    command.time_step_totals[:] = motion.clip_lengths[command.clip_ids]
+    command._clip_starts[:] = motion.clip_starts[command.clip_ids]
+    command.time_steps[:] = (torch.rand(config.num_envs, device=config.device) * command.time_step_totals).long()
+    return command
+
+
+def main(config: Config) -> None:
+    print(f"{'minutes':>8s} {'frames':>8s} {'clips':>6s} {'frame cache':>12s} {'re-gather':>12s}  (ms/control step)")
+    for minutes in config.clip_minutes:
+        num_frames = int(minutes * 60 * config.fps)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "motion.npz"
+            write_motion(path, config, num_frames)
+            body_names = [f"body_{i}" for i in range(config.num_bodies)]
+            joint_names = [f"joint_{i}" for i in range(config.num_joints)]
+            motion = MotionLoader(str(path), body_names, joint_names, device=config.device)
+
+        # Previous behaviour: every property gathers the full clip, then indexes the current time steps
+        body_fields = [motion.body_pos_w.clone(), motion.body_quat_w.clone(), motion.body_lin_vel_w.clone()]
+        joint_fields = [motion.joint_pos.clone(), motion.joint_vel.clone()]
+        body_index = torch.arange(config.num_bodies, device=config.device)
+        joint_index = torch.arange(config.num_joints, device=config.device)
+
+        time_steps = torch.randint(0, num_frames, (config.num_envs,), device=config.device)
+        tracked_body_indexes = torch.arange(config.num_tracked_bodies, device=config.device)
+
+        def regather_step(
+            time_steps=time_steps,
+            num_frames=num_frames,
+            body_fields=body_fields,
+            joint_fields=joint_fields,
+            body_index=body_index,
+            joint_index=joint_index,
+            tracked_body_indexes=tracked_body_indexes,
+        ):
+            time_steps.add_(1).remainder_(num_frames)
+            for i in range(len(PROPERTIES)):
+                if i < 2:
+                    joint_fields[i][:, joint_index][time_steps]
+                else:
+                    body_fields[i % 3][:, body_index][time_steps][:, tracked_body_indexes]
+
+        regather_ms = time_fn(regather_step, device=config.device, warmup=2, iters=config.iters)
+
+        for num_clips in config.num_clips:
+            command = make_command(make_library(motion, num_clips, config), config)
+
+            def cached_step(command=command):
+                command.time_steps.add_(1).remainder_(command.time_step_totals)
+                command._update_frame_cache()
+                for name in PROPERTIES:
+                    getattr(command, name)
+
+            cached_ms = time_fn(cached_step, device=config.device, warmup=2, iters=config.iters)
+            print(f"{minutes:>8.1f} {num_frames:>8d} {num_clips:>6d} {cached_ms:>12.3f} {regather_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
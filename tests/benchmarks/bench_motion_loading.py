@@ -0,0 +1,84 @@
+"""Benchmark loading a motion dataset from compressed ``.npz`` clips versus a native ``.hsmotion`` file.
+
+Builds a synthetic G1-sized dataset, converts it with ``holosoma.convert_motions`` and times building the
+motion library (without default-pose transitions) from either format.
+
+Example:
+    python tests/benchmarks/bench_motion_loading.py --num-clips 100 --clip-minutes 1
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import tyro
+from timing import time_fn
+
+from holosoma.convert_motions import ConvertMotionsConfig, convert_motions
+from holosoma.managers.command.terms.wbt import MotionLibrary, MotionLoader
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    num_clips: int = 100
+    clip_minutes: float = 1.0
+    num_bodies: int = 30
+    num_joints: int = 29
+    fps: int = 50
+    device: str = "cpu"
+    iters: int = 3
+
+
+def write_dataset(directory: Path, config: Config) -> tuple[list[str], list[str]]:
+    rng = np.random.default_rng(0)
+    num_frames = int(config.clip_minutes * 60 * config.fps)
+    body_names = [f"body_{i}" for i in range(config.num_bodies)]
+    joint_names = [f"joint_{i}" for i in range(config.num_joints)]
+    for clip in range(config.num_clips):
+        np.savez_compressed(
+            directory / f"clip_{clip:04d}.npz",
+            fps=np.array([config.fps]),
+            body_names=np.array(body_names),
+            joint_names=np.array(joint_names),
+            joint_pos=rng.standard_normal((num_frames, 7 + config.num_joints), dtype=np.float32),
+            joint_vel=rng.standard_normal((num_frames, 6 + config.num_joints), dtype=np.float32),
+            body_pos_w=rng.standard_normal((num_frames, config.num_bodies, 3), dtype=np.float32),
+            body_quat_w=rng.standard_normal((num_frames, config.num_bodies, 4), dtype=np.float32),
+            body_lin_vel_w=rng.standard_normal((num_frames, config.num_bodies, 3), dtype=np.float32),
+            body_ang_vel_w=rng.standard_normal((num_frames, config.num_bodies, 3), dtype=np.float32),
+        )
+    return body_names, joint_names
+
+
+def main(config: Config) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        body_names, joint_names = write_dataset(directory, config)
+        npz_files = sorted(str(path) for path in directory.glob("*.npz"))
+        motion_file = str(directory / "dataset.hsmotion")
+        header = convert_motions(ConvertMotionsConfig(inputs=(tmp_dir,), output=motion_file))
+
+        def load_npz():
+            clips = (MotionLoader(path, body_names, joint_names) for path in npz_files)
+            return MotionLibrary(clips, [Path(path).stem for path in npz_files], device=config.device)
+
+        def load_native():
+            clips = (MotionLoader(motion_file, body_names, joint_names, clip_index=i) for i in range(config.num_clips))
+            return MotionLibrary(clips, header.clip_names, device=config.device)
+
+        npz_ms = time_fn(load_npz, device=config.device, warmup=1, iters=config.iters)
+        native_ms = time_fn(load_native, device=config.device, warmup=1, iters=config.iters)
+        size_mb = header.num_frames * header.num_features * 4 / 2**20
+        print(f"{config.num_clips} clips, {header.num_frames} frames, {size_mb:.0f} MiB of float32 frames")
+        print(f"{'format':>10s} {'load (ms)':>10s}")
+        print(f"{'npz':>10s} {npz_ms:>10.1f}")
+        print(f"{'hsmotion':>10s} {native_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
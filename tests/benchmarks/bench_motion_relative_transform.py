@@ -0,0 +1,94 @@
+"""Benchmark the motion-relative body transform of ``MotionCommand.step`` over num_envs x num_bodies.
+
+Compares the previous formulation (per-env reference poses repeated over the bodies, then a chain of quaternion ops)
+against the fused, broadcasting ``motion_to_robot_frame`` in eager mode, TorchScript and, if it compiles on this
+machine, ``torch.compile``.
+
+Example:
+    python tests/benchmarks/bench_motion_relative_transform.py --num-envs 1024 4096 16384 --num-bodies 14 30
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import torch
+import tyro
+from timing import time_fn
+
+from holosoma.utils.rotations import (
+    motion_to_robot_frame,
+    motion_to_robot_frame_jit,
+    quat_apply,
+    quat_inverse,
+    quat_mul,
+    yaw_quat,
+)
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    num_envs: tuple[int, ...] = (1024, 4096, 16384)
+    num_bodies: tuple[int, ...] = (14, 30)
+    compile: bool = True
+    """Also time ``torch.compile(motion_to_robot_frame)``."""
+    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    iters: int = 100
+
+
+def repeated_ops(ref_pos_w, ref_quat_w, robot_ref_pos_w, robot_ref_quat_w, body_pos_w, body_quat_w):
+    num_bodies = body_pos_w.shape[1]
+    ref_pos_w_repeat = ref_pos_w[:, None, :].repeat(1, num_bodies, 1)
+    ref_quat_w_repeat = ref_quat_w[:, None, :].repeat(1, num_bodies, 1)
+    robot_ref_pos_w_repeat = robot_ref_pos_w[:, None, :].repeat(1, num_bodies, 1)
+    robot_ref_quat_w_repeat = robot_ref_quat_w[:, None, :].repeat(1, num_bodies, 1)
+
+    delta_quat_w = yaw_quat(
+        quat_mul(robot_ref_quat_w_repeat, quat_inverse(ref_quat_w_repeat, w_last=True), w_last=True), w_last=True
+    )
+    body_quat = quat_mul(delta_quat_w, body_quat_w, w_last=True)
+    delta_pos_w_height = ref_pos_w_repeat - robot_ref_pos_w_repeat
+    delta_pos_w_height[..., :2] = 0.0
+    body_pos = (
+        robot_ref_pos_w_repeat + delta_pos_w_height + quat_apply(delta_quat_w, body_pos_w - ref_pos_w_repeat, True)
+    )
+    return body_pos, body_quat
+
+
+def random_quat(*shape: int, device: str) -> torch.Tensor:
+    quat = torch.randn(*shape, 4, device=device)
+    return quat / quat.norm(dim=-1, keepdim=True)
+
+
+def try_time_fn(name: str, fn, args: tuple[torch.Tensor, ...], config: Config) -> float:
+    try:
+        return time_fn(lambda: fn(*args), device=config.device, iters=config.iters)
+    except Exception as e:  # torch.compile needs a working compiler toolchain
+        print(f"Skipping {name}: {type(e).__name__}")
+        return float("nan")
+
+
+def main(config: Config) -> None:
+    implementations = {"repeated": repeated_ops, "eager": motion_to_robot_frame, "jit": motion_to_robot_frame_jit}
+    if config.compile:
+        implementations["compile"] = torch.compile(motion_to_robot_frame, dynamic=False)
+
+    print(f"{'envs':>8} {'bodies':>7} " + " ".join(f"{name + ' ms':>12}" for name in implementations))
+    for num_envs in config.num_envs:
+        for num_bodies in config.num_bodies:
+            args = (
+                torch.randn(num_envs, 3, device=config.device),
+                random_quat(num_envs, device=config.device),
+                torch.randn(num_envs, 3, device=config.device),
+                random_quat(num_envs, device=config.device),
+                torch.randn(num_envs, num_bodies, 3, device=config.device),
+                random_quat(num_envs, num_bodies, device=config.device),
+            )
+            timings = [try_time_fn(name, fn, args, config) for name, fn in implementations.items()]
+            print(f"{num_envs:>8d} {num_bodies:>7d} " + " ".join(f"{ms:>12.3f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
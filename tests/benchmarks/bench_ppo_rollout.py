@@ -0,0 +1,123 @@
+"""Benchmark PPO rollout collection time per iteration with and without the graphed rollout step.
+
+Uses a synthetic environment so only the per-step policy, critic and storage overhead is measured.
+Collection time is accumulated through ``LoggingHelper.record_collection_time`` as in ``PPO.learn``.
+
+Example:
+    python tests/benchmarks/bench_ppo_rollout.py --num-envs 4096 --hidden-dims 256 128 64
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import tempfile
+from types import SimpleNamespace
+
+import torch
+import tyro
+from timing import synchronize
+from torch.utils.tensorboard import SummaryWriter
+
+from holosoma.agents.modules.logging_utils import LoggingHelper
+from holosoma.agents.ppo.ppo import PPO
+from holosoma.config_types.algo import LayerConfig, ModuleConfig, PPOConfig, PPOModuleDictConfig
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    num_envs: int = 4096
+    num_steps_per_env: int = 24
+    actor_obs_dim: int = 96
+    critic_obs_dim: int = 128
+    num_actions: int = 29
+    hidden_dims: tuple[int, ...] = (512, 256, 128)
+    iterations: int = 10
+    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+
+
+class SyntheticEnv:
+    """Minimal environment returning random observations, rewards and timeouts."""
+
+    def __init__(self, config: Config):
+        self.num_envs = config.num_envs
+        self.device = config.device
+        self.obs = {
+            "actor_obs": torch.randn(config.num_envs, config.actor_obs_dim, device=config.device),
+            "critic_obs": torch.randn(config.num_envs, config.critic_obs_dim, device=config.device),
+        }
+        self.rewards = torch.zeros(config.num_envs, device=config.device)
+        self.extras = {"final_observations": {k: v.clone() for k, v in self.obs.items()}, "episode": {}, "to_log": {}}
+
+    def step(self, actor_state):
+        self.rewards.normal_()
+        dones = (torch.rand(self.num_envs, device=self.device) < 0.02).long()
+        self.extras["time_outs"] = dones.bool() & (torch.rand(self.num_envs, device=self.device) < 0.5)
+        return self.obs, self.rewards, dones, self.extras
+
+
+def make_ppo(config: Config, **ppo_overrides) -> PPO:
+    layer_config = LayerConfig(hidden_dims=list(config.hidden_dims))
+    ppo_config = PPOConfig(
+        module_dict=PPOModuleDictConfig(
+            actor=ModuleConfig(
+                type="MLP", input_dim=["actor_obs"], output_dim=["robot_action_dim"], layer_config=layer_config
+            ),
+            critic=ModuleConfig(type="MLP", input_dim=["critic_obs"], output_dim=[1], layer_config=layer_config),
+        ),
+        num_steps_per_env=config.num_steps_per_env,
+        **ppo_overrides,
+    )
+    # Bypass PPO.__init__, which needs a full BaseTask environment
+    ppo = PPO.__new__(PPO)
+    ppo.config = ppo_config
+    ppo.env = SyntheticEnv(config)
+    ppo.device = config.device
+    ppo.log_dir = None
+    ppo.is_multi_gpu = False
+    ppo.algo_obs_dim_dict = {"actor_obs": config.actor_obs_dim, "critic_obs": config.critic_obs_dim}
+    ppo.algo_history_length_dict = {"actor_obs": 1, "critic_obs": 1}
+    ppo.num_act = config.num_actions
+    ppo.actor_learning_rate = ppo.critic_learning_rate = ppo_config.actor_learning_rate
+    ppo.min_actor_learning_rate = ppo.min_critic_learning_rate = 1e-5
+    ppo.max_actor_learning_rate = ppo.max_critic_learning_rate = 1e-2
+    ppo.use_symmetry = False
+    ppo.env.robot_config = SimpleNamespace(actions_dim=config.num_actions)
+    ppo._init_obs_keys()
+    ppo._setup_models_and_optimizer()
+    ppo._setup_storage()
+    return ppo
+
+
+def main(config: Config) -> None:
+    with tempfile.TemporaryDirectory() as log_dir:
+        writer = SummaryWriter(log_dir=log_dir)
+        for graphed in (False, True):
+            ppo = make_ppo(config, graphed_rollout=graphed)
+            helper = LoggingHelper(
+                writer,
+                log_dir,
+                num_envs=config.num_envs,
+                num_steps_per_env=config.num_steps_per_env,
+                num_learning_iterations=config.iterations,
+                device=config.device,
+            )
+            obs_dict = ppo.env.obs
+            # Warm-up iteration (includes graph capture)
+            ppo._rollout_step(obs_dict)
+            ppo.storage.clear()
+            for _ in range(config.iterations):
+                with helper.record_collection_time():
+                    ppo._rollout_step(obs_dict)
+                    synchronize(config.device)
+                ppo.storage.clear()
+            name = "graphed" if graphed else "default"
+            per_iter_ms = helper.collection_time * 1000.0 / config.iterations
+            shape = f"{config.num_envs} envs x {config.num_steps_per_env} steps"
+            print(f"{name:>8s}: {per_iter_ms:.2f} ms/iteration ({shape})")
+        writer.close()
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
@@ -0,0 +1,54 @@
+"""Benchmark PPO ``_training_step`` time with the default and packed minibatch storage.
+
+The rollout storage is filled with random data, so only minibatch generation and the PPO update are measured.
+
+Example:
+    python tests/benchmarks/bench_ppo_training_step.py --num-envs 16384 --num-mini-batches 4
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import torch
+import tyro
+from bench_ppo_rollout import Config as RolloutConfig
+from bench_ppo_rollout import make_ppo
+from timing import time_fn
+
+
+@dataclasses.dataclass
+class Config(RolloutConfig):
+    """Benchmark configuration."""
+
+    num_learning_epochs: int = 5
+    num_mini_batches: int = 4
+    iters: int = 5
+
+
+VARIANTS = {
+    "default": {},
+    "packed": {"packed_minibatches": True},
+    "packed+bf16 obs": {"packed_minibatches": True, "obs_storage_dtype": "bfloat16"},
+}
+
+
+def main(config: Config) -> None:
+    for name, overrides in VARIANTS.items():
+        ppo = make_ppo(
+            config,
+            num_learning_epochs=config.num_learning_epochs,
+            num_mini_batches=config.num_mini_batches,
+            **overrides,
+        )
+        for key in ("actor_obs", "critic_obs", "actions", "values", "returns", "advantages", "action_mean"):
+            ppo.storage[key] = torch.randn_like(ppo.storage[key], dtype=torch.float)
+        ppo.storage["actions_log_prob"] = -torch.rand_like(ppo.storage["actions_log_prob"])
+        ppo.storage["action_sigma"] = torch.rand_like(ppo.storage["action_sigma"]) + 0.5
+
+        ms = time_fn(ppo._training_step, device=config.device, warmup=1, iters=config.iters)
+        print(f"{name:>16s}: {ms:.2f} ms/training step ({config.num_envs} envs x {config.num_steps_per_env} steps)")
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
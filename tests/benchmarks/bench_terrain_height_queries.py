@@ -0,0 +1,114 @@
+"""Benchmark terrain height queries: Warp ray casting against the terrain mesh versus heightfield lookups.
+
+Generates a procedural terrain, scatters ``num_envs`` robots with a yawed height-scan grid around each and times
+``warp_utils.ray_cast`` (if Warp is installed) and every ``HeightfieldSampler`` interpolation mode. The ``%off``
+columns give the percentage of heights more than 1 mm away from the ray cast ones.
+
+Example:
+    python tests/benchmarks/bench_terrain_height_queries.py --num-envs 4096 --scan-points 5 11
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from functools import partial
+from typing import Callable
+
+import numpy as np
+import torch
+import tyro
+from timing import time_fn
+
+from holosoma.config_types.terrain import TerrainTermCfg
+from holosoma.simulator.shared.terrain import Terrain
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    num_envs: tuple[int, ...] = (1024, 4096)
+    scan_points: tuple[int, ...] = (5, 11)
+    """Height-scan grid points per side (5 -> 25 points per robot)."""
+    scan_spacing: float = 0.1
+    terrain_config: dict[str, float] = dataclasses.field(
+        default_factory=lambda: {"smooth_slope": 0.2, "rough": 0.3, "smooth_stairs": 0.3, "low_obstacles": 0.2}
+    )
+    num_rows: int = 10
+    num_cols: int = 20
+    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    iters: int = 20
+
+
+def scan_points(num_envs: int, points_per_side: int, spacing: float, extent: float, device: str) -> torch.Tensor:
+    """Random robot positions and yaws with a square scan grid around each, shape ``(num_envs, points, 2)``."""
+    generator = torch.Generator().manual_seed(0)
+    centers = torch.rand(num_envs, 1, 2, generator=generator) * extent
+    yaw = torch.rand(num_envs, 1, generator=generator) * 2 * math.pi
+    half = (points_per_side - 1) * spacing / 2
+    offsets_1d = torch.linspace(-half, half, points_per_side)
+    grid_x, grid_y = torch.meshgrid(offsets_1d, offsets_1d, indexing="ij")
+    grid_x, grid_y = grid_x.reshape(1, -1), grid_y.reshape(1, -1)
+    rotated = torch.stack(
+        [grid_x * yaw.cos() - grid_y * yaw.sin(), grid_x * yaw.sin() + grid_y * yaw.cos()],
+        dim=-1,
+    )
+    return (centers + rotated).to(device)
+
+
+def main(config: Config) -> None:
+    np.random.seed(0)
+    terrain_cfg = TerrainTermCfg(
+        func="holosoma.managers.terrain.terms.locomotion:TerrainLocomotion",
+        static_friction=1.0,
+        dynamic_friction=1.0,
+        restitution=0.0,
+        mesh_type="trimesh",
+        num_rows=config.num_rows,
+        num_cols=config.num_cols,
+        terrain_config=config.terrain_config,
+    )
+    terrain = Terrain(terrain_cfg, num_robots=1)
+    extent = min(config.num_rows * terrain_cfg.terrain_length, config.num_cols * terrain_cfg.terrain_width)
+
+    samplers = {
+        mode: terrain.height_field_sampler(config.device, mode) for mode in ("mesh", "triangle", "bilinear", "max")
+    }
+    try:
+        from holosoma.utils import warp_utils
+
+        warp_mesh = warp_utils.convert_to_wp_mesh(terrain.mesh.vertices, terrain.mesh.faces, config.device)
+    except ImportError:
+        print("Warp is not installed, skipping ray casting")
+        warp_mesh = None
+
+    def height_queries(xy: torch.Tensor) -> dict[str, Callable[[], torch.Tensor]]:
+        queries = {mode: partial(sampler.sample, xy) for mode, sampler in samplers.items()}
+        if warp_mesh is not None:
+            ray_starts = torch.cat([xy, torch.full_like(xy[..., :1], 100.0)], dim=-1)
+            ray_directions = torch.zeros_like(ray_starts)
+            ray_directions[..., 2] = -1.0
+            queries["raycast"] = lambda: warp_utils.ray_cast(ray_starts, ray_directions, warp_mesh)[..., 2]
+        return queries
+
+    names = list(height_queries(torch.zeros(1, 2, device=config.device)))
+    columns = [f"{name} ms" for name in names]
+    if warp_mesh is not None:
+        columns += [f"{mode} %off" for mode in samplers]
+    print(f"{'envs':>6} {'points':>7} " + " ".join(f"{column:>15}" for column in columns))
+    for num_envs in config.num_envs:
+        for points_per_side in config.scan_points:
+            xy = scan_points(num_envs, points_per_side, config.scan_spacing, extent, config.device)
+            queries = height_queries(xy)
+            results = [time_fn(query, device=config.device, iters=config.iters) for query in queries.values()]
+            if warp_mesh is not None:
+                ray_heights = queries["raycast"]()
+                results += [
+                    100.0 * ((queries[mode]() - ray_heights).abs() > 1e-3).float().mean().item() for mode in samplers
+                ]
+            print(f"{num_envs:>6d} {points_per_side**2:>7d} " + " ".join(f"{result:>15.3f}" for result in results))
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
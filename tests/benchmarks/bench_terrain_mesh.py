@@ -0,0 +1,78 @@
+"""Benchmark heightfield-to-mesh conversion with and without merging flat regions.
+
+Generates the default locomotion terrain (``terrain_locomotion_mix``) and reports, per mesh builder, the
+triangle and vertex counts, the conversion time, the trimesh processing time done by ``Terrain`` and the
+Warp BVH build time (if Warp is installed).
+
+Example:
+    python tests/benchmarks/bench_terrain_mesh.py --iters 3
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from functools import partial
+
+import torch
+import trimesh
+import tyro
+from timing import time_fn
+
+from holosoma.config_values.terrain import terrain_locomotion_mix
+from holosoma.simulator.shared.terrain import Terrain
+from holosoma.utils import terrain_utils
+
+
+@dataclasses.dataclass
+class Config:
+    """Benchmark configuration."""
+
+    num_rows: int = 10
+    num_cols: int = 20
+    seed: int = 0
+    device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    iters: int = 3
+
+
+def main(config: Config) -> None:
+    terrain_cfg = dataclasses.replace(
+        terrain_locomotion_mix.terrain_term,
+        num_rows=config.num_rows,
+        num_cols=config.num_cols,
+        seed=config.seed,
+        cache_dir=None,
+    )
+    terrain = Terrain(terrain_cfg, num_robots=1)
+    try:
+        from holosoma.utils import warp_utils
+    except ImportError:
+        print("Warp is not installed, skipping BVH builds")
+        warp_utils = None
+
+    print(f"{'builder':>8} {'triangles':>11} {'vertices':>11} {'convert ms':>11} {'process ms':>11} {'bvh ms':>11}")
+    for merge_flat_regions in (False, True):
+        convert = partial(
+            terrain_utils.convert_heightfield_to_trimesh,
+            terrain._height_field_raw,
+            terrain._horizontal_scale,
+            terrain._vertical_scale,
+            terrain._slope_threshold,
+            merge_flat_regions=merge_flat_regions,
+        )
+        vertices, triangles = convert()
+        results = [
+            time_fn(convert, device="cpu", warmup=1, iters=config.iters),
+            time_fn(partial(trimesh.Trimesh, vertices=vertices, faces=triangles), device="cpu", warmup=0, iters=1),
+        ]
+        if warp_utils is not None:
+            build_bvh = partial(warp_utils.convert_to_wp_mesh, vertices, triangles, config.device)
+            results.append(time_fn(build_bvh, device=config.device, warmup=1, iters=config.iters))
+        name = "merged" if merge_flat_regions else "grid"
+        print(
+            f"{name:>8} {len(triangles):>11d} {len(vertices):>11d} "
+            + " ".join(f"{result:>11.1f}" for result in results)
+        )
+
+
+if __name__ == "__main__":
+    main(tyro.cli(Config))
@@ -0,0 +1,26 @@
+"""Shared timing helpers for the micro-benchmarks in this directory."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import torch
+
+
+def synchronize(device: str) -> None:
+    """Wait for pending kernels on ``device`` so wall-clock timings are meaningful."""
+    if torch.device(device).type == "cuda":
+        torch.cuda.synchronize(device)
+
+
+def time_fn(fn: Callable[[], object], *, device: str, warmup: int = 10, iters: int = 100) -> float:
+    """Return the mean wall-clock time of ``fn`` in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    synchronize(device)
+    start = time.perf_counter()
+    for _ in range(iters):
+        fn()
+    synchronize(device)
+    return (time.perf_counter() - start) * 1000.0 / iters